@@ -1,10 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-from src.TSSCB.TSSCB import TSSCBMaterial
+from src.TSSCB.TSSCB import TSSCB
 from src.ModBoucWen.ModBoucWen import ModBoucWen
 from src.Failure.Failure import Failure
-from utils.material_test import generate_path, material_test
+from utils.material_test import generate_path, test_opspy
+from utils.plotting import plot_hysteresis
 
 
 u = generate_path([0, 
@@ -21,9 +22,7 @@ for ui in u:
     mat.setStrain(ui)
     Fi = mat.getStress()
     F_py.append(Fi)
-F_opspy, _ = np.array(material_test(u, 'ModBoucWen', paras))  # hysteretic responses obtained by OpenSeesPy
+F_opspy, _ = test_opspy(u, 'ModBoucWen', paras)  # hysteretic responses obtained by OpenSeesPy
 
-plt.plot(u, F_opspy, label='F_opspy')
-plt.plot(u, F_py, label='F_py')
-plt.legend()
+plot = plot_hysteresis({'F_opspy': (u, F_opspy), 'F_py': (u, F_py)})
 plt.show()
@@ -1,6 +1,7 @@
 import numpy as np
 import openseespy.opensees as ops
 import matplotlib.pyplot as plt
+from utils.plotting import plot_hysteresis
 
 
 def material_test(
@@ -44,5 +45,5 @@ if __name__ == "__main__":
 
     F = material_test(u, mat, paras)
     F = np.array(F)
-    plt.plot(u, F)
+    plot = plot_hysteresis((u, F))
     plt.show()
@@ -0,0 +1,69 @@
+"""
+编译src下的Cython材料: 每个.pyx就地编译为与其路径对应的模块
+(如src/CUniaxialMaterial.pyx -> src.CUniaxialMaterial，src/TSSCB/TSSCB.pyx -> src.TSSCB.TSSCB)，
+编译结果由`src.factory`自动选用。
+
+用法:
+    python build.py                    # 编译全部材料
+    python build.py --stats            # 启用热点分支计数(定义宏MYOPENSEES_STATS=1，见CUniaxialMaterial.pxd)
+    python build.py --cythonize-only   # 只重新生成提交到仓库中的.c文件
+
+生成的.c与编译选项无关(计数器开关为C宏)。--stats总是强制重新编译，
+由计数构建切换回普通构建时需加--force。
+"""
+import argparse
+import glob
+import os
+import sys
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_extensions() -> list:
+    """src下所有.pyx对应的Extension，模块名由相对于仓库根目录的路径得到"""
+    from setuptools import Extension
+    exts = []
+    for path in sorted(glob.glob('src/**/*.pyx', recursive=True)):
+        path = path.replace(os.sep, '/')
+        exts.append(Extension(path[:-4].replace('/', '.'), [path]))
+    return exts
+
+
+def _fix_openmp(ext):
+    """.pyx头部的`-fopenmp`适用于gcc/clang，MSVC改用`/openmp`"""
+    if sys.platform == 'win32':
+        ext.extra_compile_args = ['/openmp' if a == '-fopenmp' else a for a in ext.extra_compile_args]
+        ext.extra_link_args = [a for a in ext.extra_link_args if a != '-fopenmp']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the Cython materials in src/ in place')
+    parser.add_argument('--stats', action='store_true', help='compile with MYOPENSEES_STATS=1 (branch counters)')
+    parser.add_argument('--cythonize-only', action='store_true', help='only regenerate the .c files')
+    parser.add_argument('--force', action='store_true', help='regenerate and recompile everything')
+    parser.add_argument('-j', '--parallel', type=int, default=None, help='number of parallel compile jobs')
+    args = parser.parse_args(argv)
+
+    from Cython.Build import cythonize
+    os.chdir(ROOT)
+    # 以仓库根目录为include路径，使.c中记录的文件路径与平台无关
+    exts = cythonize(find_extensions(), include_path=['.'], force=args.force, quiet=True)
+    if args.cythonize_only:
+        return
+    from setuptools import setup
+    for ext in exts:
+        _fix_openmp(ext)
+        if args.stats:
+            ext.define_macros.append(('MYOPENSEES_STATS', '1'))
+    script_args = ['build_ext', '--inplace']
+    if args.stats or args.force:
+        # 计数器开关不影响.c，需强制重新编译才能在两种构建之间切换
+        script_args.append('--force')
+    if args.parallel:
+        script_args += ['--parallel', str(args.parallel)]
+    setup(name='myopensees-materials', ext_modules=exts, script_args=script_args)
+
+
+if __name__ == '__main__':
+    main()
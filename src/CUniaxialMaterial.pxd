@@ -0,0 +1,21 @@
+# 计数器开关: 编译时定义宏MYOPENSEES_STATS=1(如CFLAGS=-DMYOPENSEES_STATS=1)时启用，
+# 默认为0，`if MYOPENSEES_STATS:`分支由C编译器整体移除，不产生任何开销
+cdef extern from *:
+    """
+    #ifndef MYOPENSEES_STATS
+    #define MYOPENSEES_STATS 0
+    #endif
+    """
+    const bint MYOPENSEES_STATS
+
+
+cdef class CUniaxialMaterial:
+    cdef public int tag
+    cdef object __weakref__
+
+    cpdef void setTrialStrain(self, double strain, double strainRate=*)
+    cpdef void commitState(self)
+    cpdef void setStrain(self, double strain, double strainRate=*)
+    cpdef double getStrain(self)
+    cpdef double getStress(self)
+    cpdef double getTangent(self)
@@ -0,0 +1,80 @@
+# cython: language_level=3, freethreading_compatible=True
+"""
+扩展材料(.pyx)的抽象基类，与`src/UniaxialMaterial.py`中的接口一一对应。
+
+其他编译代码(如Failure、组合材料、SDOF积分器)可通过
+`from src.CUniaxialMaterial cimport CUniaxialMaterial`获得C级别的声明，
+对`setTrialStrain`/`commitState`等方法的调用经由vtable直接分派，不经过Python。
+"""
+import threading
+import weakref
+
+
+# 是否编译了计数器(见CUniaxialMaterial.pxd)
+STATS = bool(MYOPENSEES_STATS)
+
+
+# 材料编号 -> 材料对象(弱引用，材料对象被释放后自动移除)。
+# 与src/UniaxialMaterial.py相同，每个线程拥有独立的编号空间，线程之间不共享可变状态
+_registry = threading.local()
+
+
+cdef object _objs():
+    objs = getattr(_registry, 'objs', None)
+    if objs is None:
+        objs = _registry.objs = weakref.WeakValueDictionary()
+    return objs
+
+
+def getUniaxialMaterial(int tag) -> CUniaxialMaterial:
+    obj = _objs().get(tag)
+    if obj is None:
+        raise ValueError(f'Material with tag {tag} does not exist')
+    return obj
+
+
+def wipe():
+    """清空当前线程中定义的所有材料"""
+    _objs().clear()
+
+
+cdef class CUniaxialMaterial:
+
+    def __cinit__(self, int tag, *args, **kwargs):
+        # 同一编号重复定义时，后定义的材料覆盖之前的材料
+        self.tag = tag
+        _objs()[tag] = self
+
+    cpdef void setTrialStrain(self, double strain, double strainRate=0):
+        raise NotImplementedError(f'{type(self).__name__} must implement setTrialStrain')
+
+    cpdef void commitState(self):
+        raise NotImplementedError(f'{type(self).__name__} must implement commitState')
+
+    cpdef void setStrain(self, double strain, double strainRate=0):
+        self.setTrialStrain(strain, strainRate)
+        self.commitState()
+
+    cpdef double getStrain(self):
+        raise NotImplementedError(f'{type(self).__name__} must implement getStrain')
+
+    cpdef double getStress(self):
+        raise NotImplementedError(f'{type(self).__name__} must implement getStress')
+
+    cpdef double getTangent(self):
+        raise NotImplementedError(f'{type(self).__name__} must implement getTangent')
+
+    def getState(self) -> tuple:
+        """已提交的历史状态变量(元组，可序列化)，配合`setState`用于保存和恢复材料状态"""
+        raise NotImplementedError(f'{type(self).__name__} must implement getState')
+
+    def setState(self, tuple state):
+        """恢复由`getState`得到的状态，试探状态同时设为已提交状态"""
+        raise NotImplementedError(f'{type(self).__name__} must implement setState')
+
+    def getCounters(self) -> dict:
+        """热点分支的进入次数(未编译计数器或材料未插桩时为空字典)"""
+        return {}
+
+    def resetCounters(self):
+        pass
@@ -0,0 +1,17 @@
+from ..CUniaxialMaterial cimport CUniaxialMaterial
+
+
+cdef class Failure(CUniaxialMaterial):
+    cdef public int other_tag
+    # 被引用的材料
+    cdef CUniaxialMaterial material
+    # 材料参数
+    cdef double minStrain, maxStrain, minForce, maxForce, uy, maxCPD
+    # 历史状态变量
+    cdef bint Cfailure, Tfailure
+    cdef double Cstrain, Tstrain
+    cdef double Cyieldface, Tyieldface
+    cdef double Cwp, Twp
+
+    cdef void _check_paras(self)
+    cdef void _init_paras(self)
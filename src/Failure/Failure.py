@@ -1,7 +1,4 @@
-import math
 import sys
-import numpy as np
-import matplotlib.pyplot as plt
 from ..UniaxialMaterial import UniaxialMaterial
 
 
@@ -70,6 +67,10 @@ class Failure(UniaxialMaterial):
 
     def setTrialStrain(self, strain, strainRate=0):
         """传入当前步的应变值strain"""
+        # 已经破坏，应力和刚度恒为0，无需再计算被引用的材料
+        if self.Cfailure:
+            self.Tstrain = strain
+            return
         # Reset history variables to last converged state
         self.Tstrain = self.Cstrain
         self.Tfailure = self.Cfailure
@@ -80,7 +81,7 @@ class Failure(UniaxialMaterial):
             return
         else:
             self.Tstrain = strain
-        self.material._setTrainStrain(strain, strainRate)
+        self.material.setTrialStrain(strain, strainRate)
         if self.Tstrain > self.Cyieldface:
             # 正向屈服
             self.Twp = self.Cwp + self.Tstrain - self.Cyieldface
@@ -90,30 +91,27 @@ class Failure(UniaxialMaterial):
             self.Twp = self.Cwp + self.Cyieldface - 2 * self.uy - self.Tstrain
             self.Tyieldface = self.Tstrain + 2 * self.uy
         # 1 判断是否延性破坏
-        if self.Tstrain < self.minStrain:
-            # 负向破坏
-            self.Tfailure = True
-        elif self.Tstrain > self.maxStrain:
-            # 正向破坏
+        if self.Tstrain < self.minStrain or self.Tstrain > self.maxStrain:
             self.Tfailure = True
         # 2 判断是否累积塑性应变破坏
-        if self.Twp > self.maxCPD * self.uy:
+        elif self.Twp > self.maxCPD * self.uy:
             self.Tfailure = True
         # 3 判断是否承载力破坏
-        if self.material.getStress() < self.minForce:
-            self.Tfailure = True
-        elif self.material.getStress() > self.maxForce:
-            self.Tfailure = True
+        else:
+            stress = self.material.getStress()
+            if stress < self.minForce or stress > self.maxForce:
+                self.Tfailure = True
 
     def commitState(self):
+        if not self.Cfailure:
+            self.material.commitState()
         self.Cstrain = self.Tstrain
         self.Cfailure = self.Tfailure
         self.Cyieldface = self.Tyieldface
         self.Cwp = self.Twp
-        self.material.commitState()
 
     def getStrain(self):
-        return self.material.getStrain()
+        return self.Tstrain
 
     def getStress(self):
         if self.Tfailure:
@@ -126,4 +124,3 @@ class Failure(UniaxialMaterial):
             return 0
         else:
             return self.material.getTangent()
-
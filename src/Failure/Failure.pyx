@@ -0,0 +1,125 @@
+# cython: language_level=3, freethreading_compatible=True
+from libc.float cimport DBL_MAX
+from ..CUniaxialMaterial import getUniaxialMaterial
+
+
+cdef class Failure(CUniaxialMaterial):
+    """
+    Failure wrapper (Cython version)
+
+    被引用的材料须为扩展材料(CUniaxialMaterial的子类)，通过vtable直接调用。
+    一旦判定破坏，应力和切线刚度恒为0，此后不再计算被引用的材料。
+    """
+
+    def __init__(self,
+                 int tag,
+                 int other_tag,
+                 minStrain=None,
+                 maxStrain=None,
+                 minForce=None,
+                 maxForce=None,
+                 uy=None,
+                 maxCPD=None):
+        self.other_tag = other_tag
+        if maxCPD is not None and uy is None:
+            raise ValueError("uy must be provided when maxCPD is provided")
+        self.minStrain = -DBL_MAX if minStrain is None else minStrain
+        self.maxStrain = DBL_MAX if maxStrain is None else maxStrain
+        self.minForce = -DBL_MAX if minForce is None else minForce
+        self.maxForce = DBL_MAX if maxForce is None else maxForce
+        self.uy = DBL_MAX if uy is None else uy
+        self.maxCPD = DBL_MAX if maxCPD is None else maxCPD
+        self._check_paras()
+        self._init_paras()
+
+    cdef void _check_paras(self):
+        if not self.minStrain <= 0:
+            raise ValueError("minStrain must be negative")
+        if not self.maxStrain >= 0:
+            raise ValueError("maxStrain must be positive")
+        if not self.minForce <= 0:
+            raise ValueError("minForce must be negative")
+        if not self.maxForce >= 0:
+            raise ValueError("maxForce must be positive")
+        if not self.maxCPD > 0:
+            raise ValueError("maxCPD must be positive")
+        if not self.uy > 0:
+            raise ValueError("uy must be positive")
+
+    cdef void _init_paras(self):
+        self.Cstrain = 0.0
+        self.Tstrain = 0.0
+        self.Cfailure = False
+        self.Tfailure = False
+        self.Cyieldface = self.uy
+        self.Tyieldface = self.uy
+        self.Cwp = 0.0
+        self.Twp = 0.0
+        self.material = getUniaxialMaterial(self.other_tag)
+
+    cpdef void setTrialStrain(self, double strain, double strainRate=0):
+        cdef double dStrain, stress
+        # 已经破坏，应力和刚度恒为0，无需再计算被引用的材料
+        if self.Cfailure:
+            self.Tstrain = strain
+            return
+        # Reset history variables to last converged state
+        self.Tstrain = self.Cstrain
+        self.Tfailure = self.Cfailure
+        self.Tyieldface = self.Cyieldface
+        self.Twp = self.Cwp
+        dStrain = strain - self.Cstrain
+        if dStrain == 0:
+            return
+        self.Tstrain = strain
+        self.material.setTrialStrain(strain, strainRate)
+        if self.Tstrain > self.Cyieldface:
+            # 正向屈服
+            self.Twp = self.Cwp + self.Tstrain - self.Cyieldface
+            self.Tyieldface = self.Tstrain
+        elif self.Tstrain < self.Cyieldface - 2 * self.uy:
+            # 负向屈服
+            self.Twp = self.Cwp + self.Cyieldface - 2 * self.uy - self.Tstrain
+            self.Tyieldface = self.Tstrain + 2 * self.uy
+        # 1 判断是否延性破坏
+        if self.Tstrain < self.minStrain or self.Tstrain > self.maxStrain:
+            self.Tfailure = True
+        # 2 判断是否累积塑性应变破坏
+        elif self.Twp > self.maxCPD * self.uy:
+            self.Tfailure = True
+        # 3 判断是否承载力破坏
+        else:
+            stress = self.material.getStress()
+            if stress < self.minForce or stress > self.maxForce:
+                self.Tfailure = True
+
+    cpdef void commitState(self):
+        if not self.Cfailure:
+            self.material.commitState()
+        self.Cstrain = self.Tstrain
+        self.Cfailure = self.Tfailure
+        self.Cyieldface = self.Tyieldface
+        self.Cwp = self.Twp
+
+    cpdef double getStrain(self):
+        return self.Tstrain
+
+    cpdef double getStress(self):
+        if self.Tfailure:
+            return 0.0
+        return self.material.getStress()
+
+    cpdef double getTangent(self):
+        if self.Tfailure:
+            return 0.0
+        return self.material.getTangent()
+
+    def getState(self) -> tuple:
+        return (self.Cfailure, self.Cstrain, self.Cyieldface, self.Cwp, self.material.getState())
+
+    def setState(self, tuple state):
+        self.Cfailure = self.Tfailure = state[0]
+        self.Cstrain = self.Tstrain = state[1]
+        self.Cyieldface = self.Tyieldface = state[2]
+        self.Cwp = self.Twp = state[3]
+        self.material.setState(state[4])
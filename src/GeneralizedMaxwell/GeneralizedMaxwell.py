@@ -1,8 +1,5 @@
 import math
-import sys
-import numpy as np
-import matplotlib.pyplot as plt
-from ..UniaxialMaterial import UniaxialMaterial
+from ..UniaxialMaterial import UniaxialMaterial, STATS
 
 
 class GeneralizedMaxwell(UniaxialMaterial):
@@ -93,23 +90,35 @@ class GeneralizedMaxwell(UniaxialMaterial):
         return dS_list
 
     def setTrialStrain(self, strain, strainRate=0):
-        """传入当前步的应变值strain，使用RK4法更新内部状态"""
-        # 更新总应变增量
-        self.Tstrain = strain
-        d_eps = self.Tstrain - self.Cstrain
-
+        """传入当前步的应变值strain和应变率strainRate，由两者反推时间增量dt"""
+        d_eps = strain - self.Cstrain
         # 根据应变和应变率推导当前步的时间增量 dt
         # 如果没有提供应变率或应变率为0，则视为瞬态加载(纯弹性行为)，dt=0
         if strainRate != 0:
             dt = abs(d_eps / strainRate)
         else:
             dt = 0.0
+        self.setTrialStrainDt(strain, dt)
+
+    def setTrialStrainDt(self, strain, dt):
+        """传入当前步的应变值strain和时间增量dt，使用RK4法更新内部状态
+
+        与setTrialStrain不同，dt直接给定，应变增量为0时(如保持阶段)黏壶仍可松弛
+        """
+        # 更新总应变增量
+        self.Tstrain = strain
+        d_eps = self.Tstrain - self.Cstrain
 
         # 获取上一步各分支的收敛应力
         S = list(self.Cstress_i)
         
         # RK4积分的步长 (积分域为无量纲的x，从0到1)
         h = 1.0 / self.n_iter
+        if STATS:
+            self._count('steps')
+            self._count('rk_substeps', self.n_iter)
+            if d_eps == 0:
+                self._count('relaxation_steps')
 
         # 四阶龙格库塔方法 (RK4) 进行子步积分
         for _ in range(self.n_iter):
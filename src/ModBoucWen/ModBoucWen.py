@@ -1,8 +1,4 @@
-import math
-import sys
-import numpy as np
-import matplotlib.pyplot as plt
-from ..UniaxialMaterial import UniaxialMaterial
+from ..UniaxialMaterial import UniaxialMaterial, STATS
 
 
 class ModBoucWen(UniaxialMaterial):
@@ -83,6 +79,9 @@ class ModBoucWen(UniaxialMaterial):
             return
         else:
             self.Tstrain = strain
+        if STATS:
+            self._count('steps')
+            self._count('rk_substeps', self.iter)
         # Calculate stress and tangent
         dStrain_ = dStrain / self.iter
         z_ = self.Cz  # 临时的z值
@@ -91,10 +90,14 @@ class ModBoucWen(UniaxialMaterial):
             strain_ = self.Cstrain + dStrain_ * i  # 每一步应变
             if strain_ > self.Tface:
                 # 正向屈服
+                if STATS:
+                    self._count('yield_pos')
                 self.Twp += strain_ - self.Tface
                 self.Tface = strain_
             elif strain_ < self.Tface - 2 * self.uy:
                 # 负向屈服
+                if STATS:
+                    self._count('yield_neg')
                 self.Twp += self.Tface - 2 * self.uy - strain_
                 self.Tface = strain_ + 2 * self.uy
             if dStrain_ * z_ < 0.0:
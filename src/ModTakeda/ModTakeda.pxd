@@ -0,0 +1,25 @@
+from ..CUniaxialMaterial cimport CUniaxialMaterial, MYOPENSEES_STATS
+
+
+# 计数器编号，名称见ModTakeda.pyx中的COUNTERS
+cdef enum:  # ModTakeda计数器编号
+    MODTAKEDA_NO_CHANGE
+    MODTAKEDA_UNLOAD
+    MODTAKEDA_UNLOAD_RELOAD
+    MODTAKEDA_RELOAD
+    MODTAKEDA_RELOAD_K0
+    MODTAKEDA_BACKBONE
+    MODTAKEDA_N_COUNTERS
+
+
+cdef class ModTakeda(CUniaxialMaterial):
+    cdef public double Fy, k0, r, alpha, beta
+    cdef public double uy
+    cdef public double Cstrain, Tstrain, Cstress, Tstress, Ctangent, Ttangent
+    cdef public double Cdm_pos, Tdm_pos, Cdm_neg, Tdm_neg
+    cdef public double CFm_pos, TFm_pos, CFm_neg, TFm_neg
+    # 计数器(仅在编译时定义MYOPENSEES_STATS=1时累加)
+    cdef long long counts[MODTAKEDA_N_COUNTERS]
+
+    cdef void _check_paras(self)
+    cdef void _init_paras(self)
@@ -1,5 +1,5 @@
 import sys
-from ..UniaxialMaterial import UniaxialMaterial
+from ..UniaxialMaterial import UniaxialMaterial, STATS
 
 
 class ModTakeda(UniaxialMaterial):
@@ -66,6 +66,10 @@ class ModTakeda(UniaxialMaterial):
         """传入当前步的应变值strain"""
         # Reset history variables to last converged state
         self.Tstrain = strain
+        self.Tdm_pos = self.Cdm_pos
+        self.Tdm_neg = self.Cdm_neg
+        self.TFm_pos = self.CFm_pos
+        self.TFm_neg = self.CFm_neg
         dStrain = strain - self.Cstrain
         if abs(dStrain) > sys.float_info.epsilon:
             if dStrain > 0:
@@ -76,6 +80,8 @@ class ModTakeda(UniaxialMaterial):
                     if ku < abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon)):
                         ku = abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon))
                     if self.Cstress + ku * dStrain > 0:
+                        if STATS:
+                            self._count('unload_reload')
                         dStrain1 = -self.Cstress / ku
                         dStrain2 = dStrain - dStrain1
                         u0 = self.Cstrain + dStrain1  # 滞回曲线与x轴交点横坐标
@@ -85,14 +91,22 @@ class ModTakeda(UniaxialMaterial):
                             kr = self.k0
                         self.Tstress = kr * dStrain2
                     else:
+                        if STATS:
+                            self._count('unload')
                         self.Tstress = self.Cstress + ku * dStrain
                 else:
                     if u_flag > strain:
+                        if STATS:
+                            self._count('reload')
                         kr = (F_flag - self.Cstress) / (u_flag - self.Cstrain)  # 再加载刚度
                         self.Tstress = self.Cstress + kr * dStrain
                     else:
+                        if STATS:
+                            self._count('reload_k0')
                         self.Tstress = self.Cstress + dStrain * self.k0
                 if self.Tstress > self.r * self.k0 * (strain - self.uy) + self.Fy:
+                    if STATS:
+                        self._count('backbone')
                     self.Tstress = self.r * self.k0 * (strain - self.uy) + self.Fy
             else:
                 u_flag = min(-self.uy, self.Cdm_neg - self.beta * (self.Cdm_neg + self.uy))
@@ -102,6 +116,8 @@ class ModTakeda(UniaxialMaterial):
                     if ku < abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon)):
                         ku = abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon))
                     if self.Cstress + ku * dStrain < 0:
+                        if STATS:
+                            self._count('unload_reload')
                         dStrain1 = -self.Cstress / ku
                         dStrain2 = dStrain - dStrain1
                         u0 = self.Cstrain + dStrain1  # 滞回曲线与x轴交点横坐标
@@ -111,14 +127,22 @@ class ModTakeda(UniaxialMaterial):
                             kr = self.k0
                         self.Tstress = kr * dStrain2
                     else:
+                        if STATS:
+                            self._count('unload')
                         self.Tstress = self.Cstress + ku * dStrain
                 else:
                     if u_flag < strain:
+                        if STATS:
+                            self._count('reload')
                         kr = (F_flag - self.Cstress) / (u_flag - self.Cstrain)  # 再加载刚度
                         self.Tstress = self.Cstress + kr * dStrain
                     else:
+                        if STATS:
+                            self._count('reload_k0')
                         self.Tstress = self.Cstress + dStrain * self.k0
                 if self.Tstress < self.r * self.k0 * (strain + self.uy) - self.Fy:
+                    if STATS:
+                        self._count('backbone')
                     self.Tstress = self.r * self.k0 * (strain + self.uy) - self.Fy
             # 更新Flag点
             if dStrain > 0:
@@ -130,6 +154,8 @@ class ModTakeda(UniaxialMaterial):
             # 更新切线刚度
             self.Ttangent = (self.Tstress - self.Cstress) / dStrain
         else:
+            if STATS:
+                self._count('no_change')
             self.Tstress = self.Cstress
             self.Ttangent = self.Ctangent
 
@@ -1,16 +1,16 @@
-# cython: language_level=3
+# cython: language_level=3, freethreading_compatible=True
 import sys
+from libc.string cimport memset
 
-cdef class ModTakeda:
+
+# 计数器名称，与ModTakeda.pxd中的计数器编号(MODTAKEDA_NO_CHANGE ~ MODTAKEDA_BACKBONE)一一对应
+COUNTERS = ('no_change', 'unload', 'unload_reload', 'reload', 'reload_k0', 'backbone')
+
+
+cdef class ModTakeda(CUniaxialMaterial):
     """
     Modified Takeda model (Cython version)
     """
-    cdef public int tag
-    cdef public double Fy, k0, r, alpha, beta
-    cdef public double uy
-    cdef public double Cstrain, Tstrain, Cstress, Tstress, Ctangent, Ttangent
-    cdef public double Cdm_pos, Tdm_pos, Cdm_neg, Tdm_neg
-    cdef public double CFm_pos, TFm_pos, CFm_neg, TFm_neg
 
     def __init__(self, int tag,
                  double Fy,
@@ -57,6 +57,10 @@ cdef class ModTakeda:
         """
         # Reset history variables to last converged state
         self.Tstrain = strain
+        self.Tdm_pos = self.Cdm_pos
+        self.Tdm_neg = self.Cdm_neg
+        self.TFm_pos = self.CFm_pos
+        self.TFm_neg = self.CFm_neg
         cdef double dStrain = strain - self.Cstrain
         cdef double dStrain1, dStrain2, u0, ku, kr, u_flag, F_flag
 
@@ -69,6 +73,8 @@ cdef class ModTakeda:
                     if ku < abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon)):
                         ku = abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon))
                     if self.Cstress + ku * dStrain > 0:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_UNLOAD_RELOAD] += 1
                         dStrain1 = -self.Cstress / ku
                         dStrain2 = dStrain - dStrain1
                         u0 = self.Cstrain + dStrain1  # 滞回曲线与x轴交点横坐标
@@ -78,14 +84,22 @@ cdef class ModTakeda:
                             kr = self.k0
                         self.Tstress = kr * dStrain2
                     else:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_UNLOAD] += 1
                         self.Tstress = self.Cstress + ku * dStrain
                 else:
                     if u_flag > strain:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_RELOAD] += 1
                         kr = (F_flag - self.Cstress) / (u_flag - self.Cstrain)  # 再加载刚度
                         self.Tstress = self.Cstress + kr * dStrain
                     else:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_RELOAD_K0] += 1
                         self.Tstress = self.Cstress + dStrain * self.k0
                 if self.Tstress > self.r * self.k0 * (strain - self.uy) + self.Fy:
+                    if MYOPENSEES_STATS:
+                        self.counts[MODTAKEDA_BACKBONE] += 1
                     self.Tstress = self.r * self.k0 * (strain - self.uy) + self.Fy
             else:  # dStrain < 0
                 u_flag = min(-self.uy, self.Cdm_neg - self.beta * (self.Cdm_neg + self.uy))
@@ -95,6 +109,8 @@ cdef class ModTakeda:
                     if ku < abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon)):
                         ku = abs((self.Cstress + sys.float_info.epsilon) / (self.Cstrain + sys.float_info.epsilon))
                     if self.Cstress + ku * dStrain < 0:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_UNLOAD_RELOAD] += 1
                         dStrain1 = -self.Cstress / ku
                         dStrain2 = dStrain - dStrain1
                         u0 = self.Cstrain + dStrain1  # 滞回曲线与x轴交点横坐标
@@ -104,14 +120,22 @@ cdef class ModTakeda:
                             kr = self.k0
                         self.Tstress = kr * dStrain2
                     else:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_UNLOAD] += 1
                         self.Tstress = self.Cstress + ku * dStrain
                 else:
                     if u_flag < strain:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_RELOAD] += 1
                         kr = (F_flag - self.Cstress) / (u_flag - self.Cstrain)  # 再加载刚度
                         self.Tstress = self.Cstress + kr * dStrain
                     else:
+                        if MYOPENSEES_STATS:
+                            self.counts[MODTAKEDA_RELOAD_K0] += 1
                         self.Tstress = self.Cstress + dStrain * self.k0
                 if self.Tstress < self.r * self.k0 * (strain + self.uy) - self.Fy:
+                    if MYOPENSEES_STATS:
+                        self.counts[MODTAKEDA_BACKBONE] += 1
                     self.Tstress = self.r * self.k0 * (strain + self.uy) - self.Fy
 
             # 更新Flag点
@@ -129,6 +153,8 @@ cdef class ModTakeda:
             # 更新切线刚度
             self.Ttangent = (self.Tstress - self.Cstress) / dStrain
         else:
+            if MYOPENSEES_STATS:
+                self.counts[MODTAKEDA_NO_CHANGE] += 1
             self.Tstress = self.Cstress
             self.Ttangent = self.Ctangent
 
@@ -141,10 +167,6 @@ cdef class ModTakeda:
         self.Cdm_neg = self.Tdm_neg
         self.CFm_pos = self.TFm_pos
         self.CFm_neg = self.TFm_neg
-    
-    cpdef void setStrain(self, double strain, double strainRate=0):
-        self.setTrialStrain(strain, strainRate)
-        self.commitState()
 
     cpdef double getStrain(self):
         return self.Tstrain
@@ -153,4 +175,24 @@ cdef class ModTakeda:
         return self.Tstress
 
     cpdef double getTangent(self):
-        return self.Ttangent
\ No newline at end of file
+        return self.Ttangent
+
+    def getCounters(self) -> dict:
+        if not MYOPENSEES_STATS:
+            return {}
+        return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+
+    def resetCounters(self):
+        memset(self.counts, 0, sizeof(self.counts))
+
+    def getState(self) -> tuple:
+        return (self.Cstrain, self.Cstress, self.Ctangent, self.Cdm_pos, self.Cdm_neg, self.CFm_pos, self.CFm_neg)
+
+    def setState(self, tuple state):
+        self.Cstrain = self.Tstrain = state[0]
+        self.Cstress = self.Tstress = state[1]
+        self.Ctangent = self.Ttangent = state[2]
+        self.Cdm_pos = self.Tdm_pos = state[3]
+        self.Cdm_neg = self.Tdm_neg = state[4]
+        self.CFm_pos = self.TFm_pos = state[5]
+        self.CFm_neg = self.TFm_neg = state[6]
@@ -0,0 +1,223 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, freethreading_compatible=True
+# distutils: extra_compile_args = -fopenmp
+# distutils: extra_link_args = -fopenmp
+"""
+ModTakeda种群: 以C结构体数组保存大量独立的ModTakeda实例，
+逐步计算在nogil下进行，并通过prange在多个线程间并行推进各实例。
+"""
+import os
+import numpy as np
+from cython.parallel cimport prange
+from libc.math cimport fabs, pow, fmax, fmin
+from libc.float cimport DBL_EPSILON
+from libc.stdlib cimport malloc, free
+
+
+cdef struct ModTakedaState:
+    # 材料参数
+    double Fy, k0, r, alpha, beta
+    double uy
+    # 历史状态变量
+    double Cstrain, Tstrain, Cstress, Tstress, Ctangent, Ttangent
+    double Cdm_pos, Tdm_pos, Cdm_neg, Tdm_neg
+    double CFm_pos, TFm_pos, CFm_neg, TFm_neg
+
+
+# 参数列顺序(与ModTakeda的构造参数一致)
+PARAS = ('Fy', 'k0', 'r', 'alpha', 'beta')
+
+
+cdef void _init_state(ModTakedaState* s) noexcept nogil:
+    s.Cstrain = 0.0
+    s.Tstrain = 0.0
+    s.Cstress = 0.0
+    s.Tstress = 0.0
+    s.Ctangent = s.k0
+    s.Ttangent = s.k0
+    s.uy = s.Fy / s.k0
+    s.Cdm_pos = s.Fy / s.k0
+    s.Tdm_pos = s.Fy / s.k0
+    s.Cdm_neg = -s.Fy / s.k0
+    s.Tdm_neg = -s.Fy / s.k0
+    s.CFm_pos = s.Fy
+    s.TFm_pos = s.Fy
+    s.CFm_neg = -s.Fy
+    s.TFm_neg = -s.Fy
+
+
+cdef void _setTrialStrain(ModTakedaState* s, double strain) noexcept nogil:
+    cdef double dStrain, dStrain1, dStrain2, u0, ku, kr, u_flag, F_flag
+    s.Tstrain = strain
+    s.Tdm_pos = s.Cdm_pos
+    s.Tdm_neg = s.Cdm_neg
+    s.TFm_pos = s.CFm_pos
+    s.TFm_neg = s.CFm_neg
+    dStrain = strain - s.Cstrain
+    if fabs(dStrain) <= DBL_EPSILON:
+        s.Tstress = s.Cstress
+        s.Ttangent = s.Ctangent
+        return
+    if dStrain > 0:
+        u_flag = fmax(s.uy, s.Cdm_pos - s.beta * (s.Cdm_pos - s.uy))
+        F_flag = fmax(s.Fy, s.CFm_pos - s.beta * (s.Cdm_pos - s.uy) * s.r * s.k0)
+        if s.Cstress < 0:
+            ku = s.k0 * pow(fabs(s.uy / s.Cdm_pos), s.alpha)  # 卸载刚度
+            if ku < fabs((s.Cstress + DBL_EPSILON) / (s.Cstrain + DBL_EPSILON)):
+                ku = fabs((s.Cstress + DBL_EPSILON) / (s.Cstrain + DBL_EPSILON))
+            if s.Cstress + ku * dStrain > 0:
+                dStrain1 = -s.Cstress / ku
+                dStrain2 = dStrain - dStrain1
+                u0 = s.Cstrain + dStrain1  # 滞回曲线与x轴交点横坐标
+                if strain < u_flag:
+                    kr = F_flag / (u_flag - u0)  # 再加载刚度
+                else:
+                    kr = s.k0
+                s.Tstress = kr * dStrain2
+            else:
+                s.Tstress = s.Cstress + ku * dStrain
+        else:
+            if u_flag > strain:
+                kr = (F_flag - s.Cstress) / (u_flag - s.Cstrain)  # 再加载刚度
+                s.Tstress = s.Cstress + kr * dStrain
+            else:
+                s.Tstress = s.Cstress + dStrain * s.k0
+        if s.Tstress > s.r * s.k0 * (strain - s.uy) + s.Fy:
+            s.Tstress = s.r * s.k0 * (strain - s.uy) + s.Fy
+    else:
+        u_flag = fmin(-s.uy, s.Cdm_neg - s.beta * (s.Cdm_neg + s.uy))
+        F_flag = fmin(-s.Fy, s.CFm_neg - s.beta * (s.Cdm_neg + s.uy) * s.r * s.k0)
+        if s.Cstress > 0:
+            ku = s.k0 * pow(fabs(s.uy / s.Cdm_neg), s.alpha)  # 卸载刚度
+            if ku < fabs((s.Cstress + DBL_EPSILON) / (s.Cstrain + DBL_EPSILON)):
+                ku = fabs((s.Cstress + DBL_EPSILON) / (s.Cstrain + DBL_EPSILON))
+            if s.Cstress + ku * dStrain < 0:
+                dStrain1 = -s.Cstress / ku
+                dStrain2 = dStrain - dStrain1
+                u0 = s.Cstrain + dStrain1  # 滞回曲线与x轴交点横坐标
+                if strain > u_flag:
+                    kr = F_flag / (u_flag - u0)  # 再加载刚度
+                else:
+                    kr = s.k0
+                s.Tstress = kr * dStrain2
+            else:
+                s.Tstress = s.Cstress + ku * dStrain
+        else:
+            if u_flag < strain:
+                kr = (F_flag - s.Cstress) / (u_flag - s.Cstrain)  # 再加载刚度
+                s.Tstress = s.Cstress + kr * dStrain
+            else:
+                s.Tstress = s.Cstress + dStrain * s.k0
+        if s.Tstress < s.r * s.k0 * (strain + s.uy) - s.Fy:
+            s.Tstress = s.r * s.k0 * (strain + s.uy) - s.Fy
+    # 更新Flag点
+    if dStrain > 0:
+        if s.Tstrain > s.Tdm_pos:
+            s.Tdm_pos = s.Tstrain
+        if s.Tstress > s.TFm_pos:
+            s.TFm_pos = s.Tstress
+    else:
+        if s.Tstrain < s.Tdm_neg:
+            s.Tdm_neg = s.Tstrain
+        if s.Tstress < s.TFm_neg:
+            s.TFm_neg = s.Tstress
+    # 更新切线刚度
+    s.Ttangent = (s.Tstress - s.Cstress) / dStrain
+
+
+cdef void _commitState(ModTakedaState* s) noexcept nogil:
+    s.Cstrain = s.Tstrain
+    s.Cstress = s.Tstress
+    s.Ctangent = s.Ttangent
+    s.Cdm_pos = s.Tdm_pos
+    s.Cdm_neg = s.Tdm_neg
+    s.CFm_pos = s.TFm_pos
+    s.CFm_neg = s.TFm_neg
+
+
+cdef class ModTakedaPopulation:
+    """
+    大量独立ModTakeda实例组成的种群
+
+    paras为(n, 5)的二维数组，每行对应一个实例，列顺序见`PARAS`。
+    """
+    cdef ModTakedaState* states
+    cdef Py_ssize_t n
+    cdef public int num_threads
+
+    def __cinit__(self, paras, int num_threads=0):
+        p = np.atleast_2d(np.asarray(paras, dtype=np.float64))
+        cdef Py_ssize_t i
+        cdef ModTakedaState* s
+        if p.shape[1] != len(PARAS):
+            raise ValueError(f"paras should have {len(PARAS)} columns, but got {p.shape[1]}")
+        self.n = p.shape[0]
+        self.num_threads = num_threads if num_threads > 0 else (os.cpu_count() or 1)
+        self.states = <ModTakedaState*> malloc(max(self.n, 1) * sizeof(ModTakedaState))
+        if self.states == NULL:
+            raise MemoryError()
+        for i in range(self.n):
+            s = &self.states[i]
+            s.Fy, s.k0, s.r, s.alpha, s.beta = p[i].tolist()
+            if not (s.Fy >= 0 and s.k0 >= 0 and s.r >= 0 and s.alpha >= 0 and s.beta >= 0):
+                raise ValueError(f"Parameters of ModTakeda must be non-negative (member {i})")
+            _init_state(s)
+
+    def __dealloc__(self):
+        free(self.states)
+
+    def __len__(self):
+        return self.n
+
+    def revertToStart(self):
+        cdef Py_ssize_t i
+        for i in range(self.n):
+            _init_state(&self.states[i])
+
+    def setTrialStrain(self, strain):
+        """传入各实例当前步的应变值(长度为n的数组)"""
+        cdef double[::1] eps = np.ascontiguousarray(strain, dtype=np.float64)
+        cdef Py_ssize_t i
+        if eps.shape[0] != self.n:
+            raise ValueError(f"strain should have length {self.n}, but got {eps.shape[0]}")
+        for i in prange(self.n, nogil=True, num_threads=self.num_threads, schedule='static'):
+            _setTrialStrain(&self.states[i], eps[i])
+
+    def commitState(self):
+        cdef Py_ssize_t i
+        for i in prange(self.n, nogil=True, num_threads=self.num_threads, schedule='static'):
+            _commitState(&self.states[i])
+
+    def getStrain(self):
+        return np.array([self.states[i].Tstrain for i in range(self.n)])
+
+    def getStress(self):
+        return np.array([self.states[i].Tstress for i in range(self.n)])
+
+    def getTangent(self):
+        return np.array([self.states[i].Ttangent for i in range(self.n)])
+
+    def run(self, path):
+        """所有实例沿同一应变路径加载，每个线程负责一部分实例并完整推进其加载历史
+
+        Args:
+            path (array_like): 应变序列
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 形状为(n, len(path))的应力、切线刚度
+        """
+        cdef double[::1] u = np.ascontiguousarray(path, dtype=np.float64)
+        cdef Py_ssize_t n_step = u.shape[0]
+        stress_arr = np.empty((self.n, n_step))
+        tangent_arr = np.empty((self.n, n_step))
+        cdef double[:, ::1] stress = stress_arr
+        cdef double[:, ::1] tangent = tangent_arr
+        cdef Py_ssize_t i, j
+        cdef ModTakedaState* s
+        for i in prange(self.n, nogil=True, num_threads=self.num_threads, schedule='static'):
+            s = &self.states[i]
+            for j in range(n_step):
+                _setTrialStrain(s, u[j])
+                _commitState(s)
+                stress[i, j] = s.Tstress
+                tangent[i, j] = s.Ttangent
+        return stress_arr, tangent_arr
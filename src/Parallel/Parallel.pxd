@@ -0,0 +1,11 @@
+from ..CUniaxialMaterial cimport CUniaxialMaterial
+
+
+cdef class Parallel(CUniaxialMaterial):
+    cdef public tuple tags
+    # 组成材料及其系数
+    cdef list materials
+    cdef double* factors
+    cdef Py_ssize_t n
+    # 历史状态变量
+    cdef double Cstrain, Tstrain
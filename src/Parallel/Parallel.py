@@ -0,0 +1,60 @@
+from ..UniaxialMaterial import UniaxialMaterial
+
+
+class Parallel(UniaxialMaterial):
+    
+    def __init__(self,
+            tag: int,
+            *tags: int,
+            factors: list[float]=None,
+        ):
+        """并联材料，各组成材料应变相同，应力和切线刚度按系数叠加
+
+        Args:
+            tag (int): 独立的材料编号
+            *tags (int): 组成材料的编号
+            factors (list[float], optional): 各组成材料的系数，默认均为1
+        """
+        self.tag = tag
+        self.tags = tags
+        # Materail parameters
+        self.factors = factors
+        # Response history
+        self.Cstrain: float  # 上一步的应变
+        self.Tstrain: float  # 当前步的应变
+        self._check_paras()
+        self._init_paras()
+
+    def _check_paras(self):
+        if len(self.tags) == 0:
+            raise ValueError('At least one material should be given')
+        if self.factors is None:
+            self.factors = [1.0] * len(self.tags)
+        if len(self.factors) != len(self.tags):
+            raise ValueError(f'The number of factors ({len(self.factors)}) should be equal to the number of materials ({len(self.tags)})')
+
+    def _init_paras(self):
+        self.Cstrain = 0
+        self.Tstrain = 0
+        self.materials: list[UniaxialMaterial] = [UniaxialMaterial.getUniaxialMaterial(tag) for tag in self.tags]
+
+    def setTrialStrain(self, strain, strainRate=0):
+        """传入当前步的应变值strain"""
+        self.Tstrain = strain
+        for material in self.materials:
+            material.setTrialStrain(strain, strainRate)
+
+    def commitState(self):
+        self.Cstrain = self.Tstrain
+        for material in self.materials:
+            material.commitState()
+
+    def getStrain(self):
+        return self.Tstrain
+
+    def getStress(self):
+        return sum(f * m.getStress() for f, m in zip(self.factors, self.materials))
+
+    def getTangent(self):
+        return sum(f * m.getTangent() for f, m in zip(self.factors, self.materials))
+
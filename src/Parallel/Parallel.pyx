@@ -0,0 +1,75 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, freethreading_compatible=True
+from libc.stdlib cimport malloc, free
+from ..CUniaxialMaterial import getUniaxialMaterial
+
+
+cdef class Parallel(CUniaxialMaterial):
+    """
+    Parallel material (Cython version)
+
+    组成材料须为扩展材料(CUniaxialMaterial的子类)，通过vtable直接调用。
+    """
+
+    def __init__(self, int tag, *tags, factors=None):
+        cdef Py_ssize_t i
+        if len(tags) == 0:
+            raise ValueError('At least one material should be given')
+        if factors is None:
+            factors = [1.0] * len(tags)
+        if len(factors) != len(tags):
+            raise ValueError(f'The number of factors ({len(factors)}) should be equal to the number of materials ({len(tags)})')
+        self.tags = tuple(tags)
+        self.n = len(tags)
+        self.materials = []
+        for t in tags:
+            material = getUniaxialMaterial(t)
+            if not isinstance(material, CUniaxialMaterial):
+                raise TypeError(f'Material {t} is not an extension material')
+            self.materials.append(material)
+        self.factors = <double*> malloc(self.n * sizeof(double))
+        if self.factors == NULL:
+            raise MemoryError()
+        for i in range(self.n):
+            self.factors[i] = factors[i]
+        self.Cstrain = 0.0
+        self.Tstrain = 0.0
+
+    def __dealloc__(self):
+        free(self.factors)
+
+    cpdef void setTrialStrain(self, double strain, double strainRate=0):
+        cdef Py_ssize_t i
+        self.Tstrain = strain
+        for i in range(self.n):
+            (<CUniaxialMaterial> self.materials[i]).setTrialStrain(strain, strainRate)
+
+    cpdef void commitState(self):
+        cdef Py_ssize_t i
+        self.Cstrain = self.Tstrain
+        for i in range(self.n):
+            (<CUniaxialMaterial> self.materials[i]).commitState()
+
+    cpdef double getStrain(self):
+        return self.Tstrain
+
+    cpdef double getStress(self):
+        cdef Py_ssize_t i
+        cdef double stress = 0.0
+        for i in range(self.n):
+            stress += self.factors[i] * (<CUniaxialMaterial> self.materials[i]).getStress()
+        return stress
+
+    cpdef double getTangent(self):
+        cdef Py_ssize_t i
+        cdef double tangent = 0.0
+        for i in range(self.n):
+            tangent += self.factors[i] * (<CUniaxialMaterial> self.materials[i]).getTangent()
+        return tangent
+
+    def getState(self) -> tuple:
+        return (self.Cstrain, tuple(m.getState() for m in self.materials))
+
+    def setState(self, tuple state):
+        self.Cstrain = self.Tstrain = state[0]
+        for m, s in zip(self.materials, state[1]):
+            m.setState(s)
@@ -0,0 +1,22 @@
+from ..CUniaxialMaterial cimport CUniaxialMaterial
+
+
+cdef class Series(CUniaxialMaterial):
+    cdef public tuple tags
+    # 组成材料
+    cdef list materials
+    cdef Py_ssize_t n
+    # 材料参数
+    cdef int maxIter
+    cdef double relTol
+    # 历史状态变量
+    cdef double Cstrain, Tstrain, Cstress, Tstress, Ctangent, Ttangent
+    # 各组成材料的应变、切线刚度及迭代用的临时数组
+    cdef double* Cstrain_i
+    cdef double* Tstrain_i
+    cdef double* Ctangent_i
+    cdef double* Ttangent_i
+    cdef double* stress_i
+    cdef double* flex_i
+
+    cdef double _flexibility(self, double* tangent_i)
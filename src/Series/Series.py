@@ -0,0 +1,123 @@
+import sys
+from ..UniaxialMaterial import UniaxialMaterial
+
+
+class Series(UniaxialMaterial):
+    
+    def __init__(self,
+            tag: int,
+            *tags: int,
+            maxIter: int=10,
+            relTol: float=1e-8,
+        ):
+        """串联材料，各组成材料应力相同，应变之和等于总应变
+
+        每步以上一收敛步的应变分配为初值，按各组成材料的柔度分配应变增量，
+        再对各组成材料的应变进行局部Newton迭代，直至各组成材料的应力一致。
+
+        Args:
+            tag (int): 独立的材料编号
+            *tags (int): 组成材料的编号
+            maxIter (int, optional): 局部Newton迭代的最大次数，默认10
+            relTol (float, optional): 应力一致性的相对容差，默认1e-8
+        """
+        self.tag = tag
+        self.tags = tags
+        # Materail parameters
+        self.maxIter = maxIter
+        self.relTol = relTol
+        # Response history
+        self.Cstrain: float  # 上一步的应变
+        self.Tstrain: float  # 当前步的应变
+        self.Cstress: float  # 上一步的应力
+        self.Tstress: float # 当前步的应力
+        self.Ctangent: float  # 上一步的切线刚度
+        self.Ttangent: float  # 当前步的切线刚度
+        self.Cstrain_i: list[float]  # 各组成材料上一步的应变
+        self.Tstrain_i: list[float]  # 各组成材料当前步的应变
+        self.Ctangent_i: list[float]  # 各组成材料上一步的切线刚度
+        self.Ttangent_i: list[float]  # 各组成材料当前步的切线刚度
+        self._check_paras()
+        self._init_paras()
+
+    def _check_paras(self):
+        if len(self.tags) == 0:
+            raise ValueError('At least one material should be given')
+        if self.maxIter <= 0:
+            raise ValueError(f'maxIter should be positive, but got {self.maxIter}')
+        if self.relTol <= 0:
+            raise ValueError(f'relTol should be positive, but got {self.relTol}')
+
+    def _init_paras(self):
+        self.materials: list[UniaxialMaterial] = [UniaxialMaterial.getUniaxialMaterial(tag) for tag in self.tags]
+        n = len(self.materials)
+        self.Cstrain = 0
+        self.Tstrain = 0
+        self.Cstress = 0
+        self.Tstress = 0
+        self.Cstrain_i = [0.0] * n
+        self.Tstrain_i = [0.0] * n
+        self.Ctangent_i = [m.getTangent() for m in self.materials]
+        self.Ttangent_i = list(self.Ctangent_i)
+        self.Ctangent = self._series_tangent(self.Ctangent_i)
+        self.Ttangent = self.Ctangent
+
+    @staticmethod
+    def _flexibility(tangent_i: list[float]) -> list[float]:
+        """各组成材料的柔度(切线刚度接近0时取一个很小的值，避免除零)"""
+        k_min = max(max(abs(k) for k in tangent_i) * 1e-12, 1e-100)
+        return [1.0 / k if abs(k) > k_min else 1.0 / k_min for k in tangent_i]
+
+    @classmethod
+    def _series_tangent(cls, tangent_i: list[float]) -> float:
+        return 1.0 / sum(cls._flexibility(tangent_i))
+
+    def setTrialStrain(self, strain, strainRate=0):
+        """传入当前步的应变值strain"""
+        self.Tstrain = strain
+        dStrain = strain - self.Cstrain
+        # 以上一收敛步的应变分配为初值，按柔度分配应变增量
+        flex = self._flexibility(self.Ctangent_i)
+        sum_flex = sum(flex)
+        strain_i = [e + dStrain * f / sum_flex for e, f in zip(self.Cstrain_i, flex)]
+        for it in range(self.maxIter + 1):
+            stress_i = []
+            tangent_i = []
+            for material, e, Ce in zip(self.materials, strain_i, self.Cstrain_i):
+                rate = strainRate * (e - Ce) / dStrain if dStrain != 0 else 0.0
+                material.setTrialStrain(e, rate)
+                stress_i.append(material.getStress())
+                tangent_i.append(material.getTangent())
+            flex = self._flexibility(tangent_i)
+            sum_flex = sum(flex)
+            # 满足变形协调条件的共同应力
+            residual = strain - sum(strain_i)
+            stress = (residual + sum(s * f for s, f in zip(stress_i, flex))) / sum_flex
+            err = max(abs(s - stress) for s in stress_i)
+            if err <= self.relTol * max(abs(stress), sys.float_info.epsilon) or it == self.maxIter:
+                break
+            # Newton修正各组成材料的应变
+            strain_i = [e + (stress - s) * f for e, s, f in zip(strain_i, stress_i, flex)]
+        self.Tstrain_i = strain_i
+        self.Ttangent_i = tangent_i
+        self.Tstress = stress
+        self.Ttangent = 1.0 / sum_flex
+
+    def commitState(self):
+        self.Cstrain = self.Tstrain
+        self.Cstress = self.Tstress
+        self.Ctangent = self.Ttangent
+        self.Cstrain_i = list(self.Tstrain_i)
+        self.Ctangent_i = list(self.Ttangent_i)
+        for material in self.materials:
+            material.commitState()
+
+    def getStrain(self):
+        return self.Tstrain
+
+    def getStress(self):
+        return self.Tstress
+
+    def getTangent(self):
+        return self.Ttangent
+
@@ -0,0 +1,151 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, freethreading_compatible=True
+from libc.math cimport fabs, fmax
+from libc.float cimport DBL_EPSILON
+from libc.stdlib cimport malloc, free
+from ..CUniaxialMaterial import getUniaxialMaterial
+
+
+cdef class Series(CUniaxialMaterial):
+    """
+    Series material (Cython version)
+
+    组成材料须为扩展材料(CUniaxialMaterial的子类)，局部Newton迭代全部在C层完成。
+    """
+
+    def __init__(self, int tag, *tags, int maxIter=10, double relTol=1e-8):
+        cdef Py_ssize_t i
+        if len(tags) == 0:
+            raise ValueError('At least one material should be given')
+        if maxIter <= 0:
+            raise ValueError(f'maxIter should be positive, but got {maxIter}')
+        if relTol <= 0:
+            raise ValueError(f'relTol should be positive, but got {relTol}')
+        self.tags = tuple(tags)
+        self.n = len(tags)
+        self.maxIter = maxIter
+        self.relTol = relTol
+        self.materials = []
+        for t in tags:
+            material = getUniaxialMaterial(t)
+            if not isinstance(material, CUniaxialMaterial):
+                raise TypeError(f'Material {t} is not an extension material')
+            self.materials.append(material)
+        self.Cstrain_i = <double*> malloc(self.n * sizeof(double))
+        self.Tstrain_i = <double*> malloc(self.n * sizeof(double))
+        self.Ctangent_i = <double*> malloc(self.n * sizeof(double))
+        self.Ttangent_i = <double*> malloc(self.n * sizeof(double))
+        self.stress_i = <double*> malloc(self.n * sizeof(double))
+        self.flex_i = <double*> malloc(self.n * sizeof(double))
+        if (self.Cstrain_i == NULL or self.Tstrain_i == NULL or self.Ctangent_i == NULL
+                or self.Ttangent_i == NULL or self.stress_i == NULL or self.flex_i == NULL):
+            raise MemoryError()
+        self.Cstrain = 0.0
+        self.Tstrain = 0.0
+        self.Cstress = 0.0
+        self.Tstress = 0.0
+        for i in range(self.n):
+            self.Cstrain_i[i] = 0.0
+            self.Tstrain_i[i] = 0.0
+            self.Ctangent_i[i] = (<CUniaxialMaterial> self.materials[i]).getTangent()
+            self.Ttangent_i[i] = self.Ctangent_i[i]
+        self.Ctangent = 1.0 / self._flexibility(self.Ctangent_i)
+        self.Ttangent = self.Ctangent
+
+    def __dealloc__(self):
+        free(self.Cstrain_i)
+        free(self.Tstrain_i)
+        free(self.Ctangent_i)
+        free(self.Ttangent_i)
+        free(self.stress_i)
+        free(self.flex_i)
+
+    cdef double _flexibility(self, double* tangent_i):
+        # 计算各组成材料的柔度并存入flex_i，返回总柔度(切线刚度接近0时取一个很小的值，避免除零)
+        cdef Py_ssize_t i
+        cdef double k_min = 0.0, sum_flex = 0.0
+        for i in range(self.n):
+            k_min = fmax(k_min, fabs(tangent_i[i]))
+        k_min = fmax(k_min * 1e-12, 1e-100)
+        for i in range(self.n):
+            if fabs(tangent_i[i]) > k_min:
+                self.flex_i[i] = 1.0 / tangent_i[i]
+            else:
+                self.flex_i[i] = 1.0 / k_min
+            sum_flex += self.flex_i[i]
+        return sum_flex
+
+    cpdef void setTrialStrain(self, double strain, double strainRate=0):
+        cdef Py_ssize_t i
+        cdef int it
+        cdef double dStrain, sum_flex, residual, stress, err, rate
+        cdef CUniaxialMaterial material
+        self.Tstrain = strain
+        dStrain = strain - self.Cstrain
+        # 以上一收敛步的应变分配为初值，按柔度分配应变增量
+        sum_flex = self._flexibility(self.Ctangent_i)
+        for i in range(self.n):
+            self.Tstrain_i[i] = self.Cstrain_i[i] + dStrain * self.flex_i[i] / sum_flex
+        for it in range(self.maxIter + 1):
+            residual = strain
+            for i in range(self.n):
+                material = <CUniaxialMaterial> self.materials[i]
+                rate = strainRate * (self.Tstrain_i[i] - self.Cstrain_i[i]) / dStrain if dStrain != 0 else 0.0
+                material.setTrialStrain(self.Tstrain_i[i], rate)
+                self.stress_i[i] = material.getStress()
+                self.Ttangent_i[i] = material.getTangent()
+                residual -= self.Tstrain_i[i]
+            sum_flex = self._flexibility(self.Ttangent_i)
+            # 满足变形协调条件的共同应力
+            stress = residual
+            for i in range(self.n):
+                stress += self.stress_i[i] * self.flex_i[i]
+            stress /= sum_flex
+            err = 0.0
+            for i in range(self.n):
+                err = fmax(err, fabs(self.stress_i[i] - stress))
+            if err <= self.relTol * fmax(fabs(stress), DBL_EPSILON) or it == self.maxIter:
+                break
+            # Newton修正各组成材料的应变
+            for i in range(self.n):
+                self.Tstrain_i[i] += (stress - self.stress_i[i]) * self.flex_i[i]
+        self.Tstress = stress
+        self.Ttangent = 1.0 / sum_flex
+
+    cpdef void commitState(self):
+        cdef Py_ssize_t i
+        self.Cstrain = self.Tstrain
+        self.Cstress = self.Tstress
+        self.Ctangent = self.Ttangent
+        for i in range(self.n):
+            self.Cstrain_i[i] = self.Tstrain_i[i]
+            self.Ctangent_i[i] = self.Ttangent_i[i]
+            (<CUniaxialMaterial> self.materials[i]).commitState()
+
+    cpdef double getStrain(self):
+        return self.Tstrain
+
+    cpdef double getStress(self):
+        return self.Tstress
+
+    cpdef double getTangent(self):
+        return self.Ttangent
+
+    def getState(self) -> tuple:
+        cdef Py_ssize_t i
+        return (
+            self.Cstrain, self.Cstress, self.Ctangent,
+            tuple(self.Cstrain_i[i] for i in range(self.n)),
+            tuple(self.Ctangent_i[i] for i in range(self.n)),
+            tuple(m.getState() for m in self.materials),
+        )
+
+    def setState(self, tuple state):
+        cdef Py_ssize_t i
+        self.Cstrain = self.Tstrain = state[0]
+        self.Cstress = self.Tstress = state[1]
+        self.Ctangent = self.Ttangent = state[2]
+        for i in range(self.n):
+            self.Cstrain_i[i] = self.Tstrain_i[i] = state[3][i]
+            self.Ctangent_i[i] = self.Ttangent_i[i] = state[4][i]
+        for m, s in zip(self.materials, state[5]):
+            m.setState(s)
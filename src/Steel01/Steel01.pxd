@@ -0,0 +1,13 @@
+from ..CUniaxialMaterial cimport CUniaxialMaterial
+
+
+cdef class Steel01Material(CUniaxialMaterial):
+    # 材料参数（均用 double）
+    cdef double Fy, k, b
+    # 计算变量
+    cdef double uy
+    # 历史状态变量
+    cdef double Cstrain, Tstrain, Ctangent, Ttangent, Cstress, Tstress
+
+    cdef void _check_paras(self)
+    cdef void _init_paras(self)
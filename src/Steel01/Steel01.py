@@ -1,7 +1,4 @@
-import math
 import sys
-import numpy as np
-import matplotlib.pyplot as plt
 from ..UniaxialMaterial import UniaxialMaterial
 
 
@@ -46,7 +43,7 @@ class Steel01Material(UniaxialMaterial):
         self.Tstrain = strain
         dStrain = strain - self.Cstrain
         if abs(dStrain) > sys.float_info.epsilon:
-            f = self.Tstress + dStrain * self.k
+            f = self.Cstress + dStrain * self.k
             if f > self.b * self.k * (self.Tstrain - self.uy) + self.Fy:
                 f = self.b * self.k * (self.Tstrain - self.uy) + self.Fy
             elif f < self.b * self.k * (self.Tstrain + self.uy) - self.Fy:
@@ -1,16 +1,9 @@
-# cython: language_level=3, boundscheck=False, wraparound=False
+# cython: language_level=3, boundscheck=False, wraparound=False, freethreading_compatible=True
 from libc.math cimport fabs
 from libc.float cimport DBL_EPSILON
 
 
-cdef class Steel01Material:
-    cdef public int tag
-    # 材料参数（均用 double）
-    cdef double Fy, k, b
-    # 计算变量
-    cdef double uy
-    # 历史状态变量
-    cdef double Cstrain, Tstrain, Ctangent, Ttangent, Cstress, Tstress
+cdef class Steel01Material(CUniaxialMaterial):
 
     def __cinit__(self,
                  int tag,
@@ -40,7 +33,7 @@ cdef class Steel01Material:
         self.Ttangent = 0.0
         self.uy = self.Fy / self.k
 
-    cpdef setTrialStrain(self, double strain, double strainRate=0):
+    cpdef void setTrialStrain(self, double strain, double strainRate=0):
         cdef double dStrain, f
         self.Tstrain = strain
         dStrain = strain - self.Cstrain
@@ -56,7 +49,7 @@ cdef class Steel01Material:
             self.Tstress = self.Cstress
             self.Ttangent = self.Ctangent
 
-    cpdef commitState(self):
+    cpdef void commitState(self):
         self.Cstrain = self.Tstrain
         self.Cstress = self.Tstress
         self.Ctangent = self.Ttangent
@@ -69,3 +62,11 @@ cdef class Steel01Material:
 
     cpdef double getTangent(self):
         return self.Ttangent
+
+    def getState(self) -> tuple:
+        return (self.Cstrain, self.Cstress, self.Ctangent)
+
+    def setState(self, tuple state):
+        self.Cstrain = self.Tstrain = state[0]
+        self.Cstress = self.Tstress = state[1]
+        self.Ctangent = self.Ttangent = state[2]
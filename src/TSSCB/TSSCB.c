@@ -1,4 +1,4 @@
-/* Generated by Cython 3.2.4 */
+/* Generated by Cython 3.3.0 */
 
 /* BEGIN: Cython Metadata
 {
@@ -32,11 +32,13 @@ END: Cython Metadata */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
-#elif PY_VERSION_HEX < 0x03080000
-    #error Cython requires Python 3.8+.
+#elif PY_VERSION_HEX < 0x03090000
+    #error Cython requires Python 3.9+.
+#elif defined(Py_LIMITED_API) && (Py_LIMITED_API & 0xFFFF0000) > (PY_VERSION_HEX & 0xFFFF0000)
+    #error 'Py_LIMITED_API' can only select past Python X.Y versions, not future ones.
 #else
-#define __PYX_ABI_VERSION "3_2_4"
-#define CYTHON_HEX_VERSION 0x030204F0
+#define __PYX_ABI_VERSION "3_3_0"
+#define CYTHON_HEX_VERSION 0x030300F0
 #define CYTHON_FUTURE_DIVISION 1
 /* CModulePreamble */
 #include <stddef.h>
@@ -54,6 +56,11 @@ END: Cython Metadata */
     #define __fastcall
   #endif
 #endif
+#ifdef __has_builtin
+  #define __Pyx_has_cbuiltin(name) __has_builtin(name)
+#else
+  #define __Pyx_has_cbuiltin(name) (0)
+#endif
 #ifndef DL_IMPORT
   #define DL_IMPORT(t) t
 #endif
@@ -68,32 +75,49 @@ END: Cython Metadata */
   #define Py_HUGE_VAL HUGE_VAL
 #endif
 #define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
-#if defined(GRAALVM_PYTHON)
-  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
-     The existence of this section does not imply that anything works or is even tested */
+#if defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+    #if Py_LIMITED_API < 0x03090000
+      #error "Cython 3.3 requires the Python Limited API version to be 3.9 or greater."
+    #endif
+  #endif
+  #if defined(GRAALVM_PYTHON) || defined(PYPY_VERSION)
+    #ifdef _MSC_VER
+      #pragma message ("Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work.")
+    #else
+      #warning "Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work."
+    #endif
+  #endif
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
-  #define CYTHON_COMPILING_IN_LIMITED_API 0
-  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
   #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_TYPE_SPECS
-  #define CYTHON_USE_TYPE_SPECS 0
+  #define CYTHON_USE_TYPE_SPECS 1
   #undef CYTHON_USE_PYTYPE_LOOKUP
   #define CYTHON_USE_PYTYPE_LOOKUP 0
   #undef CYTHON_USE_PYLIST_INTERNALS
   #define CYTHON_USE_PYLIST_INTERNALS 0
   #undef CYTHON_USE_UNICODE_INTERNALS
   #define CYTHON_USE_UNICODE_INTERNALS 0
-  #undef CYTHON_USE_UNICODE_WRITER
-  #define CYTHON_USE_UNICODE_WRITER 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
   #undef CYTHON_USE_PYLONG_INTERNALS
   #define CYTHON_USE_PYLONG_INTERNALS 0
-  #undef CYTHON_AVOID_BORROWED_REFS
-  #define CYTHON_AVOID_BORROWED_REFS 1
-  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
-  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
   #undef CYTHON_ASSUME_SAFE_MACROS
   #define CYTHON_ASSUME_SAFE_MACROS 0
   #undef CYTHON_ASSUME_SAFE_SIZE
@@ -104,45 +128,62 @@ END: Cython Metadata */
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_GIL
   #define CYTHON_FAST_GIL 0
-  #undef CYTHON_METH_FASTCALL
-  #define CYTHON_METH_FASTCALL 0
-  #undef CYTHON_FAST_PYCALL
-  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_VECTORCALL
+  #define CYTHON_VECTORCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+  #ifndef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW (CYTHON_VECTORCALL && __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #endif
   #ifndef CYTHON_PEP487_INIT_SUBCLASS
     #define CYTHON_PEP487_INIT_SUBCLASS 1
   #endif
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
-  #undef CYTHON_USE_MODULE_STATE
-  #define CYTHON_USE_MODULE_STATE 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
   #undef CYTHON_USE_SYS_MONITORING
   #define CYTHON_USE_SYS_MONITORING 0
-  #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
-  #undef CYTHON_USE_AM_SEND
-  #define CYTHON_USE_AM_SEND 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (__PYX_LIMITED_VERSION_HEX >= 0x030F0000 && PY_VERSION_HEX > 0x030F00A8)
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+  #endif
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
-  #define CYTHON_USE_EXC_INFO_STACK 1
+  #define CYTHON_USE_EXC_INFO_STACK 0
   #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
     #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
   #endif
-  #undef CYTHON_USE_FREELISTS
-  #define CYTHON_USE_FREELISTS 0
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 1
+  #endif
   #undef CYTHON_IMMORTAL_CONSTANTS
   #define CYTHON_IMMORTAL_CONSTANTS 0
-#elif defined(PYPY_VERSION)
-  #define CYTHON_COMPILING_IN_PYPY 1
+  #if __PYX_LIMITED_VERSION_HEX < 0x030E0000
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+  #elif !defined(CYTHON_OPAQUE_OBJECTS)
+  #define CYTHON_OPAQUE_OBJECTS (__PYX_LIMITED_VERSION_HEX >= 0x030F0000)
+  #endif
+#elif defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
   #define CYTHON_COMPILING_IN_LIMITED_API 0
-  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
   #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
-  #undef CYTHON_USE_TYPE_SLOTS
-  #define CYTHON_USE_TYPE_SLOTS 1
-  #ifndef CYTHON_USE_TYPE_SPECS
-    #define CYTHON_USE_TYPE_SPECS 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 0
   #endif
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
   #define CYTHON_USE_PYTYPE_LOOKUP 0
   #undef CYTHON_USE_PYLIST_INTERNALS
@@ -156,125 +197,131 @@ END: Cython Metadata */
   #undef CYTHON_AVOID_BORROWED_REFS
   #define CYTHON_AVOID_BORROWED_REFS 1
   #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
-  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
   #undef CYTHON_ASSUME_SAFE_MACROS
   #define CYTHON_ASSUME_SAFE_MACROS 0
-  #ifndef CYTHON_ASSUME_SAFE_SIZE
-    #define CYTHON_ASSUME_SAFE_SIZE 1
-  #endif
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
   #undef CYTHON_UNPACK_METHODS
   #define CYTHON_UNPACK_METHODS 0
   #undef CYTHON_FAST_THREAD_STATE
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_GIL
   #define CYTHON_FAST_GIL 0
-  #undef CYTHON_METH_FASTCALL
-  #define CYTHON_METH_FASTCALL 0
-  #undef CYTHON_FAST_PYCALL
-  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
   #ifndef CYTHON_PEP487_INIT_SUBCLASS
     #define CYTHON_PEP487_INIT_SUBCLASS 1
   #endif
-  #if PY_VERSION_HEX < 0x03090000
-    #undef CYTHON_PEP489_MULTI_PHASE_INIT
-    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
-  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
-    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
-  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
   #undef CYTHON_USE_MODULE_STATE
   #define CYTHON_USE_MODULE_STATE 0
   #undef CYTHON_USE_SYS_MONITORING
   #define CYTHON_USE_SYS_MONITORING 0
-  #ifndef CYTHON_USE_TP_FINALIZE
-    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
-  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
   #undef CYTHON_USE_AM_SEND
   #define CYTHON_USE_AM_SEND 0
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
-  #define CYTHON_USE_EXC_INFO_STACK 0
+  #define CYTHON_USE_EXC_INFO_STACK 1
   #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
-    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
   #endif
   #undef CYTHON_USE_FREELISTS
   #define CYTHON_USE_FREELISTS 0
   #undef CYTHON_IMMORTAL_CONSTANTS
   #define CYTHON_IMMORTAL_CONSTANTS 0
-#elif defined(CYTHON_LIMITED_API)
-  #ifdef Py_LIMITED_API
-    #undef __PYX_LIMITED_VERSION_HEX
-    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
-  #endif
-  #define CYTHON_COMPILING_IN_PYPY 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
-  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
   #define CYTHON_COMPILING_IN_GRAAL 0
   #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
   #undef CYTHON_USE_TYPE_SLOTS
-  #define CYTHON_USE_TYPE_SLOTS 0
-  #undef CYTHON_USE_TYPE_SPECS
-  #define CYTHON_USE_TYPE_SPECS 1
+  #define CYTHON_USE_TYPE_SLOTS 1
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
   #undef CYTHON_USE_PYTYPE_LOOKUP
   #define CYTHON_USE_PYTYPE_LOOKUP 0
   #undef CYTHON_USE_PYLIST_INTERNALS
   #define CYTHON_USE_PYLIST_INTERNALS 0
   #undef CYTHON_USE_UNICODE_INTERNALS
   #define CYTHON_USE_UNICODE_INTERNALS 0
-  #ifndef CYTHON_USE_UNICODE_WRITER
-    #define CYTHON_USE_UNICODE_WRITER 0
-  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
   #undef CYTHON_USE_PYLONG_INTERNALS
   #define CYTHON_USE_PYLONG_INTERNALS 0
-  #ifndef CYTHON_AVOID_BORROWED_REFS
-    #define CYTHON_AVOID_BORROWED_REFS 0
-  #endif
-  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
-    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
-  #endif
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
   #undef CYTHON_ASSUME_SAFE_MACROS
   #define CYTHON_ASSUME_SAFE_MACROS 0
-  #undef CYTHON_ASSUME_SAFE_SIZE
-  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
   #undef CYTHON_UNPACK_METHODS
   #define CYTHON_UNPACK_METHODS 0
   #undef CYTHON_FAST_THREAD_STATE
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_GIL
   #define CYTHON_FAST_GIL 0
-  #undef CYTHON_METH_FASTCALL
-  #define CYTHON_METH_FASTCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
-  #undef CYTHON_FAST_PYCALL
-  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW (PYPY_VERSION_NUM >= 0x07030800 && CYTHON_VECTORCALL)
+  #endif
   #ifndef CYTHON_PEP487_INIT_SUBCLASS
     #define CYTHON_PEP487_INIT_SUBCLASS 1
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
     #define CYTHON_PEP489_MULTI_PHASE_INIT 1
   #endif
-  #ifndef CYTHON_USE_MODULE_STATE
-    #define CYTHON_USE_MODULE_STATE 0
-  #endif
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
   #undef CYTHON_USE_SYS_MONITORING
   #define CYTHON_USE_SYS_MONITORING 0
   #ifndef CYTHON_USE_TP_FINALIZE
-    #define CYTHON_USE_TP_FINALIZE 0
-  #endif
-  #ifndef CYTHON_USE_AM_SEND
-    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
   #endif
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
   #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
-    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
   #endif
-  #ifndef CYTHON_USE_FREELISTS
-  #define CYTHON_USE_FREELISTS 1
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
   #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
   #undef CYTHON_IMMORTAL_CONSTANTS
   #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
@@ -342,11 +389,14 @@ END: Cython Metadata */
   #elif !defined(CYTHON_FAST_GIL)
     #define CYTHON_FAST_GIL (PY_VERSION_HEX < 0x030C00A6)
   #endif
-  #ifndef CYTHON_METH_FASTCALL
-    #define CYTHON_METH_FASTCALL 1
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
   #endif
-  #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
   #endif
   #ifndef CYTHON_PEP487_INIT_SUBCLASS
     #define CYTHON_PEP487_INIT_SUBCLASS 1
@@ -378,6 +428,9 @@ END: Cython Metadata */
   #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
     #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
   #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR (PY_VERSION_HEX < 0x030C00B2)
+  #endif
   #ifndef CYTHON_USE_FREELISTS
     #define CYTHON_USE_FREELISTS (!CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
   #endif
@@ -387,19 +440,9 @@ END: Cython Metadata */
   #elif !defined(CYTHON_IMMORTAL_CONSTANTS)
     #define CYTHON_IMMORTAL_CONSTANTS (PY_VERSION_HEX >= 0x030C0000 && !CYTHON_USE_MODULE_STATE && CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
   #endif
-#endif
-#ifndef CYTHON_COMPRESS_STRINGS
-  #define CYTHON_COMPRESS_STRINGS 1
-#endif
-#ifndef CYTHON_FAST_PYCCALL
-#define CYTHON_FAST_PYCCALL  CYTHON_FAST_PYCALL
-#endif
-#ifndef CYTHON_VECTORCALL
-#if CYTHON_COMPILING_IN_LIMITED_API
-#define CYTHON_VECTORCALL  (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
-#else
-#define CYTHON_VECTORCALL  (CYTHON_FAST_PYCCALL)
-#endif
+  #ifndef CYTHON_OPAQUE_OBJECTS
+    #define CYTHON_OPAQUE_OBJECTS 0
+  #endif
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
   #undef SHIFT
@@ -435,6 +478,8 @@ END: Cython Metadata */
         #define CYTHON_UNUSED [[maybe_unused]]
       #endif
     #endif
+  #elif defined(__STDC_VERSION__) && __STDC_VERSION__ >= 202311L
+    #define CYTHON_UNUSED [[maybe_unused]]
   #endif
 #endif
 #ifndef CYTHON_UNUSED
@@ -509,8 +554,19 @@ typedef uintptr_t  __pyx_uintptr_t;
     #endif
   #endif
 #endif
+#ifdef Py_UNREACHABLE
+  #define __Pyx_UNREACHABLE() Py_UNREACHABLE()
+#elif __Pyx_has_cbuiltin(__builtin_unreachable)
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(__clang__) || defined(__INTEL_COMPILER) || (defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 5)))
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(_MSC_VER)
+  #define __Pyx_UNREACHABLE() __assume(0)
+#else
+  #define __Pyx_UNREACHABLE() Py_FatalError("Unreachable C code path reached")
+#endif
 #ifndef Py_UNREACHABLE
-  #define Py_UNREACHABLE()  assert(0); abort()
+  #define Py_UNREACHABLE() __Pyx_UNREACHABLE()
 #endif
 #ifdef __cplusplus
   template <typename T>
@@ -522,9 +578,16 @@ typedef uintptr_t  __pyx_uintptr_t;
 #if CYTHON_COMPILING_IN_PYPY == 1
   #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x030A0000)
 #else
-  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x03090000)
+  #define __PYX_NEED_TP_PRINT_SLOT  0
 #endif
 #define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+#define __Pyx_PyErr_FetchException(petype, peval, petb) PyErr_Fetch(petype, peval, petb)
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_Restore(etype, eval, etb)
+#else
+#define __Pyx_PyErr_FetchException(petype, peval, petb) *(petype)=NULL; *(peval)=PyErr_GetRaisedException(); *(petb)=NULL
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_SetRaisedException(eval)
+#endif
 
 /* CInitCode */
 #ifndef CYTHON_INLINE
@@ -577,11 +640,6 @@ typedef uintptr_t  __pyx_uintptr_t;
     #endif
 #endif
 static int __Pyx_init_co_variables(void);
-#if PY_VERSION_HEX >= 0x030900A4 || defined(Py_IS_TYPE)
-  #define __Pyx_IS_TYPE(ob, type) Py_IS_TYPE(ob, type)
-#else
-  #define __Pyx_IS_TYPE(ob, type) (((const PyObject*)ob)->ob_type == (type))
-#endif
 #if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
   #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
 #else
@@ -603,28 +661,27 @@ static int __Pyx_init_co_variables(void);
   #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
 #endif
 #define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
-#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
-  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
-#else
+#if CYTHON_COMPILING_IN_PYPY
   #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
 #endif
-#ifndef Py_TPFLAGS_CHECKTYPES
-  #define Py_TPFLAGS_CHECKTYPES 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_INDEX
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#if CYTHON_COMPILING_IN_LIMITED_API
+static unsigned long __Pyx_Runtime_TPFLAGS_SEQUENCE;
+static unsigned long __Pyx_Runtime_TPFLAGS_MAPPING;
+#else
+#define __Pyx_Runtime_TPFLAGS_SEQUENCE Py_TPFLAGS_SEQUENCE
+#define __Pyx_Runtime_TPFLAGS_MAPPING Py_TPFLAGS_MAPPING
 #endif
+static int __Pyx_init_tpflags_variables(void);
 #ifndef Py_TPFLAGS_HAVE_FINALIZE
   #define Py_TPFLAGS_HAVE_FINALIZE 0
 #endif
 #ifndef Py_TPFLAGS_SEQUENCE
-  #define Py_TPFLAGS_SEQUENCE 0
+  #define Py_TPFLAGS_SEQUENCE (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 5)
 #endif
 #ifndef Py_TPFLAGS_MAPPING
-  #define Py_TPFLAGS_MAPPING 0
+  #define Py_TPFLAGS_MAPPING (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 6)
 #endif
 #ifndef Py_TPFLAGS_IMMUTABLETYPE
   #define Py_TPFLAGS_IMMUTABLETYPE (1UL << 8)
@@ -635,7 +692,7 @@ static int __Pyx_init_co_variables(void);
 #ifndef METH_STACKLESS
   #define METH_STACKLESS 0
 #endif
-#ifndef METH_FASTCALL
+#if !defined(METH_FASTCALL) || CYTHON_COMPILING_IN_PYPY
   #ifndef METH_FASTCALL
      #define METH_FASTCALL 0x80
   #endif
@@ -651,7 +708,7 @@ static int __Pyx_init_co_variables(void);
   #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
   #endif
 #endif
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
   #define __Pyx_METH_FASTCALL METH_FASTCALL
   #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
   #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
@@ -668,11 +725,7 @@ static int __Pyx_init_co_variables(void);
   #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
   #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
 #endif
-#if PY_VERSION_HEX >= 0x030900B1
-#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_CheckExact(func)
-#else
-#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_Check(func)
-#endif
+#define __Pyx_PyCFunction_CheckExact(func) PyCFunction_CheckExact(func)
 #define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
 #if CYTHON_COMPILING_IN_CPYTHON
 #define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
@@ -693,11 +746,14 @@ static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(vo
 #endif
 }
 #define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
-#if PY_VERSION_HEX < 0x03090000 || (CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000)
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
   #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
-  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
 #else
   #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
   #define __Pyx_PyCMethod  PyCMethod
 #endif
 #ifndef METH_METHOD
@@ -729,6 +785,15 @@ static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(vo
 #else
   #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
 #endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_SHARED_SIZEOF(T) -((int)sizeof(T))
+    #define __PYX_SHARED_RELATIVE_OFFSET Py_RELATIVE_OFFSET
+    #define CYTHON_OPAQUE_SHARED_TYPES 1
+#else
+    #define __PYX_SHARED_SIZEOF(T) sizeof(T)
+    #define __PYX_SHARED_RELATIVE_OFFSET 0
+    #define CYTHON_OPAQUE_SHARED_TYPES 0
+#endif
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
 {
@@ -771,7 +836,9 @@ static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
 #define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
 static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
     PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
-    if (res == NULL) PyErr_Clear();
+    if (res == NULL && PyErr_Occurred()) {
+        PyErr_WriteUnraisable(NULL);
+    }
     return res;
 }
 #elif !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
@@ -818,6 +885,7 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
   #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_KIND_04(u)      __Pyx_PyUnicode_KIND(u)
   #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
   #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
   #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
@@ -837,12 +905,15 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
   #if PY_VERSION_HEX >= 0x030C0000
     #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
   #else
-    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #if CYTHON_COMPILING_IN_CPYTHON
     #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
     #else
     #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
     #endif
   #endif
+  static CYTHON_INLINE int __Pyx_PyUnicode_KIND_04(PyObject *o) {
+      return __Pyx_PyUnicode_KIND(o) - (int) !!PyUnicode_IS_ASCII(o);
+  }
 #endif
 #if CYTHON_COMPILING_IN_PYPY
   #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
@@ -877,14 +948,7 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
   #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
 #endif
 #ifndef PySet_CheckExact
-  #define PySet_CheckExact(obj)        __Pyx_IS_TYPE(obj, &PySet_Type)
-#endif
-#if PY_VERSION_HEX >= 0x030900A4
-  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
-  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
-#else
-  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
-  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+  #define PySet_CheckExact(obj)        Py_IS_TYPE(obj, &PySet_Type)
 #endif
 enum __Pyx_ReferenceSharing {
   __Pyx_ReferenceSharing_DefinitelyUnique, // We created it so we know it's unshared - no need to check
@@ -902,28 +966,39 @@ enum __Pyx_ReferenceSharing {
 #else
 #define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)o), ((void)sharing), 0)
 #endif
-#if CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
-  #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-    #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
-  #elif CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+  #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
     #define __Pyx_PyList_GetItemRef(o, i) (likely((i) >= 0) ? PySequence_GetItem(o, i) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
   #else
     #define __Pyx_PyList_GetItemRef(o, i) PySequence_ITEM(o, i)
   #endif
-#elif CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
-  #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-    #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+#elif CYTHON_COMPILING_IN_LIMITED_API || !(CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE)
+  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
+#else
+  #define __Pyx_PyList_GetItemRef(o, i) (likely(__Pyx_is_valid_index(i, PyList_GET_SIZE(o))) ?\
+    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+#endif
+#if CYTHON_AVOID_BORROWED_REFS || CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_PyList_GetItemRef(o, i))
+#elif CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
   #else
-    #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_XNewRef(PyList_GetItem(o, i)) : __Pyx_PyList_GetItemRef(o, i))
   #endif
+#elif CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)))
 #else
-  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_NewRef(PyList_GET_ITEM(o, i))
-#endif
-#if CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS && !CYTHON_COMPILING_IN_LIMITED_API && CYTHON_ASSUME_SAFE_MACROS
-  #define __Pyx_PyList_GetItemRefFast(o, i, unsafe_shared) (__Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
-    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
-#else
-  #define __Pyx_PyList_GetItemRefFast(o, i, unsafe_shared) __Pyx_PyList_GetItemRef(o, i)
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_XNewRef(PyList_GetItem(o, i)))
 #endif
 #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
 #define __Pyx_PyDict_GetItemRef(dict, key, result) PyDict_GetItemRef(dict, key, result)
@@ -973,6 +1048,7 @@ static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key,
   #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
   #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
   #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_GET_SIZE(o)
   #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
   #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
   #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GET_LENGTH(o)
@@ -980,6 +1056,7 @@ static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key,
   #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
   #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
   #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_Size(o)
   #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
   #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
   #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GetLength(o)
@@ -1026,11 +1103,6 @@ static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key,
 #else
     #define __Pyx_TPFLAGS_HAVE_AM_SEND (0)
 #endif
-#if PY_VERSION_HEX >= 0x03090000
-#define __Pyx_PyInterpreterState_Get() PyInterpreterState_Get()
-#else
-#define __Pyx_PyInterpreterState_Get() PyThreadState_Get()->interp
-#endif
 #if CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030A0000
 #ifdef __cplusplus
 extern "C"
@@ -1077,10 +1149,67 @@ static int __Pyx_init_co_variables(void) {
     Py_DECREF(inspect);
     return result ? 0 : -1;
 }
+static int __Pyx_init_tpflags_bitcount(unsigned long flag) {
+    int count = 0;
+    while (flag) {
+        count += (int) (flag & 1);
+        flag >>= 1;
+    }
+    return count;
+}
+static int __Pyx_init_tpflags_variables(void) {
+    if (__Pyx_Runtime_TPFLAGS_SEQUENCE != 0 && __Pyx_Runtime_TPFLAGS_MAPPING != 0) {
+        return 0;
+    }
+    PyObject *collections_abc = PyImport_ImportModule("collections.abc");
+    if (!collections_abc) return -1;
+    int result = 0;
+    PyObject *sequence = NULL, *mapping = NULL;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030D0000
+    if (PyObject_GetOptionalAttrString(collections_abc, "Sequence", &sequence) != 1) goto fail;
+    if (PyObject_GetOptionalAttrString(collections_abc, "Mapping", &mapping) != 1) goto fail;
+#else
+    sequence = PyObject_GetAttrString(collections_abc, "Sequence");
+    if (!sequence) goto fail_attr_lookup;
+    mapping = PyObject_GetAttrString(collections_abc, "Mapping");
+    if (!mapping) goto fail_attr_lookup;
+#endif
+    if (!PyType_Check(sequence) || !PyType_Check(mapping)) goto fail;
+    {
+        unsigned long sequence_flags = PyType_GetFlags((PyTypeObject*)sequence);
+        unsigned long mapping_flags = PyType_GetFlags((PyTypeObject*)mapping);
+        unsigned long mutual_flags = sequence_flags & mapping_flags;
+        sequence_flags = sequence_flags ^ mutual_flags;
+        mapping_flags = mapping_flags ^ mutual_flags;
+        if (__Pyx_Runtime_TPFLAGS_SEQUENCE == 0 && __Pyx_init_tpflags_bitcount(sequence_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_SEQUENCE = sequence_flags;
+        }
+        if (__Pyx_Runtime_TPFLAGS_MAPPING == 0 && __Pyx_init_tpflags_bitcount(mapping_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_MAPPING = mapping_flags;
+        }
+    }
+    cleanup:
+    Py_XDECREF(mapping);
+    Py_XDECREF(sequence);
+    Py_DECREF(collections_abc);
+    return result;
+#if __PYX_LIMITED_VERSION_HEX < 0x030D0000
+    fail_attr_lookup:
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    }
+#endif
+    fail:
+    result = PyErr_Occurred() ? -1 : 0;
+    goto cleanup;
+}
 #else
 static int __Pyx_init_co_variables(void) {
     return 0;  // It's a limited API-only feature
 }
+static int __Pyx_init_tpflags_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
 #endif
 
 /* MathInitCode */
@@ -1130,8 +1259,14 @@ static int __Pyx_init_co_variables(void) {
 #define __PYX_HAVE__src__TSSCB__TSSCB
 #define __PYX_HAVE_API__src__TSSCB__TSSCB
 /* Early includes */
+
+    #ifndef MYOPENSEES_STATS
+    #define MYOPENSEES_STATS 0
+    #endif
+    
 #include <math.h>
 #include <float.h>
+#include <string.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1147,7 +1282,7 @@ static int __Pyx_init_co_variables(void) {
 #define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
 #endif
 #else
-#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_NOT_USED
 #endif
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
 #define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
@@ -1242,6 +1377,7 @@ static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
 static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x);
+#define __Pyx_PyObject_RichCompareBool(a,b,cmp)  __Pyx_PyObject_IsTrueAndDecref(PyObject_RichCompare((a),(b),(cmp)))
 #define __Pyx_PySequence_Tuple(obj)\
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
@@ -1250,9 +1386,11 @@ static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __Pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AS_DOUBLE(x)
+#define __Pyx_PyFloat_IsNonZero(x) (PyFloat_AS_DOUBLE(x) != 0.0)
 #else
 #define __Pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
 #define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_IsNonZero(x) PyObject_IsTrue(x)
 #endif
 #define __Pyx_PyFloat_AsFloat(x) ((float) __Pyx_PyFloat_AsDouble(x))
 #define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
@@ -1264,25 +1402,39 @@ static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
   #ifndef _PyLong_NON_SIZE_BITS
     #define _PyLong_NON_SIZE_BITS 3
   #endif
-  #define __Pyx_PyLong_Sign(x)  (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK)
-  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_Sign(x) & 2) != 0)
+  #define __Pyx_PyLong_SignBits(x)  ((int) (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK))
+  #define __Pyx_PyLong_Sign(x)  (1 - __Pyx_PyLong_SignBits(x))
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_SignBits(x) & 2) != 0)
   #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
-  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_Sign(x) & 1)
-  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_Sign(x) == 0)
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_SignBits(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_SignBits(x) == 0)
   #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
   #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
   #define __Pyx_PyLong_SignedDigitCount(x)\
-        ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+        (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
   #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
     #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
     #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
   #else
     #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
-    #define __Pyx_PyLong_CompactValue(x)  ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+    #define __Pyx_PyLong_CompactValue(x)  (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
   #endif
+  static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_CompareSignAndSize(PyObject *a, PyObject *b) {
+      uintptr_t tag_a = ((PyLongObject*)a)->long_value.lv_tag;
+      uintptr_t tag_b = ((PyLongObject*)b)->long_value.lv_tag;
+      if (tag_a == tag_b) return 0;
+      int sign_a = (int) (tag_a & _PyLong_SIGN_MASK);
+      int sign_b = (int) (tag_b & _PyLong_SIGN_MASK);
+      if (sign_a > sign_b) return -1;
+      if (sign_a < sign_b) return 1;
+      Py_ssize_t size_a = (Py_ssize_t) (tag_a >> _PyLong_NON_SIZE_BITS);
+      Py_ssize_t size_b = (Py_ssize_t) (tag_b >> _PyLong_NON_SIZE_BITS);
+      return (1 - sign_a) * (size_a - size_b);
+  }
   typedef Py_ssize_t  __Pyx_compact_pylong;
   typedef size_t  __Pyx_compact_upylong;
   #else
+  #define __Pyx_PyLong_Sign(x)  ((int) ((Py_SIZE(x) == 0) ? 0 : (Py_SIZE(x) < 0) ? -1 : 1))
   #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
   #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
   #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
@@ -1293,6 +1445,7 @@ static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
   #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
   #define __Pyx_PyLong_CompactValue(x)\
         ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  #define __Pyx_PyLong_CompareSignAndSize(a, b)  (Py_SIZE(a) - Py_SIZE(b))
   typedef sdigit  __Pyx_compact_pylong;
   typedef digit  __Pyx_compact_upylong;
   #endif
@@ -1301,6 +1454,9 @@ static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
   #else
   #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
   #endif
+  #define __Pyx_PyLong_IsNonZero(x)  (!__Pyx_PyLong_IsZero(x))
+#else
+  #define __Pyx_PyLong_IsNonZero(x)  PyObject_IsTrue(x)
 #endif
 #if __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
   #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
@@ -1340,16 +1496,13 @@ static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
 #if !CYTHON_USE_MODULE_STATE
 static PyObject *__pyx_m = NULL;
 #endif
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
 static const char * const __pyx_cfilenm = __FILE__;
-static const char *__pyx_filename;
 
 /* #### Code section: filename_table ### */
 
 static const char* const __pyx_f[] = {
   "src/TSSCB/TSSCB.pyx",
-  "<stringsource>",
+  "(tree fragment)",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* Atomics.proto (used by UnpackUnboundCMethod) */
@@ -1518,7 +1671,7 @@ static const char* const __pyx_f[] = {
 #define __Pyx_END_CRITICAL_SECTION Py_END_CRITICAL_SECTION
 #endif
 
-/* IncludeStructmemberH.proto (used by FixUpExtensionType) */
+/* IncludeStructmemberH.proto (used by CythonFunctionShared) */
 #include <structmember.h>
 
 /* #### Code section: numeric_typedefs ### */
@@ -1526,45 +1679,105 @@ static const char* const __pyx_f[] = {
 /* #### Code section: type_declarations ### */
 
 /*--- Type declarations ---*/
+struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial;
 struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB;
-struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain;
-struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel;
+struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setTrialStrain;
+struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setStrain;
 
-/* "src/TSSCB/TSSCB.pyx":95
- *         self.i = 0
+/* "CUniaxialMaterial.pxd":16
+ *     cdef object __weakref__
  * 
- *     cpdef setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
- *         cdef double dStrain
- *         #
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=*)             # <<<<<<<<<<<<<<
+ *     cpdef void commitState(self)
+ *     cpdef void setStrain(self, double strain, double strainRate=*)
 */
-struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain {
+struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setTrialStrain {
   int __pyx_n;
   double strainRate;
 };
 
-/* "src/TSSCB/TSSCB.pyx":297
- *             self.Tstress4 = self.Tstress3 - F_hardening
+/* "CUniaxialMaterial.pxd":18
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=*)
+ *     cpdef void commitState(self)
+ *     cpdef void setStrain(self, double strain, double strainRate=*)             # <<<<<<<<<<<<<<
+ *     cpdef double getStrain(self)
+ *     cpdef double getStress(self)
+*/
+struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setStrain {
+  int __pyx_n;
+  double strainRate;
+};
+struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel;
+struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain;
+
+/* "src/TSSCB/TSSCB.pxd":5
  * 
- *     cdef double _frictionModel(self, double F0, double du, double half=1.0):             # <<<<<<<<<<<<<<
- *         #
- *         cdef double F_, F
+ * # TSSCB.pyxCOUNTERS
+ * cdef enum:  # TSSCB             # <<<<<<<<<<<<<<
+ *     TSSCB_STAGE_11
+ *     TSSCB_STAGE_12
+*/
+enum  {
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_11,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_12,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_22,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_21,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_FRACTURED,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_FRACTURING,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K2_REVERSE,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K1,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K2,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_ELASTIC,
+  __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_N_COUNTERS
+};
+
+/* "src/TSSCB/TSSCB.pxd":44
+ *     cdef void _init_paras(self)
+ *     cdef void _determineTrialState(self, double dStrain)
+ *     cdef double _frictionModel(self, double F0, double du, double half=*)             # <<<<<<<<<<<<<<
+ *     cdef double _SCModel(self, double u0, double F0, double du)
 */
 struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel {
   int __pyx_n;
   double half;
 };
 
-/* "src/TSSCB/TSSCB.pyx":6
- * 
+/* "src/TSSCB/TSSCB.pyx":84
+ *         self.i = 0
  * 
- * cdef class TSSCB:             # <<<<<<<<<<<<<<
- *     cdef public int tag
- *     #  double
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
+ *         cdef double dStrain
+ *         #
 */
-struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *__pyx_vtab;
-  int tag;
+struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain {
+  int __pyx_n;
+  double strainRate;
+};
+
+/* "CUniaxialMaterial.pxd":12
+ * 
+ * 
+ * cdef class CUniaxialMaterial:             # <<<<<<<<<<<<<<
+ *     cdef public int tag
+ *     cdef object __weakref__
+*/
+struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_3src_17CUniaxialMaterial_CUniaxialMaterial *__pyx_vtab;
+  int tag;
+  PyObject *__weakref__;
+};
+
+
+/* "src/TSSCB/TSSCB.pxd":19
+ * 
+ * 
+ * cdef class TSSCB(CUniaxialMaterial):             # <<<<<<<<<<<<<<
+ *     #  double
+ *     cdef double F1, k0, ugap, F2, k1, k2, beta
+*/
+struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB {
+  struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial __pyx_base;
   double F1;
   double k0;
   double ugap;
@@ -1612,21 +1825,45 @@ struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB {
   double Crp;
   double Trp;
   int i;
+  PY_LONG_LONG counts[__pyx_e_3src_5TSSCB_5TSSCB_TSSCB_N_COUNTERS];
+};
+
+
+
+/* "CUniaxialMaterial.pxd":12
+ * 
+ * 
+ * cdef class CUniaxialMaterial:             # <<<<<<<<<<<<<<
+ *     cdef public int tag
+ *     cdef object __weakref__
+*/
+
+struct __pyx_vtabstruct_3src_17CUniaxialMaterial_CUniaxialMaterial {
+  void (*setTrialStrain)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setTrialStrain *__pyx_optional_args);
+  void (*commitState)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch);
+  void (*setStrain)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setStrain *__pyx_optional_args);
+  double (*getStrain)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch);
+  double (*getStress)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch);
+  double (*getTangent)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch);
 };
+static struct __pyx_vtabstruct_3src_17CUniaxialMaterial_CUniaxialMaterial *__pyx_vtabptr_3src_17CUniaxialMaterial_CUniaxialMaterial;
 
 
+/* "src/TSSCB/TSSCB.pyx":14
+ * 
+ * 
+ * cdef class TSSCB(CUniaxialMaterial):             # <<<<<<<<<<<<<<
+ * 
+ *     def __cinit__(self,
+*/
 
 struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB {
+  struct __pyx_vtabstruct_3src_17CUniaxialMaterial_CUniaxialMaterial __pyx_base;
   void (*_check_paras)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *);
   void (*_init_paras)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *);
-  PyObject *(*setTrialStrain)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain *__pyx_optional_args);
   void (*_determineTrialState)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double);
   double (*_frictionModel)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, double, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel *__pyx_optional_args);
   double (*_SCModel)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, double, double);
-  PyObject *(*commitState)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, int __pyx_skip_dispatch);
-  double (*getStress)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, int __pyx_skip_dispatch);
-  double (*getTangent)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, int __pyx_skip_dispatch);
-  PyObject *(*setStrain)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *__pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB;
 /* #### Code section: utility_code_proto ### */
@@ -1705,22 +1942,119 @@ static struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *__pyx_vtabptr_3src_5TSS
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
-/* TupleAndListFromArray.proto (used by fastcall) */
+/* FastTypeChecks.proto (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+#define __Pyx_PyAnySet_Check(obj)  __Pyx_TypeCheck2(obj, &PySet_Type, &PyFrozenSet_Type)
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyAnySet_Check(obj)  PyAnySet_Check(obj)
+#endif
+
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto (used by GivenExceptionMatches) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* GivenExceptionMatches.proto (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStr.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* CopyObjectArray.proto (used by TupleOrListFromArrayImpl) */
 #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length);
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_METH_FASTCALL
-static CYTHON_INLINE PyObject* __Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+
+/* TupleOrListFromArrayImpl.proto (used by TupleFromArray) */
+#if PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_PyTuple_FromArray(src, n) PyTuple_FromArray(src, ((n)<0) ? 0 : (n))
+#else
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
 #endif
 
-/* IncludeStringH.proto (used by BytesEquals) */
+/* TupleFromArray.proto (used by fastcall) */
+
+
+/* IncludeStringH.proto (used by PyObjectCompare) */
 #include <string.h>
 
-/* BytesEquals.proto (used by UnicodeEquals) */
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+/* PyObjectCompare.proto (used by UnicodeEquals) */
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolEq_str_str(PyObject *op1, PyObject *op2, int pyop);
 
 /* UnicodeEquals.proto (used by fastcall) */
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+#define __Pyx_PyUnicode_Equals(s1, s2)  __Pyx_PyObject_CompareBoolEq_str_str(s1, s2, Py_EQ)
 
 /* fastcall.proto */
 #if CYTHON_AVOID_BORROWED_REFS
@@ -1734,12 +2068,12 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
 #define __Pyx_KwValues_VARARGS(args, nargs) NULL
 #define __Pyx_GetKwValue_VARARGS(kw, kwvalues, s) __Pyx_PyDict_GetItemStrWithError(kw, s)
 #define __Pyx_KwargsAsDict_VARARGS(kw, kwvalues) PyDict_Copy(kw)
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
     #define __Pyx_ArgRef_FASTCALL(args, i) __Pyx_NewRef(args[i])
     #define __Pyx_NumKwargs_FASTCALL(kwds) __Pyx_PyTuple_GET_SIZE(kwds)
     #define __Pyx_KwValues_FASTCALL(args, nargs) ((args) + (nargs))
     static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s);
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL
     CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues);
   #else
     #define __Pyx_KwargsAsDict_FASTCALL(kw, kwvalues) _PyStack_AsDict(kwvalues, kw)
@@ -1751,14 +2085,33 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
     #define __Pyx_GetKwValue_FASTCALL __Pyx_GetKwValue_VARARGS
     #define __Pyx_KwargsAsDict_FASTCALL __Pyx_KwargsAsDict_VARARGS
 #endif
+#if CYTHON_VECTORCALL_TPNEW
+    #if !CYTHON_VECTORCALL
+        #error Enabling CYTHON_VECTORCALL_TPNEW without CYTHON_VECTORCALL is not supported
+    #endif
+    #define __Pyx_ArgRef_FASTCALL_TPNEW __Pyx_ArgRef_FASTCALL
+    #define __Pyx_NumKwargs_FASTCALL_TPNEW __Pyx_NumKwargs_FASTCALL
+    #define __Pyx_KwValues_FASTCALL_TPNEW __Pyx_KwValues_FASTCALL
+    #define __Pyx_GetKwValue_FASTCALL_TPNEW __Pyx_GetKwValue_FASTCALL
+    #define __Pyx_KwargsAsDict_FASTCALL_TPNEW __Pyx_KwargsAsDict_FASTCALL
+#else
+    #define __Pyx_ArgRef_FASTCALL_TPNEW __Pyx_ArgRef_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL_TPNEW __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL_TPNEW __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL_TPNEW __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL_TPNEW __Pyx_KwargsAsDict_VARARGS
+#endif
 #define __Pyx_ArgsSlice_VARARGS(args, start, stop) PyTuple_GetSlice(args, start, stop)
-#if CYTHON_METH_FASTCALL || (CYTHON_COMPILING_IN_CPYTHON && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+#if CYTHON_VECTORCALL
 #define __Pyx_ArgsSlice_FASTCALL(args, start, stop) __Pyx_PyTuple_FromArray(args + start, stop - start)
 #else
-#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#define __Pyx_ArgsSlice_FASTCALL __Pyx_ArgsSlice_VARARGS
 #endif
 
 /* py_dict_items.proto (used by OwnedDictNext) */
+#define __Pyx_PyDict_items_TypePtr  (&PyDictKeys_Type)
+#define __Pyx_PyDict_items_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyDictItems_TypePtr)
+#define __Pyx_PyDict_items_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyDictItems_TypePtr)
 static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d);
 
 /* CallCFunction.proto (used by CallUnboundCMethod0) */
@@ -1785,29 +2138,31 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 
 /* PyObjectFastCall.proto (used by PyObjectCallOneArg) */
 #define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
-static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargsf, PyObject *kwargs);
 
 /* PyObjectCallOneArg.proto (used by CallUnboundCMethod0) */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
-/* PyObjectGetAttrStr.proto (used by UnpackUnboundCMethod) */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
-#else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
-/* UnpackUnboundCMethod.proto (used by CallUnboundCMethod0) */
+/* UnpackUnboundCMethod_decl.proto (used by UnpackUnboundCMethod) */
 typedef struct {
     PyObject *type;
     PyObject **method_name;
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && CYTHON_ATOMICS
-    __pyx_atomic_int_type initialized;
-#endif
     PyCFunction func;
     PyObject *method;
     int flag;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && CYTHON_ATOMICS
+    __pyx_atomic_int_type initialized;
+#endif
 } __Pyx_CachedCFunction;
+
+/* IgnoreException.proto (used by UnpackUnboundCMethod_impl) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception);
+#define __Pyx_IgnoreException(ignorable_exception) __Pyx_IgnoreGivenException(NULL, ignorable_exception)
+
+/* UnpackUnboundCMethod_impl.export */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target);
+
+/* UnpackUnboundCMethod.proto (used by CallUnboundCMethod0) */
 #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
 static CYTHON_INLINE int __Pyx_CachedCFunction_GetAndSetInitializing(__Pyx_CachedCFunction *cfunc) {
 #if !CYTHON_ATOMICS
@@ -1840,6 +2195,9 @@ static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod0(__Pyx_CachedCFunction*
 #endif
 
 /* py_dict_values.proto (used by OwnedDictNext) */
+#define __Pyx_PyDict_values_TypePtr  (&PyDictKeys_Type)
+#define __Pyx_PyDict_values_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyDictValues_TypePtr)
+#define __Pyx_PyDict_values_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyDictValues_TypePtr)
 static CYTHON_INLINE PyObject* __Pyx_PyDict_Values(PyObject* d);
 
 /* OwnedDictNext.proto (used by ParseKeywordsImpl) */
@@ -1901,55 +2259,18 @@ static CYTHON_INLINE int __Pyx_ParseKeywords(
     int ignore_unknown_kwargs
 );
 
-/* RaiseArgTupleInvalid.proto */
+/* RaiseArgTupleInvalid.export */
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
-/* PyValueError_Check.proto */
-#define __Pyx_PyExc_ValueError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_ValueError)
+/* PyObjectCompare.proto */
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolNe_object_bytes(PyObject *op1, PyObject *op2, int pyop);
 
-/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
-#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#if PY_VERSION_HEX >= 0x030C00A6
-#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
-#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
-#else
-#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
-#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
-#endif
-#else
-#define __Pyx_PyThreadState_declare
-#define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
-#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
-#endif
+/* PyObjectCompare.proto */
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolNe_object_str(PyObject *op1, PyObject *op2, int pyop);
 
-/* PyErrFetchRestore.proto (used by RaiseException) */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
-#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
-#else
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#endif
-#else
-#define __Pyx_PyErr_Clear() PyErr_Clear()
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
-#endif
+/* PyValueError_Check.proto */
+#define __Pyx_PyExc_ValueError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_ValueError)
 
 /* RaiseException.export */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
@@ -2008,82 +2329,163 @@ static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromOrdinal_Padded(int value, Py_
 static CYTHON_INLINE PyObject* __Pyx_uchar___Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char);
 static CYTHON_INLINE PyObject* __Pyx____Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char);
 
+/* JoinPyUnicode.proto */
+#define __Pyx_PyUnicode_Join_CAN_USE_KIND_AND_LENGTH\
+    (!CYTHON_COMPILING_IN_GRAAL && !CYTHON_COMPILING_IN_PYPY && !CYTHON_COMPILING_IN_LIMITED_API)
+
 /* JoinPyUnicode.export */
-static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength,
-                                      Py_UCS4 max_char);
+static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength, int kind);
 
 /* RejectKeywords.export */
 static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds);
 
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyLongBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* ArgTypeTestError.export */
+static void __Pyx_ArgTypeError(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* ArgTypeTest.proto */
+static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed, const char *name, int exact);
+
 /* PyTypeError_Check.proto */
 #define __Pyx_PyExc_TypeError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_TypeError)
 
-/* AllocateExtensionType.proto */
-static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final);
-
-/* LimitedApiGetTypeDict.proto (used by SetItemOnTypeDict) */
-#if CYTHON_COMPILING_IN_LIMITED_API
-static PyObject *__Pyx_GetTypeDict(PyTypeObject *tp);
+/* FormatTypeName.proto (used by RaiseErrorWithObjectTypes) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%N"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) Py_NewRef((PyObject*)tp)
+#define __Pyx_DECREF_TypeName(obj) Py_DECREF(obj)
+#elif CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
+#else  // !LIMITED_API
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
 #endif
 
-/* SetItemOnTypeDict.proto (used by FixUpExtensionType) */
-static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v);
-#define __Pyx_SetItemOnTypeDict(tp, k, v) __Pyx__SetItemOnTypeDict((PyTypeObject*)tp, k, v)
-
-/* FixUpExtensionType.proto */
-static CYTHON_INLINE int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type);
+/* RaiseErrorWithObjectTypes.proto */
+#define __Pyx_RaiseErrorWithObjectTypes1(exc_type, message, arg, obj1, obj2) __Pyx_RaiseErrorWithTypes1(exc_type, message, arg, Py_TYPE(obj1), Py_TYPE(obj2))
+#define __Pyx_RaiseTypeErrorWithObjectTypes(message, obj1, obj2) __Pyx_RaiseTypeErrorWithTypes(message, Py_TYPE(obj1), Py_TYPE(obj2))
+#define __Pyx_RaiseTypeErrorWithTypes(message, type_obj1, type_obj2) __Pyx_RaiseErrorWithTypes1(PyExc_TypeError, "%.1s" message, "", type_obj1, type_obj2)
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithTypes1(PyObject* exc_type, const char *message, const char *arg, PyTypeObject *type_obj1, PyTypeObject *type_obj2);
 
-/* PyObjectCallNoArg.proto (used by PyObjectCallMethod0) */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+/* CallNextTpDealloc.proto */
+static void __Pyx_call_next_tp_dealloc(PyObject* obj, destructor current_tp_dealloc);
 
-/* PyObjectGetMethod.proto (used by PyObjectCallMethod0) */
-#if !(CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000)))
-static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_3_3_0
+#define __PYX_HAVE_RT_ImportType_proto_3_3_0
+#if defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if (defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L) || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_3_3_0(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_3_3_0(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_3_3_0 {
+   __Pyx_ImportType_CheckSize_Error_3_3_0 = 0,
+   __Pyx_ImportType_CheckSize_Warn_3_3_0 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_3_3_0 = 2
+};
+static PyTypeObject *__Pyx_ImportType_3_3_0(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_3_0 check_size);
 #endif
 
+/* GetVTable.proto */
+static int __Pyx_GetVtable(PyTypeObject *type, void** table);
+
 /* PyObjectCallMethod0.proto (used by PyType_Ready) */
-static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* GetTypeDictOffset.proto (used by ValidateBasesTuple) */
+#if !CYTHON_USE_TYPE_SLOTS
+CYTHON_UNUSED static Py_ssize_t __Pyx_GetTypeDictOffset(PyObject *tp, int require_cython_valid_result);
+#endif
+
+/* RaiseErrorWithObjectType.proto (used by ValidateBasesTuple) */
+#define __Pyx_RaiseTypeErrorWithObjectType(message, obj)  __Pyx_RaiseErrorWithObjectType(PyExc_TypeError, message, obj)
+#define __Pyx_RaiseErrorWithObjectType(exc_type, message, obj)  __Pyx_RaiseErrorWithType(exc_type, message, Py_TYPE(obj))
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj);
+
+/* RaiseErrorWithObjectType1.proto (used by ValidateBasesTuple) */
+#define __Pyx_RaiseTypeErrorWithObjectType1(message, arg, obj) __Pyx_RaiseErrorWithObjectType1(PyExc_TypeError, message, arg, obj)
+#define __Pyx_RaiseErrorWithObjectType1(exc_type, message, arg, obj) __Pyx_RaiseErrorWithType1(exc_type, message, arg, Py_TYPE(obj))
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithType1(PyObject* exc_type, const char* message, const char *arg, PyTypeObject *type_obj);
 
 /* ValidateBasesTuple.proto (used by PyType_Ready) */
 #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
-static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases);
+static int __Pyx_validate_bases_tuple(const char *type_name, int has_dictoffset, PyObject *bases);
 #endif
 
-/* PyType_Ready.proto */
+/* PyType_Ready.export */
 CYTHON_UNUSED static int __Pyx_PyType_Ready(PyTypeObject *t);
 
-/* SetVTable.proto */
-static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
+/* MergeVTables.proto (used by SetVTable) */
+static int __Pyx_MergeVtables(PyTypeObject *type);
 
-/* GetVTable.proto (used by MergeVTables) */
-static void* __Pyx_GetVtable(PyTypeObject *type);
+/* SetVTable.export */
+static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
 
-/* MergeVTables.proto */
-static int __Pyx_MergeVtables(PyTypeObject *type);
+/* LimitedApiGetTypeTypeDict.proto (used by DelItemOnTypeDict) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_GetTypeTypeDict(PyTypeObject *tp);
+#endif
 
 /* DelItemOnTypeDict.proto (used by SetupReduce) */
-static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k);
 #define __Pyx_DelItemOnTypeDict(tp, k) __Pyx__DelItemOnTypeDict((PyTypeObject*)tp, k)
 
-/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
-#else
-#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
-#endif
+/* DelItemOnTypeDict.export */
+static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k);
 
-/* PyObjectGetAttrStrNoError.proto (used by SetupReduce) */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+/* SetItemOnTypeDict.proto (used by SetupReduce) */
+#define __Pyx_SetItemOnTypeDict(tp, k, v) __Pyx__SetItemOnTypeDict((PyTypeObject*)tp, k, v)
+
+/* SetItemOnTypeDict.export */
+static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v);
 
-/* SetupReduce.proto */
+/* SetupReduce.export */
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
 /* dict_setdefault.proto (used by FetchCommonType) */
 static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
 
 /* AddModuleRef.proto (used by FetchSharedCythonModule) */
-#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING ) ||\
+#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3) ||\
      __PYX_LIMITED_VERSION_HEX < 0x030d0000)
   static PyObject *__Pyx_PyImport_AddModuleRef(const char *name);
 #else
@@ -2093,6 +2495,11 @@ static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *ke
 /* FetchSharedCythonModule.proto (used by FetchCommonType) */
 static PyObject *__Pyx_FetchSharedCythonABIModule(void);
 
+/* VerifyCachedType.proto (used by FetchCommonType) */
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t expected_basicsize);
+
 /* FetchCommonType.proto (used by CommonTypesMetaclass) */
 static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases);
 
@@ -2100,52 +2507,45 @@ static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyOb
 static int __pyx_CommonTypesMetaclass_init(PyObject *module);
 #define __Pyx_CommonTypesMetaclass_USED
 
-/* CallTypeTraverse.proto (used by CythonFunctionShared) */
-#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
-#define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
+/* CythonFunctionPerModule.proto (used by CythonFunctionShared) */
+#define __Pyx_CyFunction_USED
+#if CYTHON_OPAQUE_SHARED_TYPES
+#define __Pyx_as_CyFunctionObject(o) ((__pyx_CyFunctionObject *)PyObject_GetTypeData((o), __pyx_mstate_global->__pyx_CyFunctionType))
 #else
-static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg);
+#define __Pyx_as_CyFunctionObject(o) ((__pyx_CyFunctionObject *)o)
 #endif
-
-/* PyMethodNew.proto (used by CythonFunctionShared) */
-static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ);
-
-/* PyVectorcallFastCallDict.proto (used by CythonFunctionShared) */
-#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
-static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw);
-#endif
-
-/* CythonFunctionShared.proto (used by CythonFunction) */
-#define __Pyx_CyFunction_USED
 #define __Pyx_CYFUNCTION_STATICMETHOD  0x01
 #define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
 #define __Pyx_CYFUNCTION_CCLASS        0x04
 #define __Pyx_CYFUNCTION_COROUTINE     0x08
 #define __Pyx_CyFunction_GetClosure(f)\
-    (((__pyx_CyFunctionObject *) (f))->func_closure)
-#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
-  #define __Pyx_CyFunction_GetClassObj(f)\
-      (((__pyx_CyFunctionObject *) (f))->func_classobj)
+    ((__Pyx_as_CyFunctionObject(f))->func_closure)
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx__CyFunction_GetClassObj(f)\
+      ((f)->func_classobj)
 #else
-  #define __Pyx_CyFunction_GetClassObj(f)\
+  #define __Pyx__CyFunction_GetClassObj(f)\
       ((PyObject*) ((PyCMethodObject *) (f))->mm_class)
 #endif
+#define __Pyx_CyFunction_GetClassObj(f)\
+    __Pyx__CyFunction_GetClassObj(__Pyx_as_CyFunctionObject(f))
 #define __Pyx_CyFunction_SetClassObj(f, classobj)\
-    __Pyx__CyFunction_SetClassObj((__pyx_CyFunctionObject *) (f), (classobj))
+    __Pyx__CyFunction_SetClassObj(__Pyx_as_CyFunctionObject(f), (classobj))
 #define __Pyx_CyFunction_Defaults(type, f)\
-    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+    ((type *)((__Pyx_as_CyFunctionObject(f))->defaults))
 #define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
-    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+    (__Pyx_as_CyFunctionObject(f))->defaults_getter = (g)
 typedef struct {
 #if CYTHON_COMPILING_IN_LIMITED_API
+#if !CYTHON_OPAQUE_OBJECTS
     PyObject_HEAD
-    PyObject *func;
-#elif PY_VERSION_HEX < 0x030900B1
-    PyCFunctionObject func;
+#endif
+    PyMethodDef *func_methoddef;
+    PyObject *func_module;
 #else
     PyCMethodObject func;
 #endif
-#if CYTHON_COMPILING_IN_LIMITED_API && CYTHON_METH_FASTCALL
+#if (CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY) && CYTHON_VECTORCALL
     __pyx_vectorcallfunc func_vectorcall;
 #endif
 #if CYTHON_COMPILING_IN_LIMITED_API
@@ -2160,7 +2560,7 @@ typedef struct {
     PyObject *func_globals;
     PyObject *func_code;
     PyObject *func_closure;
-#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+#if CYTHON_COMPILING_IN_LIMITED_API
     PyObject *func_classobj;
 #endif
     PyObject *defaults;
@@ -2169,20 +2569,17 @@ typedef struct {
     PyObject *defaults_kwdict;
     PyObject *(*defaults_getter)(PyObject *);
     PyObject *func_annotations;
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
     PyObject *func_is_coroutine;
+#endif
 } __pyx_CyFunctionObject;
 #undef __Pyx_CyOrPyCFunction_Check
 #define __Pyx_CyFunction_Check(obj)  __Pyx_TypeCheck(obj, __pyx_mstate_global->__pyx_CyFunctionType)
 #define __Pyx_CyOrPyCFunction_Check(obj)  __Pyx_TypeCheck2(obj, __pyx_mstate_global->__pyx_CyFunctionType, &PyCFunction_Type)
-#define __Pyx_CyFunction_CheckExact(obj)  __Pyx_IS_TYPE(obj, __pyx_mstate_global->__pyx_CyFunctionType)
+#define __Pyx_CyFunction_CheckExact(obj)  Py_IS_TYPE(obj, __pyx_mstate_global->__pyx_CyFunctionType)
 static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void));
 #undef __Pyx_IsSameCFunction
 #define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCyOrCFunction(func, cfunc)
-static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
-                                      int flags, PyObject* qualname,
-                                      PyObject *closure,
-                                      PyObject *module, PyObject *globals,
-                                      PyObject* code);
 static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj);
 static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func,
                                                          PyTypeObject *defaults_type);
@@ -2193,24 +2590,49 @@ static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
 static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
                                                               PyObject *dict);
 static int __pyx_CyFunction_init(PyObject *module);
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+#define __Pyx_CyFunction_func_vectorcall(f) ((f)->func_vectorcall)
+#else
+#define __Pyx_CyFunction_func_vectorcall(f) (((PyCFunctionObject*)f)->vectorcall)
+#endif
+#endif
+
+/* CallTypeTraverse.proto (used by CythonFunctionShared) */
+#if !CYTHON_USE_TYPE_SPECS
+#define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg);
+#endif
+
+/* PyMethodNew.proto (used by CythonFunctionShared) */
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ);
+
+/* PyVectorcallFastCallDict.proto (used by CythonFunctionShared) */
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw);
+#endif
+
+/* CythonFunctionShared.proto (used by CythonFunction) */
+static PyObject *__Pyx_CyFunction_Init(PyObject *op_in, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+#if CYTHON_VECTORCALL
 static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
-#if CYTHON_COMPILING_IN_LIMITED_API
-#define __Pyx_CyFunction_func_vectorcall(f) (((__pyx_CyFunctionObject*)f)->func_vectorcall)
-#else
-#define __Pyx_CyFunction_func_vectorcall(f) (((PyCFunctionObject*)f)->vectorcall)
-#endif
 #endif
 
-/* CythonFunction.proto */
+/* CythonFunction.export */
 static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
                                       int flags, PyObject* qualname,
                                       PyObject *closure,
                                       PyObject *module, PyObject *globals,
                                       PyObject* code);
+static PyTypeObject *__Pyx_Get_CyFunction_Type(void);
 
 /* CLineInTraceback.proto (used by AddTraceback) */
 #if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
@@ -2248,43 +2670,28 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
 
-/* PyObjectVectorCallKwBuilder.proto (used by CIntToPy) */
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+/* PyObjectVectorcallKwds.proto (used by PyObjectVectorcallMethodKwds) */
 #if CYTHON_VECTORCALL
-#if PY_VERSION_HEX >= 0x03090000
-#define __Pyx_Object_Vectorcall_CallFromBuilder PyObject_Vectorcall
+#define __Pyx_Object_VectorcallKwds PyObject_Vectorcall
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i);
 #else
-#define __Pyx_Object_Vectorcall_CallFromBuilder _PyObject_Vectorcall
+#define __Pyx_Object_VectorcallKwds __Pyx_PyObject_FastCallDict
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n);
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i);
 #endif
-#define __Pyx_MakeVectorcallBuilderKwds(n) PyTuple_New(n)
-static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
-static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+
+/* PyObjectVectorcallMethodKwds.proto (used by CIntToPy) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallMethodKwds PyObject_VectorcallMethod
 #else
-#define __Pyx_Object_Vectorcall_CallFromBuilder __Pyx_PyObject_FastCallDict
-#define __Pyx_MakeVectorcallBuilderKwds(n) __Pyx_PyDict_NewPresized(n)
-#define __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n) PyDict_SetItem(builder, key, value)
-#define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 #endif
 
 /* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value);
 
-/* FormatTypeName.proto */
-#if CYTHON_COMPILING_IN_LIMITED_API
-typedef PyObject *__Pyx_TypeName;
-#define __Pyx_FMT_TYPENAME "%U"
-#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
-#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-#define __Pyx_PyType_GetFullyQualifiedName PyType_GetFullyQualifiedName
-#else
-static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
-#endif
-#else  // !LIMITED_API
-typedef const char *__Pyx_TypeName;
-#define __Pyx_FMT_TYPENAME "%.200s"
-#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
-#define __Pyx_DECREF_TypeName(obj)
-#endif
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
@@ -2292,30 +2699,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
 
-/* FastTypeChecks.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
-#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
-static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
-#else
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
-#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
-    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
-}
-#endif
-#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
-#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
-#ifdef PyExceptionInstance_Check
-  #define __Pyx_PyBaseException_Check(obj) PyExceptionInstance_Check(obj)
-#else
-  #define __Pyx_PyBaseException_Check(obj) __Pyx_TypeCheck(obj, PyExc_BaseException)
-#endif
-
 /* GetRuntimeVersion.proto */
 #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
 static unsigned long __Pyx_cached_runtime_version = 0;
@@ -2331,8 +2714,12 @@ static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt
 /* DecompressString.proto */
 static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo);
 
+/* DecompressString_LZSS.proto */
+static PyObject *__Pyx_DecompressString_LZSS(const char *s, size_t compressed_length, size_t uncompressed_length);
+
 /* MultiPhaseInitModuleState.proto */
 #if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#include <stdlib.h>
 static PyObject *__Pyx_State_FindModule(void*);
 static int __Pyx_State_AddModule(PyObject* module, void*);
 static int __Pyx_State_RemoveModule(void*);
@@ -2345,12 +2732,12 @@ static int __Pyx_State_RemoveModule(void*);
 /* #### Code section: module_declarations ### */
 /* CythonABIVersion.proto */
 #if CYTHON_COMPILING_IN_LIMITED_API
-    #if CYTHON_METH_FASTCALL
-        #define __PYX_FASTCALL_ABI_SUFFIX  "_fastcall"
+    #if CYTHON_VECTORCALL
+        #define __PYX_VECTORCALL_ABI_SUFFIX  "_vectorcall"
     #else
-        #define __PYX_FASTCALL_ABI_SUFFIX
+        #define __PYX_VECTORCALL_ABI_SUFFIX
     #endif
-    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_FASTCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_VECTORCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
 #else
     #define __PYX_LIMITED_ABI_SUFFIX
 #endif
@@ -2374,25 +2761,34 @@ static int __Pyx_State_RemoveModule(void*);
 #else
     #define __PYX_FREELISTS_ABI_SUFFIX "nofreelists"
 #endif
-#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX "opaque"
+#else
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#endif
+#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
 #define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
 #define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
 
 static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto*/
 static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto*/
-static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain *__pyx_optional_args); /* proto*/
+static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain *__pyx_optional_args); /* proto*/
 static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_dStrain); /* proto*/
 static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_F0, double __pyx_v_du, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel *__pyx_optional_args); /* proto*/
 static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_u0, double __pyx_v_F0, double __pyx_v_du); /* proto*/
-static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, int __pyx_skip_dispatch); /* proto*/
+
+/* Module declarations from "src.CUniaxialMaterial" */
 
 /* Module declarations from "libc.math" */
 
 /* Module declarations from "libc.float" */
 
+/* Module declarations from "libc.string" */
+
 /* Module declarations from "src.TSSCB.TSSCB" */
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
@@ -2402,18 +2798,22 @@ int __pyx_module_is_main_src__TSSCB__TSSCB = 0;
 
 /* Implementation of "src.TSSCB.TSSCB" */
 /* #### Code section: global_var ### */
+static PyObject *__pyx_builtin_enumerate;
 /* #### Code section: string_decls ### */
 /* #### Code section: decls ### */
 static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_v_tag, double __pyx_v_F1, double __pyx_v_k0, double __pyx_v_ugap, double __pyx_v_F2, double __pyx_v_k1, double __pyx_v_k2, double __pyx_v_beta, PyObject *__pyx_v_hardening, double __pyx_v_uh, double __pyx_v_r1, double __pyx_v_r2, double __pyx_v_r3, PyObject *__pyx_v_minmax, double __pyx_v_uf, PyObject *__pyx_v__configType, int __pyx_v_configType, PyObject *__pyx_v__up, double __pyx_v_up); /* proto */
 static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_2setTrialStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, double __pyx_v_strainRate); /* proto */
 static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_4commitState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStress(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getTangent(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_10setStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain); /* proto */
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_3tag___get__(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
-static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_3tag_2__set__(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getStress(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_10getTangent(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_12getCounters(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_14resetCounters(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_16getState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_18setState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, PyObject *__pyx_v_state); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new__initialisation_3src_5TSSCB_5TSSCB_TSSCB(PyObject *o, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_3src_5TSSCB_5TSSCB_TSSCB(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
@@ -2428,22 +2828,26 @@ static PyObject *__pyx_tp_new_3src_5TSSCB_5TSSCB_TSSCB(PyTypeObject *t, PyObject
 #endif
 #endif
 
-typedef struct {
-  PyObject *__pyx_d;
-  PyObject *__pyx_b;
-  PyObject *__pyx_cython_runtime;
-  PyObject *__pyx_empty_tuple;
-  PyObject *__pyx_empty_bytes;
-  PyObject *__pyx_empty_unicode;
-  PyObject *__pyx_type_3src_5TSSCB_5TSSCB_TSSCB;
-  PyTypeObject *__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB;
-  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
-  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
-  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
-  PyObject *__pyx_tuple[1];
-  PyObject *__pyx_codeobj_tab[7];
-  PyObject *__pyx_string_tab[87];
-  PyObject *__pyx_number_tab[1];
+#ifdef __cplusplus
+namespace {
+  #endif
+  typedef struct {
+    PyObject *__pyx_d;
+    PyObject *__pyx_b;
+    PyObject *__pyx_cython_runtime;
+    PyObject *__pyx_empty_tuple;
+    PyObject *__pyx_empty_bytes;
+    PyObject *__pyx_empty_unicode;
+    PyTypeObject *__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial;
+    PyObject *__pyx_type_3src_5TSSCB_5TSSCB_TSSCB;
+    PyTypeObject *__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
+    __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
+    PyObject *__pyx_tuple[2];
+    PyObject *__pyx_codeobj_tab[11];
+    PyObject *__pyx_string_tab[119];
+    PyObject *__pyx_number_tab[3];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
 PyTypeObject *__pyx_CommonTypesMetaclassType;
@@ -2453,7 +2857,7 @@ PyTypeObject *__pyx_CommonTypesMetaclassType;
 PyObject *__Pyx_CachedMethodType;
 #endif
 
-/* CythonFunctionShared.module_state_decls */
+/* CythonFunctionPerModule.module_state_decls */
 PyTypeObject *__pyx_CyFunctionType;
 
 /* CodeObjectCache.module_state_decls */
@@ -2461,6 +2865,9 @@ struct __Pyx_CodeObjectCache __pyx_code_cache;
 
 /* #### Code section: module_state_end ### */
 } __pyx_mstatetype;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
 
 #if CYTHON_USE_MODULE_STATE
 #ifdef __cplusplus
@@ -2484,94 +2891,128 @@ static __pyx_mstatetype __pyx_mstate_global_static =
 static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_static;
 #endif
 /* #### Code section: constant_name_defines ### */
-#define __pyx_kp_u_ __pyx_string_tab[0]
-#define __pyx_kp_u_Invalid_parameters_for_TSSCBMate __pyx_string_tab[1]
-#define __pyx_kp_u_Invalid_state_transition_Cstage __pyx_string_tab[2]
-#define __pyx_kp_u_Tstage __pyx_string_tab[3]
-#define __pyx_kp_u_configType_3 __pyx_string_tab[4]
-#define __pyx_kp_u_configType_should_be_configTyp __pyx_string_tab[5]
-#define __pyx_kp_u_disable __pyx_string_tab[6]
-#define __pyx_kp_u_enable __pyx_string_tab[7]
-#define __pyx_kp_u_gc __pyx_string_tab[8]
-#define __pyx_kp_u_hardening_2 __pyx_string_tab[9]
-#define __pyx_kp_u_hardening_should_be_hardening_i __pyx_string_tab[10]
-#define __pyx_kp_u_isenabled __pyx_string_tab[11]
-#define __pyx_kp_u_minmax_2 __pyx_string_tab[12]
+#define __pyx_kp_u_tree_fragment __pyx_string_tab[0]
+#define __pyx_kp_u_Tstage __pyx_string_tab[1]
+#define __pyx_kp_u_configType_3 __pyx_string_tab[2]
+#define __pyx_kp_u_hardening_2 __pyx_string_tab[3]
+#define __pyx_kp_u_minmax_2 __pyx_string_tab[4]
+#define __pyx_kp_u_up_3 __pyx_string_tab[5]
+#define __pyx_kp_u_ __pyx_string_tab[6]
+#define __pyx_kp_u_Invalid_parameters_for_TSSCBMate __pyx_string_tab[7]
+#define __pyx_kp_u_Invalid_state_transition_Cstage __pyx_string_tab[8]
+#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[9]
+#define __pyx_kp_u_configType_should_be_configTyp __pyx_string_tab[10]
+#define __pyx_kp_u_up_should_be_up_if_given __pyx_string_tab[11]
+#define __pyx_kp_u_hardening_should_be_hardening_i __pyx_string_tab[12]
 #define __pyx_kp_u_minmax_should_be_minmax_if_give __pyx_string_tab[13]
-#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[14]
-#define __pyx_kp_u_src_TSSCB_TSSCB_pyx __pyx_string_tab[15]
-#define __pyx_kp_u_stringsource __pyx_string_tab[16]
-#define __pyx_kp_u_up_3 __pyx_string_tab[17]
-#define __pyx_kp_u_up_should_be_up_if_given __pyx_string_tab[18]
-#define __pyx_n_u_F1 __pyx_string_tab[19]
-#define __pyx_n_u_F2 __pyx_string_tab[20]
-#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[21]
-#define __pyx_n_u_TSSCB __pyx_string_tab[22]
-#define __pyx_n_u_TSSCB___reduce_cython __pyx_string_tab[23]
-#define __pyx_n_u_TSSCB___setstate_cython __pyx_string_tab[24]
-#define __pyx_n_u_TSSCB_commitState __pyx_string_tab[25]
-#define __pyx_n_u_TSSCB_getStress __pyx_string_tab[26]
-#define __pyx_n_u_TSSCB_getTangent __pyx_string_tab[27]
-#define __pyx_n_u_TSSCB_setStrain __pyx_string_tab[28]
-#define __pyx_n_u_TSSCB_setTrialStrain __pyx_string_tab[29]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[30]
-#define __pyx_n_u_beta __pyx_string_tab[31]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[32]
-#define __pyx_n_u_commitState __pyx_string_tab[33]
-#define __pyx_n_u_configType __pyx_string_tab[34]
-#define __pyx_n_u_configType_2 __pyx_string_tab[35]
-#define __pyx_n_u_func __pyx_string_tab[36]
-#define __pyx_n_u_getStress __pyx_string_tab[37]
-#define __pyx_n_u_getTangent __pyx_string_tab[38]
+#define __pyx_kp_u_add_note __pyx_string_tab[14]
+#define __pyx_kp_u_disable __pyx_string_tab[15]
+#define __pyx_kp_u_enable __pyx_string_tab[16]
+#define __pyx_kp_u_gc __pyx_string_tab[17]
+#define __pyx_kp_u_isenabled __pyx_string_tab[18]
+#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[19]
+#define __pyx_kp_u_src_TSSCB_TSSCB_pyx __pyx_string_tab[20]
+#define __pyx_n_u_COUNTERS __pyx_string_tab[21]
+#define __pyx_n_u_F1 __pyx_string_tab[22]
+#define __pyx_n_u_F2 __pyx_string_tab[23]
+#define __pyx_n_u_TSSCB __pyx_string_tab[24]
+#define __pyx_n_u_TSSCB___reduce_cython __pyx_string_tab[25]
+#define __pyx_n_u_TSSCB___setstate_cython __pyx_string_tab[26]
+#define __pyx_n_u_TSSCB_commitState __pyx_string_tab[27]
+#define __pyx_n_u_TSSCB_getCounters __pyx_string_tab[28]
+#define __pyx_n_u_TSSCB_getState __pyx_string_tab[29]
+#define __pyx_n_u_TSSCB_getStrain __pyx_string_tab[30]
+#define __pyx_n_u_TSSCB_getStress __pyx_string_tab[31]
+#define __pyx_n_u_TSSCB_getTangent __pyx_string_tab[32]
+#define __pyx_n_u_TSSCB_resetCounters __pyx_string_tab[33]
+#define __pyx_n_u_TSSCB_setState __pyx_string_tab[34]
+#define __pyx_n_u_TSSCB_setTrialStrain __pyx_string_tab[35]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[36]
+#define __pyx_n_u_annotate __pyx_string_tab[37]
+#define __pyx_n_u_func __pyx_string_tab[38]
 #define __pyx_n_u_getstate __pyx_string_tab[39]
-#define __pyx_n_u_hardening __pyx_string_tab[40]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[41]
-#define __pyx_n_u_items __pyx_string_tab[42]
-#define __pyx_n_u_k0 __pyx_string_tab[43]
-#define __pyx_n_u_k1 __pyx_string_tab[44]
-#define __pyx_n_u_k2 __pyx_string_tab[45]
-#define __pyx_n_u_main __pyx_string_tab[46]
-#define __pyx_n_u_minmax __pyx_string_tab[47]
-#define __pyx_n_u_module __pyx_string_tab[48]
-#define __pyx_n_u_name __pyx_string_tab[49]
-#define __pyx_n_u_pop __pyx_string_tab[50]
-#define __pyx_n_u_pyx_state __pyx_string_tab[51]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[52]
-#define __pyx_n_u_qualname __pyx_string_tab[53]
-#define __pyx_n_u_r1 __pyx_string_tab[54]
-#define __pyx_n_u_r2 __pyx_string_tab[55]
-#define __pyx_n_u_r3 __pyx_string_tab[56]
-#define __pyx_n_u_reduce __pyx_string_tab[57]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[58]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[59]
-#define __pyx_n_u_self __pyx_string_tab[60]
-#define __pyx_n_u_setStrain __pyx_string_tab[61]
-#define __pyx_n_u_setTrialStrain __pyx_string_tab[62]
-#define __pyx_n_u_set_name __pyx_string_tab[63]
-#define __pyx_n_u_setdefault __pyx_string_tab[64]
-#define __pyx_n_u_setstate __pyx_string_tab[65]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[66]
-#define __pyx_n_u_src_TSSCB_TSSCB __pyx_string_tab[67]
-#define __pyx_n_u_strain __pyx_string_tab[68]
-#define __pyx_n_u_strainRate __pyx_string_tab[69]
-#define __pyx_n_u_tag __pyx_string_tab[70]
-#define __pyx_n_u_test __pyx_string_tab[71]
-#define __pyx_n_u_uf __pyx_string_tab[72]
-#define __pyx_n_u_ugap __pyx_string_tab[73]
-#define __pyx_n_u_uh __pyx_string_tab[74]
-#define __pyx_n_u_up __pyx_string_tab[75]
-#define __pyx_n_u_up_2 __pyx_string_tab[76]
-#define __pyx_n_u_values __pyx_string_tab[77]
-#define __pyx_kp_b_configType_3 __pyx_string_tab[78]
-#define __pyx_kp_b_hardening_2 __pyx_string_tab[79]
-#define __pyx_kp_b_iso88591_A_Kt1_L_A_L_A_Jd_N_a_L_A_L_A_L_A __pyx_string_tab[80]
-#define __pyx_kp_b_iso88591_A_O1A_L __pyx_string_tab[81]
-#define __pyx_kp_b_iso88591_A_t1 __pyx_string_tab[82]
-#define __pyx_kp_b_iso88591_Kt1_L_A_L_A_Jd_N_a_L_A_L_A_L_A __pyx_string_tab[83]
-#define __pyx_kp_b_iso88591_Q __pyx_string_tab[84]
-#define __pyx_kp_b_minmax_2 __pyx_string_tab[85]
-#define __pyx_kp_b_up_3 __pyx_string_tab[86]
+#define __pyx_n_u_main __pyx_string_tab[40]
+#define __pyx_n_u_module __pyx_string_tab[41]
+#define __pyx_n_u_name __pyx_string_tab[42]
+#define __pyx_n_u_pyx_state __pyx_string_tab[43]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[44]
+#define __pyx_n_u_qualname __pyx_string_tab[45]
+#define __pyx_n_u_reduce __pyx_string_tab[46]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[47]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[48]
+#define __pyx_n_u_set_name __pyx_string_tab[49]
+#define __pyx_n_u_setstate __pyx_string_tab[50]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[51]
+#define __pyx_n_u_test __pyx_string_tab[52]
+#define __pyx_n_u_configType __pyx_string_tab[53]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[54]
+#define __pyx_n_u_up __pyx_string_tab[55]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[56]
+#define __pyx_n_u_beta __pyx_string_tab[57]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[58]
+#define __pyx_n_u_commitState __pyx_string_tab[59]
+#define __pyx_n_u_configType_2 __pyx_string_tab[60]
+#define __pyx_n_u_dict __pyx_string_tab[61]
+#define __pyx_n_u_enumerate __pyx_string_tab[62]
+#define __pyx_n_u_fractured __pyx_string_tab[63]
+#define __pyx_n_u_fracturing __pyx_string_tab[64]
+#define __pyx_n_u_getCounters __pyx_string_tab[65]
+#define __pyx_n_u_getState __pyx_string_tab[66]
+#define __pyx_n_u_getStrain __pyx_string_tab[67]
+#define __pyx_n_u_getStress __pyx_string_tab[68]
+#define __pyx_n_u_getTangent __pyx_string_tab[69]
+#define __pyx_n_u_hardening __pyx_string_tab[70]
+#define __pyx_n_u_i __pyx_string_tab[71]
+#define __pyx_n_u_items __pyx_string_tab[72]
+#define __pyx_n_u_k0 __pyx_string_tab[73]
+#define __pyx_n_u_k1 __pyx_string_tab[74]
+#define __pyx_n_u_k2 __pyx_string_tab[75]
+#define __pyx_n_u_minmax __pyx_string_tab[76]
+#define __pyx_n_u_name_2 __pyx_string_tab[77]
+#define __pyx_n_u_pop __pyx_string_tab[78]
+#define __pyx_n_u_r1 __pyx_string_tab[79]
+#define __pyx_n_u_r2 __pyx_string_tab[80]
+#define __pyx_n_u_r3 __pyx_string_tab[81]
+#define __pyx_n_u_resetCounters __pyx_string_tab[82]
+#define __pyx_n_u_return __pyx_string_tab[83]
+#define __pyx_n_u_sc_elastic __pyx_string_tab[84]
+#define __pyx_n_u_sc_k1 __pyx_string_tab[85]
+#define __pyx_n_u_sc_k2 __pyx_string_tab[86]
+#define __pyx_n_u_sc_k2_reverse __pyx_string_tab[87]
+#define __pyx_n_u_self __pyx_string_tab[88]
+#define __pyx_n_u_setState __pyx_string_tab[89]
+#define __pyx_n_u_setTrialStrain __pyx_string_tab[90]
+#define __pyx_n_u_setdefault __pyx_string_tab[91]
+#define __pyx_n_u_src_TSSCB_TSSCB __pyx_string_tab[92]
+#define __pyx_n_u_stage_1_1 __pyx_string_tab[93]
+#define __pyx_n_u_stage_1_2 __pyx_string_tab[94]
+#define __pyx_n_u_stage_2_1 __pyx_string_tab[95]
+#define __pyx_n_u_stage_2_2 __pyx_string_tab[96]
+#define __pyx_n_u_state __pyx_string_tab[97]
+#define __pyx_n_u_strain __pyx_string_tab[98]
+#define __pyx_n_u_strainRate __pyx_string_tab[99]
+#define __pyx_n_u_tag __pyx_string_tab[100]
+#define __pyx_n_u_tuple __pyx_string_tab[101]
+#define __pyx_n_u_uf __pyx_string_tab[102]
+#define __pyx_n_u_ugap __pyx_string_tab[103]
+#define __pyx_n_u_uh __pyx_string_tab[104]
+#define __pyx_n_u_up_2 __pyx_string_tab[105]
+#define __pyx_n_u_values __pyx_string_tab[106]
+#define __pyx_kp_b_configType_3 __pyx_string_tab[107]
+#define __pyx_kp_b_hardening_2 __pyx_string_tab[108]
+#define __pyx_kp_b_minmax_2 __pyx_string_tab[109]
+#define __pyx_kp_b_up_3 __pyx_string_tab[110]
+#define __pyx_kp_b_iso88591_Q __pyx_string_tab[111]
+#define __pyx_kp_b_iso88591_A_Jd_E_Kt_e1A_L_L_Qa_N_nE_L_L_Qa __pyx_string_tab[112]
+#define __pyx_kp_b_iso88591_A_at9Cwe1 __pyx_string_tab[113]
+#define __pyx_kp_b_iso88591_A_t1 __pyx_string_tab[114]
+#define __pyx_kp_b_iso88591_A_Kt1_L_A_L_A_Jd_N_a_L_A_L_A_L_A __pyx_string_tab[115]
+#define __pyx_kp_b_iso88591_Zt_d_4_k_Q_t_t1_j_D __pyx_string_tab[116]
+#define __pyx_kp_b_iso88591_Q_4q_1_q_d_T_HIQa __pyx_string_tab[117]
+#define __pyx_kp_b_iso88591_EQ_Kt1_L_A_L_A_Jd_N_a_L_A_L_A_L __pyx_string_tab[118]
 #define __pyx_float_0_0 __pyx_number_tab[0]
+#define __pyx_int_0 __pyx_number_tab[1]
+#define __pyx_int_1 __pyx_number_tab[2]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -2586,17 +3027,21 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __Pyx_State_RemoveModule(NULL);
   #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial);
   Py_CLEAR(clear_module_state->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB);
   Py_CLEAR(clear_module_state->__pyx_type_3src_5TSSCB_5TSSCB_TSSCB);
-  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<7; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<87; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
-  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_items.method);
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_pop.method);
+  Py_CLEAR(clear_module_state->__pyx_umethod_PyDict_Type_values.method);
+  for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<11; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<119; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<3; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
 Py_CLEAR(clear_module_state->__pyx_CommonTypesMetaclassType);
 
-/* CythonFunctionShared.module_state_clear */
+/* CythonFunctionPerModule.module_state_clear */
 Py_CLEAR(clear_module_state->__pyx_CyFunctionType);
 
 /* #### Code section: module_state_clear_end ### */
@@ -2614,17 +3059,21 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  Py_VISIT(traverse_module_state->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial);
   Py_VISIT(traverse_module_state->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB);
   Py_VISIT(traverse_module_state->__pyx_type_3src_5TSSCB_5TSSCB_TSSCB);
-  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<7; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<87; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
-  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_items.method);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_pop.method);
+  Py_VISIT(traverse_module_state->__pyx_umethod_PyDict_Type_values.method);
+  for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<11; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<119; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<3; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
 Py_VISIT(traverse_module_state->__pyx_CommonTypesMetaclassType);
 
-/* CythonFunctionShared.module_state_traverse */
+/* CythonFunctionPerModule.module_state_traverse */
 Py_VISIT(traverse_module_state->__pyx_CyFunctionType);
 
 /* #### Code section: module_state_traverse_end ### */
@@ -2633,8 +3082,8 @@ return 0;
 #endif
 /* #### Code section: module_code ### */
 
-/* "src/TSSCB/TSSCB.pyx":27
- *     cdef int i
+/* "src/TSSCB/TSSCB.pyx":16
+ * cdef class TSSCB(CUniaxialMaterial):
  * 
  *     def __cinit__(self,             # <<<<<<<<<<<<<<
  *                   int tag,
@@ -2681,92 +3130,92 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_tag,&__pyx_mstate_global->__pyx_n_u_F1,&__pyx_mstate_global->__pyx_n_u_k0,&__pyx_mstate_global->__pyx_n_u_ugap,&__pyx_mstate_global->__pyx_n_u_F2,&__pyx_mstate_global->__pyx_n_u_k1,&__pyx_mstate_global->__pyx_n_u_k2,&__pyx_mstate_global->__pyx_n_u_beta,&__pyx_mstate_global->__pyx_n_u_hardening,&__pyx_mstate_global->__pyx_n_u_uh,&__pyx_mstate_global->__pyx_n_u_r1,&__pyx_mstate_global->__pyx_n_u_r2,&__pyx_mstate_global->__pyx_n_u_r3,&__pyx_mstate_global->__pyx_n_u_minmax,&__pyx_mstate_global->__pyx_n_u_uf,&__pyx_mstate_global->__pyx_n_u_configType,&__pyx_mstate_global->__pyx_n_u_configType_2,&__pyx_mstate_global->__pyx_n_u_up,&__pyx_mstate_global->__pyx_n_u_up_2,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 27, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 16, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case 19:
         values[18] = __Pyx_ArgRef_VARARGS(__pyx_args, 18);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 18:
         values[17] = __Pyx_ArgRef_VARARGS(__pyx_args, 17);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 17:
         values[16] = __Pyx_ArgRef_VARARGS(__pyx_args, 16);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 16:
         values[15] = __Pyx_ArgRef_VARARGS(__pyx_args, 15);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 15:
         values[14] = __Pyx_ArgRef_VARARGS(__pyx_args, 14);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 14:
         values[13] = __Pyx_ArgRef_VARARGS(__pyx_args, 13);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 13:
         values[12] = __Pyx_ArgRef_VARARGS(__pyx_args, 12);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 12:
         values[11] = __Pyx_ArgRef_VARARGS(__pyx_args, 11);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 11:
         values[10] = __Pyx_ArgRef_VARARGS(__pyx_args, 10);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 10:
         values[9] = __Pyx_ArgRef_VARARGS(__pyx_args, 9);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  9:
         values[8] = __Pyx_ArgRef_VARARGS(__pyx_args, 8);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  8:
         values[7] = __Pyx_ArgRef_VARARGS(__pyx_args, 7);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  7:
         values[6] = __Pyx_ArgRef_VARARGS(__pyx_args, 6);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  6:
         values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  5:
         values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__cinit__", 0) < (0)) __PYX_ERR(0, 27, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__cinit__", 0) < (0)) __PYX_ERR(0, 16, __pyx_L3_error)
 
-      /* "src/TSSCB/TSSCB.pyx":30
+      /* "src/TSSCB/TSSCB.pyx":19
  *                   int tag,
  *                   double F1, double k0, double ugap, double F2, double k1, double k2, double beta,
  *                   object hardening=None, double uh=1e16, double r1=1, double r2=1, double r3=0,             # <<<<<<<<<<<<<<
@@ -2775,7 +3224,7 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[8]) values[8] = __Pyx_NewRef(((PyObject *)Py_None));
 
-      /* "src/TSSCB/TSSCB.pyx":31
+      /* "src/TSSCB/TSSCB.pyx":20
  *                   double F1, double k0, double ugap, double F2, double k1, double k2, double beta,
  *                   object hardening=None, double uh=1e16, double r1=1, double r2=1, double r3=0,
  *                   object minmax=None, double uf=1e16,             # <<<<<<<<<<<<<<
@@ -2784,7 +3233,7 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[13]) values[13] = __Pyx_NewRef(((PyObject *)Py_None));
 
-      /* "src/TSSCB/TSSCB.pyx":32
+      /* "src/TSSCB/TSSCB.pyx":21
  *                   object hardening=None, double uh=1e16, double r1=1, double r2=1, double r3=0,
  *                   object minmax=None, double uf=1e16,
  *                   object _configType=None, int configType=1,             # <<<<<<<<<<<<<<
@@ -2793,7 +3242,7 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[15]) values[15] = __Pyx_NewRef(((PyObject *)Py_None));
 
-      /* "src/TSSCB/TSSCB.pyx":33
+      /* "src/TSSCB/TSSCB.pyx":22
  *                   object minmax=None, double uf=1e16,
  *                   object _configType=None, int configType=1,
  *                   object _up=None, double up=0):             # <<<<<<<<<<<<<<
@@ -2802,76 +3251,76 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[17]) values[17] = __Pyx_NewRef(((PyObject *)Py_None));
       for (Py_ssize_t i = __pyx_nargs; i < 8; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 19, i); __PYX_ERR(0, 27, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 19, i); __PYX_ERR(0, 16, __pyx_L3_error) }
       }
     } else {
       switch (__pyx_nargs) {
         case 19:
         values[18] = __Pyx_ArgRef_VARARGS(__pyx_args, 18);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[18])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 18:
         values[17] = __Pyx_ArgRef_VARARGS(__pyx_args, 17);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[17])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 17:
         values[16] = __Pyx_ArgRef_VARARGS(__pyx_args, 16);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[16])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 16:
         values[15] = __Pyx_ArgRef_VARARGS(__pyx_args, 15);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[15])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 15:
         values[14] = __Pyx_ArgRef_VARARGS(__pyx_args, 14);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[14])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 14:
         values[13] = __Pyx_ArgRef_VARARGS(__pyx_args, 13);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[13])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 13:
         values[12] = __Pyx_ArgRef_VARARGS(__pyx_args, 12);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[12])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 12:
         values[11] = __Pyx_ArgRef_VARARGS(__pyx_args, 11);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 11:
         values[10] = __Pyx_ArgRef_VARARGS(__pyx_args, 10);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case 10:
         values[9] = __Pyx_ArgRef_VARARGS(__pyx_args, 9);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  9:
         values[8] = __Pyx_ArgRef_VARARGS(__pyx_args, 8);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 16, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  8:
         values[7] = __Pyx_ArgRef_VARARGS(__pyx_args, 7);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 16, __pyx_L3_error)
         values[6] = __Pyx_ArgRef_VARARGS(__pyx_args, 6);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 16, __pyx_L3_error)
         values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 16, __pyx_L3_error)
         values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 16, __pyx_L3_error)
         values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 16, __pyx_L3_error)
         values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 16, __pyx_L3_error)
         values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 16, __pyx_L3_error)
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 16, __pyx_L3_error)
         break;
         default: goto __pyx_L5_argtuple_error;
       }
 
-      /* "src/TSSCB/TSSCB.pyx":30
+      /* "src/TSSCB/TSSCB.pyx":19
  *                   int tag,
  *                   double F1, double k0, double ugap, double F2, double k1, double k2, double beta,
  *                   object hardening=None, double uh=1e16, double r1=1, double r2=1, double r3=0,             # <<<<<<<<<<<<<<
@@ -2880,7 +3329,7 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[8]) values[8] = __Pyx_NewRef(((PyObject *)Py_None));
 
-      /* "src/TSSCB/TSSCB.pyx":31
+      /* "src/TSSCB/TSSCB.pyx":20
  *                   double F1, double k0, double ugap, double F2, double k1, double k2, double beta,
  *                   object hardening=None, double uh=1e16, double r1=1, double r2=1, double r3=0,
  *                   object minmax=None, double uf=1e16,             # <<<<<<<<<<<<<<
@@ -2889,7 +3338,7 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[13]) values[13] = __Pyx_NewRef(((PyObject *)Py_None));
 
-      /* "src/TSSCB/TSSCB.pyx":32
+      /* "src/TSSCB/TSSCB.pyx":21
  *                   object hardening=None, double uh=1e16, double r1=1, double r2=1, double r3=0,
  *                   object minmax=None, double uf=1e16,
  *                   object _configType=None, int configType=1,             # <<<<<<<<<<<<<<
@@ -2898,7 +3347,7 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[15]) values[15] = __Pyx_NewRef(((PyObject *)Py_None));
 
-      /* "src/TSSCB/TSSCB.pyx":33
+      /* "src/TSSCB/TSSCB.pyx":22
  *                   object minmax=None, double uf=1e16,
  *                   object _configType=None, int configType=1,
  *                   object _up=None, double up=0):             # <<<<<<<<<<<<<<
@@ -2907,57 +3356,57 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
 */
       if (!values[17]) values[17] = __Pyx_NewRef(((PyObject *)Py_None));
     }
-    __pyx_v_tag = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_tag == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
-    __pyx_v_F1 = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_F1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 29, __pyx_L3_error)
-    __pyx_v_k0 = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_k0 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 29, __pyx_L3_error)
-    __pyx_v_ugap = __Pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_ugap == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 29, __pyx_L3_error)
-    __pyx_v_F2 = __Pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_F2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 29, __pyx_L3_error)
-    __pyx_v_k1 = __Pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_k1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 29, __pyx_L3_error)
-    __pyx_v_k2 = __Pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_k2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 29, __pyx_L3_error)
-    __pyx_v_beta = __Pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_beta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 29, __pyx_L3_error)
+    __pyx_v_tag = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_tag == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 17, __pyx_L3_error)
+    __pyx_v_F1 = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_F1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+    __pyx_v_k0 = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_k0 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+    __pyx_v_ugap = __Pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_ugap == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+    __pyx_v_F2 = __Pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_F2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+    __pyx_v_k1 = __Pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_k1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+    __pyx_v_k2 = __Pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_k2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+    __pyx_v_beta = __Pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_beta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
     __pyx_v_hardening = values[8];
     if (values[9]) {
-      __pyx_v_uh = __Pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_uh == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+      __pyx_v_uh = __Pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_uh == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 19, __pyx_L3_error)
     } else {
       __pyx_v_uh = ((double)1e16);
     }
     if (values[10]) {
-      __pyx_v_r1 = __Pyx_PyFloat_AsDouble(values[10]); if (unlikely((__pyx_v_r1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+      __pyx_v_r1 = __Pyx_PyFloat_AsDouble(values[10]); if (unlikely((__pyx_v_r1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 19, __pyx_L3_error)
     } else {
       __pyx_v_r1 = ((double)1.0);
     }
     if (values[11]) {
-      __pyx_v_r2 = __Pyx_PyFloat_AsDouble(values[11]); if (unlikely((__pyx_v_r2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+      __pyx_v_r2 = __Pyx_PyFloat_AsDouble(values[11]); if (unlikely((__pyx_v_r2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 19, __pyx_L3_error)
     } else {
       __pyx_v_r2 = ((double)1.0);
     }
     if (values[12]) {
-      __pyx_v_r3 = __Pyx_PyFloat_AsDouble(values[12]); if (unlikely((__pyx_v_r3 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+      __pyx_v_r3 = __Pyx_PyFloat_AsDouble(values[12]); if (unlikely((__pyx_v_r3 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 19, __pyx_L3_error)
     } else {
       __pyx_v_r3 = ((double)0.0);
     }
     __pyx_v_minmax = values[13];
     if (values[14]) {
-      __pyx_v_uf = __Pyx_PyFloat_AsDouble(values[14]); if (unlikely((__pyx_v_uf == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L3_error)
+      __pyx_v_uf = __Pyx_PyFloat_AsDouble(values[14]); if (unlikely((__pyx_v_uf == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 20, __pyx_L3_error)
     } else {
       __pyx_v_uf = ((double)1e16);
     }
     __pyx_v__configType = values[15];
     if (values[16]) {
-      __pyx_v_configType = __Pyx_PyLong_As_int(values[16]); if (unlikely((__pyx_v_configType == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
+      __pyx_v_configType = __Pyx_PyLong_As_int(values[16]); if (unlikely((__pyx_v_configType == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 21, __pyx_L3_error)
     } else {
       __pyx_v_configType = ((int)1);
     }
     __pyx_v__up = values[17];
     if (values[18]) {
-      __pyx_v_up = __Pyx_PyFloat_AsDouble(values[18]); if (unlikely((__pyx_v_up == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
+      __pyx_v_up = __Pyx_PyFloat_AsDouble(values[18]); if (unlikely((__pyx_v_up == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 22, __pyx_L3_error)
     } else {
       __pyx_v_up = ((double)0.0);
     }
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 19, __pyx_nargs); __PYX_ERR(0, 27, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 19, __pyx_nargs); __PYX_ERR(0, 16, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -2970,8 +3419,8 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self), __pyx_v_tag, __pyx_v_F1, __pyx_v_k0, __pyx_v_ugap, __pyx_v_F2, __pyx_v_k1, __pyx_v_k2, __pyx_v_beta, __pyx_v_hardening, __pyx_v_uh, __pyx_v_r1, __pyx_v_r2, __pyx_v_r3, __pyx_v_minmax, __pyx_v_uf, __pyx_v__configType, __pyx_v_configType, __pyx_v__up, __pyx_v_up);
 
-  /* "src/TSSCB/TSSCB.pyx":27
- *     cdef int i
+  /* "src/TSSCB/TSSCB.pyx":16
+ * cdef class TSSCB(CUniaxialMaterial):
  * 
  *     def __cinit__(self,             # <<<<<<<<<<<<<<
  *                   int tag,
@@ -2982,6 +3431,21 @@ static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(PyObject *__pyx_v_self,
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
@@ -2999,16 +3463,16 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "src/TSSCB/TSSCB.pyx":34
+  /* "src/TSSCB/TSSCB.pyx":23
  *                   object _configType=None, int configType=1,
  *                   object _up=None, double up=0):
  *         self.tag = tag             # <<<<<<<<<<<<<<
  *         #
  *         self.F1 = F1;   self.k0 = k0;   self.ugap = ugap
 */
-  __pyx_v_self->tag = __pyx_v_tag;
+  __pyx_v_self->__pyx_base.tag = __pyx_v_tag;
 
-  /* "src/TSSCB/TSSCB.pyx":36
+  /* "src/TSSCB/TSSCB.pyx":25
  *         self.tag = tag
  *         #
  *         self.F1 = F1;   self.k0 = k0;   self.ugap = ugap             # <<<<<<<<<<<<<<
@@ -3019,7 +3483,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __pyx_v_self->k0 = __pyx_v_k0;
   __pyx_v_self->ugap = __pyx_v_ugap;
 
-  /* "src/TSSCB/TSSCB.pyx":37
+  /* "src/TSSCB/TSSCB.pyx":26
  *         #
  *         self.F1 = F1;   self.k0 = k0;   self.ugap = ugap
  *         self.F2 = F2;   self.k1 = k1;   self.k2 = k2;   self.beta = beta             # <<<<<<<<<<<<<<
@@ -3031,7 +3495,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __pyx_v_self->k2 = __pyx_v_k2;
   __pyx_v_self->beta = __pyx_v_beta;
 
-  /* "src/TSSCB/TSSCB.pyx":38
+  /* "src/TSSCB/TSSCB.pyx":27
  *         self.F1 = F1;   self.k0 = k0;   self.ugap = ugap
  *         self.F2 = F2;   self.k1 = k1;   self.k2 = k2;   self.beta = beta
  *         if hardening is not None:             # <<<<<<<<<<<<<<
@@ -3041,25 +3505,32 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __pyx_t_1 = (__pyx_v_hardening != Py_None);
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":39
+
+    /* "src/TSSCB/TSSCB.pyx":28
  *         self.F2 = F2;   self.k1 = k1;   self.k2 = k2;   self.beta = beta
  *         if hardening is not None:
  *             if hardening != b'-hardening' and hardening != "-hardening":             # <<<<<<<<<<<<<<
  *                 raise ValueError("`hardening` should be `-hardening` if given")
  *             self.hasHardening = True
 */
-    __pyx_t_2 = (__Pyx_PyBytes_Equals(__pyx_v_hardening, __pyx_mstate_global->__pyx_kp_b_hardening_2, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 39, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_bytes(__pyx_v_hardening, __pyx_mstate_global->__pyx_kp_b_hardening_2, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 28, __pyx_L1_error)
     if (__pyx_t_2) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_2;
+
       goto __pyx_L5_bool_binop_done;
     }
-    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_hardening, __pyx_mstate_global->__pyx_kp_u_hardening_2, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 39, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_str(__pyx_v_hardening, __pyx_mstate_global->__pyx_kp_u_hardening_2, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 28, __pyx_L1_error)
+
     __pyx_t_1 = __pyx_t_2;
+
     __pyx_L5_bool_binop_done:;
     if (unlikely(__pyx_t_1)) {
 
-      /* "src/TSSCB/TSSCB.pyx":40
+
+      /* "src/TSSCB/TSSCB.pyx":29
  *         if hardening is not None:
  *             if hardening != b'-hardening' and hardening != "-hardening":
  *                 raise ValueError("`hardening` should be `-hardening` if given")             # <<<<<<<<<<<<<<
@@ -3072,14 +3543,14 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
         PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_hardening_should_be_hardening_i};
         __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 40, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 29, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
       }
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 40, __pyx_L1_error)
+      __PYX_ERR(0, 29, __pyx_L1_error)
 
-      /* "src/TSSCB/TSSCB.pyx":39
+      /* "src/TSSCB/TSSCB.pyx":28
  *         self.F2 = F2;   self.k1 = k1;   self.k2 = k2;   self.beta = beta
  *         if hardening is not None:
  *             if hardening != b'-hardening' and hardening != "-hardening":             # <<<<<<<<<<<<<<
@@ -3088,7 +3559,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":41
+    /* "src/TSSCB/TSSCB.pyx":30
  *             if hardening != b'-hardening' and hardening != "-hardening":
  *                 raise ValueError("`hardening` should be `-hardening` if given")
  *             self.hasHardening = True             # <<<<<<<<<<<<<<
@@ -3097,7 +3568,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
     __pyx_v_self->hasHardening = 1;
 
-    /* "src/TSSCB/TSSCB.pyx":38
+    /* "src/TSSCB/TSSCB.pyx":27
  *         self.F1 = F1;   self.k0 = k0;   self.ugap = ugap
  *         self.F2 = F2;   self.k1 = k1;   self.k2 = k2;   self.beta = beta
  *         if hardening is not None:             # <<<<<<<<<<<<<<
@@ -3107,7 +3578,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
     goto __pyx_L3;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":43
+  /* "src/TSSCB/TSSCB.pyx":32
  *             self.hasHardening = True
  *         else:
  *             self.hasHardening = False             # <<<<<<<<<<<<<<
@@ -3119,7 +3590,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   }
   __pyx_L3:;
 
-  /* "src/TSSCB/TSSCB.pyx":44
+  /* "src/TSSCB/TSSCB.pyx":33
  *         else:
  *             self.hasHardening = False
  *         if minmax is not None:             # <<<<<<<<<<<<<<
@@ -3129,25 +3600,32 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __pyx_t_1 = (__pyx_v_minmax != Py_None);
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":45
+
+    /* "src/TSSCB/TSSCB.pyx":34
  *             self.hasHardening = False
  *         if minmax is not None:
  *             if minmax != b'-minmax' and minmax != "-minmax":             # <<<<<<<<<<<<<<
  *                 raise ValueError("`minmax` should be `-minmax` if given")
  *         if _configType is not None:
 */
-    __pyx_t_2 = (__Pyx_PyBytes_Equals(__pyx_v_minmax, __pyx_mstate_global->__pyx_kp_b_minmax_2, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 45, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_bytes(__pyx_v_minmax, __pyx_mstate_global->__pyx_kp_b_minmax_2, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 34, __pyx_L1_error)
     if (__pyx_t_2) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_2;
+
       goto __pyx_L9_bool_binop_done;
     }
-    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_minmax, __pyx_mstate_global->__pyx_kp_u_minmax_2, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 45, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_str(__pyx_v_minmax, __pyx_mstate_global->__pyx_kp_u_minmax_2, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 34, __pyx_L1_error)
+
     __pyx_t_1 = __pyx_t_2;
+
     __pyx_L9_bool_binop_done:;
     if (unlikely(__pyx_t_1)) {
 
-      /* "src/TSSCB/TSSCB.pyx":46
+
+      /* "src/TSSCB/TSSCB.pyx":35
  *         if minmax is not None:
  *             if minmax != b'-minmax' and minmax != "-minmax":
  *                 raise ValueError("`minmax` should be `-minmax` if given")             # <<<<<<<<<<<<<<
@@ -3160,14 +3638,14 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
         PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_minmax_should_be_minmax_if_give};
         __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 35, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
       }
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 46, __pyx_L1_error)
+      __PYX_ERR(0, 35, __pyx_L1_error)
 
-      /* "src/TSSCB/TSSCB.pyx":45
+      /* "src/TSSCB/TSSCB.pyx":34
  *             self.hasHardening = False
  *         if minmax is not None:
  *             if minmax != b'-minmax' and minmax != "-minmax":             # <<<<<<<<<<<<<<
@@ -3176,7 +3654,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":44
+    /* "src/TSSCB/TSSCB.pyx":33
  *         else:
  *             self.hasHardening = False
  *         if minmax is not None:             # <<<<<<<<<<<<<<
@@ -3185,7 +3663,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":47
+  /* "src/TSSCB/TSSCB.pyx":36
  *             if minmax != b'-minmax' and minmax != "-minmax":
  *                 raise ValueError("`minmax` should be `-minmax` if given")
  *         if _configType is not None:             # <<<<<<<<<<<<<<
@@ -3195,25 +3673,32 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __pyx_t_1 = (__pyx_v__configType != Py_None);
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":48
+
+    /* "src/TSSCB/TSSCB.pyx":37
  *                 raise ValueError("`minmax` should be `-minmax` if given")
  *         if _configType is not None:
  *             if _configType != b'-configType' and _configType != "-configType":             # <<<<<<<<<<<<<<
  *                 raise ValueError("`_configType` should be `-configType` if given")
  *         if _up is not None:
 */
-    __pyx_t_2 = (__Pyx_PyBytes_Equals(__pyx_v__configType, __pyx_mstate_global->__pyx_kp_b_configType_3, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_bytes(__pyx_v__configType, __pyx_mstate_global->__pyx_kp_b_configType_3, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 37, __pyx_L1_error)
     if (__pyx_t_2) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_2;
+
       goto __pyx_L13_bool_binop_done;
     }
-    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v__configType, __pyx_mstate_global->__pyx_kp_u_configType_3, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_str(__pyx_v__configType, __pyx_mstate_global->__pyx_kp_u_configType_3, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 37, __pyx_L1_error)
+
     __pyx_t_1 = __pyx_t_2;
+
     __pyx_L13_bool_binop_done:;
     if (unlikely(__pyx_t_1)) {
 
-      /* "src/TSSCB/TSSCB.pyx":49
+
+      /* "src/TSSCB/TSSCB.pyx":38
  *         if _configType is not None:
  *             if _configType != b'-configType' and _configType != "-configType":
  *                 raise ValueError("`_configType` should be `-configType` if given")             # <<<<<<<<<<<<<<
@@ -3226,14 +3711,14 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
         PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_configType_should_be_configTyp};
         __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 49, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 38, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
       }
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 49, __pyx_L1_error)
+      __PYX_ERR(0, 38, __pyx_L1_error)
 
-      /* "src/TSSCB/TSSCB.pyx":48
+      /* "src/TSSCB/TSSCB.pyx":37
  *                 raise ValueError("`minmax` should be `-minmax` if given")
  *         if _configType is not None:
  *             if _configType != b'-configType' and _configType != "-configType":             # <<<<<<<<<<<<<<
@@ -3242,7 +3727,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":47
+    /* "src/TSSCB/TSSCB.pyx":36
  *             if minmax != b'-minmax' and minmax != "-minmax":
  *                 raise ValueError("`minmax` should be `-minmax` if given")
  *         if _configType is not None:             # <<<<<<<<<<<<<<
@@ -3251,7 +3736,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":50
+  /* "src/TSSCB/TSSCB.pyx":39
  *             if _configType != b'-configType' and _configType != "-configType":
  *                 raise ValueError("`_configType` should be `-configType` if given")
  *         if _up is not None:             # <<<<<<<<<<<<<<
@@ -3261,25 +3746,32 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __pyx_t_1 = (__pyx_v__up != Py_None);
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":51
+
+    /* "src/TSSCB/TSSCB.pyx":40
  *                 raise ValueError("`_configType` should be `-configType` if given")
  *         if _up is not None:
  *             if _up != b'-up' and _up != "-up":             # <<<<<<<<<<<<<<
  *                 raise ValueError("`_up` should be `-up` if given")
  *         self.uh = uh; self.r1 = r1; self.r2 = r2; self.r3 = r3; self.uf = uf
 */
-    __pyx_t_2 = (__Pyx_PyBytes_Equals(__pyx_v__up, __pyx_mstate_global->__pyx_kp_b_up_3, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_bytes(__pyx_v__up, __pyx_mstate_global->__pyx_kp_b_up_3, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 40, __pyx_L1_error)
     if (__pyx_t_2) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_2;
+
       goto __pyx_L17_bool_binop_done;
     }
-    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v__up, __pyx_mstate_global->__pyx_kp_u_up_3, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CompareBoolNe_object_str(__pyx_v__up, __pyx_mstate_global->__pyx_kp_u_up_3, Py_NE); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 40, __pyx_L1_error)
+
     __pyx_t_1 = __pyx_t_2;
+
     __pyx_L17_bool_binop_done:;
     if (unlikely(__pyx_t_1)) {
 
-      /* "src/TSSCB/TSSCB.pyx":52
+
+      /* "src/TSSCB/TSSCB.pyx":41
  *         if _up is not None:
  *             if _up != b'-up' and _up != "-up":
  *                 raise ValueError("`_up` should be `-up` if given")             # <<<<<<<<<<<<<<
@@ -3292,14 +3784,14 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
         PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_up_should_be_up_if_given};
         __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 52, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 41, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
       }
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 52, __pyx_L1_error)
+      __PYX_ERR(0, 41, __pyx_L1_error)
 
-      /* "src/TSSCB/TSSCB.pyx":51
+      /* "src/TSSCB/TSSCB.pyx":40
  *                 raise ValueError("`_configType` should be `-configType` if given")
  *         if _up is not None:
  *             if _up != b'-up' and _up != "-up":             # <<<<<<<<<<<<<<
@@ -3308,7 +3800,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":50
+    /* "src/TSSCB/TSSCB.pyx":39
  *             if _configType != b'-configType' and _configType != "-configType":
  *                 raise ValueError("`_configType` should be `-configType` if given")
  *         if _up is not None:             # <<<<<<<<<<<<<<
@@ -3317,7 +3809,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":53
+  /* "src/TSSCB/TSSCB.pyx":42
  *             if _up != b'-up' and _up != "-up":
  *                 raise ValueError("`_up` should be `-up` if given")
  *         self.uh = uh; self.r1 = r1; self.r2 = r2; self.r3 = r3; self.uf = uf             # <<<<<<<<<<<<<<
@@ -3330,7 +3822,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __pyx_v_self->r3 = __pyx_v_r3;
   __pyx_v_self->uf = __pyx_v_uf;
 
-  /* "src/TSSCB/TSSCB.pyx":54
+  /* "src/TSSCB/TSSCB.pyx":43
  *                 raise ValueError("`_up` should be `-up` if given")
  *         self.uh = uh; self.r1 = r1; self.r2 = r2; self.r3 = r3; self.uf = uf
  *         self.configType = configType             # <<<<<<<<<<<<<<
@@ -3339,7 +3831,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
   __pyx_v_self->configType = __pyx_v_configType;
 
-  /* "src/TSSCB/TSSCB.pyx":55
+  /* "src/TSSCB/TSSCB.pyx":44
  *         self.uh = uh; self.r1 = r1; self.r2 = r2; self.r3 = r3; self.uf = uf
  *         self.configType = configType
  *         self.up = up             # <<<<<<<<<<<<<<
@@ -3348,7 +3840,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
   __pyx_v_self->up = __pyx_v_up;
 
-  /* "src/TSSCB/TSSCB.pyx":57
+  /* "src/TSSCB/TSSCB.pyx":46
  *         self.up = up
  *         #  ua
  *         self.ua = self.ugap - self.F1 / self.k1             # <<<<<<<<<<<<<<
@@ -3357,11 +3849,11 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
   if (unlikely(__pyx_v_self->k1 == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 57, __pyx_L1_error)
+    __PYX_ERR(0, 46, __pyx_L1_error)
   }
   __pyx_v_self->ua = (__pyx_v_self->ugap - (__pyx_v_self->F1 / __pyx_v_self->k1));
 
-  /* "src/TSSCB/TSSCB.pyx":58
+  /* "src/TSSCB/TSSCB.pyx":47
  *         #  ua
  *         self.ua = self.ugap - self.F1 / self.k1
  *         if self.ua < 0:             # <<<<<<<<<<<<<<
@@ -3369,9 +3861,11 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
  *         #
 */
   __pyx_t_1 = (__pyx_v_self->ua < 0.0);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":59
+
+    /* "src/TSSCB/TSSCB.pyx":48
  *         self.ua = self.ugap - self.F1 / self.k1
  *         if self.ua < 0:
  *             self.ua = 0.0             # <<<<<<<<<<<<<<
@@ -3380,7 +3874,7 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
     __pyx_v_self->ua = 0.0;
 
-    /* "src/TSSCB/TSSCB.pyx":58
+    /* "src/TSSCB/TSSCB.pyx":47
  *         #  ua
  *         self.ua = self.ugap - self.F1 / self.k1
  *         if self.ua < 0:             # <<<<<<<<<<<<<<
@@ -3389,26 +3883,26 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":61
+  /* "src/TSSCB/TSSCB.pyx":50
  *             self.ua = 0.0
  *         #
  *         self._check_paras()             # <<<<<<<<<<<<<<
  *         self._init_paras()
  * 
 */
-  ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_check_paras(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_check_paras(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 50, __pyx_L1_error)
 
-  /* "src/TSSCB/TSSCB.pyx":62
+  /* "src/TSSCB/TSSCB.pyx":51
  *         #
  *         self._check_paras()
  *         self._init_paras()             # <<<<<<<<<<<<<<
  * 
  *     cdef void _check_paras(self):
 */
-  ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_init_paras(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 62, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_init_paras(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 51, __pyx_L1_error)
 
-  /* "src/TSSCB/TSSCB.pyx":27
- *     cdef int i
+  /* "src/TSSCB/TSSCB.pyx":16
+ * cdef class TSSCB(CUniaxialMaterial):
  * 
  *     def __cinit__(self,             # <<<<<<<<<<<<<<
  *                   int tag,
@@ -3424,11 +3918,12 @@ static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB___cinit__(struct __pyx_obj_3src_5T
   __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
+
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":64
+/* "src/TSSCB/TSSCB.pyx":53
  *         self._init_paras()
  * 
  *     cdef void _check_paras(self):             # <<<<<<<<<<<<<<
@@ -3448,7 +3943,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_check_paras", 0);
 
-  /* "src/TSSCB/TSSCB.pyx":65
+  /* "src/TSSCB/TSSCB.pyx":54
  * 
  *     cdef void _check_paras(self):
  *         if not (self.F1 >= 0 and self.k0 > 0 and self.ugap >= 0 and             # <<<<<<<<<<<<<<
@@ -3456,25 +3951,37 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
  *                 0 <= self.beta <= 2 and self.uh > 0 and
 */
   __pyx_t_2 = (__pyx_v_self->F1 >= 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->k0 > 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->ugap >= 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":66
+  /* "src/TSSCB/TSSCB.pyx":55
  *     cdef void _check_paras(self):
  *         if not (self.F1 >= 0 and self.k0 > 0 and self.ugap >= 0 and
  *                 self.F2 > 0 and self.k1 > 0 and self.k2 > 0 and             # <<<<<<<<<<<<<<
@@ -3482,25 +3989,37 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
  *                 self.r1 >= 0 and self.r2 >= 0 and self.r3 >= 0 and
 */
   __pyx_t_2 = (__pyx_v_self->F2 > 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->k1 > 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->k2 > 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":67
+  /* "src/TSSCB/TSSCB.pyx":56
  *         if not (self.F1 >= 0 and self.k0 > 0 and self.ugap >= 0 and
  *                 self.F2 > 0 and self.k1 > 0 and self.k2 > 0 and
  *                 0 <= self.beta <= 2 and self.uh > 0 and             # <<<<<<<<<<<<<<
@@ -3512,18 +4031,25 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
     __pyx_t_2 = (__pyx_v_self->beta <= 2.0);
   }
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->uh > 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":68
+  /* "src/TSSCB/TSSCB.pyx":57
  *                 self.F2 > 0 and self.k1 > 0 and self.k2 > 0 and
  *                 0 <= self.beta <= 2 and self.uh > 0 and
  *                 self.r1 >= 0 and self.r2 >= 0 and self.r3 >= 0 and             # <<<<<<<<<<<<<<
@@ -3531,25 +4057,37 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
  *             raise ValueError("Invalid parameters for TSSCBMaterial")
 */
   __pyx_t_2 = (__pyx_v_self->r1 >= 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->r2 >= 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->r3 >= 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":69
+  /* "src/TSSCB/TSSCB.pyx":58
  *                 0 <= self.beta <= 2 and self.uh > 0 and
  *                 self.r1 >= 0 and self.r2 >= 0 and self.r3 >= 0 and
  *                 self.uf > 0 and self.up >= 0):             # <<<<<<<<<<<<<<
@@ -3557,16 +4095,23 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
  * 
 */
   __pyx_t_2 = (__pyx_v_self->uf > 0.0);
+
   if (__pyx_t_2) {
+
   } else {
+
     __pyx_t_1 = __pyx_t_2;
+
     goto __pyx_L4_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->up >= 0.0);
+
+
   __pyx_t_1 = __pyx_t_2;
+
   __pyx_L4_bool_binop_done:;
 
-  /* "src/TSSCB/TSSCB.pyx":65
+  /* "src/TSSCB/TSSCB.pyx":54
  * 
  *     cdef void _check_paras(self):
  *         if not (self.F1 >= 0 and self.k0 > 0 and self.ugap >= 0 and             # <<<<<<<<<<<<<<
@@ -3574,9 +4119,12 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
  *                 0 <= self.beta <= 2 and self.uh > 0 and
 */
   __pyx_t_2 = (!__pyx_t_1);
+
+
   if (unlikely(__pyx_t_2)) {
 
-    /* "src/TSSCB/TSSCB.pyx":70
+
+    /* "src/TSSCB/TSSCB.pyx":59
  *                 self.r1 >= 0 and self.r2 >= 0 and self.r3 >= 0 and
  *                 self.uf > 0 and self.up >= 0):
  *             raise ValueError("Invalid parameters for TSSCBMaterial")             # <<<<<<<<<<<<<<
@@ -3589,14 +4137,14 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
       PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_Invalid_parameters_for_TSSCBMate};
       __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 59, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
     }
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 70, __pyx_L1_error)
+    __PYX_ERR(0, 59, __pyx_L1_error)
 
-    /* "src/TSSCB/TSSCB.pyx":65
+    /* "src/TSSCB/TSSCB.pyx":54
  * 
  *     cdef void _check_paras(self):
  *         if not (self.F1 >= 0 and self.k0 > 0 and self.ugap >= 0 and             # <<<<<<<<<<<<<<
@@ -3605,7 +4153,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":64
+  /* "src/TSSCB/TSSCB.pyx":53
  *         self._init_paras()
  * 
  *     cdef void _check_paras(self):             # <<<<<<<<<<<<<<
@@ -3620,10 +4168,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras(struct __pyx_obj_3src
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB._check_paras", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_L0:;
+
   __Pyx_RefNannyFinishContext();
 }
 
-/* "src/TSSCB/TSSCB.pyx":72
+/* "src/TSSCB/TSSCB.pyx":61
  *             raise ValueError("Invalid parameters for TSSCBMaterial")
  * 
  *     cdef void _init_paras(self):             # <<<<<<<<<<<<<<
@@ -3635,7 +4184,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   int __pyx_t_1;
   double __pyx_t_2;
 
-  /* "src/TSSCB/TSSCB.pyx":74
+  /* "src/TSSCB/TSSCB.pyx":63
  *     cdef void _init_paras(self):
  *         #
  *         self.Cstage = 1; self.Tstage = 1             # <<<<<<<<<<<<<<
@@ -3645,7 +4194,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cstage = 1;
   __pyx_v_self->Tstage = 1;
 
-  /* "src/TSSCB/TSSCB.pyx":75
+  /* "src/TSSCB/TSSCB.pyx":64
  *         #
  *         self.Cstage = 1; self.Tstage = 1
  *         self.Cstrain = 0.0; self.Tstrain = 0.0             # <<<<<<<<<<<<<<
@@ -3655,7 +4204,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cstrain = 0.0;
   __pyx_v_self->Tstrain = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":76
+  /* "src/TSSCB/TSSCB.pyx":65
  *         self.Cstage = 1; self.Tstage = 1
  *         self.Cstrain = 0.0; self.Tstrain = 0.0
  *         self.Cstress3 = 0.0; self.Tstress3 = 0.0             # <<<<<<<<<<<<<<
@@ -3665,7 +4214,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cstress3 = 0.0;
   __pyx_v_self->Tstress3 = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":77
+  /* "src/TSSCB/TSSCB.pyx":66
  *         self.Cstrain = 0.0; self.Tstrain = 0.0
  *         self.Cstress3 = 0.0; self.Tstress3 = 0.0
  *         if self.ugap == 0.0:             # <<<<<<<<<<<<<<
@@ -3673,9 +4222,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
  *             self.Cstage = 2; self.Tstage = 2
 */
   __pyx_t_1 = (__pyx_v_self->ugap == 0.0);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":78
+
+    /* "src/TSSCB/TSSCB.pyx":67
  *         self.Cstress3 = 0.0; self.Tstress3 = 0.0
  *         if self.ugap == 0.0:
  *             self.Ctangent = self.k1; self.Ttangent = self.k1             # <<<<<<<<<<<<<<
@@ -3683,11 +4234,13 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
  *         else:
 */
     __pyx_t_2 = __pyx_v_self->k1;
+
     __pyx_v_self->Ctangent = __pyx_t_2;
     __pyx_t_2 = __pyx_v_self->k1;
+
     __pyx_v_self->Ttangent = __pyx_t_2;
 
-    /* "src/TSSCB/TSSCB.pyx":79
+    /* "src/TSSCB/TSSCB.pyx":68
  *         if self.ugap == 0.0:
  *             self.Ctangent = self.k1; self.Ttangent = self.k1
  *             self.Cstage = 2; self.Tstage = 2             # <<<<<<<<<<<<<<
@@ -3697,7 +4250,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
     __pyx_v_self->Cstage = 2;
     __pyx_v_self->Tstage = 2;
 
-    /* "src/TSSCB/TSSCB.pyx":77
+    /* "src/TSSCB/TSSCB.pyx":66
  *         self.Cstrain = 0.0; self.Tstrain = 0.0
  *         self.Cstress3 = 0.0; self.Tstress3 = 0.0
  *         if self.ugap == 0.0:             # <<<<<<<<<<<<<<
@@ -3707,7 +4260,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
     goto __pyx_L3;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":81
+  /* "src/TSSCB/TSSCB.pyx":70
  *             self.Cstage = 2; self.Tstage = 2
  *         else:
  *             self.Ctangent = self.k0; self.Ttangent = self.k0             # <<<<<<<<<<<<<<
@@ -3716,13 +4269,15 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
 */
   /*else*/ {
     __pyx_t_2 = __pyx_v_self->k0;
+
     __pyx_v_self->Ctangent = __pyx_t_2;
     __pyx_t_2 = __pyx_v_self->k0;
+
     __pyx_v_self->Ttangent = __pyx_t_2;
   }
   __pyx_L3:;
 
-  /* "src/TSSCB/TSSCB.pyx":82
+  /* "src/TSSCB/TSSCB.pyx":71
  *         else:
  *             self.Ctangent = self.k0; self.Ttangent = self.k0
  *         self.Chardening = False; self.Thardening = False             # <<<<<<<<<<<<<<
@@ -3732,7 +4287,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Chardening = 0;
   __pyx_v_self->Thardening = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":83
+  /* "src/TSSCB/TSSCB.pyx":72
  *             self.Ctangent = self.k0; self.Ttangent = self.k0
  *         self.Chardening = False; self.Thardening = False
  *         self.Cstress1 = 0.0; self.Tstress1 = 0.0             # <<<<<<<<<<<<<<
@@ -3742,7 +4297,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cstress1 = 0.0;
   __pyx_v_self->Tstress1 = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":84
+  /* "src/TSSCB/TSSCB.pyx":73
  *         self.Chardening = False; self.Thardening = False
  *         self.Cstress1 = 0.0; self.Tstress1 = 0.0
  *         self.Cstress2 = 0.0; self.Tstress2 = 0.0             # <<<<<<<<<<<<<<
@@ -3752,7 +4307,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cstress2 = 0.0;
   __pyx_v_self->Tstress2 = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":85
+  /* "src/TSSCB/TSSCB.pyx":74
  *         self.Cstress1 = 0.0; self.Tstress1 = 0.0
  *         self.Cstress2 = 0.0; self.Tstress2 = 0.0
  *         self.Cstress4 = 0.0; self.Tstress4 = 0.0             # <<<<<<<<<<<<<<
@@ -3762,7 +4317,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cstress4 = 0.0;
   __pyx_v_self->Tstress4 = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":86
+  /* "src/TSSCB/TSSCB.pyx":75
  *         self.Cstress2 = 0.0; self.Tstress2 = 0.0
  *         self.Cstress4 = 0.0; self.Tstress4 = 0.0
  *         self.CCDD = 0.0; self.TCDD = 0.0             # <<<<<<<<<<<<<<
@@ -3772,7 +4327,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->CCDD = 0.0;
   __pyx_v_self->TCDD = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":87
+  /* "src/TSSCB/TSSCB.pyx":76
  *         self.Cstress4 = 0.0; self.Tstress4 = 0.0
  *         self.CCDD = 0.0; self.TCDD = 0.0
  *         self.Cfracture = False; self.Tfracture = False             # <<<<<<<<<<<<<<
@@ -3782,7 +4337,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cfracture = 0;
   __pyx_v_self->Tfracture = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":88
+  /* "src/TSSCB/TSSCB.pyx":77
  *         self.CCDD = 0.0; self.TCDD = 0.0
  *         self.Cfracture = False; self.Tfracture = False
  *         self.Cplate1 = self.ugap; self.Tplate1 = self.ugap             # <<<<<<<<<<<<<<
@@ -3790,11 +4345,13 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
  *         self.Cfracturing = False; self.Tfracturing = False
 */
   __pyx_t_2 = __pyx_v_self->ugap;
+
   __pyx_v_self->Cplate1 = __pyx_t_2;
   __pyx_t_2 = __pyx_v_self->ugap;
+
   __pyx_v_self->Tplate1 = __pyx_t_2;
 
-  /* "src/TSSCB/TSSCB.pyx":89
+  /* "src/TSSCB/TSSCB.pyx":78
  *         self.Cfracture = False; self.Tfracture = False
  *         self.Cplate1 = self.ugap; self.Tplate1 = self.ugap
  *         self.Cplate2 = -self.ugap; self.Tplate2 = -self.ugap             # <<<<<<<<<<<<<<
@@ -3804,7 +4361,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cplate2 = (-__pyx_v_self->ugap);
   __pyx_v_self->Tplate2 = (-__pyx_v_self->ugap);
 
-  /* "src/TSSCB/TSSCB.pyx":90
+  /* "src/TSSCB/TSSCB.pyx":79
  *         self.Cplate1 = self.ugap; self.Tplate1 = self.ugap
  *         self.Cplate2 = -self.ugap; self.Tplate2 = -self.ugap
  *         self.Cfracturing = False; self.Tfracturing = False             # <<<<<<<<<<<<<<
@@ -3814,7 +4371,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Cfracturing = 0;
   __pyx_v_self->Tfracturing = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":91
+  /* "src/TSSCB/TSSCB.pyx":80
  *         self.Cplate2 = -self.ugap; self.Tplate2 = -self.ugap
  *         self.Cfracturing = False; self.Tfracturing = False
  *         self.CfractureFore = 0.0; self.TfractureFore = 0.0             # <<<<<<<<<<<<<<
@@ -3824,7 +4381,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->CfractureFore = 0.0;
   __pyx_v_self->TfractureFore = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":92
+  /* "src/TSSCB/TSSCB.pyx":81
  *         self.Cfracturing = False; self.Tfracturing = False
  *         self.CfractureFore = 0.0; self.TfractureFore = 0.0
  *         self.Crp = 0.0; self.Trp = 0.0             # <<<<<<<<<<<<<<
@@ -3834,16 +4391,16 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
   __pyx_v_self->Crp = 0.0;
   __pyx_v_self->Trp = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":93
+  /* "src/TSSCB/TSSCB.pyx":82
  *         self.CfractureFore = 0.0; self.TfractureFore = 0.0
  *         self.Crp = 0.0; self.Trp = 0.0
  *         self.i = 0             # <<<<<<<<<<<<<<
  * 
- *     cpdef setTrialStrain(self, double strain, double strainRate=0):
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=0):
 */
   __pyx_v_self->i = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":72
+  /* "src/TSSCB/TSSCB.pyx":61
  *             raise ValueError("Invalid parameters for TSSCBMaterial")
  * 
  *     cdef void _init_paras(self):             # <<<<<<<<<<<<<<
@@ -3852,27 +4409,27 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras(struct __pyx_obj_3src_
 */
 
   /* function exit code */
+
 }
 
-/* "src/TSSCB/TSSCB.pyx":95
+/* "src/TSSCB/TSSCB.pyx":84
  *         self.i = 0
  * 
- *     cpdef setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
  *         cdef double dStrain
  *         #
 */
 
 static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain *__pyx_optional_args) {
+static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain *__pyx_optional_args) {
   double __pyx_v_strainRate = ((double)0.0);
   double __pyx_v_dStrain;
-  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -3910,16 +4467,15 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_setTrialStrain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_setTrialStrain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain)) {
-        __Pyx_XDECREF(__pyx_r);
         __pyx_t_3 = NULL;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_4 = __pyx_t_1; 
-        __pyx_t_5 = PyFloat_FromDouble(__pyx_v_strain); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 95, __pyx_L1_error)
+        __pyx_t_5 = PyFloat_FromDouble(__pyx_v_strain); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 84, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_6 = PyFloat_FromDouble(__pyx_v_strainRate); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 95, __pyx_L1_error)
+        __pyx_t_6 = PyFloat_FromDouble(__pyx_v_strainRate); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 84, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __pyx_t_7 = 1;
         #if CYTHON_UNPACK_METHODS
@@ -3940,11 +4496,12 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
           __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
           __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
-        __pyx_r = __pyx_t_2;
-        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        {
+        }
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
       }
@@ -3961,7 +4518,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
     #endif
   }
 
-  /* "src/TSSCB/TSSCB.pyx":98
+  /* "src/TSSCB/TSSCB.pyx":87
  *         cdef double dStrain
  *         #
  *         self.Tstrain = self.Cstrain             # <<<<<<<<<<<<<<
@@ -3969,9 +4526,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Ttangent = self.Ctangent
 */
   __pyx_t_8 = __pyx_v_self->Cstrain;
+
   __pyx_v_self->Tstrain = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":99
+  /* "src/TSSCB/TSSCB.pyx":88
  *         #
  *         self.Tstrain = self.Cstrain
  *         self.Tstress3 = self.Cstress3             # <<<<<<<<<<<<<<
@@ -3979,9 +4537,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Tstage = self.Cstage
 */
   __pyx_t_8 = __pyx_v_self->Cstress3;
+
   __pyx_v_self->Tstress3 = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":100
+  /* "src/TSSCB/TSSCB.pyx":89
  *         self.Tstrain = self.Cstrain
  *         self.Tstress3 = self.Cstress3
  *         self.Ttangent = self.Ctangent             # <<<<<<<<<<<<<<
@@ -3989,9 +4548,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Thardening = self.Chardening
 */
   __pyx_t_8 = __pyx_v_self->Ctangent;
+
   __pyx_v_self->Ttangent = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":101
+  /* "src/TSSCB/TSSCB.pyx":90
  *         self.Tstress3 = self.Cstress3
  *         self.Ttangent = self.Ctangent
  *         self.Tstage = self.Cstage             # <<<<<<<<<<<<<<
@@ -3999,9 +4559,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Tstress1 = self.Cstress1
 */
   __pyx_t_9 = __pyx_v_self->Cstage;
+
   __pyx_v_self->Tstage = __pyx_t_9;
 
-  /* "src/TSSCB/TSSCB.pyx":102
+  /* "src/TSSCB/TSSCB.pyx":91
  *         self.Ttangent = self.Ctangent
  *         self.Tstage = self.Cstage
  *         self.Thardening = self.Chardening             # <<<<<<<<<<<<<<
@@ -4009,9 +4570,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Tstress2 = self.Cstress2
 */
   __pyx_t_10 = __pyx_v_self->Chardening;
+
   __pyx_v_self->Thardening = __pyx_t_10;
 
-  /* "src/TSSCB/TSSCB.pyx":103
+  /* "src/TSSCB/TSSCB.pyx":92
  *         self.Tstage = self.Cstage
  *         self.Thardening = self.Chardening
  *         self.Tstress1 = self.Cstress1             # <<<<<<<<<<<<<<
@@ -4019,9 +4581,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Tstress4 = self.Cstress4
 */
   __pyx_t_8 = __pyx_v_self->Cstress1;
+
   __pyx_v_self->Tstress1 = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":104
+  /* "src/TSSCB/TSSCB.pyx":93
  *         self.Thardening = self.Chardening
  *         self.Tstress1 = self.Cstress1
  *         self.Tstress2 = self.Cstress2             # <<<<<<<<<<<<<<
@@ -4029,9 +4592,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.TCDD = self.CCDD
 */
   __pyx_t_8 = __pyx_v_self->Cstress2;
+
   __pyx_v_self->Tstress2 = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":105
+  /* "src/TSSCB/TSSCB.pyx":94
  *         self.Tstress1 = self.Cstress1
  *         self.Tstress2 = self.Cstress2
  *         self.Tstress4 = self.Cstress4             # <<<<<<<<<<<<<<
@@ -4039,9 +4603,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Tfracture = self.Cfracture
 */
   __pyx_t_8 = __pyx_v_self->Cstress4;
+
   __pyx_v_self->Tstress4 = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":106
+  /* "src/TSSCB/TSSCB.pyx":95
  *         self.Tstress2 = self.Cstress2
  *         self.Tstress4 = self.Cstress4
  *         self.TCDD = self.CCDD             # <<<<<<<<<<<<<<
@@ -4049,9 +4614,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Tplate1 = self.Cplate1
 */
   __pyx_t_8 = __pyx_v_self->CCDD;
+
   __pyx_v_self->TCDD = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":107
+  /* "src/TSSCB/TSSCB.pyx":96
  *         self.Tstress4 = self.Cstress4
  *         self.TCDD = self.CCDD
  *         self.Tfracture = self.Cfracture             # <<<<<<<<<<<<<<
@@ -4059,9 +4625,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         self.Tplate2 = self.Cplate2
 */
   __pyx_t_10 = __pyx_v_self->Cfracture;
+
   __pyx_v_self->Tfracture = __pyx_t_10;
 
-  /* "src/TSSCB/TSSCB.pyx":108
+  /* "src/TSSCB/TSSCB.pyx":97
  *         self.TCDD = self.CCDD
  *         self.Tfracture = self.Cfracture
  *         self.Tplate1 = self.Cplate1             # <<<<<<<<<<<<<<
@@ -4069,9 +4636,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         #
 */
   __pyx_t_8 = __pyx_v_self->Cplate1;
+
   __pyx_v_self->Tplate1 = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":109
+  /* "src/TSSCB/TSSCB.pyx":98
  *         self.Tfracture = self.Cfracture
  *         self.Tplate1 = self.Cplate1
  *         self.Tplate2 = self.Cplate2             # <<<<<<<<<<<<<<
@@ -4079,9 +4647,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *         dStrain = strain - self.Cstrain
 */
   __pyx_t_8 = __pyx_v_self->Cplate2;
+
   __pyx_v_self->Tplate2 = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":111
+  /* "src/TSSCB/TSSCB.pyx":100
  *         self.Tplate2 = self.Cplate2
  *         #
  *         dStrain = strain - self.Cstrain             # <<<<<<<<<<<<<<
@@ -4090,7 +4659,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
   __pyx_v_dStrain = (__pyx_v_strain - __pyx_v_self->Cstrain);
 
-  /* "src/TSSCB/TSSCB.pyx":112
+  /* "src/TSSCB/TSSCB.pyx":101
  *         #
  *         dStrain = strain - self.Cstrain
  *         if fabs(dStrain) > DBL_EPSILON:             # <<<<<<<<<<<<<<
@@ -4098,9 +4667,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             #
 */
   __pyx_t_10 = (fabs(__pyx_v_dStrain) > DBL_EPSILON);
+
   if (__pyx_t_10) {
 
-    /* "src/TSSCB/TSSCB.pyx":113
+
+    /* "src/TSSCB/TSSCB.pyx":102
  *         dStrain = strain - self.Cstrain
  *         if fabs(dStrain) > DBL_EPSILON:
  *             self.Tstrain = strain             # <<<<<<<<<<<<<<
@@ -4109,7 +4680,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     __pyx_v_self->Tstrain = __pyx_v_strain;
 
-    /* "src/TSSCB/TSSCB.pyx":115
+    /* "src/TSSCB/TSSCB.pyx":104
  *             self.Tstrain = strain
  *             #
  *             if fabs(self.Tstrain) > self.uh or self.Chardening:             # <<<<<<<<<<<<<<
@@ -4117,16 +4688,22 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             if fabs(self.Tstrain) > self.uf:
 */
     __pyx_t_11 = (fabs(__pyx_v_self->Tstrain) > __pyx_v_self->uh);
+
     if (!__pyx_t_11) {
+
     } else {
+
       __pyx_t_10 = __pyx_t_11;
+
       goto __pyx_L5_bool_binop_done;
     }
+
     __pyx_t_10 = __pyx_v_self->Chardening;
     __pyx_L5_bool_binop_done:;
     if (__pyx_t_10) {
 
-      /* "src/TSSCB/TSSCB.pyx":116
+
+      /* "src/TSSCB/TSSCB.pyx":105
  *             #
  *             if fabs(self.Tstrain) > self.uh or self.Chardening:
  *                 self.Thardening = True             # <<<<<<<<<<<<<<
@@ -4135,7 +4712,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
       __pyx_v_self->Thardening = 1;
 
-      /* "src/TSSCB/TSSCB.pyx":115
+      /* "src/TSSCB/TSSCB.pyx":104
  *             self.Tstrain = strain
  *             #
  *             if fabs(self.Tstrain) > self.uh or self.Chardening:             # <<<<<<<<<<<<<<
@@ -4144,7 +4721,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":117
+    /* "src/TSSCB/TSSCB.pyx":106
  *             if fabs(self.Tstrain) > self.uh or self.Chardening:
  *                 self.Thardening = True
  *             if fabs(self.Tstrain) > self.uf:             # <<<<<<<<<<<<<<
@@ -4152,9 +4729,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                     self.Tfracture = True
 */
     __pyx_t_10 = (fabs(__pyx_v_self->Tstrain) > __pyx_v_self->uf);
+
     if (__pyx_t_10) {
 
-      /* "src/TSSCB/TSSCB.pyx":118
+
+      /* "src/TSSCB/TSSCB.pyx":107
  *                 self.Thardening = True
  *             if fabs(self.Tstrain) > self.uf:
  *                 if self.up == 0.0:             # <<<<<<<<<<<<<<
@@ -4162,9 +4741,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                 else:
 */
       __pyx_t_10 = (__pyx_v_self->up == 0.0);
+
       if (__pyx_t_10) {
 
-        /* "src/TSSCB/TSSCB.pyx":119
+
+        /* "src/TSSCB/TSSCB.pyx":108
  *             if fabs(self.Tstrain) > self.uf:
  *                 if self.up == 0.0:
  *                     self.Tfracture = True             # <<<<<<<<<<<<<<
@@ -4173,7 +4754,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
         __pyx_v_self->Tfracture = 1;
 
-        /* "src/TSSCB/TSSCB.pyx":118
+        /* "src/TSSCB/TSSCB.pyx":107
  *                 self.Thardening = True
  *             if fabs(self.Tstrain) > self.uf:
  *                 if self.up == 0.0:             # <<<<<<<<<<<<<<
@@ -4183,7 +4764,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
         goto __pyx_L8;
       }
 
-      /* "src/TSSCB/TSSCB.pyx":121
+      /* "src/TSSCB/TSSCB.pyx":110
  *                     self.Tfracture = True
  *                 else:
  *                     self.Tfracturing = True             # <<<<<<<<<<<<<<
@@ -4195,7 +4776,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
       }
       __pyx_L8:;
 
-      /* "src/TSSCB/TSSCB.pyx":117
+      /* "src/TSSCB/TSSCB.pyx":106
  *             if fabs(self.Tstrain) > self.uh or self.Chardening:
  *                 self.Thardening = True
  *             if fabs(self.Tstrain) > self.uf:             # <<<<<<<<<<<<<<
@@ -4204,7 +4785,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":122
+    /* "src/TSSCB/TSSCB.pyx":111
  *                 else:
  *                     self.Tfracturing = True
  *             if self.Tfracturing:             # <<<<<<<<<<<<<<
@@ -4213,7 +4794,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     if (__pyx_v_self->Tfracturing) {
 
-      /* "src/TSSCB/TSSCB.pyx":123
+      /* "src/TSSCB/TSSCB.pyx":112
  *                     self.Tfracturing = True
  *             if self.Tfracturing:
  *                 self.Trp = self.Crp + fabs(dStrain) / self.up             # <<<<<<<<<<<<<<
@@ -4221,13 +4802,15 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                     self.Tfracture = True
 */
       __pyx_t_8 = fabs(__pyx_v_dStrain);
+
       if (unlikely(__pyx_v_self->up == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 123, __pyx_L1_error)
+        __PYX_ERR(0, 112, __pyx_L1_error)
       }
       __pyx_v_self->Trp = (__pyx_v_self->Crp + (__pyx_t_8 / __pyx_v_self->up));
 
-      /* "src/TSSCB/TSSCB.pyx":124
+
+      /* "src/TSSCB/TSSCB.pyx":113
  *             if self.Tfracturing:
  *                 self.Trp = self.Crp + fabs(dStrain) / self.up
  *                 if self.Trp >= 1.0:             # <<<<<<<<<<<<<<
@@ -4235,9 +4818,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                     self.Trp = 1.0
 */
       __pyx_t_10 = (__pyx_v_self->Trp >= 1.0);
+
       if (__pyx_t_10) {
 
-        /* "src/TSSCB/TSSCB.pyx":125
+
+        /* "src/TSSCB/TSSCB.pyx":114
  *                 self.Trp = self.Crp + fabs(dStrain) / self.up
  *                 if self.Trp >= 1.0:
  *                     self.Tfracture = True             # <<<<<<<<<<<<<<
@@ -4246,7 +4831,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
         __pyx_v_self->Tfracture = 1;
 
-        /* "src/TSSCB/TSSCB.pyx":126
+        /* "src/TSSCB/TSSCB.pyx":115
  *                 if self.Trp >= 1.0:
  *                     self.Tfracture = True
  *                     self.Trp = 1.0             # <<<<<<<<<<<<<<
@@ -4255,7 +4840,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
         __pyx_v_self->Trp = 1.0;
 
-        /* "src/TSSCB/TSSCB.pyx":124
+        /* "src/TSSCB/TSSCB.pyx":113
  *             if self.Tfracturing:
  *                 self.Trp = self.Crp + fabs(dStrain) / self.up
  *                 if self.Trp >= 1.0:             # <<<<<<<<<<<<<<
@@ -4264,7 +4849,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
       }
 
-      /* "src/TSSCB/TSSCB.pyx":127
+      /* "src/TSSCB/TSSCB.pyx":116
  *                     self.Tfracture = True
  *                     self.Trp = 1.0
  *                 if self.Crp == 0.0:             # <<<<<<<<<<<<<<
@@ -4272,9 +4857,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             #
 */
       __pyx_t_10 = (__pyx_v_self->Crp == 0.0);
+
       if (__pyx_t_10) {
 
-        /* "src/TSSCB/TSSCB.pyx":128
+
+        /* "src/TSSCB/TSSCB.pyx":117
  *                     self.Trp = 1.0
  *                 if self.Crp == 0.0:
  *                     self.TfractureFore = self.Cstress4             # <<<<<<<<<<<<<<
@@ -4282,9 +4869,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             self._determineTrialState(dStrain)
 */
         __pyx_t_8 = __pyx_v_self->Cstress4;
+
         __pyx_v_self->TfractureFore = __pyx_t_8;
 
-        /* "src/TSSCB/TSSCB.pyx":127
+        /* "src/TSSCB/TSSCB.pyx":116
  *                     self.Tfracture = True
  *                     self.Trp = 1.0
  *                 if self.Crp == 0.0:             # <<<<<<<<<<<<<<
@@ -4293,7 +4881,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
       }
 
-      /* "src/TSSCB/TSSCB.pyx":122
+      /* "src/TSSCB/TSSCB.pyx":111
  *                 else:
  *                     self.Tfracturing = True
  *             if self.Tfracturing:             # <<<<<<<<<<<<<<
@@ -4302,16 +4890,16 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":130
+    /* "src/TSSCB/TSSCB.pyx":119
  *                     self.TfractureFore = self.Cstress4
  *             #
  *             self._determineTrialState(dStrain)             # <<<<<<<<<<<<<<
  *             #
  *             if dStrain > 0:
 */
-    ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_determineTrialState(__pyx_v_self, __pyx_v_dStrain); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L1_error)
+    ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_determineTrialState(__pyx_v_self, __pyx_v_dStrain); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 119, __pyx_L1_error)
 
-    /* "src/TSSCB/TSSCB.pyx":132
+    /* "src/TSSCB/TSSCB.pyx":121
  *             self._determineTrialState(dStrain)
  *             #
  *             if dStrain > 0:             # <<<<<<<<<<<<<<
@@ -4319,9 +4907,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                     self.Tplate1 = self.Tstrain
 */
     __pyx_t_10 = (__pyx_v_dStrain > 0.0);
+
     if (__pyx_t_10) {
 
-      /* "src/TSSCB/TSSCB.pyx":133
+
+      /* "src/TSSCB/TSSCB.pyx":122
  *             #
  *             if dStrain > 0:
  *                 if self.Tplate1 < self.Tstrain:             # <<<<<<<<<<<<<<
@@ -4329,9 +4919,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                 if not self.Tfracture:
 */
       __pyx_t_10 = (__pyx_v_self->Tplate1 < __pyx_v_self->Tstrain);
+
       if (__pyx_t_10) {
 
-        /* "src/TSSCB/TSSCB.pyx":134
+
+        /* "src/TSSCB/TSSCB.pyx":123
  *             if dStrain > 0:
  *                 if self.Tplate1 < self.Tstrain:
  *                     self.Tplate1 = self.Tstrain             # <<<<<<<<<<<<<<
@@ -4339,9 +4931,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                     self.Tplate2 += dStrain
 */
         __pyx_t_8 = __pyx_v_self->Tstrain;
+
         __pyx_v_self->Tplate1 = __pyx_t_8;
 
-        /* "src/TSSCB/TSSCB.pyx":133
+        /* "src/TSSCB/TSSCB.pyx":122
  *             #
  *             if dStrain > 0:
  *                 if self.Tplate1 < self.Tstrain:             # <<<<<<<<<<<<<<
@@ -4350,7 +4943,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
       }
 
-      /* "src/TSSCB/TSSCB.pyx":135
+      /* "src/TSSCB/TSSCB.pyx":124
  *                 if self.Tplate1 < self.Tstrain:
  *                     self.Tplate1 = self.Tstrain
  *                 if not self.Tfracture:             # <<<<<<<<<<<<<<
@@ -4358,9 +4951,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             else:
 */
       __pyx_t_10 = (!__pyx_v_self->Tfracture);
+
       if (__pyx_t_10) {
 
-        /* "src/TSSCB/TSSCB.pyx":136
+
+        /* "src/TSSCB/TSSCB.pyx":125
  *                     self.Tplate1 = self.Tstrain
  *                 if not self.Tfracture:
  *                     self.Tplate2 += dStrain             # <<<<<<<<<<<<<<
@@ -4369,7 +4964,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
         __pyx_v_self->Tplate2 = (__pyx_v_self->Tplate2 + __pyx_v_dStrain);
 
-        /* "src/TSSCB/TSSCB.pyx":135
+        /* "src/TSSCB/TSSCB.pyx":124
  *                 if self.Tplate1 < self.Tstrain:
  *                     self.Tplate1 = self.Tstrain
  *                 if not self.Tfracture:             # <<<<<<<<<<<<<<
@@ -4378,7 +4973,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
       }
 
-      /* "src/TSSCB/TSSCB.pyx":132
+      /* "src/TSSCB/TSSCB.pyx":121
  *             self._determineTrialState(dStrain)
  *             #
  *             if dStrain > 0:             # <<<<<<<<<<<<<<
@@ -4388,7 +4983,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
       goto __pyx_L12;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":138
+    /* "src/TSSCB/TSSCB.pyx":127
  *                     self.Tplate2 += dStrain
  *             else:
  *                 if self.Tplate2 > self.Tstrain:             # <<<<<<<<<<<<<<
@@ -4397,9 +4992,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     /*else*/ {
       __pyx_t_10 = (__pyx_v_self->Tplate2 > __pyx_v_self->Tstrain);
+
       if (__pyx_t_10) {
 
-        /* "src/TSSCB/TSSCB.pyx":139
+
+        /* "src/TSSCB/TSSCB.pyx":128
  *             else:
  *                 if self.Tplate2 > self.Tstrain:
  *                     self.Tplate2 = self.Tstrain             # <<<<<<<<<<<<<<
@@ -4407,9 +5004,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                     self.Tplate1 += dStrain
 */
         __pyx_t_8 = __pyx_v_self->Tstrain;
+
         __pyx_v_self->Tplate2 = __pyx_t_8;
 
-        /* "src/TSSCB/TSSCB.pyx":138
+        /* "src/TSSCB/TSSCB.pyx":127
  *                     self.Tplate2 += dStrain
  *             else:
  *                 if self.Tplate2 > self.Tstrain:             # <<<<<<<<<<<<<<
@@ -4418,7 +5016,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
       }
 
-      /* "src/TSSCB/TSSCB.pyx":140
+      /* "src/TSSCB/TSSCB.pyx":129
  *                 if self.Tplate2 > self.Tstrain:
  *                     self.Tplate2 = self.Tstrain
  *                 if not self.Tfracture:             # <<<<<<<<<<<<<<
@@ -4426,9 +5024,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             if self.Tplate1 < self.ugap:
 */
       __pyx_t_10 = (!__pyx_v_self->Tfracture);
+
       if (__pyx_t_10) {
 
-        /* "src/TSSCB/TSSCB.pyx":141
+
+        /* "src/TSSCB/TSSCB.pyx":130
  *                     self.Tplate2 = self.Tstrain
  *                 if not self.Tfracture:
  *                     self.Tplate1 += dStrain             # <<<<<<<<<<<<<<
@@ -4437,7 +5037,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
         __pyx_v_self->Tplate1 = (__pyx_v_self->Tplate1 + __pyx_v_dStrain);
 
-        /* "src/TSSCB/TSSCB.pyx":140
+        /* "src/TSSCB/TSSCB.pyx":129
  *                 if self.Tplate2 > self.Tstrain:
  *                     self.Tplate2 = self.Tstrain
  *                 if not self.Tfracture:             # <<<<<<<<<<<<<<
@@ -4448,7 +5048,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
     }
     __pyx_L12:;
 
-    /* "src/TSSCB/TSSCB.pyx":142
+    /* "src/TSSCB/TSSCB.pyx":131
  *                 if not self.Tfracture:
  *                     self.Tplate1 += dStrain
  *             if self.Tplate1 < self.ugap:             # <<<<<<<<<<<<<<
@@ -4456,9 +5056,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             if self.Tplate2 > -self.ugap:
 */
     __pyx_t_10 = (__pyx_v_self->Tplate1 < __pyx_v_self->ugap);
+
     if (__pyx_t_10) {
 
-      /* "src/TSSCB/TSSCB.pyx":143
+
+      /* "src/TSSCB/TSSCB.pyx":132
  *                     self.Tplate1 += dStrain
  *             if self.Tplate1 < self.ugap:
  *                 self.Tplate1 = self.ugap             # <<<<<<<<<<<<<<
@@ -4466,9 +5068,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *                 self.Tplate2 = -self.ugap
 */
       __pyx_t_8 = __pyx_v_self->ugap;
+
       __pyx_v_self->Tplate1 = __pyx_t_8;
 
-      /* "src/TSSCB/TSSCB.pyx":142
+      /* "src/TSSCB/TSSCB.pyx":131
  *                 if not self.Tfracture:
  *                     self.Tplate1 += dStrain
  *             if self.Tplate1 < self.ugap:             # <<<<<<<<<<<<<<
@@ -4477,7 +5080,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":144
+    /* "src/TSSCB/TSSCB.pyx":133
  *             if self.Tplate1 < self.ugap:
  *                 self.Tplate1 = self.ugap
  *             if self.Tplate2 > -self.ugap:             # <<<<<<<<<<<<<<
@@ -4485,9 +5088,11 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             #
 */
     __pyx_t_10 = (__pyx_v_self->Tplate2 > (-__pyx_v_self->ugap));
+
     if (__pyx_t_10) {
 
-      /* "src/TSSCB/TSSCB.pyx":145
+
+      /* "src/TSSCB/TSSCB.pyx":134
  *                 self.Tplate1 = self.ugap
  *             if self.Tplate2 > -self.ugap:
  *                 self.Tplate2 = -self.ugap             # <<<<<<<<<<<<<<
@@ -4496,7 +5101,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
       __pyx_v_self->Tplate2 = (-__pyx_v_self->ugap);
 
-      /* "src/TSSCB/TSSCB.pyx":144
+      /* "src/TSSCB/TSSCB.pyx":133
  *             if self.Tplate1 < self.ugap:
  *                 self.Tplate1 = self.ugap
  *             if self.Tplate2 > -self.ugap:             # <<<<<<<<<<<<<<
@@ -4505,7 +5110,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":147
+    /* "src/TSSCB/TSSCB.pyx":136
  *                 self.Tplate2 = -self.ugap
  *             #
  *             self.Ttangent = (self.Tstress4 - self.Cstress4) / dStrain             # <<<<<<<<<<<<<<
@@ -4513,13 +5118,15 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
  *             pass  #
 */
     __pyx_t_8 = (__pyx_v_self->Tstress4 - __pyx_v_self->Cstress4);
+
     if (unlikely(__pyx_v_dStrain == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 147, __pyx_L1_error)
+      __PYX_ERR(0, 136, __pyx_L1_error)
     }
     __pyx_v_self->Ttangent = (__pyx_t_8 / __pyx_v_dStrain);
 
-    /* "src/TSSCB/TSSCB.pyx":112
+
+    /* "src/TSSCB/TSSCB.pyx":101
  *         #
  *         dStrain = strain - self.Cstrain
  *         if fabs(dStrain) > DBL_EPSILON:             # <<<<<<<<<<<<<<
@@ -4529,7 +5136,7 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
     goto __pyx_L3;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":149
+  /* "src/TSSCB/TSSCB.pyx":138
  *             self.Ttangent = (self.Tstress4 - self.Cstress4) / dStrain
  *         else:
  *             pass  #             # <<<<<<<<<<<<<<
@@ -4540,16 +5147,15 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
   }
   __pyx_L3:;
 
-  /* "src/TSSCB/TSSCB.pyx":95
+  /* "src/TSSCB/TSSCB.pyx":84
  *         self.i = 0
  * 
- *     cpdef setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
  *         cdef double dStrain
  *         #
 */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
@@ -4559,16 +5165,15 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain(struct __pyx_o
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.setTrialStrain", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
+
+
   __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
 /* Python wrapper */
 static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
@@ -4576,7 +5181,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 ); /*proto*/
 static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain = {"setTrialStrain", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
 static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
@@ -4584,7 +5189,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 ) {
   double __pyx_v_strain;
   double __pyx_v_strainRate;
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
@@ -4595,7 +5200,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("setTrialStrain (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
@@ -4606,48 +5211,48 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_strain,&__pyx_mstate_global->__pyx_n_u_strainRate,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 95, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 84, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 95, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 84, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 95, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 84, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "setTrialStrain", 0) < (0)) __PYX_ERR(0, 95, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "setTrialStrain", 0) < (0)) __PYX_ERR(0, 84, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("setTrialStrain", 0, 1, 2, i); __PYX_ERR(0, 95, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("setTrialStrain", 0, 1, 2, i); __PYX_ERR(0, 84, __pyx_L3_error) }
       }
     } else {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 95, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 84, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 95, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 84, __pyx_L3_error)
         break;
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_strain = __Pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_strain == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 95, __pyx_L3_error)
+    __pyx_v_strain = __Pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_strain == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L3_error)
     if (values[1]) {
-      __pyx_v_strainRate = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_strainRate == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 95, __pyx_L3_error)
+      __pyx_v_strainRate = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_strainRate == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L3_error)
     } else {
       __pyx_v_strainRate = ((double)0.0);
     }
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("setTrialStrain", 0, 1, 2, __pyx_nargs); __PYX_ERR(0, 95, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("setTrialStrain", 0, 1, 2, __pyx_nargs); __PYX_ERR(0, 84, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4664,6 +5269,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
+
+
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
@@ -4671,24 +5278,31 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_2setTrialStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, double __pyx_v_strainRate) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain __pyx_t_2;
+  struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setTrialStrain __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("setTrialStrain", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2.__pyx_n = 1;
-  __pyx_t_2.strainRate = __pyx_v_strainRate;
-  __pyx_t_1 = __pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB->setTrialStrain(__pyx_v_self, __pyx_v_strain, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_1.__pyx_n = 1;
+  __pyx_t_1.strainRate = __pyx_v_strainRate;
+  __pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB->__pyx_base.setTrialStrain(((struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *)__pyx_v_self), __pyx_v_strain, 1, &__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_2;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.setTrialStrain", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -4697,7 +5311,7 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_2setTrialStrain(struct __pyx
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":151
+/* "src/TSSCB/TSSCB.pyx":140
  *             pass  #
  * 
  *     cdef void _determineTrialState(self, double dStrain):             # <<<<<<<<<<<<<<
@@ -4718,23 +5332,26 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
   double __pyx_v_F_hardening;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
-  double __pyx_t_2;
-  struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel __pyx_t_3;
-  int __pyx_t_4;
-  double __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_2;
+  double __pyx_t_3;
+  struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
   PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10[4];
-  PyObject *__pyx_t_11 = NULL;
-  size_t __pyx_t_12;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11[4];
+  Py_ssize_t __pyx_t_12;
+  int __pyx_t_13;
+  PyObject *__pyx_t_14 = NULL;
+  size_t __pyx_t_15;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_determineTrialState", 0);
 
-  /* "src/TSSCB/TSSCB.pyx":153
+  /* "src/TSSCB/TSSCB.pyx":142
  *     cdef void _determineTrialState(self, double dStrain):
  *         #
  *         if -self.ugap <= self.Tstrain <= self.ugap:             # <<<<<<<<<<<<<<
@@ -4747,7 +5364,8 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
   }
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":154
+
+    /* "src/TSSCB/TSSCB.pyx":143
  *         #
  *         if -self.ugap <= self.Tstrain <= self.ugap:
  *             self.Tstage = 1             # <<<<<<<<<<<<<<
@@ -4756,7 +5374,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_self->Tstage = 1;
 
-    /* "src/TSSCB/TSSCB.pyx":153
+    /* "src/TSSCB/TSSCB.pyx":142
  *     cdef void _determineTrialState(self, double dStrain):
  *         #
  *         if -self.ugap <= self.Tstrain <= self.ugap:             # <<<<<<<<<<<<<<
@@ -4766,7 +5384,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
     goto __pyx_L3;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":156
+  /* "src/TSSCB/TSSCB.pyx":145
  *             self.Tstage = 1
  *         else:
  *             self.Tstage = 2             # <<<<<<<<<<<<<<
@@ -4778,7 +5396,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
   }
   __pyx_L3:;
 
-  /* "src/TSSCB/TSSCB.pyx":157
+  /* "src/TSSCB/TSSCB.pyx":146
  *         else:
  *             self.Tstage = 2
  *         if self.ugap == 0.0:             # <<<<<<<<<<<<<<
@@ -4786,9 +5404,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         #
 */
   __pyx_t_1 = (__pyx_v_self->ugap == 0.0);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":158
+
+    /* "src/TSSCB/TSSCB.pyx":147
  *             self.Tstage = 2
  *         if self.ugap == 0.0:
  *             self.Tstage = 2             # <<<<<<<<<<<<<<
@@ -4797,7 +5417,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_self->Tstage = 2;
 
-    /* "src/TSSCB/TSSCB.pyx":157
+    /* "src/TSSCB/TSSCB.pyx":146
  *         else:
  *             self.Tstage = 2
  *         if self.ugap == 0.0:             # <<<<<<<<<<<<<<
@@ -4806,27 +5426,61 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":160
+  /* "src/TSSCB/TSSCB.pyx":149
  *             self.Tstage = 2
  *         #
  *         if self.Tfracture:             # <<<<<<<<<<<<<<
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURED] += 1
+*/
+  if (__pyx_v_self->Tfracture) {
+
+    /* "src/TSSCB/TSSCB.pyx":150
+ *         #
+ *         if self.Tfracture:
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_FRACTURED] += 1
+ *             if self.configType == 1:
+*/
+    __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+    if (__pyx_t_1) {
+
+
+      /* "src/TSSCB/TSSCB.pyx":151
+ *         if self.Tfracture:
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURED] += 1             # <<<<<<<<<<<<<<
  *             if self.configType == 1:
  *                 uy = self.F1 / self.k0
 */
-  if (__pyx_v_self->Tfracture) {
 
-    /* "src/TSSCB/TSSCB.pyx":161
+      __pyx_t_2 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_FRACTURED;
+      (__pyx_v_self->counts[__pyx_t_2]) = ((__pyx_v_self->counts[__pyx_t_2]) + 1);
+
+      /* "src/TSSCB/TSSCB.pyx":150
  *         #
  *         if self.Tfracture:
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_FRACTURED] += 1
+ *             if self.configType == 1:
+*/
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":152
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURED] += 1
  *             if self.configType == 1:             # <<<<<<<<<<<<<<
  *                 uy = self.F1 / self.k0
  *                 if (self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy):
 */
     __pyx_t_1 = (__pyx_v_self->configType == 1);
+
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":162
- *         if self.Tfracture:
+
+      /* "src/TSSCB/TSSCB.pyx":153
+ *                 self.counts[TSSCB_FRACTURED] += 1
  *             if self.configType == 1:
  *                 uy = self.F1 / self.k0             # <<<<<<<<<<<<<<
  *                 if (self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy):
@@ -4834,11 +5488,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       if (unlikely(__pyx_v_self->k0 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 162, __pyx_L1_error)
+        __PYX_ERR(0, 153, __pyx_L1_error)
       }
       __pyx_v_uy = (__pyx_v_self->F1 / __pyx_v_self->k0);
 
-      /* "src/TSSCB/TSSCB.pyx":163
+      /* "src/TSSCB/TSSCB.pyx":154
  *             if self.configType == 1:
  *                 uy = self.F1 / self.k0
  *                 if (self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy):             # <<<<<<<<<<<<<<
@@ -4851,7 +5505,8 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
       }
       if (__pyx_t_1) {
 
-        /* "src/TSSCB/TSSCB.pyx":164
+
+        /* "src/TSSCB/TSSCB.pyx":155
  *                 uy = self.F1 / self.k0
  *                 if (self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy):
  *                     self.Tstress4 = 0.0             # <<<<<<<<<<<<<<
@@ -4860,17 +5515,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
         __pyx_v_self->Tstress4 = 0.0;
 
-        /* "src/TSSCB/TSSCB.pyx":163
+        /* "src/TSSCB/TSSCB.pyx":154
  *             if self.configType == 1:
  *                 uy = self.F1 / self.k0
  *                 if (self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy):             # <<<<<<<<<<<<<<
  *                     self.Tstress4 = 0.0
  *                 else:
 */
-        goto __pyx_L7;
+        goto __pyx_L8;
       }
 
-      /* "src/TSSCB/TSSCB.pyx":166
+      /* "src/TSSCB/TSSCB.pyx":157
  *                     self.Tstress4 = 0.0
  *                 else:
  *                     self.Tstress4 = self._frictionModel(self.Cstress4, dStrain, 0.5)             # <<<<<<<<<<<<<<
@@ -4878,36 +5533,48 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *                         self.Tstress4 = 0.0
 */
       /*else*/ {
-        __pyx_t_3.__pyx_n = 1;
-        __pyx_t_3.half = 0.5;
-        __pyx_t_2 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress4, __pyx_v_dStrain, &__pyx_t_3); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 166, __pyx_L1_error)
-        __pyx_v_self->Tstress4 = __pyx_t_2;
+        __pyx_t_4.__pyx_n = 1;
+        __pyx_t_4.half = 0.5;
+        __pyx_t_3 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress4, __pyx_v_dStrain, &__pyx_t_4); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L1_error)
+        __pyx_v_self->Tstress4 = __pyx_t_3;
 
-        /* "src/TSSCB/TSSCB.pyx":167
+        /* "src/TSSCB/TSSCB.pyx":158
  *                 else:
  *                     self.Tstress4 = self._frictionModel(self.Cstress4, dStrain, 0.5)
  *                     if dStrain < 0 and self.Tstrain > 0 and self.Tstress4 <= 0:             # <<<<<<<<<<<<<<
  *                         self.Tstress4 = 0.0
  *                     elif dStrain > 0 and self.Tstrain < 0 and self.Tstress4 >= 0:
 */
-        __pyx_t_4 = (__pyx_v_dStrain < 0.0);
-        if (__pyx_t_4) {
+        __pyx_t_5 = (__pyx_v_dStrain < 0.0);
+
+        if (__pyx_t_5) {
+
         } else {
-          __pyx_t_1 = __pyx_t_4;
-          goto __pyx_L9_bool_binop_done;
+
+          __pyx_t_1 = __pyx_t_5;
+
+          goto __pyx_L10_bool_binop_done;
         }
-        __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-        if (__pyx_t_4) {
+        __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+        if (__pyx_t_5) {
+
         } else {
-          __pyx_t_1 = __pyx_t_4;
-          goto __pyx_L9_bool_binop_done;
+
+          __pyx_t_1 = __pyx_t_5;
+
+          goto __pyx_L10_bool_binop_done;
         }
-        __pyx_t_4 = (__pyx_v_self->Tstress4 <= 0.0);
-        __pyx_t_1 = __pyx_t_4;
-        __pyx_L9_bool_binop_done:;
+        __pyx_t_5 = (__pyx_v_self->Tstress4 <= 0.0);
+
+
+        __pyx_t_1 = __pyx_t_5;
+
+        __pyx_L10_bool_binop_done:;
         if (__pyx_t_1) {
 
-          /* "src/TSSCB/TSSCB.pyx":168
+
+          /* "src/TSSCB/TSSCB.pyx":159
  *                     self.Tstress4 = self._frictionModel(self.Cstress4, dStrain, 0.5)
  *                     if dStrain < 0 and self.Tstrain > 0 and self.Tstress4 <= 0:
  *                         self.Tstress4 = 0.0             # <<<<<<<<<<<<<<
@@ -4916,41 +5583,53 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
           __pyx_v_self->Tstress4 = 0.0;
 
-          /* "src/TSSCB/TSSCB.pyx":167
+          /* "src/TSSCB/TSSCB.pyx":158
  *                 else:
  *                     self.Tstress4 = self._frictionModel(self.Cstress4, dStrain, 0.5)
  *                     if dStrain < 0 and self.Tstrain > 0 and self.Tstress4 <= 0:             # <<<<<<<<<<<<<<
  *                         self.Tstress4 = 0.0
  *                     elif dStrain > 0 and self.Tstrain < 0 and self.Tstress4 >= 0:
 */
-          goto __pyx_L8;
+          goto __pyx_L9;
         }
 
-        /* "src/TSSCB/TSSCB.pyx":169
+        /* "src/TSSCB/TSSCB.pyx":160
  *                     if dStrain < 0 and self.Tstrain > 0 and self.Tstress4 <= 0:
  *                         self.Tstress4 = 0.0
  *                     elif dStrain > 0 and self.Tstrain < 0 and self.Tstress4 >= 0:             # <<<<<<<<<<<<<<
  *                         self.Tstress4 = 0.0
  *             else:
 */
-        __pyx_t_4 = (__pyx_v_dStrain > 0.0);
-        if (__pyx_t_4) {
+        __pyx_t_5 = (__pyx_v_dStrain > 0.0);
+
+        if (__pyx_t_5) {
+
         } else {
-          __pyx_t_1 = __pyx_t_4;
-          goto __pyx_L12_bool_binop_done;
+
+          __pyx_t_1 = __pyx_t_5;
+
+          goto __pyx_L13_bool_binop_done;
         }
-        __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-        if (__pyx_t_4) {
+        __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+        if (__pyx_t_5) {
+
         } else {
-          __pyx_t_1 = __pyx_t_4;
-          goto __pyx_L12_bool_binop_done;
+
+          __pyx_t_1 = __pyx_t_5;
+
+          goto __pyx_L13_bool_binop_done;
         }
-        __pyx_t_4 = (__pyx_v_self->Tstress4 >= 0.0);
-        __pyx_t_1 = __pyx_t_4;
-        __pyx_L12_bool_binop_done:;
+        __pyx_t_5 = (__pyx_v_self->Tstress4 >= 0.0);
+
+
+        __pyx_t_1 = __pyx_t_5;
+
+        __pyx_L13_bool_binop_done:;
         if (__pyx_t_1) {
 
-          /* "src/TSSCB/TSSCB.pyx":170
+
+          /* "src/TSSCB/TSSCB.pyx":161
  *                         self.Tstress4 = 0.0
  *                     elif dStrain > 0 and self.Tstrain < 0 and self.Tstress4 >= 0:
  *                         self.Tstress4 = 0.0             # <<<<<<<<<<<<<<
@@ -4959,7 +5638,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
           __pyx_v_self->Tstress4 = 0.0;
 
-          /* "src/TSSCB/TSSCB.pyx":169
+          /* "src/TSSCB/TSSCB.pyx":160
  *                     if dStrain < 0 and self.Tstrain > 0 and self.Tstress4 <= 0:
  *                         self.Tstress4 = 0.0
  *                     elif dStrain > 0 and self.Tstrain < 0 and self.Tstress4 >= 0:             # <<<<<<<<<<<<<<
@@ -4967,21 +5646,21 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             else:
 */
         }
-        __pyx_L8:;
+        __pyx_L9:;
       }
-      __pyx_L7:;
+      __pyx_L8:;
 
-      /* "src/TSSCB/TSSCB.pyx":161
- *         #
- *         if self.Tfracture:
+      /* "src/TSSCB/TSSCB.pyx":152
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURED] += 1
  *             if self.configType == 1:             # <<<<<<<<<<<<<<
  *                 uy = self.F1 / self.k0
  *                 if (self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy):
 */
-      goto __pyx_L6;
+      goto __pyx_L7;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":172
+    /* "src/TSSCB/TSSCB.pyx":163
  *                         self.Tstress4 = 0.0
  *             else:
  *                 self.Tstress4 = self._frictionModel(self.Cstress4, dStrain)             # <<<<<<<<<<<<<<
@@ -4989,50 +5668,86 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         #
 */
     /*else*/ {
-      __pyx_t_2 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress4, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 172, __pyx_L1_error)
-      __pyx_v_self->Tstress4 = __pyx_t_2;
+      __pyx_t_3 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress4, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 163, __pyx_L1_error)
+      __pyx_v_self->Tstress4 = __pyx_t_3;
     }
-    __pyx_L6:;
+    __pyx_L7:;
 
-    /* "src/TSSCB/TSSCB.pyx":173
+    /* "src/TSSCB/TSSCB.pyx":164
  *             else:
  *                 self.Tstress4 = self._frictionModel(self.Cstress4, dStrain)
  *             return             # <<<<<<<<<<<<<<
  *         #
  *         if self.Tfracturing:
 */
+    {
+    }
     goto __pyx_L0;
 
-    /* "src/TSSCB/TSSCB.pyx":160
+    /* "src/TSSCB/TSSCB.pyx":149
  *             self.Tstage = 2
  *         #
  *         if self.Tfracture:             # <<<<<<<<<<<<<<
- *             if self.configType == 1:
- *                 uy = self.F1 / self.k0
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURED] += 1
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":175
+  /* "src/TSSCB/TSSCB.pyx":166
  *             return
  *         #
  *         if self.Tfracturing:             # <<<<<<<<<<<<<<
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURING] += 1
+*/
+  if (__pyx_v_self->Tfracturing) {
+
+    /* "src/TSSCB/TSSCB.pyx":167
+ *         #
+ *         if self.Tfracturing:
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_FRACTURING] += 1
+ *             if self.Cstress4 >= 0.0:
+*/
+    __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+    if (__pyx_t_1) {
+
+
+      /* "src/TSSCB/TSSCB.pyx":168
+ *         if self.Tfracturing:
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURING] += 1             # <<<<<<<<<<<<<<
  *             if self.Cstress4 >= 0.0:
  *                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp
 */
-  if (__pyx_v_self->Tfracturing) {
 
-    /* "src/TSSCB/TSSCB.pyx":176
+      __pyx_t_2 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_FRACTURING;
+      (__pyx_v_self->counts[__pyx_t_2]) = ((__pyx_v_self->counts[__pyx_t_2]) + 1);
+
+      /* "src/TSSCB/TSSCB.pyx":167
  *         #
  *         if self.Tfracturing:
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_FRACTURING] += 1
+ *             if self.Cstress4 >= 0.0:
+*/
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":169
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURING] += 1
  *             if self.Cstress4 >= 0.0:             # <<<<<<<<<<<<<<
  *                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp
  *             else:
 */
     __pyx_t_1 = (__pyx_v_self->Cstress4 >= 0.0);
+
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":177
- *         if self.Tfracturing:
+
+      /* "src/TSSCB/TSSCB.pyx":170
+ *                 self.counts[TSSCB_FRACTURING] += 1
  *             if self.Cstress4 >= 0.0:
  *                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp             # <<<<<<<<<<<<<<
  *             else:
@@ -5040,17 +5755,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress4 = (__pyx_v_self->TfractureFore - ((__pyx_v_self->TfractureFore - __pyx_v_self->F1) * __pyx_v_self->Trp));
 
-      /* "src/TSSCB/TSSCB.pyx":176
- *         #
- *         if self.Tfracturing:
+      /* "src/TSSCB/TSSCB.pyx":169
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURING] += 1
  *             if self.Cstress4 >= 0.0:             # <<<<<<<<<<<<<<
  *                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp
  *             else:
 */
-      goto __pyx_L16;
+      goto __pyx_L18;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":179
+    /* "src/TSSCB/TSSCB.pyx":172
  *                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp
  *             else:
  *                 self.Tstress4 = self.TfractureFore + (-self.F1 - self.TfractureFore) * self.Trp             # <<<<<<<<<<<<<<
@@ -5060,114 +5775,200 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
     /*else*/ {
       __pyx_v_self->Tstress4 = (__pyx_v_self->TfractureFore + (((-__pyx_v_self->F1) - __pyx_v_self->TfractureFore) * __pyx_v_self->Trp));
     }
-    __pyx_L16:;
+    __pyx_L18:;
 
-    /* "src/TSSCB/TSSCB.pyx":180
+    /* "src/TSSCB/TSSCB.pyx":173
  *             else:
  *                 self.Tstress4 = self.TfractureFore + (-self.F1 - self.TfractureFore) * self.Trp
  *             return             # <<<<<<<<<<<<<<
  *         #
  *         if self.Cstage == 1 and self.Tstage == 1:
 */
+    {
+    }
     goto __pyx_L0;
 
-    /* "src/TSSCB/TSSCB.pyx":175
+    /* "src/TSSCB/TSSCB.pyx":166
  *             return
  *         #
  *         if self.Tfracturing:             # <<<<<<<<<<<<<<
- *             if self.Cstress4 >= 0.0:
- *                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_FRACTURING] += 1
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":182
+  /* "src/TSSCB/TSSCB.pyx":175
  *             return
  *         #
  *         if self.Cstage == 1 and self.Tstage == 1:             # <<<<<<<<<<<<<<
  *             # 1->1
- *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
+ *             if MYOPENSEES_STATS:
 */
-  __pyx_t_4 = (__pyx_v_self->Cstage == 1);
-  if (__pyx_t_4) {
+  __pyx_t_5 = (__pyx_v_self->Cstage == 1);
+
+  if (__pyx_t_5) {
+
   } else {
-    __pyx_t_1 = __pyx_t_4;
-    goto __pyx_L18_bool_binop_done;
+
+    __pyx_t_1 = __pyx_t_5;
+
+    goto __pyx_L20_bool_binop_done;
   }
-  __pyx_t_4 = (__pyx_v_self->Tstage == 1);
-  __pyx_t_1 = __pyx_t_4;
-  __pyx_L18_bool_binop_done:;
+  __pyx_t_5 = (__pyx_v_self->Tstage == 1);
+
+
+  __pyx_t_1 = __pyx_t_5;
+
+  __pyx_L20_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":184
+
+    /* "src/TSSCB/TSSCB.pyx":177
  *         if self.Cstage == 1 and self.Tstage == 1:
  *             # 1->1
- *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)             # <<<<<<<<<<<<<<
- *             self.Tstress2 = self.Tstress1
- *             self.Tstress3 = self.Tstress1
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_11] += 1
+ *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
 */
-    __pyx_t_2 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress3, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 184, __pyx_L1_error)
-    __pyx_v_self->Tstress1 = __pyx_t_2;
+    __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+    if (__pyx_t_1) {
+
 
-    /* "src/TSSCB/TSSCB.pyx":185
+      /* "src/TSSCB/TSSCB.pyx":178
  *             # 1->1
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_11] += 1             # <<<<<<<<<<<<<<
  *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
- *             self.Tstress2 = self.Tstress1             # <<<<<<<<<<<<<<
- *             self.Tstress3 = self.Tstress1
+ *             self.Tstress2 = self.Tstress1
+*/
+
+      __pyx_t_2 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_11;
+      (__pyx_v_self->counts[__pyx_t_2]) = ((__pyx_v_self->counts[__pyx_t_2]) + 1);
+
+      /* "src/TSSCB/TSSCB.pyx":177
+ *         if self.Cstage == 1 and self.Tstage == 1:
+ *             # 1->1
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_11] += 1
+ *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
+*/
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":179
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_11] += 1
+ *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)             # <<<<<<<<<<<<<<
+ *             self.Tstress2 = self.Tstress1
+ *             self.Tstress3 = self.Tstress1
+*/
+    __pyx_t_3 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress3, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L1_error)
+    __pyx_v_self->Tstress1 = __pyx_t_3;
+
+    /* "src/TSSCB/TSSCB.pyx":180
+ *                 self.counts[TSSCB_STAGE_11] += 1
+ *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
+ *             self.Tstress2 = self.Tstress1             # <<<<<<<<<<<<<<
+ *             self.Tstress3 = self.Tstress1
  *         elif self.Cstage == 1 and self.Tstage == 2:
 */
-    __pyx_t_2 = __pyx_v_self->Tstress1;
-    __pyx_v_self->Tstress2 = __pyx_t_2;
+    __pyx_t_3 = __pyx_v_self->Tstress1;
 
-    /* "src/TSSCB/TSSCB.pyx":186
+    __pyx_v_self->Tstress2 = __pyx_t_3;
+
+    /* "src/TSSCB/TSSCB.pyx":181
  *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
  *             self.Tstress2 = self.Tstress1
  *             self.Tstress3 = self.Tstress1             # <<<<<<<<<<<<<<
  *         elif self.Cstage == 1 and self.Tstage == 2:
  *             # 1->2
 */
-    __pyx_t_2 = __pyx_v_self->Tstress1;
-    __pyx_v_self->Tstress3 = __pyx_t_2;
+    __pyx_t_3 = __pyx_v_self->Tstress1;
 
-    /* "src/TSSCB/TSSCB.pyx":182
+    __pyx_v_self->Tstress3 = __pyx_t_3;
+
+    /* "src/TSSCB/TSSCB.pyx":175
  *             return
  *         #
  *         if self.Cstage == 1 and self.Tstage == 1:             # <<<<<<<<<<<<<<
  *             # 1->1
- *             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
+ *             if MYOPENSEES_STATS:
 */
-    goto __pyx_L17;
+    goto __pyx_L19;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":187
+  /* "src/TSSCB/TSSCB.pyx":182
  *             self.Tstress2 = self.Tstress1
  *             self.Tstress3 = self.Tstress1
  *         elif self.Cstage == 1 and self.Tstage == 2:             # <<<<<<<<<<<<<<
  *             # 1->2
- *             if dStrain > 0:
+ *             if MYOPENSEES_STATS:
 */
-  __pyx_t_4 = (__pyx_v_self->Cstage == 1);
-  if (__pyx_t_4) {
+  __pyx_t_5 = (__pyx_v_self->Cstage == 1);
+
+  if (__pyx_t_5) {
+
   } else {
-    __pyx_t_1 = __pyx_t_4;
-    goto __pyx_L20_bool_binop_done;
+
+    __pyx_t_1 = __pyx_t_5;
+
+    goto __pyx_L23_bool_binop_done;
   }
-  __pyx_t_4 = (__pyx_v_self->Tstage == 2);
-  __pyx_t_1 = __pyx_t_4;
-  __pyx_L20_bool_binop_done:;
+  __pyx_t_5 = (__pyx_v_self->Tstage == 2);
+
+
+  __pyx_t_1 = __pyx_t_5;
+
+  __pyx_L23_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":189
+
+    /* "src/TSSCB/TSSCB.pyx":184
+ *         elif self.Cstage == 1 and self.Tstage == 2:
+ *             # 1->2
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_12] += 1
+ *             if dStrain > 0:
+*/
+    __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+    if (__pyx_t_1) {
+
+
+      /* "src/TSSCB/TSSCB.pyx":185
+ *             # 1->2
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_12] += 1             # <<<<<<<<<<<<<<
+ *             if dStrain > 0:
+ *                 du1 = self.ugap - self.Cstrain
+*/
+
+      __pyx_t_2 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_12;
+      (__pyx_v_self->counts[__pyx_t_2]) = ((__pyx_v_self->counts[__pyx_t_2]) + 1);
+
+      /* "src/TSSCB/TSSCB.pyx":184
  *         elif self.Cstage == 1 and self.Tstage == 2:
  *             # 1->2
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_12] += 1
+ *             if dStrain > 0:
+*/
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":186
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_12] += 1
  *             if dStrain > 0:             # <<<<<<<<<<<<<<
  *                 du1 = self.ugap - self.Cstrain
  *                 du2 = dStrain - du1
 */
     __pyx_t_1 = (__pyx_v_dStrain > 0.0);
+
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":190
- *             # 1->2
+
+      /* "src/TSSCB/TSSCB.pyx":187
+ *                 self.counts[TSSCB_STAGE_12] += 1
  *             if dStrain > 0:
  *                 du1 = self.ugap - self.Cstrain             # <<<<<<<<<<<<<<
  *                 du2 = dStrain - du1
@@ -5175,7 +5976,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_du1 = (__pyx_v_self->ugap - __pyx_v_self->Cstrain);
 
-      /* "src/TSSCB/TSSCB.pyx":191
+      /* "src/TSSCB/TSSCB.pyx":188
  *             if dStrain > 0:
  *                 du1 = self.ugap - self.Cstrain
  *                 du2 = dStrain - du1             # <<<<<<<<<<<<<<
@@ -5184,7 +5985,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_du2 = (__pyx_v_dStrain - __pyx_v_du1);
 
-      /* "src/TSSCB/TSSCB.pyx":192
+      /* "src/TSSCB/TSSCB.pyx":189
  *                 du1 = self.ugap - self.Cstrain
  *                 du2 = dStrain - du1
  *                 usc0 = self.ugap - self.ua             # <<<<<<<<<<<<<<
@@ -5193,17 +5994,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_usc0 = (__pyx_v_self->ugap - __pyx_v_self->ua);
 
-      /* "src/TSSCB/TSSCB.pyx":189
- *         elif self.Cstage == 1 and self.Tstage == 2:
- *             # 1->2
+      /* "src/TSSCB/TSSCB.pyx":186
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_12] += 1
  *             if dStrain > 0:             # <<<<<<<<<<<<<<
  *                 du1 = self.ugap - self.Cstrain
  *                 du2 = dStrain - du1
 */
-      goto __pyx_L22;
+      goto __pyx_L26;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":194
+    /* "src/TSSCB/TSSCB.pyx":191
  *                 usc0 = self.ugap - self.ua
  *             else:
  *                 du1 = -self.ugap - self.Cstrain             # <<<<<<<<<<<<<<
@@ -5213,7 +6014,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
     /*else*/ {
       __pyx_v_du1 = ((-__pyx_v_self->ugap) - __pyx_v_self->Cstrain);
 
-      /* "src/TSSCB/TSSCB.pyx":195
+      /* "src/TSSCB/TSSCB.pyx":192
  *             else:
  *                 du1 = -self.ugap - self.Cstrain
  *                 du2 = dStrain - du1             # <<<<<<<<<<<<<<
@@ -5222,7 +6023,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_du2 = (__pyx_v_dStrain - __pyx_v_du1);
 
-      /* "src/TSSCB/TSSCB.pyx":196
+      /* "src/TSSCB/TSSCB.pyx":193
  *                 du1 = -self.ugap - self.Cstrain
  *                 du2 = dStrain - du1
  *                 usc0 = self.ua - self.ugap             # <<<<<<<<<<<<<<
@@ -5231,9 +6032,9 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_usc0 = (__pyx_v_self->ua - __pyx_v_self->ugap);
     }
-    __pyx_L22:;
+    __pyx_L26:;
 
-    /* "src/TSSCB/TSSCB.pyx":197
+    /* "src/TSSCB/TSSCB.pyx":194
  *                 du2 = dStrain - du1
  *                 usc0 = self.ua - self.ugap
  *             if self.Thardening:             # <<<<<<<<<<<<<<
@@ -5242,22 +6043,26 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
 
-      /* "src/TSSCB/TSSCB.pyx":198
+      /* "src/TSSCB/TSSCB.pyx":195
  *                 usc0 = self.ua - self.ugap
  *             if self.Thardening:
  *                 self.TCDD = self.CCDD + fabs(du2) / (self.uh - self.ugap)             # <<<<<<<<<<<<<<
  *             F1_ = self._frictionModel(self.Cstress1, du1)
  *             F2_ = self._SCModel(usc0, F1_, du2)
 */
-      __pyx_t_2 = fabs(__pyx_v_du2);
-      __pyx_t_5 = (__pyx_v_self->uh - __pyx_v_self->ugap);
-      if (unlikely(__pyx_t_5 == 0)) {
+      __pyx_t_3 = fabs(__pyx_v_du2);
+
+      __pyx_t_6 = (__pyx_v_self->uh - __pyx_v_self->ugap);
+
+      if (unlikely(__pyx_t_6 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 198, __pyx_L1_error)
+        __PYX_ERR(0, 195, __pyx_L1_error)
       }
-      __pyx_v_self->TCDD = (__pyx_v_self->CCDD + (__pyx_t_2 / __pyx_t_5));
+      __pyx_v_self->TCDD = (__pyx_v_self->CCDD + (__pyx_t_3 / __pyx_t_6));
+
 
-      /* "src/TSSCB/TSSCB.pyx":197
+
+      /* "src/TSSCB/TSSCB.pyx":194
  *                 du2 = dStrain - du1
  *                 usc0 = self.ua - self.ugap
  *             if self.Thardening:             # <<<<<<<<<<<<<<
@@ -5266,27 +6071,27 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":199
+    /* "src/TSSCB/TSSCB.pyx":196
  *             if self.Thardening:
  *                 self.TCDD = self.CCDD + fabs(du2) / (self.uh - self.ugap)
  *             F1_ = self._frictionModel(self.Cstress1, du1)             # <<<<<<<<<<<<<<
  *             F2_ = self._SCModel(usc0, F1_, du2)
  *             self.Tstress1 = F2_
 */
-    __pyx_t_5 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress1, __pyx_v_du1, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 199, __pyx_L1_error)
-    __pyx_v_F1_ = __pyx_t_5;
+    __pyx_t_6 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress1, __pyx_v_du1, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 196, __pyx_L1_error)
+    __pyx_v_F1_ = __pyx_t_6;
 
-    /* "src/TSSCB/TSSCB.pyx":200
+    /* "src/TSSCB/TSSCB.pyx":197
  *                 self.TCDD = self.CCDD + fabs(du2) / (self.uh - self.ugap)
  *             F1_ = self._frictionModel(self.Cstress1, du1)
  *             F2_ = self._SCModel(usc0, F1_, du2)             # <<<<<<<<<<<<<<
  *             self.Tstress1 = F2_
  *             self.Tstress2 = self.Tstress1
 */
-    __pyx_t_5 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_SCModel(__pyx_v_self, __pyx_v_usc0, __pyx_v_F1_, __pyx_v_du2); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L1_error)
-    __pyx_v_F2_ = __pyx_t_5;
+    __pyx_t_6 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_SCModel(__pyx_v_self, __pyx_v_usc0, __pyx_v_F1_, __pyx_v_du2); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 197, __pyx_L1_error)
+    __pyx_v_F2_ = __pyx_t_6;
 
-    /* "src/TSSCB/TSSCB.pyx":201
+    /* "src/TSSCB/TSSCB.pyx":198
  *             F1_ = self._frictionModel(self.Cstress1, du1)
  *             F2_ = self._SCModel(usc0, F1_, du2)
  *             self.Tstress1 = F2_             # <<<<<<<<<<<<<<
@@ -5295,32 +6100,37 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_self->Tstress1 = __pyx_v_F2_;
 
-    /* "src/TSSCB/TSSCB.pyx":202
+    /* "src/TSSCB/TSSCB.pyx":199
  *             F2_ = self._SCModel(usc0, F1_, du2)
  *             self.Tstress1 = F2_
  *             self.Tstress2 = self.Tstress1             # <<<<<<<<<<<<<<
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:
 */
-    __pyx_t_5 = __pyx_v_self->Tstress1;
-    __pyx_v_self->Tstress2 = __pyx_t_5;
+    __pyx_t_6 = __pyx_v_self->Tstress1;
 
-    /* "src/TSSCB/TSSCB.pyx":203
+    __pyx_v_self->Tstress2 = __pyx_t_6;
+
+    /* "src/TSSCB/TSSCB.pyx":200
  *             self.Tstress1 = F2_
  *             self.Tstress2 = self.Tstress1
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))             # <<<<<<<<<<<<<<
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd
 */
-    __pyx_t_5 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
-    __pyx_t_2 = (__pyx_v_self->uh - __pyx_v_self->ugap);
-    if (unlikely(__pyx_t_2 == 0)) {
+    __pyx_t_6 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
+
+    __pyx_t_3 = (__pyx_v_self->uh - __pyx_v_self->ugap);
+
+    if (unlikely(__pyx_t_3 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 203, __pyx_L1_error)
+      __PYX_ERR(0, 200, __pyx_L1_error)
     }
-    __pyx_v_Fd = (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_5 / __pyx_t_2)));
+    __pyx_v_Fd = (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_6 / __pyx_t_3)));
+
 
-    /* "src/TSSCB/TSSCB.pyx":204
+
+    /* "src/TSSCB/TSSCB.pyx":201
  *             self.Tstress2 = self.Tstress1
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:             # <<<<<<<<<<<<<<
@@ -5329,15 +6139,20 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L25_bool_binop_done;
+      goto __pyx_L29_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L25_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L29_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":205
+
+      /* "src/TSSCB/TSSCB.pyx":202
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd             # <<<<<<<<<<<<<<
@@ -5346,17 +6161,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress2 = (__pyx_v_self->Tstress1 - __pyx_v_Fd);
 
-      /* "src/TSSCB/TSSCB.pyx":204
+      /* "src/TSSCB/TSSCB.pyx":201
  *             self.Tstress2 = self.Tstress1
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:             # <<<<<<<<<<<<<<
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:
 */
-      goto __pyx_L24;
+      goto __pyx_L28;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":206
+    /* "src/TSSCB/TSSCB.pyx":203
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:             # <<<<<<<<<<<<<<
@@ -5365,15 +6180,20 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L27_bool_binop_done;
+      goto __pyx_L31_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L27_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L31_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":207
+
+      /* "src/TSSCB/TSSCB.pyx":204
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:
  *                 self.Tstress2 = self.Tstress1 + Fd             # <<<<<<<<<<<<<<
@@ -5382,7 +6202,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress2 = (__pyx_v_self->Tstress1 + __pyx_v_Fd);
 
-      /* "src/TSSCB/TSSCB.pyx":206
+      /* "src/TSSCB/TSSCB.pyx":203
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:             # <<<<<<<<<<<<<<
@@ -5390,75 +6210,93 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             self.Tstress3 = self.Tstress2
 */
     }
-    __pyx_L24:;
+    __pyx_L28:;
 
-    /* "src/TSSCB/TSSCB.pyx":208
+    /* "src/TSSCB/TSSCB.pyx":205
  *             elif self.Thardening and self.Tstrain < 0:
  *                 self.Tstress2 = self.Tstress1 + Fd
  *             self.Tstress3 = self.Tstress2             # <<<<<<<<<<<<<<
  *             if dStrain > 0 and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self.F1
 */
-    __pyx_t_2 = __pyx_v_self->Tstress2;
-    __pyx_v_self->Tstress3 = __pyx_t_2;
+    __pyx_t_3 = __pyx_v_self->Tstress2;
+
+    __pyx_v_self->Tstress3 = __pyx_t_3;
 
-    /* "src/TSSCB/TSSCB.pyx":209
+    /* "src/TSSCB/TSSCB.pyx":206
  *                 self.Tstress2 = self.Tstress1 + Fd
  *             self.Tstress3 = self.Tstress2
  *             if dStrain > 0 and self.Tstress2 < self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:
 */
-    __pyx_t_4 = (__pyx_v_dStrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L30_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L34_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 < __pyx_v_self->F1);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L30_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress2 < __pyx_v_self->F1);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L34_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":210
+
+      /* "src/TSSCB/TSSCB.pyx":207
  *             self.Tstress3 = self.Tstress2
  *             if dStrain > 0 and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self.F1             # <<<<<<<<<<<<<<
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:
  *                 self.Tstress3 = -self.F1
 */
-      __pyx_t_2 = __pyx_v_self->F1;
-      __pyx_v_self->Tstress3 = __pyx_t_2;
+      __pyx_t_3 = __pyx_v_self->F1;
 
-      /* "src/TSSCB/TSSCB.pyx":209
+      __pyx_v_self->Tstress3 = __pyx_t_3;
+
+      /* "src/TSSCB/TSSCB.pyx":206
  *                 self.Tstress2 = self.Tstress1 + Fd
  *             self.Tstress3 = self.Tstress2
  *             if dStrain > 0 and self.Tstress2 < self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:
 */
-      goto __pyx_L29;
+      goto __pyx_L33;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":211
+    /* "src/TSSCB/TSSCB.pyx":208
  *             if dStrain > 0 and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = -self.F1
  *         elif self.Cstage == 2 and self.Tstage == 2:
 */
-    __pyx_t_4 = (__pyx_v_dStrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L32_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L36_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 > (-__pyx_v_self->F1));
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L32_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress2 > (-__pyx_v_self->F1));
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L36_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":212
+
+      /* "src/TSSCB/TSSCB.pyx":209
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:
  *                 self.Tstress3 = -self.F1             # <<<<<<<<<<<<<<
@@ -5467,7 +6305,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress3 = (-__pyx_v_self->F1);
 
-      /* "src/TSSCB/TSSCB.pyx":211
+      /* "src/TSSCB/TSSCB.pyx":208
  *             if dStrain > 0 and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:             # <<<<<<<<<<<<<<
@@ -5475,70 +6313,114 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         elif self.Cstage == 2 and self.Tstage == 2:
 */
     }
-    __pyx_L29:;
+    __pyx_L33:;
 
-    /* "src/TSSCB/TSSCB.pyx":187
+    /* "src/TSSCB/TSSCB.pyx":182
  *             self.Tstress2 = self.Tstress1
  *             self.Tstress3 = self.Tstress1
  *         elif self.Cstage == 1 and self.Tstage == 2:             # <<<<<<<<<<<<<<
  *             # 1->2
- *             if dStrain > 0:
+ *             if MYOPENSEES_STATS:
 */
-    goto __pyx_L17;
+    goto __pyx_L19;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":213
+  /* "src/TSSCB/TSSCB.pyx":210
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:
  *                 self.Tstress3 = -self.F1
  *         elif self.Cstage == 2 and self.Tstage == 2:             # <<<<<<<<<<<<<<
  *             # 2->2
- *             if self.Thardening:
+ *             if MYOPENSEES_STATS:
 */
-  __pyx_t_4 = (__pyx_v_self->Cstage == 2);
-  if (__pyx_t_4) {
+  __pyx_t_5 = (__pyx_v_self->Cstage == 2);
+
+  if (__pyx_t_5) {
+
   } else {
-    __pyx_t_1 = __pyx_t_4;
-    goto __pyx_L34_bool_binop_done;
+
+    __pyx_t_1 = __pyx_t_5;
+
+    goto __pyx_L38_bool_binop_done;
   }
-  __pyx_t_4 = (__pyx_v_self->Tstage == 2);
-  __pyx_t_1 = __pyx_t_4;
-  __pyx_L34_bool_binop_done:;
+  __pyx_t_5 = (__pyx_v_self->Tstage == 2);
+
+
+  __pyx_t_1 = __pyx_t_5;
+
+  __pyx_L38_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":215
+
+    /* "src/TSSCB/TSSCB.pyx":212
+ *         elif self.Cstage == 2 and self.Tstage == 2:
+ *             # 2->2
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_22] += 1
+ *             if self.Thardening:
+*/
+    __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+    if (__pyx_t_1) {
+
+
+      /* "src/TSSCB/TSSCB.pyx":213
+ *             # 2->2
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_22] += 1             # <<<<<<<<<<<<<<
+ *             if self.Thardening:
+ *                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)
+*/
+
+      __pyx_t_2 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_22;
+      (__pyx_v_self->counts[__pyx_t_2]) = ((__pyx_v_self->counts[__pyx_t_2]) + 1);
+
+      /* "src/TSSCB/TSSCB.pyx":212
  *         elif self.Cstage == 2 and self.Tstage == 2:
  *             # 2->2
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_22] += 1
+ *             if self.Thardening:
+*/
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":214
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_22] += 1
  *             if self.Thardening:             # <<<<<<<<<<<<<<
  *                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)
  *             if self.Tstrain >= 0:
 */
     if (__pyx_v_self->Thardening) {
 
-      /* "src/TSSCB/TSSCB.pyx":216
- *             # 2->2
+      /* "src/TSSCB/TSSCB.pyx":215
+ *                 self.counts[TSSCB_STAGE_22] += 1
  *             if self.Thardening:
  *                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)             # <<<<<<<<<<<<<<
  *             if self.Tstrain >= 0:
  *                 usc0 = self.Cstrain - self.ua
 */
-      __pyx_t_2 = fabs(__pyx_v_dStrain);
-      __pyx_t_5 = (__pyx_v_self->uh - __pyx_v_self->ugap);
-      if (unlikely(__pyx_t_5 == 0)) {
+      __pyx_t_3 = fabs(__pyx_v_dStrain);
+
+      __pyx_t_6 = (__pyx_v_self->uh - __pyx_v_self->ugap);
+
+      if (unlikely(__pyx_t_6 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 216, __pyx_L1_error)
+        __PYX_ERR(0, 215, __pyx_L1_error)
       }
-      __pyx_v_self->TCDD = (__pyx_v_self->CCDD + (__pyx_t_2 / __pyx_t_5));
+      __pyx_v_self->TCDD = (__pyx_v_self->CCDD + (__pyx_t_3 / __pyx_t_6));
 
-      /* "src/TSSCB/TSSCB.pyx":215
- *         elif self.Cstage == 2 and self.Tstage == 2:
- *             # 2->2
+
+
+      /* "src/TSSCB/TSSCB.pyx":214
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_22] += 1
  *             if self.Thardening:             # <<<<<<<<<<<<<<
  *                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)
  *             if self.Tstrain >= 0:
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":217
+    /* "src/TSSCB/TSSCB.pyx":216
  *             if self.Thardening:
  *                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)
  *             if self.Tstrain >= 0:             # <<<<<<<<<<<<<<
@@ -5546,9 +6428,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             else:
 */
     __pyx_t_1 = (__pyx_v_self->Tstrain >= 0.0);
+
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":218
+
+      /* "src/TSSCB/TSSCB.pyx":217
  *                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)
  *             if self.Tstrain >= 0:
  *                 usc0 = self.Cstrain - self.ua             # <<<<<<<<<<<<<<
@@ -5557,17 +6441,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_usc0 = (__pyx_v_self->Cstrain - __pyx_v_self->ua);
 
-      /* "src/TSSCB/TSSCB.pyx":217
+      /* "src/TSSCB/TSSCB.pyx":216
  *             if self.Thardening:
  *                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)
  *             if self.Tstrain >= 0:             # <<<<<<<<<<<<<<
  *                 usc0 = self.Cstrain - self.ua
  *             else:
 */
-      goto __pyx_L37;
+      goto __pyx_L42;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":220
+    /* "src/TSSCB/TSSCB.pyx":219
  *                 usc0 = self.Cstrain - self.ua
  *             else:
  *                 usc0 = self.Cstrain + self.ua             # <<<<<<<<<<<<<<
@@ -5577,44 +6461,49 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
     /*else*/ {
       __pyx_v_usc0 = (__pyx_v_self->Cstrain + __pyx_v_self->ua);
     }
-    __pyx_L37:;
+    __pyx_L42:;
 
-    /* "src/TSSCB/TSSCB.pyx":221
+    /* "src/TSSCB/TSSCB.pyx":220
  *             else:
  *                 usc0 = self.Cstrain + self.ua
  *             self.Tstress1 = self._SCModel(usc0, self.Cstress1, dStrain)             # <<<<<<<<<<<<<<
  *             self.Tstress2 = self.Tstress1
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
 */
-    __pyx_t_5 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_SCModel(__pyx_v_self, __pyx_v_usc0, __pyx_v_self->Cstress1, __pyx_v_dStrain); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 221, __pyx_L1_error)
-    __pyx_v_self->Tstress1 = __pyx_t_5;
+    __pyx_t_6 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_SCModel(__pyx_v_self, __pyx_v_usc0, __pyx_v_self->Cstress1, __pyx_v_dStrain); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 220, __pyx_L1_error)
+    __pyx_v_self->Tstress1 = __pyx_t_6;
 
-    /* "src/TSSCB/TSSCB.pyx":222
+    /* "src/TSSCB/TSSCB.pyx":221
  *                 usc0 = self.Cstrain + self.ua
  *             self.Tstress1 = self._SCModel(usc0, self.Cstress1, dStrain)
  *             self.Tstress2 = self.Tstress1             # <<<<<<<<<<<<<<
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:
 */
-    __pyx_t_5 = __pyx_v_self->Tstress1;
-    __pyx_v_self->Tstress2 = __pyx_t_5;
+    __pyx_t_6 = __pyx_v_self->Tstress1;
 
-    /* "src/TSSCB/TSSCB.pyx":223
+    __pyx_v_self->Tstress2 = __pyx_t_6;
+
+    /* "src/TSSCB/TSSCB.pyx":222
  *             self.Tstress1 = self._SCModel(usc0, self.Cstress1, dStrain)
  *             self.Tstress2 = self.Tstress1
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))             # <<<<<<<<<<<<<<
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd
 */
-    __pyx_t_5 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
-    __pyx_t_2 = (__pyx_v_self->uh - __pyx_v_self->ugap);
-    if (unlikely(__pyx_t_2 == 0)) {
+    __pyx_t_6 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
+
+    __pyx_t_3 = (__pyx_v_self->uh - __pyx_v_self->ugap);
+
+    if (unlikely(__pyx_t_3 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 223, __pyx_L1_error)
+      __PYX_ERR(0, 222, __pyx_L1_error)
     }
-    __pyx_v_Fd = (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_5 / __pyx_t_2)));
+    __pyx_v_Fd = (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_6 / __pyx_t_3)));
+
 
-    /* "src/TSSCB/TSSCB.pyx":224
+
+    /* "src/TSSCB/TSSCB.pyx":223
  *             self.Tstress2 = self.Tstress1
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:             # <<<<<<<<<<<<<<
@@ -5623,15 +6512,20 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L39_bool_binop_done;
+      goto __pyx_L44_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L39_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L44_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":225
+
+      /* "src/TSSCB/TSSCB.pyx":224
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd             # <<<<<<<<<<<<<<
@@ -5640,17 +6534,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress2 = (__pyx_v_self->Tstress1 - __pyx_v_Fd);
 
-      /* "src/TSSCB/TSSCB.pyx":224
+      /* "src/TSSCB/TSSCB.pyx":223
  *             self.Tstress2 = self.Tstress1
  *             Fd = (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.Thardening and self.Tstrain > 0:             # <<<<<<<<<<<<<<
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:
 */
-      goto __pyx_L38;
+      goto __pyx_L43;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":226
+    /* "src/TSSCB/TSSCB.pyx":225
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:             # <<<<<<<<<<<<<<
@@ -5659,15 +6553,20 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L41_bool_binop_done;
+      goto __pyx_L46_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L41_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L46_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":227
+
+      /* "src/TSSCB/TSSCB.pyx":226
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:
  *                 self.Tstress2 = self.Tstress1 + Fd             # <<<<<<<<<<<<<<
@@ -5676,7 +6575,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress2 = (__pyx_v_self->Tstress1 + __pyx_v_Fd);
 
-      /* "src/TSSCB/TSSCB.pyx":226
+      /* "src/TSSCB/TSSCB.pyx":225
  *             if self.Thardening and self.Tstrain > 0:
  *                 self.Tstress2 = self.Tstress1 - Fd
  *             elif self.Thardening and self.Tstrain < 0:             # <<<<<<<<<<<<<<
@@ -5684,9 +6583,9 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             if self.configType == 1:
 */
     }
-    __pyx_L38:;
+    __pyx_L43:;
 
-    /* "src/TSSCB/TSSCB.pyx":228
+    /* "src/TSSCB/TSSCB.pyx":227
  *             elif self.Thardening and self.Tstrain < 0:
  *                 self.Tstress2 = self.Tstress1 + Fd
  *             if self.configType == 1:             # <<<<<<<<<<<<<<
@@ -5694,9 +6593,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             else:
 */
     __pyx_t_1 = (__pyx_v_self->configType == 1);
+
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":229
+
+      /* "src/TSSCB/TSSCB.pyx":228
  *                 self.Tstress2 = self.Tstress1 + Fd
  *             if self.configType == 1:
  *                 F_bound = 0.0             # <<<<<<<<<<<<<<
@@ -5705,17 +6606,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_F_bound = 0.0;
 
-      /* "src/TSSCB/TSSCB.pyx":228
+      /* "src/TSSCB/TSSCB.pyx":227
  *             elif self.Thardening and self.Tstrain < 0:
  *                 self.Tstress2 = self.Tstress1 + Fd
  *             if self.configType == 1:             # <<<<<<<<<<<<<<
  *                 F_bound = 0.0
  *             else:
 */
-      goto __pyx_L43;
+      goto __pyx_L48;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":231
+    /* "src/TSSCB/TSSCB.pyx":230
  *                 F_bound = 0.0
  *             else:
  *                 F_bound = self.F1             # <<<<<<<<<<<<<<
@@ -5723,114 +6624,157 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             if dStrain > 0 and self.Tstrain > 0 and self.Tstress2 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
 */
     /*else*/ {
-      __pyx_t_2 = __pyx_v_self->F1;
-      __pyx_v_F_bound = __pyx_t_2;
+      __pyx_t_3 = __pyx_v_self->F1;
+
+      __pyx_v_F_bound = __pyx_t_3;
     }
-    __pyx_L43:;
+    __pyx_L48:;
 
-    /* "src/TSSCB/TSSCB.pyx":232
+    /* "src/TSSCB/TSSCB.pyx":231
  *             else:
  *                 F_bound = self.F1
  *             self.Tstress3 = self.Tstress2             # <<<<<<<<<<<<<<
  *             if dStrain > 0 and self.Tstrain > 0 and self.Tstress2 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
  *                 self.Tstress3 = self.F1
 */
-    __pyx_t_2 = __pyx_v_self->Tstress2;
-    __pyx_v_self->Tstress3 = __pyx_t_2;
+    __pyx_t_3 = __pyx_v_self->Tstress2;
 
-    /* "src/TSSCB/TSSCB.pyx":233
+    __pyx_v_self->Tstress3 = __pyx_t_3;
+
+    /* "src/TSSCB/TSSCB.pyx":232
  *                 F_bound = self.F1
  *             self.Tstress3 = self.Tstress2
  *             if dStrain > 0 and self.Tstrain > 0 and self.Tstress2 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
 */
-    __pyx_t_4 = (__pyx_v_dStrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L45_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L50_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L45_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L50_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 < __pyx_v_self->F1);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstress2 < __pyx_v_self->F1);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L45_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L50_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->ugap > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->ugap > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L45_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L50_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Cstress3 == __pyx_v_self->F1);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L45_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Cstress3 == __pyx_v_self->F1);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L50_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":234
+
+      /* "src/TSSCB/TSSCB.pyx":233
  *             self.Tstress3 = self.Tstress2
  *             if dStrain > 0 and self.Tstrain > 0 and self.Tstress2 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
  *                 self.Tstress3 = self.F1             # <<<<<<<<<<<<<<
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 self.Tstress3 = -self.F1
 */
-      __pyx_t_2 = __pyx_v_self->F1;
-      __pyx_v_self->Tstress3 = __pyx_t_2;
+      __pyx_t_3 = __pyx_v_self->F1;
 
-      /* "src/TSSCB/TSSCB.pyx":233
+      __pyx_v_self->Tstress3 = __pyx_t_3;
+
+      /* "src/TSSCB/TSSCB.pyx":232
  *                 F_bound = self.F1
  *             self.Tstress3 = self.Tstress2
  *             if dStrain > 0 and self.Tstrain > 0 and self.Tstress2 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
 */
-      goto __pyx_L44;
+      goto __pyx_L49;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":235
+    /* "src/TSSCB/TSSCB.pyx":234
  *             if dStrain > 0 and self.Tstrain > 0 and self.Tstress2 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = -self.F1
  *             elif self.Tstrain > 0 and self.Tstress2 < -F_bound:
 */
-    __pyx_t_4 = (__pyx_v_dStrain < 0.0);
-    if (__pyx_t_4) {
-    } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L50_bool_binop_done;
-    }
-    __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L50_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L55_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 > (-__pyx_v_self->F1));
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L50_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L55_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->ugap > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstress2 > (-__pyx_v_self->F1));
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L50_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L55_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Cstress3 == (-__pyx_v_self->F1));
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L50_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->ugap > 0.0);
+
+    if (__pyx_t_5) {
+
+    } else {
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L55_bool_binop_done;
+    }
+    __pyx_t_5 = (__pyx_v_self->Cstress3 == (-__pyx_v_self->F1));
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L55_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":236
+
+      /* "src/TSSCB/TSSCB.pyx":235
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 self.Tstress3 = -self.F1             # <<<<<<<<<<<<<<
@@ -5839,35 +6783,43 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress3 = (-__pyx_v_self->F1);
 
-      /* "src/TSSCB/TSSCB.pyx":235
+      /* "src/TSSCB/TSSCB.pyx":234
  *             if dStrain > 0 and self.Tstrain > 0 and self.Tstress2 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
  *                 self.Tstress3 = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = -self.F1
  *             elif self.Tstrain > 0 and self.Tstress2 < -F_bound:
 */
-      goto __pyx_L44;
+      goto __pyx_L49;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":237
+    /* "src/TSSCB/TSSCB.pyx":236
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 self.Tstress3 = -self.F1
  *             elif self.Tstrain > 0 and self.Tstress2 < -F_bound:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = -F_bound
  *             elif self.Tstrain < 0 and self.Tstress2 > F_bound:
 */
-    __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L55_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L60_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 < (-__pyx_v_F_bound));
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L55_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress2 < (-__pyx_v_F_bound));
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L60_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":238
+
+      /* "src/TSSCB/TSSCB.pyx":237
  *                 self.Tstress3 = -self.F1
  *             elif self.Tstrain > 0 and self.Tstress2 < -F_bound:
  *                 self.Tstress3 = -F_bound             # <<<<<<<<<<<<<<
@@ -5876,35 +6828,43 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress3 = (-__pyx_v_F_bound);
 
-      /* "src/TSSCB/TSSCB.pyx":237
+      /* "src/TSSCB/TSSCB.pyx":236
  *             elif dStrain < 0 and self.Tstrain < 0 and self.Tstress2 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 self.Tstress3 = -self.F1
  *             elif self.Tstrain > 0 and self.Tstress2 < -F_bound:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = -F_bound
  *             elif self.Tstrain < 0 and self.Tstress2 > F_bound:
 */
-      goto __pyx_L44;
+      goto __pyx_L49;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":239
+    /* "src/TSSCB/TSSCB.pyx":238
  *             elif self.Tstrain > 0 and self.Tstress2 < -F_bound:
  *                 self.Tstress3 = -F_bound
  *             elif self.Tstrain < 0 and self.Tstress2 > F_bound:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = F_bound
  *             if dStrain > 0 and self.Tstress3 <= self.Cstress3:
 */
-    __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L57_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L62_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 > __pyx_v_F_bound);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L57_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress2 > __pyx_v_F_bound);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L62_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":240
+
+      /* "src/TSSCB/TSSCB.pyx":239
  *                 self.Tstress3 = -F_bound
  *             elif self.Tstrain < 0 and self.Tstress2 > F_bound:
  *                 self.Tstress3 = F_bound             # <<<<<<<<<<<<<<
@@ -5913,7 +6873,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_self->Tstress3 = __pyx_v_F_bound;
 
-      /* "src/TSSCB/TSSCB.pyx":239
+      /* "src/TSSCB/TSSCB.pyx":238
  *             elif self.Tstrain > 0 and self.Tstress2 < -F_bound:
  *                 self.Tstress3 = -F_bound
  *             elif self.Tstrain < 0 and self.Tstress2 > F_bound:             # <<<<<<<<<<<<<<
@@ -5921,75 +6881,93 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             if dStrain > 0 and self.Tstress3 <= self.Cstress3:
 */
     }
-    __pyx_L44:;
+    __pyx_L49:;
 
-    /* "src/TSSCB/TSSCB.pyx":241
+    /* "src/TSSCB/TSSCB.pyx":240
  *             elif self.Tstrain < 0 and self.Tstress2 > F_bound:
  *                 self.Tstress3 = F_bound
  *             if dStrain > 0 and self.Tstress3 <= self.Cstress3:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self.Cstress4
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:
 */
-    __pyx_t_4 = (__pyx_v_dStrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L60_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L65_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress3 <= __pyx_v_self->Cstress3);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L60_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress3 <= __pyx_v_self->Cstress3);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L65_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":242
+
+      /* "src/TSSCB/TSSCB.pyx":241
  *                 self.Tstress3 = F_bound
  *             if dStrain > 0 and self.Tstress3 <= self.Cstress3:
  *                 self.Tstress3 = self.Cstress4             # <<<<<<<<<<<<<<
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:
  *                 self.Tstress3 = self.Cstress4
 */
-      __pyx_t_2 = __pyx_v_self->Cstress4;
-      __pyx_v_self->Tstress3 = __pyx_t_2;
+      __pyx_t_3 = __pyx_v_self->Cstress4;
 
-      /* "src/TSSCB/TSSCB.pyx":241
+      __pyx_v_self->Tstress3 = __pyx_t_3;
+
+      /* "src/TSSCB/TSSCB.pyx":240
  *             elif self.Tstrain < 0 and self.Tstress2 > F_bound:
  *                 self.Tstress3 = F_bound
  *             if dStrain > 0 and self.Tstress3 <= self.Cstress3:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self.Cstress4
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:
 */
-      goto __pyx_L59;
+      goto __pyx_L64;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":243
+    /* "src/TSSCB/TSSCB.pyx":242
  *             if dStrain > 0 and self.Tstress3 <= self.Cstress3:
  *                 self.Tstress3 = self.Cstress4
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self.Cstress4
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:
 */
-    __pyx_t_4 = (__pyx_v_dStrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L62_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L67_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress3 >= __pyx_v_self->Cstress3);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L62_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress3 >= __pyx_v_self->Cstress3);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L67_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":244
+
+      /* "src/TSSCB/TSSCB.pyx":243
  *                 self.Tstress3 = self.Cstress4
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:
  *                 self.Tstress3 = self.Cstress4             # <<<<<<<<<<<<<<
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
 */
-      __pyx_t_2 = __pyx_v_self->Cstress4;
-      __pyx_v_self->Tstress3 = __pyx_t_2;
+      __pyx_t_3 = __pyx_v_self->Cstress4;
 
-      /* "src/TSSCB/TSSCB.pyx":243
+      __pyx_v_self->Tstress3 = __pyx_t_3;
+
+      /* "src/TSSCB/TSSCB.pyx":242
  *             if dStrain > 0 and self.Tstress3 <= self.Cstress3:
  *                 self.Tstress3 = self.Cstress4
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:             # <<<<<<<<<<<<<<
@@ -5997,109 +6975,143 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:
 */
     }
-    __pyx_L59:;
+    __pyx_L64:;
 
-    /* "src/TSSCB/TSSCB.pyx":245
+    /* "src/TSSCB/TSSCB.pyx":244
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:
  *                 self.Tstress3 = self.Cstress4
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:
 */
-    __pyx_t_4 = (__pyx_v_self->configType == 1);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->configType == 1);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L65_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L70_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain >= 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain >= 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L65_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L70_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_dStrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L65_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L70_bool_binop_done;
     }
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L65_bool_binop_done;
+      goto __pyx_L70_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 < __pyx_v_self->F1);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L65_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress2 < __pyx_v_self->F1);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L70_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":246
+
+      /* "src/TSSCB/TSSCB.pyx":245
  *                 self.Tstress3 = self.Cstress4
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)             # <<<<<<<<<<<<<<
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
 */
-      __pyx_t_2 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress3, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L1_error)
-      __pyx_v_self->Tstress3 = __pyx_t_2;
+      __pyx_t_3 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress3, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 245, __pyx_L1_error)
+      __pyx_v_self->Tstress3 = __pyx_t_3;
 
-      /* "src/TSSCB/TSSCB.pyx":245
+      /* "src/TSSCB/TSSCB.pyx":244
  *             elif dStrain < 0 and self.Tstress3 >= self.Cstress3:
  *                 self.Tstress3 = self.Cstress4
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:
 */
-      goto __pyx_L64;
+      goto __pyx_L69;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":247
+    /* "src/TSSCB/TSSCB.pyx":246
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:             # <<<<<<<<<<<<<<
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *         elif self.Cstage == 2 and self.Tstage == 1:
 */
-    __pyx_t_4 = (__pyx_v_self->configType == 1);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->configType == 1);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L70_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L75_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain <= 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain <= 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L70_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L75_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_dStrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L70_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L75_bool_binop_done;
     }
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L70_bool_binop_done;
+      goto __pyx_L75_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstress2 > __pyx_v_self->F1);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L70_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstress2 > __pyx_v_self->F1);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L75_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":248
+
+      /* "src/TSSCB/TSSCB.pyx":247
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)             # <<<<<<<<<<<<<<
  *         elif self.Cstage == 2 and self.Tstage == 1:
  *             # 2->1
 */
-      __pyx_t_2 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress3, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 248, __pyx_L1_error)
-      __pyx_v_self->Tstress3 = __pyx_t_2;
+      __pyx_t_3 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_self->Cstress3, __pyx_v_dStrain, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 247, __pyx_L1_error)
+      __pyx_v_self->Tstress3 = __pyx_t_3;
 
-      /* "src/TSSCB/TSSCB.pyx":247
+      /* "src/TSSCB/TSSCB.pyx":246
  *             if self.configType == 1 and self.Tstrain >= 0 and dStrain > 0 and self.Thardening and self.Tstress2 < self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:             # <<<<<<<<<<<<<<
@@ -6107,48 +7119,90 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         elif self.Cstage == 2 and self.Tstage == 1:
 */
     }
-    __pyx_L64:;
+    __pyx_L69:;
 
-    /* "src/TSSCB/TSSCB.pyx":213
+    /* "src/TSSCB/TSSCB.pyx":210
  *             elif dStrain < 0 and self.Tstress2 > -self.F1:
  *                 self.Tstress3 = -self.F1
  *         elif self.Cstage == 2 and self.Tstage == 2:             # <<<<<<<<<<<<<<
  *             # 2->2
- *             if self.Thardening:
+ *             if MYOPENSEES_STATS:
 */
-    goto __pyx_L17;
+    goto __pyx_L19;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":249
+  /* "src/TSSCB/TSSCB.pyx":248
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *         elif self.Cstage == 2 and self.Tstage == 1:             # <<<<<<<<<<<<<<
  *             # 2->1
- *             if dStrain < 0:
+ *             if MYOPENSEES_STATS:
 */
-  __pyx_t_4 = (__pyx_v_self->Cstage == 2);
-  if (__pyx_t_4) {
+  __pyx_t_5 = (__pyx_v_self->Cstage == 2);
+
+  if (__pyx_t_5) {
+
   } else {
-    __pyx_t_1 = __pyx_t_4;
-    goto __pyx_L75_bool_binop_done;
+
+    __pyx_t_1 = __pyx_t_5;
+
+    goto __pyx_L80_bool_binop_done;
   }
-  __pyx_t_4 = (__pyx_v_self->Tstage == 1);
-  __pyx_t_1 = __pyx_t_4;
-  __pyx_L75_bool_binop_done:;
+  __pyx_t_5 = (__pyx_v_self->Tstage == 1);
+
+
+  __pyx_t_1 = __pyx_t_5;
+
+  __pyx_L80_bool_binop_done:;
   if (likely(__pyx_t_1)) {
 
-    /* "src/TSSCB/TSSCB.pyx":251
+
+    /* "src/TSSCB/TSSCB.pyx":250
+ *         elif self.Cstage == 2 and self.Tstage == 1:
+ *             # 2->1
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_21] += 1
+ *             if dStrain < 0:
+*/
+    __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+    if (__pyx_t_1) {
+
+
+      /* "src/TSSCB/TSSCB.pyx":251
+ *             # 2->1
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_21] += 1             # <<<<<<<<<<<<<<
+ *             if dStrain < 0:
+ *                 du1 = -(self.Cstrain - self.ugap)
+*/
+
+      __pyx_t_2 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_STAGE_21;
+      (__pyx_v_self->counts[__pyx_t_2]) = ((__pyx_v_self->counts[__pyx_t_2]) + 1);
+
+      /* "src/TSSCB/TSSCB.pyx":250
  *         elif self.Cstage == 2 and self.Tstage == 1:
  *             # 2->1
+ *             if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                 self.counts[TSSCB_STAGE_21] += 1
+ *             if dStrain < 0:
+*/
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":252
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_21] += 1
  *             if dStrain < 0:             # <<<<<<<<<<<<<<
  *                 du1 = -(self.Cstrain - self.ugap)
  *                 du2 = -(self.ugap - self.Tstrain)
 */
     __pyx_t_1 = (__pyx_v_dStrain < 0.0);
+
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":252
- *             # 2->1
+
+      /* "src/TSSCB/TSSCB.pyx":253
+ *                 self.counts[TSSCB_STAGE_21] += 1
  *             if dStrain < 0:
  *                 du1 = -(self.Cstrain - self.ugap)             # <<<<<<<<<<<<<<
  *                 du2 = -(self.ugap - self.Tstrain)
@@ -6156,7 +7210,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_du1 = (-(__pyx_v_self->Cstrain - __pyx_v_self->ugap));
 
-      /* "src/TSSCB/TSSCB.pyx":253
+      /* "src/TSSCB/TSSCB.pyx":254
  *             if dStrain < 0:
  *                 du1 = -(self.Cstrain - self.ugap)
  *                 du2 = -(self.ugap - self.Tstrain)             # <<<<<<<<<<<<<<
@@ -6165,7 +7219,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_du2 = (-(__pyx_v_self->ugap - __pyx_v_self->Tstrain));
 
-      /* "src/TSSCB/TSSCB.pyx":254
+      /* "src/TSSCB/TSSCB.pyx":255
  *                 du1 = -(self.Cstrain - self.ugap)
  *                 du2 = -(self.ugap - self.Tstrain)
  *                 usc0 = self.Cstrain - self.ua             # <<<<<<<<<<<<<<
@@ -6174,17 +7228,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_usc0 = (__pyx_v_self->Cstrain - __pyx_v_self->ua);
 
-      /* "src/TSSCB/TSSCB.pyx":251
- *         elif self.Cstage == 2 and self.Tstage == 1:
- *             # 2->1
+      /* "src/TSSCB/TSSCB.pyx":252
+ *             if MYOPENSEES_STATS:
+ *                 self.counts[TSSCB_STAGE_21] += 1
  *             if dStrain < 0:             # <<<<<<<<<<<<<<
  *                 du1 = -(self.Cstrain - self.ugap)
  *                 du2 = -(self.ugap - self.Tstrain)
 */
-      goto __pyx_L77;
+      goto __pyx_L83;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":256
+    /* "src/TSSCB/TSSCB.pyx":257
  *                 usc0 = self.Cstrain - self.ua
  *             else:
  *                 du1 = -self.ugap - self.Cstrain             # <<<<<<<<<<<<<<
@@ -6194,7 +7248,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
     /*else*/ {
       __pyx_v_du1 = ((-__pyx_v_self->ugap) - __pyx_v_self->Cstrain);
 
-      /* "src/TSSCB/TSSCB.pyx":257
+      /* "src/TSSCB/TSSCB.pyx":258
  *             else:
  *                 du1 = -self.ugap - self.Cstrain
  *                 du2 = self.Tstrain + self.ugap             # <<<<<<<<<<<<<<
@@ -6203,7 +7257,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_du2 = (__pyx_v_self->Tstrain + __pyx_v_self->ugap);
 
-      /* "src/TSSCB/TSSCB.pyx":258
+      /* "src/TSSCB/TSSCB.pyx":259
  *                 du1 = -self.ugap - self.Cstrain
  *                 du2 = self.Tstrain + self.ugap
  *                 usc0 = self.Cstrain + self.ua             # <<<<<<<<<<<<<<
@@ -6212,9 +7266,9 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_usc0 = (__pyx_v_self->Cstrain + __pyx_v_self->ua);
     }
-    __pyx_L77:;
+    __pyx_L83:;
 
-    /* "src/TSSCB/TSSCB.pyx":259
+    /* "src/TSSCB/TSSCB.pyx":260
  *                 du2 = self.Tstrain + self.ugap
  *                 usc0 = self.Cstrain + self.ua
  *             if self.Thardening:             # <<<<<<<<<<<<<<
@@ -6223,22 +7277,26 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
 
-      /* "src/TSSCB/TSSCB.pyx":260
+      /* "src/TSSCB/TSSCB.pyx":261
  *                 usc0 = self.Cstrain + self.ua
  *             if self.Thardening:
  *                 self.TCDD = self.CCDD + fabs(du1) / (self.uh - self.ugap)             # <<<<<<<<<<<<<<
  *             F1_ = self._SCModel(usc0, self.Cstress1, du1)
  *             F1_ideal1 = F1_
 */
-      __pyx_t_2 = fabs(__pyx_v_du1);
-      __pyx_t_5 = (__pyx_v_self->uh - __pyx_v_self->ugap);
-      if (unlikely(__pyx_t_5 == 0)) {
+      __pyx_t_3 = fabs(__pyx_v_du1);
+
+      __pyx_t_6 = (__pyx_v_self->uh - __pyx_v_self->ugap);
+
+      if (unlikely(__pyx_t_6 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 260, __pyx_L1_error)
+        __PYX_ERR(0, 261, __pyx_L1_error)
       }
-      __pyx_v_self->TCDD = (__pyx_v_self->CCDD + (__pyx_t_2 / __pyx_t_5));
+      __pyx_v_self->TCDD = (__pyx_v_self->CCDD + (__pyx_t_3 / __pyx_t_6));
 
-      /* "src/TSSCB/TSSCB.pyx":259
+
+
+      /* "src/TSSCB/TSSCB.pyx":260
  *                 du2 = self.Tstrain + self.ugap
  *                 usc0 = self.Cstrain + self.ua
  *             if self.Thardening:             # <<<<<<<<<<<<<<
@@ -6247,17 +7305,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     }
 
-    /* "src/TSSCB/TSSCB.pyx":261
+    /* "src/TSSCB/TSSCB.pyx":262
  *             if self.Thardening:
  *                 self.TCDD = self.CCDD + fabs(du1) / (self.uh - self.ugap)
  *             F1_ = self._SCModel(usc0, self.Cstress1, du1)             # <<<<<<<<<<<<<<
  *             F1_ideal1 = F1_
  *             if self.Thardening and self.Tstrain > 0:
 */
-    __pyx_t_5 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_SCModel(__pyx_v_self, __pyx_v_usc0, __pyx_v_self->Cstress1, __pyx_v_du1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L1_error)
-    __pyx_v_F1_ = __pyx_t_5;
+    __pyx_t_6 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_SCModel(__pyx_v_self, __pyx_v_usc0, __pyx_v_self->Cstress1, __pyx_v_du1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 262, __pyx_L1_error)
+    __pyx_v_F1_ = __pyx_t_6;
 
-    /* "src/TSSCB/TSSCB.pyx":262
+    /* "src/TSSCB/TSSCB.pyx":263
  *                 self.TCDD = self.CCDD + fabs(du1) / (self.uh - self.ugap)
  *             F1_ = self._SCModel(usc0, self.Cstress1, du1)
  *             F1_ideal1 = F1_             # <<<<<<<<<<<<<<
@@ -6266,7 +7324,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_F1_ideal1 = __pyx_v_F1_;
 
-    /* "src/TSSCB/TSSCB.pyx":263
+    /* "src/TSSCB/TSSCB.pyx":264
  *             F1_ = self._SCModel(usc0, self.Cstress1, du1)
  *             F1_ideal1 = F1_
  *             if self.Thardening and self.Tstrain > 0:             # <<<<<<<<<<<<<<
@@ -6275,40 +7333,49 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L80_bool_binop_done;
+      goto __pyx_L86_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L80_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L86_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":264
+
+      /* "src/TSSCB/TSSCB.pyx":265
  *             F1_ideal1 = F1_
  *             if self.Thardening and self.Tstrain > 0:
  *                 F1_ideal1 = F1_ - (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))             # <<<<<<<<<<<<<<
  *             elif self.Thardening and self.Tstrain < 0:
  *                 F1_ideal1 = F1_ + (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
 */
-      __pyx_t_5 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
-      __pyx_t_2 = (__pyx_v_self->uh - __pyx_v_self->ugap);
-      if (unlikely(__pyx_t_2 == 0)) {
+      __pyx_t_6 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
+
+      __pyx_t_3 = (__pyx_v_self->uh - __pyx_v_self->ugap);
+
+      if (unlikely(__pyx_t_3 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 264, __pyx_L1_error)
+        __PYX_ERR(0, 265, __pyx_L1_error)
       }
-      __pyx_v_F1_ideal1 = (__pyx_v_F1_ - (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_5 / __pyx_t_2))));
+      __pyx_v_F1_ideal1 = (__pyx_v_F1_ - (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_6 / __pyx_t_3))));
+
 
-      /* "src/TSSCB/TSSCB.pyx":263
+
+      /* "src/TSSCB/TSSCB.pyx":264
  *             F1_ = self._SCModel(usc0, self.Cstress1, du1)
  *             F1_ideal1 = F1_
  *             if self.Thardening and self.Tstrain > 0:             # <<<<<<<<<<<<<<
  *                 F1_ideal1 = F1_ - (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             elif self.Thardening and self.Tstrain < 0:
 */
-      goto __pyx_L79;
+      goto __pyx_L85;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":265
+    /* "src/TSSCB/TSSCB.pyx":266
  *             if self.Thardening and self.Tstrain > 0:
  *                 F1_ideal1 = F1_ - (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             elif self.Thardening and self.Tstrain < 0:             # <<<<<<<<<<<<<<
@@ -6317,30 +7384,39 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     if (__pyx_v_self->Thardening) {
     } else {
+
       __pyx_t_1 = __pyx_v_self->Thardening;
-      goto __pyx_L82_bool_binop_done;
+      goto __pyx_L88_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L82_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L88_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":266
+
+      /* "src/TSSCB/TSSCB.pyx":267
  *                 F1_ideal1 = F1_ - (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             elif self.Thardening and self.Tstrain < 0:
  *                 F1_ideal1 = F1_ + (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))             # <<<<<<<<<<<<<<
  *             if self.configType == 1:
  *                 F_bound = 0.0
 */
-      __pyx_t_2 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
-      __pyx_t_5 = (__pyx_v_self->uh - __pyx_v_self->ugap);
-      if (unlikely(__pyx_t_5 == 0)) {
+      __pyx_t_3 = (__pyx_v_self->r2 * (fabs(__pyx_v_self->Tstrain) - __pyx_v_self->ugap));
+
+      __pyx_t_6 = (__pyx_v_self->uh - __pyx_v_self->ugap);
+
+      if (unlikely(__pyx_t_6 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 266, __pyx_L1_error)
+        __PYX_ERR(0, 267, __pyx_L1_error)
       }
-      __pyx_v_F1_ideal1 = (__pyx_v_F1_ + (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_2 / __pyx_t_5))));
+      __pyx_v_F1_ideal1 = (__pyx_v_F1_ + (((__pyx_v_self->F2 - (__pyx_v_self->F1 / 2.0)) * __pyx_v_self->TCDD) * (__pyx_v_self->r1 - (__pyx_t_3 / __pyx_t_6))));
 
-      /* "src/TSSCB/TSSCB.pyx":265
+
+
+      /* "src/TSSCB/TSSCB.pyx":266
  *             if self.Thardening and self.Tstrain > 0:
  *                 F1_ideal1 = F1_ - (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             elif self.Thardening and self.Tstrain < 0:             # <<<<<<<<<<<<<<
@@ -6348,9 +7424,9 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             if self.configType == 1:
 */
     }
-    __pyx_L79:;
+    __pyx_L85:;
 
-    /* "src/TSSCB/TSSCB.pyx":267
+    /* "src/TSSCB/TSSCB.pyx":268
  *             elif self.Thardening and self.Tstrain < 0:
  *                 F1_ideal1 = F1_ + (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.configType == 1:             # <<<<<<<<<<<<<<
@@ -6358,9 +7434,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             else:
 */
     __pyx_t_1 = (__pyx_v_self->configType == 1);
+
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":268
+
+      /* "src/TSSCB/TSSCB.pyx":269
  *                 F1_ideal1 = F1_ + (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.configType == 1:
  *                 F_bound = 0.0             # <<<<<<<<<<<<<<
@@ -6369,17 +7447,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_F_bound = 0.0;
 
-      /* "src/TSSCB/TSSCB.pyx":267
+      /* "src/TSSCB/TSSCB.pyx":268
  *             elif self.Thardening and self.Tstrain < 0:
  *                 F1_ideal1 = F1_ + (self.F2 - self.F1 / 2.0) * self.TCDD * (self.r1 - self.r2 * (fabs(self.Tstrain) - self.ugap) / (self.uh - self.ugap))
  *             if self.configType == 1:             # <<<<<<<<<<<<<<
  *                 F_bound = 0.0
  *             else:
 */
-      goto __pyx_L84;
+      goto __pyx_L90;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":270
+    /* "src/TSSCB/TSSCB.pyx":271
  *                 F_bound = 0.0
  *             else:
  *                 F_bound = self.F1             # <<<<<<<<<<<<<<
@@ -6387,12 +7465,13 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             if dStrain > 0 and self.Tstrain > 0 and F1_ideal1 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
 */
     /*else*/ {
-      __pyx_t_5 = __pyx_v_self->F1;
-      __pyx_v_F_bound = __pyx_t_5;
+      __pyx_t_6 = __pyx_v_self->F1;
+
+      __pyx_v_F_bound = __pyx_t_6;
     }
-    __pyx_L84:;
+    __pyx_L90:;
 
-    /* "src/TSSCB/TSSCB.pyx":271
+    /* "src/TSSCB/TSSCB.pyx":272
  *             else:
  *                 F_bound = self.F1
  *             F1_ = F1_ideal1             # <<<<<<<<<<<<<<
@@ -6401,99 +7480,140 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_F1_ = __pyx_v_F1_ideal1;
 
-    /* "src/TSSCB/TSSCB.pyx":272
+    /* "src/TSSCB/TSSCB.pyx":273
  *                 F_bound = self.F1
  *             F1_ = F1_ideal1
  *             if dStrain > 0 and self.Tstrain > 0 and F1_ideal1 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:             # <<<<<<<<<<<<<<
  *                 F1_ = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
 */
-    __pyx_t_4 = (__pyx_v_dStrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L86_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L92_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L86_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L92_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_F1_ideal1 < __pyx_v_self->F1);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_F1_ideal1 < __pyx_v_self->F1);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L86_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L92_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->ugap > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->ugap > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L86_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L92_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Cstress3 == __pyx_v_self->F1);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L86_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Cstress3 == __pyx_v_self->F1);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L92_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":273
+
+      /* "src/TSSCB/TSSCB.pyx":274
  *             F1_ = F1_ideal1
  *             if dStrain > 0 and self.Tstrain > 0 and F1_ideal1 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
  *                 F1_ = self.F1             # <<<<<<<<<<<<<<
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 F1_ = -self.F1
 */
-      __pyx_t_5 = __pyx_v_self->F1;
-      __pyx_v_F1_ = __pyx_t_5;
+      __pyx_t_6 = __pyx_v_self->F1;
 
-      /* "src/TSSCB/TSSCB.pyx":272
+      __pyx_v_F1_ = __pyx_t_6;
+
+      /* "src/TSSCB/TSSCB.pyx":273
  *                 F_bound = self.F1
  *             F1_ = F1_ideal1
  *             if dStrain > 0 and self.Tstrain > 0 and F1_ideal1 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:             # <<<<<<<<<<<<<<
  *                 F1_ = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
 */
-      goto __pyx_L85;
+      goto __pyx_L91;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":274
+    /* "src/TSSCB/TSSCB.pyx":275
  *             if dStrain > 0 and self.Tstrain > 0 and F1_ideal1 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
  *                 F1_ = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:             # <<<<<<<<<<<<<<
  *                 F1_ = -self.F1
  *             elif self.Tstrain > 0 and F1_ideal1 < -F_bound:
 */
-    __pyx_t_4 = (__pyx_v_dStrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_dStrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L91_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L97_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L91_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L97_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_F1_ideal1 > (-__pyx_v_self->F1));
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_F1_ideal1 > (-__pyx_v_self->F1));
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L91_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L97_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->ugap > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->ugap > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L91_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L97_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_self->Cstress3 == (-__pyx_v_self->F1));
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L91_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_self->Cstress3 == (-__pyx_v_self->F1));
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L97_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":275
+
+      /* "src/TSSCB/TSSCB.pyx":276
  *                 F1_ = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 F1_ = -self.F1             # <<<<<<<<<<<<<<
@@ -6502,35 +7622,43 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_F1_ = (-__pyx_v_self->F1);
 
-      /* "src/TSSCB/TSSCB.pyx":274
+      /* "src/TSSCB/TSSCB.pyx":275
  *             if dStrain > 0 and self.Tstrain > 0 and F1_ideal1 < self.F1 and self.ugap > 0 and self.Cstress3 == self.F1:
  *                 F1_ = self.F1
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:             # <<<<<<<<<<<<<<
  *                 F1_ = -self.F1
  *             elif self.Tstrain > 0 and F1_ideal1 < -F_bound:
 */
-      goto __pyx_L85;
+      goto __pyx_L91;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":276
+    /* "src/TSSCB/TSSCB.pyx":277
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 F1_ = -self.F1
  *             elif self.Tstrain > 0 and F1_ideal1 < -F_bound:             # <<<<<<<<<<<<<<
  *                 F1_ = -F_bound
  *             elif self.Tstrain < 0 and F1_ideal1 > F_bound:
 */
-    __pyx_t_4 = (__pyx_v_self->Tstrain > 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain > 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L96_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L102_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_F1_ideal1 < (-__pyx_v_F_bound));
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L96_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_F1_ideal1 < (-__pyx_v_F_bound));
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L102_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":277
+
+      /* "src/TSSCB/TSSCB.pyx":278
  *                 F1_ = -self.F1
  *             elif self.Tstrain > 0 and F1_ideal1 < -F_bound:
  *                 F1_ = -F_bound             # <<<<<<<<<<<<<<
@@ -6539,35 +7667,43 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_F1_ = (-__pyx_v_F_bound);
 
-      /* "src/TSSCB/TSSCB.pyx":276
+      /* "src/TSSCB/TSSCB.pyx":277
  *             elif dStrain < 0 and self.Tstrain < 0 and F1_ideal1 > -self.F1 and self.ugap > 0 and self.Cstress3 == -self.F1:
  *                 F1_ = -self.F1
  *             elif self.Tstrain > 0 and F1_ideal1 < -F_bound:             # <<<<<<<<<<<<<<
  *                 F1_ = -F_bound
  *             elif self.Tstrain < 0 and F1_ideal1 > F_bound:
 */
-      goto __pyx_L85;
+      goto __pyx_L91;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":278
+    /* "src/TSSCB/TSSCB.pyx":279
  *             elif self.Tstrain > 0 and F1_ideal1 < -F_bound:
  *                 F1_ = -F_bound
  *             elif self.Tstrain < 0 and F1_ideal1 > F_bound:             # <<<<<<<<<<<<<<
  *                 F1_ = F_bound
  *             F2_ = self._frictionModel(F1_, du2)
 */
-    __pyx_t_4 = (__pyx_v_self->Tstrain < 0.0);
-    if (__pyx_t_4) {
+    __pyx_t_5 = (__pyx_v_self->Tstrain < 0.0);
+
+    if (__pyx_t_5) {
+
     } else {
-      __pyx_t_1 = __pyx_t_4;
-      goto __pyx_L98_bool_binop_done;
+
+      __pyx_t_1 = __pyx_t_5;
+
+      goto __pyx_L104_bool_binop_done;
     }
-    __pyx_t_4 = (__pyx_v_F1_ideal1 > __pyx_v_F_bound);
-    __pyx_t_1 = __pyx_t_4;
-    __pyx_L98_bool_binop_done:;
+    __pyx_t_5 = (__pyx_v_F1_ideal1 > __pyx_v_F_bound);
+
+
+    __pyx_t_1 = __pyx_t_5;
+
+    __pyx_L104_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":279
+
+      /* "src/TSSCB/TSSCB.pyx":280
  *                 F1_ = -F_bound
  *             elif self.Tstrain < 0 and F1_ideal1 > F_bound:
  *                 F1_ = F_bound             # <<<<<<<<<<<<<<
@@ -6576,7 +7712,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
       __pyx_v_F1_ = __pyx_v_F_bound;
 
-      /* "src/TSSCB/TSSCB.pyx":278
+      /* "src/TSSCB/TSSCB.pyx":279
  *             elif self.Tstrain > 0 and F1_ideal1 < -F_bound:
  *                 F1_ = -F_bound
  *             elif self.Tstrain < 0 and F1_ideal1 > F_bound:             # <<<<<<<<<<<<<<
@@ -6584,19 +7720,19 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *             F2_ = self._frictionModel(F1_, du2)
 */
     }
-    __pyx_L85:;
+    __pyx_L91:;
 
-    /* "src/TSSCB/TSSCB.pyx":280
+    /* "src/TSSCB/TSSCB.pyx":281
  *             elif self.Tstrain < 0 and F1_ideal1 > F_bound:
  *                 F1_ = F_bound
  *             F2_ = self._frictionModel(F1_, du2)             # <<<<<<<<<<<<<<
  *             self.Tstress1 = F2_
  *             self.Tstress2 = self.Tstress1
 */
-    __pyx_t_5 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_F1_, __pyx_v_du2, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L1_error)
-    __pyx_v_F2_ = __pyx_t_5;
+    __pyx_t_6 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_base.__pyx_vtab)->_frictionModel(__pyx_v_self, __pyx_v_F1_, __pyx_v_du2, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L1_error)
+    __pyx_v_F2_ = __pyx_t_6;
 
-    /* "src/TSSCB/TSSCB.pyx":281
+    /* "src/TSSCB/TSSCB.pyx":282
  *                 F1_ = F_bound
  *             F2_ = self._frictionModel(F1_, du2)
  *             self.Tstress1 = F2_             # <<<<<<<<<<<<<<
@@ -6605,37 +7741,39 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_self->Tstress1 = __pyx_v_F2_;
 
-    /* "src/TSSCB/TSSCB.pyx":282
+    /* "src/TSSCB/TSSCB.pyx":283
  *             F2_ = self._frictionModel(F1_, du2)
  *             self.Tstress1 = F2_
  *             self.Tstress2 = self.Tstress1             # <<<<<<<<<<<<<<
  *             self.Tstress3 = self.Tstress1
  *         else:
 */
-    __pyx_t_5 = __pyx_v_self->Tstress1;
-    __pyx_v_self->Tstress2 = __pyx_t_5;
+    __pyx_t_6 = __pyx_v_self->Tstress1;
 
-    /* "src/TSSCB/TSSCB.pyx":283
+    __pyx_v_self->Tstress2 = __pyx_t_6;
+
+    /* "src/TSSCB/TSSCB.pyx":284
  *             self.Tstress1 = F2_
  *             self.Tstress2 = self.Tstress1
  *             self.Tstress3 = self.Tstress1             # <<<<<<<<<<<<<<
  *         else:
  *             raise AssertionError(f"Invalid state transition: Cstage={self.Cstage}, Tstage={self.Tstage}")
 */
-    __pyx_t_5 = __pyx_v_self->Tstress1;
-    __pyx_v_self->Tstress3 = __pyx_t_5;
+    __pyx_t_6 = __pyx_v_self->Tstress1;
 
-    /* "src/TSSCB/TSSCB.pyx":249
+    __pyx_v_self->Tstress3 = __pyx_t_6;
+
+    /* "src/TSSCB/TSSCB.pyx":248
  *             elif self.configType == 1 and self.Tstrain <= 0 and dStrain < 0 and self.Thardening and self.Tstress2 > self.F1:
  *                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
  *         elif self.Cstage == 2 and self.Tstage == 1:             # <<<<<<<<<<<<<<
  *             # 2->1
- *             if dStrain < 0:
+ *             if MYOPENSEES_STATS:
 */
-    goto __pyx_L17;
+    goto __pyx_L19;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":285
+  /* "src/TSSCB/TSSCB.pyx":286
  *             self.Tstress3 = self.Tstress1
  *         else:
  *             raise AssertionError(f"Invalid state transition: Cstage={self.Cstage}, Tstage={self.Tstage}")             # <<<<<<<<<<<<<<
@@ -6643,36 +7781,41 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         cdef double F_hardening = 0.0
 */
   /*else*/ {
-    __pyx_t_7 = NULL;
-    __pyx_t_8 = __Pyx_PyUnicode_From_int(__pyx_v_self->Cstage, 0, ' ', 'd'); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 285, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_9 = __Pyx_PyUnicode_From_int(__pyx_v_self->Tstage, 0, ' ', 'd'); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __pyx_t_8 = NULL;
+    __pyx_t_9 = __Pyx_PyUnicode_From_int(__pyx_v_self->Cstage, 0, ' ', 'd'); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 286, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_10[0] = __pyx_mstate_global->__pyx_kp_u_Invalid_state_transition_Cstage;
-    __pyx_t_10[1] = __pyx_t_8;
-    __pyx_t_10[2] = __pyx_mstate_global->__pyx_kp_u_Tstage;
-    __pyx_t_10[3] = __pyx_t_9;
-    __pyx_t_11 = __Pyx_PyUnicode_Join(__pyx_t_10, 4, 33 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_8) + 9 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_9), 127);
-    if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 285, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_10 = __Pyx_PyUnicode_From_int(__pyx_v_self->Tstage, 0, ' ', 'd'); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_11[0] = __pyx_mstate_global->__pyx_kp_u_Invalid_state_transition_Cstage;
+    __pyx_t_11[1] = __pyx_t_9;
+    __pyx_t_11[2] = __pyx_mstate_global->__pyx_kp_u_Tstage;
+    __pyx_t_11[3] = __pyx_t_10;
+    __pyx_t_12 = 42;
+    #if __Pyx_PyUnicode_Join_CAN_USE_KIND_AND_LENGTH
+    __pyx_t_12 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_11[1]) + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_11[3]);
+    #endif
+    __pyx_t_13 = 0;
+    __pyx_t_14 = __Pyx_PyUnicode_Join(__pyx_t_11, 4, __pyx_t_12, __pyx_t_13);
+    if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_t_12 = 1;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_15 = 1;
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_t_11};
-      __pyx_t_6 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_AssertionError)), __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 285, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-    }
-    __Pyx_Raise(__pyx_t_6, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __PYX_ERR(0, 285, __pyx_L1_error)
+      PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_t_14};
+      __pyx_t_7 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_AssertionError)), __pyx_callargs+__pyx_t_15, (2-__pyx_t_15) | (__pyx_t_15*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+    }
+    __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __PYX_ERR(0, 286, __pyx_L1_error)
   }
-  __pyx_L17:;
+  __pyx_L19:;
 
-  /* "src/TSSCB/TSSCB.pyx":287
+  /* "src/TSSCB/TSSCB.pyx":288
  *             raise AssertionError(f"Invalid state transition: Cstage={self.Cstage}, Tstage={self.Tstage}")
  *         #
  *         cdef double F_hardening = 0.0             # <<<<<<<<<<<<<<
@@ -6681,7 +7824,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
   __pyx_v_F_hardening = 0.0;
 
-  /* "src/TSSCB/TSSCB.pyx":288
+  /* "src/TSSCB/TSSCB.pyx":289
  *         #
  *         cdef double F_hardening = 0.0
  *         if self.Tstrain > self.uh:             # <<<<<<<<<<<<<<
@@ -6689,9 +7832,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         elif -self.Tstrain > self.uh:
 */
   __pyx_t_1 = (__pyx_v_self->Tstrain > __pyx_v_self->uh);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":289
+
+    /* "src/TSSCB/TSSCB.pyx":290
  *         cdef double F_hardening = 0.0
  *         if self.Tstrain > self.uh:
  *             F_hardening = (self.Tstrain - self.uh) * self.k2 * self.r3             # <<<<<<<<<<<<<<
@@ -6700,17 +7845,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_F_hardening = (((__pyx_v_self->Tstrain - __pyx_v_self->uh) * __pyx_v_self->k2) * __pyx_v_self->r3);
 
-    /* "src/TSSCB/TSSCB.pyx":288
+    /* "src/TSSCB/TSSCB.pyx":289
  *         #
  *         cdef double F_hardening = 0.0
  *         if self.Tstrain > self.uh:             # <<<<<<<<<<<<<<
  *             F_hardening = (self.Tstrain - self.uh) * self.k2 * self.r3
  *         elif -self.Tstrain > self.uh:
 */
-    goto __pyx_L100;
+    goto __pyx_L106;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":290
+  /* "src/TSSCB/TSSCB.pyx":291
  *         if self.Tstrain > self.uh:
  *             F_hardening = (self.Tstrain - self.uh) * self.k2 * self.r3
  *         elif -self.Tstrain > self.uh:             # <<<<<<<<<<<<<<
@@ -6718,9 +7863,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         if self.Tstrain >= 0:
 */
   __pyx_t_1 = ((-__pyx_v_self->Tstrain) > __pyx_v_self->uh);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":291
+
+    /* "src/TSSCB/TSSCB.pyx":292
  *             F_hardening = (self.Tstrain - self.uh) * self.k2 * self.r3
  *         elif -self.Tstrain > self.uh:
  *             F_hardening = ( -self.Tstrain - self.uh) * self.k2 * self.r3             # <<<<<<<<<<<<<<
@@ -6729,7 +7876,7 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_F_hardening = ((((-__pyx_v_self->Tstrain) - __pyx_v_self->uh) * __pyx_v_self->k2) * __pyx_v_self->r3);
 
-    /* "src/TSSCB/TSSCB.pyx":290
+    /* "src/TSSCB/TSSCB.pyx":291
  *         if self.Tstrain > self.uh:
  *             F_hardening = (self.Tstrain - self.uh) * self.k2 * self.r3
  *         elif -self.Tstrain > self.uh:             # <<<<<<<<<<<<<<
@@ -6737,9 +7884,9 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         if self.Tstrain >= 0:
 */
   }
-  __pyx_L100:;
+  __pyx_L106:;
 
-  /* "src/TSSCB/TSSCB.pyx":292
+  /* "src/TSSCB/TSSCB.pyx":293
  *         elif -self.Tstrain > self.uh:
  *             F_hardening = ( -self.Tstrain - self.uh) * self.k2 * self.r3
  *         if self.Tstrain >= 0:             # <<<<<<<<<<<<<<
@@ -6747,9 +7894,11 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
  *         else:
 */
   __pyx_t_1 = (__pyx_v_self->Tstrain >= 0.0);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":293
+
+    /* "src/TSSCB/TSSCB.pyx":294
  *             F_hardening = ( -self.Tstrain - self.uh) * self.k2 * self.r3
  *         if self.Tstrain >= 0:
  *             self.Tstress4 = self.Tstress3 + F_hardening             # <<<<<<<<<<<<<<
@@ -6758,17 +7907,17 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
 */
     __pyx_v_self->Tstress4 = (__pyx_v_self->Tstress3 + __pyx_v_F_hardening);
 
-    /* "src/TSSCB/TSSCB.pyx":292
+    /* "src/TSSCB/TSSCB.pyx":293
  *         elif -self.Tstrain > self.uh:
  *             F_hardening = ( -self.Tstrain - self.uh) * self.k2 * self.r3
  *         if self.Tstrain >= 0:             # <<<<<<<<<<<<<<
  *             self.Tstress4 = self.Tstress3 + F_hardening
  *         else:
 */
-    goto __pyx_L101;
+    goto __pyx_L107;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":295
+  /* "src/TSSCB/TSSCB.pyx":296
  *             self.Tstress4 = self.Tstress3 + F_hardening
  *         else:
  *             self.Tstress4 = self.Tstress3 - F_hardening             # <<<<<<<<<<<<<<
@@ -6778,9 +7927,9 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
   /*else*/ {
     __pyx_v_self->Tstress4 = (__pyx_v_self->Tstress3 - __pyx_v_F_hardening);
   }
-  __pyx_L101:;
+  __pyx_L107:;
 
-  /* "src/TSSCB/TSSCB.pyx":151
+  /* "src/TSSCB/TSSCB.pyx":140
  *             pass  #
  * 
  *     cdef void _determineTrialState(self, double dStrain):             # <<<<<<<<<<<<<<
@@ -6791,17 +7940,28 @@ static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState(struct __pyx_
   /* function exit code */
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_8);
   __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_14);
   __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB._determineTrialState", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_L0:;
+
+
+
+
+
+
+
+
+
+
+
   __Pyx_RefNannyFinishContext();
 }
 
-/* "src/TSSCB/TSSCB.pyx":297
+/* "src/TSSCB/TSSCB.pyx":298
  *             self.Tstress4 = self.Tstress3 - F_hardening
  * 
  *     cdef double _frictionModel(self, double F0, double du, double half=1.0):             # <<<<<<<<<<<<<<
@@ -6821,7 +7981,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
     }
   }
 
-  /* "src/TSSCB/TSSCB.pyx":300
+  /* "src/TSSCB/TSSCB.pyx":301
  *         #
  *         cdef double F_, F
  *         if du == 0.0:             # <<<<<<<<<<<<<<
@@ -6829,19 +7989,24 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
  *         F_ = F0 + du * self.k0
 */
   __pyx_t_1 = (__pyx_v_du == 0.0);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":301
+
+    /* "src/TSSCB/TSSCB.pyx":302
  *         cdef double F_, F
  *         if du == 0.0:
  *             return F0             # <<<<<<<<<<<<<<
  *         F_ = F0 + du * self.k0
  *         if F_ > self.F1 * half:
 */
-    __pyx_r = __pyx_v_F0;
+    {
+
+      __pyx_r = __pyx_v_F0;
+    }
     goto __pyx_L0;
 
-    /* "src/TSSCB/TSSCB.pyx":300
+    /* "src/TSSCB/TSSCB.pyx":301
  *         #
  *         cdef double F_, F
  *         if du == 0.0:             # <<<<<<<<<<<<<<
@@ -6850,7 +8015,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":302
+  /* "src/TSSCB/TSSCB.pyx":303
  *         if du == 0.0:
  *             return F0
  *         F_ = F0 + du * self.k0             # <<<<<<<<<<<<<<
@@ -6859,7 +8024,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
 */
   __pyx_v_F_ = (__pyx_v_F0 + (__pyx_v_du * __pyx_v_self->k0));
 
-  /* "src/TSSCB/TSSCB.pyx":303
+  /* "src/TSSCB/TSSCB.pyx":304
  *             return F0
  *         F_ = F0 + du * self.k0
  *         if F_ > self.F1 * half:             # <<<<<<<<<<<<<<
@@ -6867,9 +8032,11 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
  *         elif F_ < -self.F1 * half:
 */
   __pyx_t_1 = (__pyx_v_F_ > (__pyx_v_self->F1 * __pyx_v_half));
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":304
+
+    /* "src/TSSCB/TSSCB.pyx":305
  *         F_ = F0 + du * self.k0
  *         if F_ > self.F1 * half:
  *             F = self.F1 * half             # <<<<<<<<<<<<<<
@@ -6878,7 +8045,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
 */
     __pyx_v_F = (__pyx_v_self->F1 * __pyx_v_half);
 
-    /* "src/TSSCB/TSSCB.pyx":303
+    /* "src/TSSCB/TSSCB.pyx":304
  *             return F0
  *         F_ = F0 + du * self.k0
  *         if F_ > self.F1 * half:             # <<<<<<<<<<<<<<
@@ -6888,7 +8055,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
     goto __pyx_L4;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":305
+  /* "src/TSSCB/TSSCB.pyx":306
  *         if F_ > self.F1 * half:
  *             F = self.F1 * half
  *         elif F_ < -self.F1 * half:             # <<<<<<<<<<<<<<
@@ -6896,9 +8063,11 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
  *         else:
 */
   __pyx_t_1 = (__pyx_v_F_ < ((-__pyx_v_self->F1) * __pyx_v_half));
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":306
+
+    /* "src/TSSCB/TSSCB.pyx":307
  *             F = self.F1 * half
  *         elif F_ < -self.F1 * half:
  *             F = -self.F1 * half             # <<<<<<<<<<<<<<
@@ -6907,7 +8076,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
 */
     __pyx_v_F = ((-__pyx_v_self->F1) * __pyx_v_half);
 
-    /* "src/TSSCB/TSSCB.pyx":305
+    /* "src/TSSCB/TSSCB.pyx":306
  *         if F_ > self.F1 * half:
  *             F = self.F1 * half
  *         elif F_ < -self.F1 * half:             # <<<<<<<<<<<<<<
@@ -6917,7 +8086,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
     goto __pyx_L4;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":308
+  /* "src/TSSCB/TSSCB.pyx":309
  *             F = -self.F1 * half
  *         else:
  *             F = F_             # <<<<<<<<<<<<<<
@@ -6929,17 +8098,20 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
   }
   __pyx_L4:;
 
-  /* "src/TSSCB/TSSCB.pyx":309
+  /* "src/TSSCB/TSSCB.pyx":310
  *         else:
  *             F = F_
  *         return F             # <<<<<<<<<<<<<<
  * 
  *     cdef double _SCModel(self, double u0, double F0, double du):
 */
-  __pyx_r = __pyx_v_F;
+  {
+
+    __pyx_r = __pyx_v_F;
+  }
   goto __pyx_L0;
 
-  /* "src/TSSCB/TSSCB.pyx":297
+  /* "src/TSSCB/TSSCB.pyx":298
  *             self.Tstress4 = self.Tstress3 - F_hardening
  * 
  *     cdef double _frictionModel(self, double F0, double du, double half=1.0):             # <<<<<<<<<<<<<<
@@ -6949,10 +8121,13 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel(struct __pyx_obj_
 
   /* function exit code */
   __pyx_L0:;
+
+
+
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":311
+/* "src/TSSCB/TSSCB.pyx":312
  *         return F
  * 
  *     cdef double _SCModel(self, double u0, double F0, double du):             # <<<<<<<<<<<<<<
@@ -6969,11 +8144,12 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
   int __pyx_t_1;
   double __pyx_t_2;
   int __pyx_t_3;
+  int __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":314
+  /* "src/TSSCB/TSSCB.pyx":315
  *         #
  *         cdef double u, uy, F_, F
  *         if du == 0.0:             # <<<<<<<<<<<<<<
@@ -6981,19 +8157,24 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
  *         if self.Tfracture:
 */
   __pyx_t_1 = (__pyx_v_du == 0.0);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":315
+
+    /* "src/TSSCB/TSSCB.pyx":316
  *         cdef double u, uy, F_, F
  *         if du == 0.0:
  *             return F0             # <<<<<<<<<<<<<<
  *         if self.Tfracture:
  *             return 0.0
 */
-    __pyx_r = __pyx_v_F0;
+    {
+
+      __pyx_r = __pyx_v_F0;
+    }
     goto __pyx_L0;
 
-    /* "src/TSSCB/TSSCB.pyx":314
+    /* "src/TSSCB/TSSCB.pyx":315
  *         #
  *         cdef double u, uy, F_, F
  *         if du == 0.0:             # <<<<<<<<<<<<<<
@@ -7002,7 +8183,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":316
+  /* "src/TSSCB/TSSCB.pyx":317
  *         if du == 0.0:
  *             return F0
  *         if self.Tfracture:             # <<<<<<<<<<<<<<
@@ -7011,17 +8192,20 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
 */
   if (__pyx_v_self->Tfracture) {
 
-    /* "src/TSSCB/TSSCB.pyx":317
+    /* "src/TSSCB/TSSCB.pyx":318
  *             return F0
  *         if self.Tfracture:
  *             return 0.0             # <<<<<<<<<<<<<<
  *         u = u0 + du
  *         uy = self.F2 / self.k1
 */
-    __pyx_r = 0.0;
+    {
+
+      __pyx_r = 0.0;
+    }
     goto __pyx_L0;
 
-    /* "src/TSSCB/TSSCB.pyx":316
+    /* "src/TSSCB/TSSCB.pyx":317
  *         if du == 0.0:
  *             return F0
  *         if self.Tfracture:             # <<<<<<<<<<<<<<
@@ -7030,7 +8214,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":318
+  /* "src/TSSCB/TSSCB.pyx":319
  *         if self.Tfracture:
  *             return 0.0
  *         u = u0 + du             # <<<<<<<<<<<<<<
@@ -7039,7 +8223,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
 */
   __pyx_v_u = (__pyx_v_u0 + __pyx_v_du);
 
-  /* "src/TSSCB/TSSCB.pyx":319
+  /* "src/TSSCB/TSSCB.pyx":320
  *             return 0.0
  *         u = u0 + du
  *         uy = self.F2 / self.k1             # <<<<<<<<<<<<<<
@@ -7048,11 +8232,11 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
 */
   if (unlikely(__pyx_v_self->k1 == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 319, __pyx_L1_error)
+    __PYX_ERR(0, 320, __pyx_L1_error)
   }
   __pyx_v_uy = (__pyx_v_self->F2 / __pyx_v_self->k1);
 
-  /* "src/TSSCB/TSSCB.pyx":320
+  /* "src/TSSCB/TSSCB.pyx":321
  *         u = u0 + du
  *         uy = self.F2 / self.k1
  *         F_ = F0 + du * self.k1             # <<<<<<<<<<<<<<
@@ -7061,7 +8245,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
 */
   __pyx_v_F_ = (__pyx_v_F0 + (__pyx_v_du * __pyx_v_self->k1));
 
-  /* "src/TSSCB/TSSCB.pyx":321
+  /* "src/TSSCB/TSSCB.pyx":322
  *         uy = self.F2 / self.k1
  *         F_ = F0 + du * self.k1
  *         if du > 0:             # <<<<<<<<<<<<<<
@@ -7069,158 +8253,317 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
  *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
 */
   __pyx_t_1 = (__pyx_v_du > 0.0);
+
   if (__pyx_t_1) {
 
-    /* "src/TSSCB/TSSCB.pyx":322
+
+    /* "src/TSSCB/TSSCB.pyx":323
  *         F_ = F0 + du * self.k1
  *         if du > 0:
  *             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):             # <<<<<<<<<<<<<<
  *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
- *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
+ *                 if MYOPENSEES_STATS:
 */
     __pyx_t_2 = ((-__pyx_v_self->F2) * (1.0 - __pyx_v_self->beta));
+
     if (unlikely(__pyx_v_self->k1 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 322, __pyx_L1_error)
+      __PYX_ERR(0, 323, __pyx_L1_error)
     }
     __pyx_t_3 = (__pyx_v_u < (__pyx_t_2 / __pyx_v_self->k1));
+
+
     if (__pyx_t_3) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_3;
+
       goto __pyx_L7_bool_binop_done;
     }
     if (unlikely(__pyx_v_self->k1 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 322, __pyx_L1_error)
+      __PYX_ERR(0, 323, __pyx_L1_error)
     }
     __pyx_t_3 = (__pyx_v_F_ > ((__pyx_v_self->k2 * __pyx_v_u) - ((__pyx_v_self->F2 * (1.0 - __pyx_v_self->beta)) * (1.0 - (__pyx_v_self->k2 / __pyx_v_self->k1)))));
+
+
     __pyx_t_1 = __pyx_t_3;
+
     __pyx_L7_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":323
+
+      /* "src/TSSCB/TSSCB.pyx":324
  *         if du > 0:
  *             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
  *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)             # <<<<<<<<<<<<<<
- *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
- *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
 */
       if (unlikely(__pyx_v_self->k1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 323, __pyx_L1_error)
+        __PYX_ERR(0, 324, __pyx_L1_error)
       }
       __pyx_v_F = ((__pyx_v_self->k2 * __pyx_v_u) - ((__pyx_v_self->F2 * (1.0 - __pyx_v_self->beta)) * (1.0 - (__pyx_v_self->k2 / __pyx_v_self->k1))));
 
-      /* "src/TSSCB/TSSCB.pyx":322
+      /* "src/TSSCB/TSSCB.pyx":325
+ *             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
+ *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
+ *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
+*/
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
+
+        /* "src/TSSCB/TSSCB.pyx":326
+ *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1             # <<<<<<<<<<<<<<
+ *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
+ *                 F = self.k1 * u
+*/
+
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K2_REVERSE;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
+
+        /* "src/TSSCB/TSSCB.pyx":325
+ *             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
+ *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
+ *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
+*/
+      }
+
+      /* "src/TSSCB/TSSCB.pyx":323
  *         F_ = F0 + du * self.k1
  *         if du > 0:
  *             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):             # <<<<<<<<<<<<<<
  *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
- *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
+ *                 if MYOPENSEES_STATS:
 */
       goto __pyx_L6;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":324
- *             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
- *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+    /* "src/TSSCB/TSSCB.pyx":327
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
  *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:             # <<<<<<<<<<<<<<
  *                 F = self.k1 * u
- *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
+ *                 if MYOPENSEES_STATS:
 */
     __pyx_t_2 = ((-__pyx_v_self->F2) * (1.0 - __pyx_v_self->beta));
+
     if (unlikely(__pyx_v_self->k1 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 324, __pyx_L1_error)
+      __PYX_ERR(0, 327, __pyx_L1_error)
     }
     __pyx_t_3 = ((__pyx_t_2 / __pyx_v_self->k1) <= __pyx_v_u);
     if (__pyx_t_3) {
       __pyx_t_3 = (__pyx_v_u <= __pyx_v_uy);
     }
+
     if (__pyx_t_3) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_3;
-      goto __pyx_L9_bool_binop_done;
+
+      goto __pyx_L10_bool_binop_done;
     }
     __pyx_t_3 = (__pyx_v_F_ > (__pyx_v_self->k1 * __pyx_v_u));
+
+
     __pyx_t_1 = __pyx_t_3;
-    __pyx_L9_bool_binop_done:;
+
+    __pyx_L10_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":325
- *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+
+      /* "src/TSSCB/TSSCB.pyx":328
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
  *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
  *                 F = self.k1 * u             # <<<<<<<<<<<<<<
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1
+*/
+      __pyx_v_F = (__pyx_v_self->k1 * __pyx_v_u);
+
+      /* "src/TSSCB/TSSCB.pyx":329
+ *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
+ *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K1] += 1
+ *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
+*/
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
+
+        /* "src/TSSCB/TSSCB.pyx":330
+ *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1             # <<<<<<<<<<<<<<
  *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
  *                 F = self.k2 * u + self.F2 - self.k2 * uy
 */
-      __pyx_v_F = (__pyx_v_self->k1 * __pyx_v_u);
 
-      /* "src/TSSCB/TSSCB.pyx":324
- *             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
- *                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
- *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:             # <<<<<<<<<<<<<<
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K1;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
+
+        /* "src/TSSCB/TSSCB.pyx":329
+ *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
  *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K1] += 1
  *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
+*/
+      }
+
+      /* "src/TSSCB/TSSCB.pyx":327
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
+ *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:             # <<<<<<<<<<<<<<
+ *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:
 */
       goto __pyx_L6;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":326
- *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
- *                 F = self.k1 * u
+    /* "src/TSSCB/TSSCB.pyx":331
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1
  *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:             # <<<<<<<<<<<<<<
  *                 F = self.k2 * u + self.F2 - self.k2 * uy
- *             else:
+ *                 if MYOPENSEES_STATS:
 */
     __pyx_t_2 = (__pyx_v_self->F2 * (1.0 - __pyx_v_self->beta));
+
     if (unlikely(__pyx_v_self->k1 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 326, __pyx_L1_error)
+      __PYX_ERR(0, 331, __pyx_L1_error)
     }
     __pyx_t_3 = (__pyx_v_u > (__pyx_t_2 / __pyx_v_self->k1));
+
+
     if (__pyx_t_3) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_3;
-      goto __pyx_L11_bool_binop_done;
-    }
+
+      goto __pyx_L13_bool_binop_done;
+    }
     __pyx_t_3 = (__pyx_v_F_ > (((__pyx_v_self->k2 * __pyx_v_u) + __pyx_v_self->F2) - (__pyx_v_self->k2 * __pyx_v_uy)));
+
+
     __pyx_t_1 = __pyx_t_3;
-    __pyx_L11_bool_binop_done:;
+
+    __pyx_L13_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":327
- *                 F = self.k1 * u
+
+      /* "src/TSSCB/TSSCB.pyx":332
+ *                     self.counts[TSSCB_SC_K1] += 1
  *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
  *                 F = self.k2 * u + self.F2 - self.k2 * uy             # <<<<<<<<<<<<<<
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2] += 1
+*/
+      __pyx_v_F = (((__pyx_v_self->k2 * __pyx_v_u) + __pyx_v_self->F2) - (__pyx_v_self->k2 * __pyx_v_uy));
+
+      /* "src/TSSCB/TSSCB.pyx":333
+ *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
+ *                 F = self.k2 * u + self.F2 - self.k2 * uy
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2] += 1
+ *             else:
+*/
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
+
+        /* "src/TSSCB/TSSCB.pyx":334
+ *                 F = self.k2 * u + self.F2 - self.k2 * uy
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2] += 1             # <<<<<<<<<<<<<<
  *             else:
  *                 F = F_
 */
-      __pyx_v_F = (((__pyx_v_self->k2 * __pyx_v_u) + __pyx_v_self->F2) - (__pyx_v_self->k2 * __pyx_v_uy));
 
-      /* "src/TSSCB/TSSCB.pyx":326
- *             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
- *                 F = self.k1 * u
- *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:             # <<<<<<<<<<<<<<
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K2;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
+
+        /* "src/TSSCB/TSSCB.pyx":333
+ *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
  *                 F = self.k2 * u + self.F2 - self.k2 * uy
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2] += 1
  *             else:
+*/
+      }
+
+      /* "src/TSSCB/TSSCB.pyx":331
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1
+ *             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:             # <<<<<<<<<<<<<<
+ *                 F = self.k2 * u + self.F2 - self.k2 * uy
+ *                 if MYOPENSEES_STATS:
 */
       goto __pyx_L6;
     }
 
-    /* "src/TSSCB/TSSCB.pyx":329
- *                 F = self.k2 * u + self.F2 - self.k2 * uy
+    /* "src/TSSCB/TSSCB.pyx":336
+ *                     self.counts[TSSCB_SC_K2] += 1
  *             else:
  *                 F = F_             # <<<<<<<<<<<<<<
- *         else:
- *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
 */
     /*else*/ {
       __pyx_v_F = __pyx_v_F_;
+
+      /* "src/TSSCB/TSSCB.pyx":337
+ *             else:
+ *                 F = F_
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
+ *         else:
+*/
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
+
+        /* "src/TSSCB/TSSCB.pyx":338
+ *                 F = F_
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
+*/
+
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_ELASTIC;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
+
+        /* "src/TSSCB/TSSCB.pyx":337
+ *             else:
+ *                 F = F_
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
+ *         else:
+*/
+      }
     }
     __pyx_L6:;
 
-    /* "src/TSSCB/TSSCB.pyx":321
+    /* "src/TSSCB/TSSCB.pyx":322
  *         uy = self.F2 / self.k1
  *         F_ = F0 + du * self.k1
  *         if du > 0:             # <<<<<<<<<<<<<<
@@ -7230,199 +8573,362 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
     goto __pyx_L5;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":331
- *                 F = F_
+  /* "src/TSSCB/TSSCB.pyx":340
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
  *         else:
  *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):             # <<<<<<<<<<<<<<
  *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
- *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
+ *                 if MYOPENSEES_STATS:
 */
   /*else*/ {
     __pyx_t_2 = (__pyx_v_self->F2 * (1.0 - __pyx_v_self->beta));
+
     if (unlikely(__pyx_v_self->k1 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 331, __pyx_L1_error)
+      __PYX_ERR(0, 340, __pyx_L1_error)
     }
     __pyx_t_3 = (__pyx_v_u > (__pyx_t_2 / __pyx_v_self->k1));
+
+
     if (__pyx_t_3) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_3;
-      goto __pyx_L14_bool_binop_done;
+
+      goto __pyx_L18_bool_binop_done;
     }
     if (unlikely(__pyx_v_self->k1 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 331, __pyx_L1_error)
+      __PYX_ERR(0, 340, __pyx_L1_error)
     }
     __pyx_t_3 = (__pyx_v_F_ < ((__pyx_v_self->k2 * __pyx_v_u) + ((__pyx_v_self->F2 * (1.0 - __pyx_v_self->beta)) * (1.0 - (__pyx_v_self->k2 / __pyx_v_self->k1)))));
+
+
     __pyx_t_1 = __pyx_t_3;
-    __pyx_L14_bool_binop_done:;
+
+    __pyx_L18_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":332
+
+      /* "src/TSSCB/TSSCB.pyx":341
  *         else:
  *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
  *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)             # <<<<<<<<<<<<<<
- *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
- *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
 */
       if (unlikely(__pyx_v_self->k1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 332, __pyx_L1_error)
+        __PYX_ERR(0, 341, __pyx_L1_error)
       }
       __pyx_v_F = ((__pyx_v_self->k2 * __pyx_v_u) + ((__pyx_v_self->F2 * (1.0 - __pyx_v_self->beta)) * (1.0 - (__pyx_v_self->k2 / __pyx_v_self->k1))));
 
-      /* "src/TSSCB/TSSCB.pyx":331
- *                 F = F_
- *         else:
- *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):             # <<<<<<<<<<<<<<
+      /* "src/TSSCB/TSSCB.pyx":342
+ *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
  *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
  *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
 */
-      goto __pyx_L13;
-    }
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
 
-    /* "src/TSSCB/TSSCB.pyx":333
+        /* "src/TSSCB/TSSCB.pyx":343
+ *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1             # <<<<<<<<<<<<<<
+ *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
+ *                 F = self.k1 * u
+*/
+
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K2_REVERSE;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
+
+        /* "src/TSSCB/TSSCB.pyx":342
  *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
  *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
+ *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
+*/
+      }
+
+      /* "src/TSSCB/TSSCB.pyx":340
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
+ *         else:
+ *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):             # <<<<<<<<<<<<<<
+ *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+ *                 if MYOPENSEES_STATS:
+*/
+      goto __pyx_L17;
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":344
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
  *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:             # <<<<<<<<<<<<<<
  *                 F = self.k1 * u
- *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
+ *                 if MYOPENSEES_STATS:
 */
     __pyx_t_3 = ((-__pyx_v_uy) <= __pyx_v_u);
     if (__pyx_t_3) {
       __pyx_t_2 = (__pyx_v_self->F2 * (1.0 - __pyx_v_self->beta));
+
       if (unlikely(__pyx_v_self->k1 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 333, __pyx_L1_error)
+        __PYX_ERR(0, 344, __pyx_L1_error)
       }
       __pyx_t_3 = (__pyx_v_u <= (__pyx_t_2 / __pyx_v_self->k1));
+
     }
     if (__pyx_t_3) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_3;
-      goto __pyx_L16_bool_binop_done;
+
+      goto __pyx_L21_bool_binop_done;
     }
     __pyx_t_3 = (__pyx_v_F_ < (__pyx_v_self->k1 * __pyx_v_u));
+
+
     __pyx_t_1 = __pyx_t_3;
-    __pyx_L16_bool_binop_done:;
+
+    __pyx_L21_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":334
- *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+
+      /* "src/TSSCB/TSSCB.pyx":345
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
  *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
  *                 F = self.k1 * u             # <<<<<<<<<<<<<<
- *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
- *                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1
 */
       __pyx_v_F = (__pyx_v_self->k1 * __pyx_v_u);
 
-      /* "src/TSSCB/TSSCB.pyx":333
- *             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
- *                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
- *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:             # <<<<<<<<<<<<<<
+      /* "src/TSSCB/TSSCB.pyx":346
+ *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
  *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K1] += 1
  *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
 */
-      goto __pyx_L13;
-    }
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
+
+        /* "src/TSSCB/TSSCB.pyx":347
+ *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1             # <<<<<<<<<<<<<<
+ *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
+ *                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+*/
+
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K1;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
 
-    /* "src/TSSCB/TSSCB.pyx":335
+        /* "src/TSSCB/TSSCB.pyx":346
  *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
  *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K1] += 1
+ *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
+*/
+      }
+
+      /* "src/TSSCB/TSSCB.pyx":344
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2_REVERSE] += 1
+ *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:             # <<<<<<<<<<<<<<
+ *                 F = self.k1 * u
+ *                 if MYOPENSEES_STATS:
+*/
+      goto __pyx_L17;
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":348
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1
  *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):             # <<<<<<<<<<<<<<
  *                 F = self.k2 * u - (self.F2 - self.k2 * uy)
- *             else:
+ *                 if MYOPENSEES_STATS:
 */
     __pyx_t_2 = ((-__pyx_v_self->F2) * (1.0 - __pyx_v_self->beta));
+
     if (unlikely(__pyx_v_self->k1 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 335, __pyx_L1_error)
+      __PYX_ERR(0, 348, __pyx_L1_error)
     }
     __pyx_t_3 = (__pyx_v_u < (__pyx_t_2 / __pyx_v_self->k1));
+
+
     if (__pyx_t_3) {
+
     } else {
+
       __pyx_t_1 = __pyx_t_3;
-      goto __pyx_L18_bool_binop_done;
+
+      goto __pyx_L24_bool_binop_done;
     }
     __pyx_t_3 = (__pyx_v_F_ < ((__pyx_v_self->k2 * __pyx_v_u) - (__pyx_v_self->F2 - (__pyx_v_self->k2 * __pyx_v_uy))));
+
+
     __pyx_t_1 = __pyx_t_3;
-    __pyx_L18_bool_binop_done:;
+
+    __pyx_L24_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "src/TSSCB/TSSCB.pyx":336
- *                 F = self.k1 * u
+
+      /* "src/TSSCB/TSSCB.pyx":349
+ *                     self.counts[TSSCB_SC_K1] += 1
  *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
  *                 F = self.k2 * u - (self.F2 - self.k2 * uy)             # <<<<<<<<<<<<<<
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2] += 1
+*/
+      __pyx_v_F = ((__pyx_v_self->k2 * __pyx_v_u) - (__pyx_v_self->F2 - (__pyx_v_self->k2 * __pyx_v_uy)));
+
+      /* "src/TSSCB/TSSCB.pyx":350
+ *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
+ *                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2] += 1
+ *             else:
+*/
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
+
+        /* "src/TSSCB/TSSCB.pyx":351
+ *                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K2] += 1             # <<<<<<<<<<<<<<
  *             else:
  *                 F = F_
 */
-      __pyx_v_F = ((__pyx_v_self->k2 * __pyx_v_u) - (__pyx_v_self->F2 - (__pyx_v_self->k2 * __pyx_v_uy)));
 
-      /* "src/TSSCB/TSSCB.pyx":335
- *             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
- *                 F = self.k1 * u
- *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):             # <<<<<<<<<<<<<<
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_K2;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
+
+        /* "src/TSSCB/TSSCB.pyx":350
+ *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
  *                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_K2] += 1
  *             else:
 */
-      goto __pyx_L13;
-    }
+      }
 
-    /* "src/TSSCB/TSSCB.pyx":338
+      /* "src/TSSCB/TSSCB.pyx":348
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_K1] += 1
+ *             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):             # <<<<<<<<<<<<<<
  *                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+ *                 if MYOPENSEES_STATS:
+*/
+      goto __pyx_L17;
+    }
+
+    /* "src/TSSCB/TSSCB.pyx":353
+ *                     self.counts[TSSCB_SC_K2] += 1
  *             else:
  *                 F = F_             # <<<<<<<<<<<<<<
- *         if self.Tfracturing:
- *             return F * self.Trp
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
 */
     /*else*/ {
       __pyx_v_F = __pyx_v_F_;
+
+      /* "src/TSSCB/TSSCB.pyx":354
+ *             else:
+ *                 F = F_
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
+ *         if self.Tfracturing:
+*/
+      __pyx_t_1 = (MYOPENSEES_STATS != 0);
+
+      if (__pyx_t_1) {
+
+
+        /* "src/TSSCB/TSSCB.pyx":355
+ *                 F = F_
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1             # <<<<<<<<<<<<<<
+ *         if self.Tfracturing:
+ *             return F * self.Trp
+*/
+
+        __pyx_t_4 = __pyx_e_3src_5TSSCB_5TSSCB_TSSCB_SC_ELASTIC;
+        (__pyx_v_self->counts[__pyx_t_4]) = ((__pyx_v_self->counts[__pyx_t_4]) + 1);
+
+        /* "src/TSSCB/TSSCB.pyx":354
+ *             else:
+ *                 F = F_
+ *                 if MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
+ *         if self.Tfracturing:
+*/
+      }
     }
-    __pyx_L13:;
+    __pyx_L17:;
   }
   __pyx_L5:;
 
-  /* "src/TSSCB/TSSCB.pyx":339
- *             else:
- *                 F = F_
+  /* "src/TSSCB/TSSCB.pyx":356
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
  *         if self.Tfracturing:             # <<<<<<<<<<<<<<
  *             return F * self.Trp
  *         else:
 */
   if (__pyx_v_self->Tfracturing) {
 
-    /* "src/TSSCB/TSSCB.pyx":340
- *                 F = F_
+    /* "src/TSSCB/TSSCB.pyx":357
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
  *         if self.Tfracturing:
  *             return F * self.Trp             # <<<<<<<<<<<<<<
  *         else:
  *             return F
 */
-    __pyx_r = (__pyx_v_F * __pyx_v_self->Trp);
+    {
+
+      __pyx_r = (__pyx_v_F * __pyx_v_self->Trp);
+    }
     goto __pyx_L0;
 
-    /* "src/TSSCB/TSSCB.pyx":339
- *             else:
- *                 F = F_
+    /* "src/TSSCB/TSSCB.pyx":356
+ *                 if MYOPENSEES_STATS:
+ *                     self.counts[TSSCB_SC_ELASTIC] += 1
  *         if self.Tfracturing:             # <<<<<<<<<<<<<<
  *             return F * self.Trp
  *         else:
 */
   }
 
-  /* "src/TSSCB/TSSCB.pyx":342
+  /* "src/TSSCB/TSSCB.pyx":359
  *             return F * self.Trp
  *         else:
  *             return F             # <<<<<<<<<<<<<<
  * 
- *     cpdef commitState(self):
+ *     cpdef void commitState(self):
 */
   /*else*/ {
-    __pyx_r = __pyx_v_F;
+    {
+
+      __pyx_r = __pyx_v_F;
+    }
     goto __pyx_L0;
   }
 
-  /* "src/TSSCB/TSSCB.pyx":311
+  /* "src/TSSCB/TSSCB.pyx":312
  *         return F
  * 
  *     cdef double _SCModel(self, double u0, double F0, double du):             # <<<<<<<<<<<<<<
@@ -7435,26 +8941,30 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel(struct __pyx_obj_3src_5
   __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB._SCModel", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+
+
+
+
+
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":344
+/* "src/TSSCB/TSSCB.pyx":361
  *             return F
  * 
- *     cpdef commitState(self):             # <<<<<<<<<<<<<<
+ *     cpdef void commitState(self):             # <<<<<<<<<<<<<<
  *         #
  *         self.Cstrain = self.Tstrain
 */
 
 static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_5commitState(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch) {
-  PyObject *__pyx_r = NULL;
+static void __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch) {
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -7484,10 +8994,9 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_commitState); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 344, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_commitState); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_5commitState)) {
-        __Pyx_XDECREF(__pyx_r);
         __pyx_t_3 = NULL;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_4 = __pyx_t_1; 
@@ -7508,11 +9017,12 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 344, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
-        __pyx_r = __pyx_t_2;
-        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        {
+        }
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
       }
@@ -7529,17 +9039,18 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
     #endif
   }
 
-  /* "src/TSSCB/TSSCB.pyx":346
- *     cpdef commitState(self):
+  /* "src/TSSCB/TSSCB.pyx":363
+ *     cpdef void commitState(self):
  *         #
  *         self.Cstrain = self.Tstrain             # <<<<<<<<<<<<<<
  *         self.Cstress3 = self.Tstress3
  *         self.Ctangent = self.Ttangent
 */
   __pyx_t_6 = __pyx_v_self->Tstrain;
+
   __pyx_v_self->Cstrain = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":347
+  /* "src/TSSCB/TSSCB.pyx":364
  *         #
  *         self.Cstrain = self.Tstrain
  *         self.Cstress3 = self.Tstress3             # <<<<<<<<<<<<<<
@@ -7547,9 +9058,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cstage = self.Tstage
 */
   __pyx_t_6 = __pyx_v_self->Tstress3;
+
   __pyx_v_self->Cstress3 = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":348
+  /* "src/TSSCB/TSSCB.pyx":365
  *         self.Cstrain = self.Tstrain
  *         self.Cstress3 = self.Tstress3
  *         self.Ctangent = self.Ttangent             # <<<<<<<<<<<<<<
@@ -7557,9 +9069,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Chardening = self.Thardening
 */
   __pyx_t_6 = __pyx_v_self->Ttangent;
+
   __pyx_v_self->Ctangent = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":349
+  /* "src/TSSCB/TSSCB.pyx":366
  *         self.Cstress3 = self.Tstress3
  *         self.Ctangent = self.Ttangent
  *         self.Cstage = self.Tstage             # <<<<<<<<<<<<<<
@@ -7567,9 +9080,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cstress1 = self.Tstress1
 */
   __pyx_t_7 = __pyx_v_self->Tstage;
+
   __pyx_v_self->Cstage = __pyx_t_7;
 
-  /* "src/TSSCB/TSSCB.pyx":350
+  /* "src/TSSCB/TSSCB.pyx":367
  *         self.Ctangent = self.Ttangent
  *         self.Cstage = self.Tstage
  *         self.Chardening = self.Thardening             # <<<<<<<<<<<<<<
@@ -7577,9 +9091,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cstress2 = self.Tstress2
 */
   __pyx_t_8 = __pyx_v_self->Thardening;
+
   __pyx_v_self->Chardening = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":351
+  /* "src/TSSCB/TSSCB.pyx":368
  *         self.Cstage = self.Tstage
  *         self.Chardening = self.Thardening
  *         self.Cstress1 = self.Tstress1             # <<<<<<<<<<<<<<
@@ -7587,9 +9102,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cstress4 = self.Tstress4
 */
   __pyx_t_6 = __pyx_v_self->Tstress1;
+
   __pyx_v_self->Cstress1 = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":352
+  /* "src/TSSCB/TSSCB.pyx":369
  *         self.Chardening = self.Thardening
  *         self.Cstress1 = self.Tstress1
  *         self.Cstress2 = self.Tstress2             # <<<<<<<<<<<<<<
@@ -7597,9 +9113,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.CCDD = self.TCDD
 */
   __pyx_t_6 = __pyx_v_self->Tstress2;
+
   __pyx_v_self->Cstress2 = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":353
+  /* "src/TSSCB/TSSCB.pyx":370
  *         self.Cstress1 = self.Tstress1
  *         self.Cstress2 = self.Tstress2
  *         self.Cstress4 = self.Tstress4             # <<<<<<<<<<<<<<
@@ -7607,9 +9124,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cfracture = self.Tfracture
 */
   __pyx_t_6 = __pyx_v_self->Tstress4;
+
   __pyx_v_self->Cstress4 = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":354
+  /* "src/TSSCB/TSSCB.pyx":371
  *         self.Cstress2 = self.Tstress2
  *         self.Cstress4 = self.Tstress4
  *         self.CCDD = self.TCDD             # <<<<<<<<<<<<<<
@@ -7617,9 +9135,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cplate1 = self.Tplate1
 */
   __pyx_t_6 = __pyx_v_self->TCDD;
+
   __pyx_v_self->CCDD = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":355
+  /* "src/TSSCB/TSSCB.pyx":372
  *         self.Cstress4 = self.Tstress4
  *         self.CCDD = self.TCDD
  *         self.Cfracture = self.Tfracture             # <<<<<<<<<<<<<<
@@ -7627,9 +9146,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cplate2 = self.Tplate2
 */
   __pyx_t_8 = __pyx_v_self->Tfracture;
+
   __pyx_v_self->Cfracture = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":356
+  /* "src/TSSCB/TSSCB.pyx":373
  *         self.CCDD = self.TCDD
  *         self.Cfracture = self.Tfracture
  *         self.Cplate1 = self.Tplate1             # <<<<<<<<<<<<<<
@@ -7637,9 +9157,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Cfracturing = self.Tfracturing
 */
   __pyx_t_6 = __pyx_v_self->Tplate1;
+
   __pyx_v_self->Cplate1 = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":357
+  /* "src/TSSCB/TSSCB.pyx":374
  *         self.Cfracture = self.Tfracture
  *         self.Cplate1 = self.Tplate1
  *         self.Cplate2 = self.Tplate2             # <<<<<<<<<<<<<<
@@ -7647,9 +9168,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.CfractureFore = self.TfractureFore
 */
   __pyx_t_6 = __pyx_v_self->Tplate2;
+
   __pyx_v_self->Cplate2 = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":358
+  /* "src/TSSCB/TSSCB.pyx":375
  *         self.Cplate1 = self.Tplate1
  *         self.Cplate2 = self.Tplate2
  *         self.Cfracturing = self.Tfracturing             # <<<<<<<<<<<<<<
@@ -7657,9 +9179,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.Crp = self.Trp
 */
   __pyx_t_8 = __pyx_v_self->Tfracturing;
+
   __pyx_v_self->Cfracturing = __pyx_t_8;
 
-  /* "src/TSSCB/TSSCB.pyx":359
+  /* "src/TSSCB/TSSCB.pyx":376
  *         self.Cplate2 = self.Tplate2
  *         self.Cfracturing = self.Tfracturing
  *         self.CfractureFore = self.TfractureFore             # <<<<<<<<<<<<<<
@@ -7667,9 +9190,10 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  *         self.i += 1
 */
   __pyx_t_6 = __pyx_v_self->TfractureFore;
+
   __pyx_v_self->CfractureFore = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":360
+  /* "src/TSSCB/TSSCB.pyx":377
  *         self.Cfracturing = self.Tfracturing
  *         self.CfractureFore = self.TfractureFore
  *         self.Crp = self.Trp             # <<<<<<<<<<<<<<
@@ -7677,27 +9201,27 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
  * 
 */
   __pyx_t_6 = __pyx_v_self->Trp;
+
   __pyx_v_self->Crp = __pyx_t_6;
 
-  /* "src/TSSCB/TSSCB.pyx":361
+  /* "src/TSSCB/TSSCB.pyx":378
  *         self.CfractureFore = self.TfractureFore
  *         self.Crp = self.Trp
  *         self.i += 1             # <<<<<<<<<<<<<<
  * 
- *     cpdef double getStress(self):
+ *     cpdef double getStrain(self):
 */
   __pyx_v_self->i = (__pyx_v_self->i + 1);
 
-  /* "src/TSSCB/TSSCB.pyx":344
+  /* "src/TSSCB/TSSCB.pyx":361
  *             return F
  * 
- *     cpdef commitState(self):             # <<<<<<<<<<<<<<
+ *     cpdef void commitState(self):             # <<<<<<<<<<<<<<
  *         #
  *         self.Cstrain = self.Tstrain
 */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
@@ -7705,16 +9229,14 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(struct __pyx_obj_
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.commitState", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
+
   __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
 /* Python wrapper */
 static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_5commitState(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
@@ -7722,20 +9244,20 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 ); /*proto*/
 static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_5commitState = {"commitState", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_5commitState, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
 static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_5commitState(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("commitState (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
@@ -7762,10 +9284,17 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_4commitState(struct __pyx_ob
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("commitState", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 361, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_1;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
@@ -7780,22 +9309,22 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_4commitState(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":363
+/* "src/TSSCB/TSSCB.pyx":380
  *         self.i += 1
  * 
- *     cpdef double getStress(self):             # <<<<<<<<<<<<<<
- *         return self.Tstress4
+ *     cpdef double getStrain(self):             # <<<<<<<<<<<<<<
+ *         return self.Tstrain
  * 
 */
 
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStress(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStrain(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch) {
+static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch) {
   double __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -7807,7 +9336,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("getStress", 0);
+  __Pyx_RefNannySetupContext("getStrain", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
@@ -7824,9 +9353,9 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_getStress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_getStrain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 380, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStress)) {
+      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStrain)) {
         __pyx_t_3 = NULL;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_4 = __pyx_t_1; 
@@ -7847,12 +9376,14 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
-        __pyx_t_6 = __Pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 363, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 380, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_r = __pyx_t_6;
+        {
+          __pyx_r = __pyx_t_6;
+        }
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
       }
@@ -7869,21 +9400,24 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_
     #endif
   }
 
-  /* "src/TSSCB/TSSCB.pyx":364
+  /* "src/TSSCB/TSSCB.pyx":381
  * 
- *     cpdef double getStress(self):
- *         return self.Tstress4             # <<<<<<<<<<<<<<
+ *     cpdef double getStrain(self):
+ *         return self.Tstrain             # <<<<<<<<<<<<<<
  * 
- *     cpdef double getTangent(self):
+ *     cpdef double getStress(self):
 */
-  __pyx_r = __pyx_v_self->Tstress4;
+  {
+
+    __pyx_r = __pyx_v_self->Tstrain;
+  }
   goto __pyx_L0;
 
-  /* "src/TSSCB/TSSCB.pyx":363
+  /* "src/TSSCB/TSSCB.pyx":380
  *         self.i += 1
  * 
- *     cpdef double getStress(self):             # <<<<<<<<<<<<<<
- *         return self.Tstress4
+ *     cpdef double getStrain(self):             # <<<<<<<<<<<<<<
+ *         return self.Tstrain
  * 
 */
 
@@ -7893,37 +9427,38 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getStress", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getStrain", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStress(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStrain(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_7getStress = {"getStress", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStress, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStress(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_7getStrain = {"getStrain", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStrain, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_7getStrain(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("getStress (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  __Pyx_RefNannySetupContext("getStrain (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
@@ -7931,18 +9466,18 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("getStress", 1, 0, 0, __pyx_nargs); return NULL; }
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("getStrain", 1, 0, 0, __pyx_nargs); return NULL; }
   const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
   if (unlikely(__pyx_kwds_len < 0)) return NULL;
-  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("getStress", __pyx_kwds); return NULL;}
-  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStress(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("getStrain", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStrain(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStress(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   double __pyx_t_1;
@@ -7950,19 +9485,26 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStress(struct __pyx_obj_
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("getStress", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 363, __pyx_L1_error)
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_RefNannySetupContext("getStrain", 0);
+  __pyx_t_1 = __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStrain(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 380, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
+
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_2;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getStress", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getStrain", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -7970,22 +9512,22 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_6getStress(struct __pyx_obj_
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":366
- *         return self.Tstress4
+/* "src/TSSCB/TSSCB.pyx":383
+ *         return self.Tstrain
  * 
- *     cpdef double getTangent(self):             # <<<<<<<<<<<<<<
- *         return self.Ttangent
+ *     cpdef double getStress(self):             # <<<<<<<<<<<<<<
+ *         return self.Tstress4
  * 
 */
 
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getTangent(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getStress(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch) {
+static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch) {
   double __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -7997,7 +9539,7 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("getTangent", 0);
+  __Pyx_RefNannySetupContext("getStress", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
@@ -8014,9 +9556,9 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_getTangent); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 366, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_getStress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 383, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getTangent)) {
+      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getStress)) {
         __pyx_t_3 = NULL;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_4 = __pyx_t_1; 
@@ -8037,12 +9579,14 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 383, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
-        __pyx_t_6 = __Pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 366, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 383, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_r = __pyx_t_6;
+        {
+          __pyx_r = __pyx_t_6;
+        }
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
       }
@@ -8059,21 +9603,24 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src
     #endif
   }
 
-  /* "src/TSSCB/TSSCB.pyx":367
+  /* "src/TSSCB/TSSCB.pyx":384
  * 
- *     cpdef double getTangent(self):
- *         return self.Ttangent             # <<<<<<<<<<<<<<
+ *     cpdef double getStress(self):
+ *         return self.Tstress4             # <<<<<<<<<<<<<<
  * 
- *     cpdef setStrain(self, double strain):
+ *     cpdef double getTangent(self):
 */
-  __pyx_r = __pyx_v_self->Ttangent;
+  {
+
+    __pyx_r = __pyx_v_self->Tstress4;
+  }
   goto __pyx_L0;
 
-  /* "src/TSSCB/TSSCB.pyx":366
- *         return self.Tstress4
+  /* "src/TSSCB/TSSCB.pyx":383
+ *         return self.Tstrain
  * 
- *     cpdef double getTangent(self):             # <<<<<<<<<<<<<<
- *         return self.Ttangent
+ *     cpdef double getStress(self):             # <<<<<<<<<<<<<<
+ *         return self.Tstress4
  * 
 */
 
@@ -8083,37 +9630,38 @@ static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getTangent", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getStress", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getTangent(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getStress(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_9getTangent = {"getTangent", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getTangent, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getTangent(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_9getStress = {"getStress", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getStress, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_9getStress(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("getTangent (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  __Pyx_RefNannySetupContext("getStress (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
@@ -8121,18 +9669,18 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("getTangent", 1, 0, 0, __pyx_nargs); return NULL; }
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("getStress", 1, 0, 0, __pyx_nargs); return NULL; }
   const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
   if (unlikely(__pyx_kwds_len < 0)) return NULL;
-  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("getTangent", __pyx_kwds); return NULL;}
-  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getTangent(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("getStress", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getStress(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getTangent(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getStress(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   double __pyx_t_1;
@@ -8140,19 +9688,26 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getTangent(struct __pyx_obj
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("getTangent", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 366, __pyx_L1_error)
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_RefNannySetupContext("getStress", 0);
+  __pyx_t_1 = __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 383, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 383, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
+
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_2;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getTangent", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getStress", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8160,34 +9715,34 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_8getTangent(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":369
+/* "src/TSSCB/TSSCB.pyx":386
+ *         return self.Tstress4
+ * 
+ *     cpdef double getTangent(self):             # <<<<<<<<<<<<<<
  *         return self.Ttangent
  * 
- *     cpdef setStrain(self, double strain):             # <<<<<<<<<<<<<<
- *         self.setTrialStrain(strain)
- *         self.commitState()
 */
 
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11setStrain(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11getTangent(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain, int __pyx_skip_dispatch) {
-  PyObject *__pyx_r = NULL;
+static double __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, int __pyx_skip_dispatch) {
+  double __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
+  size_t __pyx_t_5;
+  double __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("setStrain", 0);
+  __Pyx_RefNannySetupContext("getTangent", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
@@ -8204,16 +9759,13 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setStrain(struct __pyx_obj_3s
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_setStrain); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 369, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_getTangent); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 386, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11setStrain)) {
-        __Pyx_XDECREF(__pyx_r);
+      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11getTangent)) {
         __pyx_t_3 = NULL;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_4 = __pyx_t_1; 
-        __pyx_t_5 = PyFloat_FromDouble(__pyx_v_strain); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 369, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_6 = 1;
+        __pyx_t_5 = 1;
         #if CYTHON_UNPACK_METHODS
         if (unlikely(PyMethod_Check(__pyx_t_4))) {
           __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
@@ -8222,20 +9774,22 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setStrain(struct __pyx_obj_3s
           __Pyx_INCREF(__pyx_t_3);
           __Pyx_INCREF(__pyx__function);
           __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-          __pyx_t_6 = 0;
+          __pyx_t_5 = 0;
         }
         #endif
         {
-          PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_5};
-          __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+          PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
+          __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
-        __pyx_r = __pyx_t_2;
-        __pyx_t_2 = 0;
+        __pyx_t_6 = __Pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 386, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        {
+          __pyx_r = __pyx_t_6;
+        }
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
       }
@@ -8252,79 +9806,65 @@ static PyObject *__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setStrain(struct __pyx_obj_3s
     #endif
   }
 
-  /* "src/TSSCB/TSSCB.pyx":370
+  /* "src/TSSCB/TSSCB.pyx":387
+ * 
+ *     cpdef double getTangent(self):
+ *         return self.Ttangent             # <<<<<<<<<<<<<<
  * 
- *     cpdef setStrain(self, double strain):
- *         self.setTrialStrain(strain)             # <<<<<<<<<<<<<<
- *         self.commitState()
+ *     def getCounters(self) -> dict:
 */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->setTrialStrain(__pyx_v_self, __pyx_v_strain, 0, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 370, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  {
 
-  /* "src/TSSCB/TSSCB.pyx":371
- *     cpdef setStrain(self, double strain):
- *         self.setTrialStrain(strain)
- *         self.commitState()             # <<<<<<<<<<<<<<
-*/
-  __pyx_t_1 = ((struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self->__pyx_vtab)->commitState(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 371, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_v_self->Ttangent;
+  }
+  goto __pyx_L0;
 
-  /* "src/TSSCB/TSSCB.pyx":369
+  /* "src/TSSCB/TSSCB.pyx":386
+ *         return self.Tstress4
+ * 
+ *     cpdef double getTangent(self):             # <<<<<<<<<<<<<<
  *         return self.Ttangent
  * 
- *     cpdef setStrain(self, double strain):             # <<<<<<<<<<<<<<
- *         self.setTrialStrain(strain)
- *         self.commitState()
 */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.setStrain", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getTangent", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
+
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11setStrain(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11getTangent(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_11setStrain = {"setStrain", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11setStrain, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11setStrain(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_11getTangent = {"getTangent", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11getTangent, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_11getTangent(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  double __pyx_v_strain;
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("setStrain (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  __Pyx_RefNannySetupContext("getTangent (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
@@ -8332,74 +9872,45 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_strain,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 369, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 369, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "setStrain", 0) < (0)) __PYX_ERR(0, 369, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("setStrain", 1, 1, 1, i); __PYX_ERR(0, 369, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 369, __pyx_L3_error)
-    }
-    __pyx_v_strain = __Pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_strain == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 369, __pyx_L3_error)
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("setStrain", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 369, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.setStrain", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_10setStrain(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self), __pyx_v_strain);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("getTangent", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("getTangent", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_10getTangent(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
 
   /* function exit code */
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_10setStrain(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, double __pyx_v_strain) {
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_10getTangent(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  double __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("setStrain", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setStrain(__pyx_v_self, __pyx_v_strain, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 369, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __Pyx_RefNannySetupContext("getTangent", 0);
+  __pyx_t_1 = __pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 386, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = __pyx_t_2;
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.setStrain", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getTangent", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8407,119 +9918,273 @@ static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_10setStrain(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "src/TSSCB/TSSCB.pyx":7
+/* "src/TSSCB/TSSCB.pyx":389
+ *         return self.Ttangent
  * 
- * cdef class TSSCB:
- *     cdef public int tag             # <<<<<<<<<<<<<<
- *     #  double
- *     cdef double F1, k0, ugap, F2, k1, k2, beta
+ *     def getCounters(self) -> dict:             # <<<<<<<<<<<<<<
+ *         if not MYOPENSEES_STATS:
+ *             return {}
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3tag_1__get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3tag_1__get__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13getCounters(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_13getCounters = {"getCounters", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13getCounters, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13getCounters(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
-  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_3tag___get__(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("getCounters (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("getCounters", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("getCounters", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_12getCounters(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_3tag___get__(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_12getCounters(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
+  PyObject *__pyx_7genexpr__pyx_v_i = NULL;
+  PyObject *__pyx_7genexpr__pyx_v_name = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  Py_ssize_t __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->tag); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_RefNannySetupContext("getCounters", 0);
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.tag.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3tag_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
-static int __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3tag_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
-  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_3tag_2__set__(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+  /* "src/TSSCB/TSSCB.pyx":390
+ * 
+ *     def getCounters(self) -> dict:
+ *         if not MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *             return {}
+ *         return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+*/
+  __pyx_t_1 = (!(MYOPENSEES_STATS != 0));
 
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  if (__pyx_t_1) {
 
-static int __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_3tag_2__set__(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, PyObject *__pyx_v_value) {
-  int __pyx_r;
-  int __pyx_t_1;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 7, __pyx_L1_error)
-  __pyx_v_self->tag = __pyx_t_1;
 
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.tag.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+    /* "src/TSSCB/TSSCB.pyx":391
+ *     def getCounters(self) -> dict:
+ *         if not MYOPENSEES_STATS:
+ *             return {}             # <<<<<<<<<<<<<<
+ *         return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+ * 
+*/
+    __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 391, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    {
+      PyObject *__pyx_temp;
+      {
+        __pyx_temp = __pyx_r;
+        __pyx_r = ((PyObject*)__pyx_t_2);
+      }
+      __Pyx_XDECREF(__pyx_temp);
+    }
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "src/TSSCB/TSSCB.pyx":390
+ * 
+ *     def getCounters(self) -> dict:
+ *         if not MYOPENSEES_STATS:             # <<<<<<<<<<<<<<
+ *             return {}
+ *         return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+*/
+  }
+
+  /* "src/TSSCB/TSSCB.pyx":392
+ *         if not MYOPENSEES_STATS:
+ *             return {}
+ *         return {name: self.counts[i] for i, name in enumerate(COUNTERS)}             # <<<<<<<<<<<<<<
+ * 
+ *     def resetCounters(self):
+*/
+  { /* enter inner scope */
+    __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L6_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
+    __pyx_t_3 = __pyx_mstate_global->__pyx_int_0;
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_COUNTERS); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L6_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
+      __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5);
+      __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+    } else {
+      __pyx_t_6 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 392, __pyx_L6_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_7 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 392, __pyx_L6_error)
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_7)) {
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+            #if !CYTHON_ASSUME_SAFE_SIZE
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 392, __pyx_L6_error)
+            #endif
+            if (__pyx_t_6 >= __pyx_temp) break;
+          }
+          __pyx_t_4 = __Pyx_PyList_GET_ITEM_REF(__pyx_t_5, __pyx_t_6, __Pyx_ReferenceSharing_OwnStrongReference);
+          ++__pyx_t_6;
+        } else {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_5);
+            #if !CYTHON_ASSUME_SAFE_SIZE
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 392, __pyx_L6_error)
+            #endif
+            if (__pyx_t_6 >= __pyx_temp) break;
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_4 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_6));
+          #else
+          __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_6);
+          #endif
+          ++__pyx_t_6;
+        }
+        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L6_error)
+      } else {
+        __pyx_t_4 = __pyx_t_7(__pyx_t_5);
+        if (unlikely(!__pyx_t_4)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 392, __pyx_L6_error)
+            PyErr_Clear();
+          }
+          break;
+        }
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_name, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_i, __pyx_t_3);
+      __pyx_t_4 = __Pyx_PyLong_AddObjC(__pyx_t_3, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L6_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3);
+      __pyx_t_3 = __pyx_t_4;
+      __pyx_t_4 = 0;
+      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_7genexpr__pyx_v_i); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 392, __pyx_L6_error)
+      __pyx_t_4 = __Pyx_PyLong_From_PY_LONG_LONG((__pyx_v_self->counts[__pyx_t_8])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L6_error)
+      __Pyx_GOTREF(__pyx_t_4);
+
+      if (unlikely(PyDict_SetItem(__pyx_t_2, __pyx_7genexpr__pyx_v_name, __pyx_t_4))) __PYX_ERR(0, 392, __pyx_L6_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_i); __pyx_7genexpr__pyx_v_i = 0;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_name); __pyx_7genexpr__pyx_v_name = 0;
+    goto __pyx_L10_exit_scope;
+    __pyx_L6_error:;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_i); __pyx_7genexpr__pyx_v_i = 0;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_name); __pyx_7genexpr__pyx_v_name = 0;
+    goto __pyx_L1_error;
+    __pyx_L10_exit_scope:;
+  } /* exit inner scope */
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = ((PyObject*)__pyx_t_2);
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "src/TSSCB/TSSCB.pyx":389
+ *         return self.Ttangent
+ * 
+ *     def getCounters(self) -> dict:             # <<<<<<<<<<<<<<
+ *         if not MYOPENSEES_STATS:
+ *             return {}
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getCounters", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_i);
+  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_name);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
+/* "src/TSSCB/TSSCB.pyx":394
+ *         return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+ * 
+ *     def resetCounters(self):             # <<<<<<<<<<<<<<
+ *         memset(self.counts, 0, sizeof(self.counts))
+ * 
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13__reduce_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15resetCounters(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_13__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13__reduce_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_15resetCounters = {"resetCounters", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15resetCounters, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15resetCounters(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  #if !CYTHON_METH_FASTCALL
+  #if !CYTHON_VECTORCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  __Pyx_RefNannySetupContext("resetCounters (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
@@ -8527,74 +10192,307 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL; }
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("resetCounters", 1, 0, 0, __pyx_nargs); return NULL; }
   const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
   if (unlikely(__pyx_kwds_len < 0)) return NULL;
-  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
-  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_12__reduce_cython__(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("resetCounters", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_14resetCounters(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_14resetCounters(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("resetCounters", 0);
+
+  /* "src/TSSCB/TSSCB.pyx":395
+ * 
+ *     def resetCounters(self):
+ *         memset(self.counts, 0, sizeof(self.counts))             # <<<<<<<<<<<<<<
+ * 
+ *     def getState(self) -> tuple:
+*/
+  (void)(memset(__pyx_v_self->counts, 0, (sizeof(__pyx_v_self->counts))));
+
+  /* "src/TSSCB/TSSCB.pyx":394
+ *         return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+ * 
+ *     def resetCounters(self):             # <<<<<<<<<<<<<<
+ *         memset(self.counts, 0, sizeof(self.counts))
+ * 
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "src/TSSCB/TSSCB.pyx":397
+ *         memset(self.counts, 0, sizeof(self.counts))
+ * 
+ *     def getState(self) -> tuple:             # <<<<<<<<<<<<<<
+ *         return (
+ *             self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_17getState(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_17getState = {"getState", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_17getState, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_17getState(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("getState (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("getState", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("getState", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_16getState(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_16getState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+  __Pyx_RefNannySetupContext("getState", 0);
 
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+  /* "src/TSSCB/TSSCB.pyx":399
+ *     def getState(self) -> tuple:
+ *         return (
+ *             self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,             # <<<<<<<<<<<<<<
+ *             self.Cstress1, self.Cstress2, self.Cstress3, self.Cstress4,
+ *             self.CCDD, self.Cfracture, self.Cfracturing,
 */
-  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
-  __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->Cstage); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->Cstrain); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_self->Ctangent); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyBool_FromLong(__pyx_v_self->Chardening); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "src/TSSCB/TSSCB.pyx":400
+ *         return (
+ *             self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,
+ *             self.Cstress1, self.Cstress2, self.Cstress3, self.Cstress4,             # <<<<<<<<<<<<<<
+ *             self.CCDD, self.Cfracture, self.Cfracturing,
+ *             self.Cplate1, self.Cplate2, self.CfractureFore, self.Crp,
+*/
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_self->Cstress1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_self->Cstress2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_self->Cstress3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_self->Cstress4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+
+  /* "src/TSSCB/TSSCB.pyx":401
+ *             self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,
+ *             self.Cstress1, self.Cstress2, self.Cstress3, self.Cstress4,
+ *             self.CCDD, self.Cfracture, self.Cfracturing,             # <<<<<<<<<<<<<<
+ *             self.Cplate1, self.Cplate2, self.CfractureFore, self.Crp,
+ *         )
+*/
+  __pyx_t_9 = PyFloat_FromDouble(__pyx_v_self->CCDD); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = __Pyx_PyBool_FromLong(__pyx_v_self->Cfracture); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = __Pyx_PyBool_FromLong(__pyx_v_self->Cfracturing); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+
+  /* "src/TSSCB/TSSCB.pyx":402
+ *             self.Cstress1, self.Cstress2, self.Cstress3, self.Cstress4,
+ *             self.CCDD, self.Cfracture, self.Cfracturing,
+ *             self.Cplate1, self.Cplate2, self.CfractureFore, self.Crp,             # <<<<<<<<<<<<<<
+ *         )
+ * 
+*/
+  __pyx_t_12 = PyFloat_FromDouble(__pyx_v_self->Cplate1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 402, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = PyFloat_FromDouble(__pyx_v_self->Cplate2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 402, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = PyFloat_FromDouble(__pyx_v_self->CfractureFore); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 402, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_15 = PyFloat_FromDouble(__pyx_v_self->Crp); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 402, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+
+  /* "src/TSSCB/TSSCB.pyx":399
+ *     def getState(self) -> tuple:
+ *         return (
+ *             self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,             # <<<<<<<<<<<<<<
+ *             self.Cstress1, self.Cstress2, self.Cstress3, self.Cstress4,
+ *             self.CCDD, self.Cfracture, self.Cfracturing,
+*/
+  __pyx_t_16 = PyTuple_New(15); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_16);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_t_1) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 1, __pyx_t_2) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_3);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 2, __pyx_t_3) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_4);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 3, __pyx_t_4) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_5);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 4, __pyx_t_5) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_6);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 5, __pyx_t_6) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_7);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 6, __pyx_t_7) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_8);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 7, __pyx_t_8) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_9);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 8, __pyx_t_9) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_10);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 9, __pyx_t_10) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_11);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 10, __pyx_t_11) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_12);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 11, __pyx_t_12) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_13);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 12, __pyx_t_13) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_14);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 13, __pyx_t_14) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_15);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 14, __pyx_t_15) != (0)) __PYX_ERR(0, 399, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  __pyx_t_9 = 0;
+  __pyx_t_10 = 0;
+  __pyx_t_11 = 0;
+  __pyx_t_12 = 0;
+  __pyx_t_13 = 0;
+  __pyx_t_14 = 0;
+  __pyx_t_15 = 0;
+  {
+    PyObject *__pyx_temp;
+    {
+      __pyx_temp = __pyx_r;
+      __pyx_r = ((PyObject*)__pyx_t_16);
+    }
+    __Pyx_XDECREF(__pyx_temp);
+  }
+  __pyx_t_16 = 0;
+  goto __pyx_L0;
 
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
+  /* "src/TSSCB/TSSCB.pyx":397
+ *         memset(self.counts, 0, sizeof(self.counts))
+ * 
+ *     def getState(self) -> tuple:             # <<<<<<<<<<<<<<
+ *         return (
+ *             self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.getState", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+/* "src/TSSCB/TSSCB.pyx":405
+ *         )
+ * 
+ *     def setState(self, tuple state):             # <<<<<<<<<<<<<<
+ *         self.Cstage = self.Tstage = state[0]
+ *         self.Cstrain = self.Tstrain = state[1]
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15__setstate_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_19setState(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_15__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15__setstate_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_19setState = {"setState", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_19setState, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_19setState(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
-  #if !CYTHON_METH_FASTCALL
+  PyObject *__pyx_v_state = 0;
+  #if !CYTHON_VECTORCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
@@ -8604,8 +10502,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  __Pyx_RefNannySetupContext("setState (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
@@ -8614,153 +10512,600 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_state,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 3, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(0, 405, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 405, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__setstate_cython__", 0) < (0)) __PYX_ERR(1, 3, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "setState", 0) < (0)) __PYX_ERR(0, 405, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, i); __PYX_ERR(1, 3, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("setState", 1, 1, 1, i); __PYX_ERR(0, 405, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 405, __pyx_L3_error)
     }
-    __pyx_v___pyx_state = values[0];
+    __pyx_v_state = ((PyObject*)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 3, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("setState", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 405, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.setState", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_14__setstate_cython__(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self), __pyx_v___pyx_state);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_state), (&PyTuple_Type), 1, "state", 1))) __PYX_ERR(0, 405, __pyx_L1_error)
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_18setState(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self), __pyx_v_state);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
+  __pyx_L7_cleaned_up:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_18setState(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, PyObject *__pyx_v_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  double __pyx_t_2;
+  int __pyx_t_3;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+  __Pyx_RefNannySetupContext("setState", 0);
 
-  /* "(tree fragment)":4
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+  /* "src/TSSCB/TSSCB.pyx":406
+ * 
+ *     def setState(self, tuple state):
+ *         self.Cstage = self.Tstage = state[0]             # <<<<<<<<<<<<<<
+ *         self.Cstrain = self.Tstrain = state[1]
+ *         self.Ctangent = self.Ttangent = state[2]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 406, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyLong_As_int(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 0)); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L1_error)
+  __pyx_v_self->Cstage = __pyx_t_1;
+  __pyx_v_self->Tstage = __pyx_t_1;
+
+
+  /* "src/TSSCB/TSSCB.pyx":407
+ *     def setState(self, tuple state):
+ *         self.Cstage = self.Tstage = state[0]
+ *         self.Cstrain = self.Tstrain = state[1]             # <<<<<<<<<<<<<<
+ *         self.Ctangent = self.Ttangent = state[2]
+ *         self.Chardening = self.Thardening = state[3]
 */
-  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
-  __PYX_ERR(1, 4, __pyx_L1_error)
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 407, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 1)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 407, __pyx_L1_error)
+  __pyx_v_self->Cstrain = __pyx_t_2;
+  __pyx_v_self->Tstrain = __pyx_t_2;
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+
+  /* "src/TSSCB/TSSCB.pyx":408
+ *         self.Cstage = self.Tstage = state[0]
+ *         self.Cstrain = self.Tstrain = state[1]
+ *         self.Ctangent = self.Ttangent = state[2]             # <<<<<<<<<<<<<<
+ *         self.Chardening = self.Thardening = state[3]
+ *         self.Cstress1 = self.Tstress1 = state[4]
 */
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 408, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 2)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 408, __pyx_L1_error)
+  __pyx_v_self->Ctangent = __pyx_t_2;
+  __pyx_v_self->Ttangent = __pyx_t_2;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-/* #### Code section: module_exttypes ### */
-static struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB;
 
-static PyObject *__pyx_tp_new_3src_5TSSCB_5TSSCB_TSSCB(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *p;
-  PyObject *o;
-  o = __Pyx_AllocateExtensionType(t, 0);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)o);
-  p->__pyx_vtab = __pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB;
-  if (unlikely(__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
+  /* "src/TSSCB/TSSCB.pyx":409
+ *         self.Cstrain = self.Tstrain = state[1]
+ *         self.Ctangent = self.Ttangent = state[2]
+ *         self.Chardening = self.Thardening = state[3]             # <<<<<<<<<<<<<<
+ *         self.Cstress1 = self.Tstress1 = state[4]
+ *         self.Cstress2 = self.Tstress2 = state[5]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 409, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 3)); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 409, __pyx_L1_error)
+  __pyx_v_self->Chardening = __pyx_t_3;
+  __pyx_v_self->Thardening = __pyx_t_3;
 
-static void __pyx_tp_dealloc_3src_5TSSCB_5TSSCB_TSSCB(PyObject *o) {
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
-    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_3src_5TSSCB_5TSSCB_TSSCB) {
-      if (PyObject_CallFinalizerFromDealloc(o)) return;
-    }
+
+  /* "src/TSSCB/TSSCB.pyx":410
+ *         self.Ctangent = self.Ttangent = state[2]
+ *         self.Chardening = self.Thardening = state[3]
+ *         self.Cstress1 = self.Tstress1 = state[4]             # <<<<<<<<<<<<<<
+ *         self.Cstress2 = self.Tstress2 = state[5]
+ *         self.Cstress3 = self.Tstress3 = state[6]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 410, __pyx_L1_error)
   }
-  #endif
-  PyTypeObject *tp = Py_TYPE(o);
-  #if CYTHON_USE_TYPE_SLOTS
-  (*tp->tp_free)(o);
-  #else
-  {
-    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
-    if (tp_free) tp_free(o);
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 4)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 410, __pyx_L1_error)
+  __pyx_v_self->Cstress1 = __pyx_t_2;
+  __pyx_v_self->Tstress1 = __pyx_t_2;
+
+
+  /* "src/TSSCB/TSSCB.pyx":411
+ *         self.Chardening = self.Thardening = state[3]
+ *         self.Cstress1 = self.Tstress1 = state[4]
+ *         self.Cstress2 = self.Tstress2 = state[5]             # <<<<<<<<<<<<<<
+ *         self.Cstress3 = self.Tstress3 = state[6]
+ *         self.Cstress4 = self.Tstress4 = state[7]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 411, __pyx_L1_error)
   }
-  #endif
-  #if CYTHON_USE_TYPE_SPECS
-  Py_DECREF(tp);
-  #endif
-}
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 5)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 411, __pyx_L1_error)
+  __pyx_v_self->Cstress2 = __pyx_t_2;
+  __pyx_v_self->Tstress2 = __pyx_t_2;
 
-static PyObject *__pyx_getprop_3src_5TSSCB_5TSSCB_5TSSCB_tag(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3tag_1__get__(o);
-}
 
-static int __pyx_setprop_3src_5TSSCB_5TSSCB_5TSSCB_tag(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_3tag_3__set__(o, v);
+  /* "src/TSSCB/TSSCB.pyx":412
+ *         self.Cstress1 = self.Tstress1 = state[4]
+ *         self.Cstress2 = self.Tstress2 = state[5]
+ *         self.Cstress3 = self.Tstress3 = state[6]             # <<<<<<<<<<<<<<
+ *         self.Cstress4 = self.Tstress4 = state[7]
+ *         self.CCDD = self.TCDD = state[8]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 412, __pyx_L1_error)
   }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 6)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 412, __pyx_L1_error)
+  __pyx_v_self->Cstress3 = __pyx_t_2;
+  __pyx_v_self->Tstress3 = __pyx_t_2;
+
+
+  /* "src/TSSCB/TSSCB.pyx":413
+ *         self.Cstress2 = self.Tstress2 = state[5]
+ *         self.Cstress3 = self.Tstress3 = state[6]
+ *         self.Cstress4 = self.Tstress4 = state[7]             # <<<<<<<<<<<<<<
+ *         self.CCDD = self.TCDD = state[8]
+ *         self.Cfracture = self.Tfracture = state[9]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 413, __pyx_L1_error)
   }
-}
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 7)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 413, __pyx_L1_error)
+  __pyx_v_self->Cstress4 = __pyx_t_2;
+  __pyx_v_self->Tstress4 = __pyx_t_2;
 
-static PyMethodDef __pyx_methods_3src_5TSSCB_5TSSCB_TSSCB[] = {
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {0, 0, 0, 0}
-};
 
-static struct PyGetSetDef __pyx_getsets_3src_5TSSCB_5TSSCB_TSSCB[] = {
-  {"tag", __pyx_getprop_3src_5TSSCB_5TSSCB_5TSSCB_tag, __pyx_setprop_3src_5TSSCB_5TSSCB_5TSSCB_tag, 0, 0},
-  {0, 0, 0, 0, 0}
-};
+  /* "src/TSSCB/TSSCB.pyx":414
+ *         self.Cstress3 = self.Tstress3 = state[6]
+ *         self.Cstress4 = self.Tstress4 = state[7]
+ *         self.CCDD = self.TCDD = state[8]             # <<<<<<<<<<<<<<
+ *         self.Cfracture = self.Tfracture = state[9]
+ *         self.Cfracturing = self.Tfracturing = state[10]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 414, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 8)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 414, __pyx_L1_error)
+  __pyx_v_self->CCDD = __pyx_t_2;
+  __pyx_v_self->TCDD = __pyx_t_2;
+
+
+  /* "src/TSSCB/TSSCB.pyx":415
+ *         self.Cstress4 = self.Tstress4 = state[7]
+ *         self.CCDD = self.TCDD = state[8]
+ *         self.Cfracture = self.Tfracture = state[9]             # <<<<<<<<<<<<<<
+ *         self.Cfracturing = self.Tfracturing = state[10]
+ *         self.Cplate1 = self.Tplate1 = state[11]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 415, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 9)); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 415, __pyx_L1_error)
+  __pyx_v_self->Cfracture = __pyx_t_3;
+  __pyx_v_self->Tfracture = __pyx_t_3;
+
+
+  /* "src/TSSCB/TSSCB.pyx":416
+ *         self.CCDD = self.TCDD = state[8]
+ *         self.Cfracture = self.Tfracture = state[9]
+ *         self.Cfracturing = self.Tfracturing = state[10]             # <<<<<<<<<<<<<<
+ *         self.Cplate1 = self.Tplate1 = state[11]
+ *         self.Cplate2 = self.Tplate2 = state[12]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 416, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 10)); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 416, __pyx_L1_error)
+  __pyx_v_self->Cfracturing = __pyx_t_3;
+  __pyx_v_self->Tfracturing = __pyx_t_3;
+
+
+  /* "src/TSSCB/TSSCB.pyx":417
+ *         self.Cfracture = self.Tfracture = state[9]
+ *         self.Cfracturing = self.Tfracturing = state[10]
+ *         self.Cplate1 = self.Tplate1 = state[11]             # <<<<<<<<<<<<<<
+ *         self.Cplate2 = self.Tplate2 = state[12]
+ *         self.CfractureFore = self.TfractureFore = state[13]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 417, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 11)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 417, __pyx_L1_error)
+  __pyx_v_self->Cplate1 = __pyx_t_2;
+  __pyx_v_self->Tplate1 = __pyx_t_2;
+
+
+  /* "src/TSSCB/TSSCB.pyx":418
+ *         self.Cfracturing = self.Tfracturing = state[10]
+ *         self.Cplate1 = self.Tplate1 = state[11]
+ *         self.Cplate2 = self.Tplate2 = state[12]             # <<<<<<<<<<<<<<
+ *         self.CfractureFore = self.TfractureFore = state[13]
+ *         self.Crp = self.Trp = state[14]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 418, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 12)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 418, __pyx_L1_error)
+  __pyx_v_self->Cplate2 = __pyx_t_2;
+  __pyx_v_self->Tplate2 = __pyx_t_2;
+
+
+  /* "src/TSSCB/TSSCB.pyx":419
+ *         self.Cplate1 = self.Tplate1 = state[11]
+ *         self.Cplate2 = self.Tplate2 = state[12]
+ *         self.CfractureFore = self.TfractureFore = state[13]             # <<<<<<<<<<<<<<
+ *         self.Crp = self.Trp = state[14]
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 419, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 13)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 419, __pyx_L1_error)
+  __pyx_v_self->CfractureFore = __pyx_t_2;
+  __pyx_v_self->TfractureFore = __pyx_t_2;
+
+
+  /* "src/TSSCB/TSSCB.pyx":420
+ *         self.Cplate2 = self.Tplate2 = state[12]
+ *         self.CfractureFore = self.TfractureFore = state[13]
+ *         self.Crp = self.Trp = state[14]             # <<<<<<<<<<<<<<
+*/
+  if (unlikely(__pyx_v_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "\047NoneType\047 object is not subscriptable");
+    __PYX_ERR(0, 420, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyFloat_AsDouble(__Pyx_PyTuple_GET_ITEM(__pyx_v_state, 14)); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 420, __pyx_L1_error)
+  __pyx_v_self->Crp = __pyx_t_2;
+  __pyx_v_self->Trp = __pyx_t_2;
+
+
+  /* "src/TSSCB/TSSCB.pyx":405
+ *         )
+ * 
+ *     def setState(self, tuple state):             # <<<<<<<<<<<<<<
+ *         self.Cstage = self.Tstage = state[0]
+ *         self.Cstrain = self.Tstrain = state[1]
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.setState", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_21__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_21__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_21__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_21__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_20__reduce_cython__(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_23__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_23__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_23__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_23__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_VECTORCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_VECTORCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_VECTORCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len < 0)) __PYX_ERR(1, 3, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__setstate_cython__", 0) < (0)) __PYX_ERR(1, 3, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, i); __PYX_ERR(1, 3, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_22__setstate_cython__(((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3src_5TSSCB_5TSSCB_5TSSCB_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("src.TSSCB.TSSCB.TSSCB.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+/* #### Code section: module_exttypes ### */
+static struct __pyx_vtabstruct_3src_5TSSCB_5TSSCB_TSSCB __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB;
+
+static PyObject *__pyx_tp_new__initialisation_3src_5TSSCB_5TSSCB_TSSCB(PyObject *o, PyObject *a, PyObject *k) {
+  struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *p = ((struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_3src_17CUniaxialMaterial_CUniaxialMaterial*)__pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB;
+  {
+    int cinit_result = __pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_1__cinit__(o, a, k);
+    if (unlikely(cinit_result)) goto bad;
+  }
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static PyObject *__pyx_tp_new_3src_5TSSCB_5TSSCB_TSSCB(PyTypeObject *t, PyObject *a, PyObject *k) {
+  PyObject *o;
+  newfunc base_tp_new = __Pyx_PyType_TryGetSlot(__pyx_mstate_global->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial, tp_new, newfunc);
+  #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_VEX < 0x030A0000
+  if (unlikely(!base_tp_new)) {
+    __Pyx_RaiseTypeErrorWithTypes("Type " __Pyx_FMT_TYPENAME " cannot be instantiated because it cannot access tp_new of its base " __Pyx_FMT_TYPENAME ". This is probably because the base is not a heap type and is a restriction of the Limited API in Python<=3.9", t, __pyx_mstate_global->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial);
+    o = NULL;
+  } else
+  #endif
+  o = base_tp_new(t, a, k);
+  if (unlikely(!o)) return 0;
+  return __pyx_tp_new__initialisation_3src_5TSSCB_5TSSCB_TSSCB(o, a, k);
+}
+
+static void __pyx_tp_dealloc_3src_5TSSCB_5TSSCB_TSSCB(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_3src_5TSSCB_5TSSCB_TSSCB) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  PyObject *tp = (PyObject*)Py_TYPE(o);
+  #endif
+  #if !CYTHON_USE_MODULE_STATE
+  if (likely(__pyx_mstate_global->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial)) __Pyx_PyType_GetSlot(__pyx_mstate_global->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial, tp_dealloc, destructor)(o); else
+  #endif
+  __Pyx_call_next_tp_dealloc(o, __pyx_tp_dealloc_3src_5TSSCB_5TSSCB_TSSCB);
+  #if CYTHON_USE_TYPE_SPECS
+  if (!__Pyx_PyType_HasFeature(__pyx_mstate_global->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial, Py_TPFLAGS_HEAPTYPE)) {
+    Py_DECREF(tp);
+  }
+  #endif
+}
+
+static PyMethodDef __pyx_methods_3src_5TSSCB_5TSSCB_TSSCB[] = {
+  {"getCounters", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_13getCounters, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"resetCounters", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_15resetCounters, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"getState", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_17getState, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"setState", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_19setState, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_21__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_3src_5TSSCB_5TSSCB_5TSSCB_23__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {0, 0, 0, 0}
+};
 #if CYTHON_USE_TYPE_SPECS
 static PyType_Slot __pyx_type_3src_5TSSCB_5TSSCB_TSSCB_slots[] = {
   {Py_tp_dealloc, (void *)__pyx_tp_dealloc_3src_5TSSCB_5TSSCB_TSSCB},
   {Py_tp_methods, (void *)__pyx_methods_3src_5TSSCB_5TSSCB_TSSCB},
-  {Py_tp_getset, (void *)__pyx_getsets_3src_5TSSCB_5TSSCB_TSSCB},
   {Py_tp_new, (void *)__pyx_tp_new_3src_5TSSCB_5TSSCB_TSSCB},
   {0, 0},
 };
@@ -8768,7 +11113,7 @@ static PyType_Spec __pyx_type_3src_5TSSCB_5TSSCB_TSSCB_spec = {
   "src.TSSCB.TSSCB.TSSCB",
   sizeof(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB),
   0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE,
   __pyx_type_3src_5TSSCB_5TSSCB_TSSCB_slots,
 };
 #else
@@ -8793,7 +11138,7 @@ static PyTypeObject __pyx_type_3src_5TSSCB_5TSSCB_TSSCB = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_BASETYPE, /*tp_flags*/
   0, /*tp_doc*/
   0, /*tp_traverse*/
   0, /*tp_clear*/
@@ -8803,7 +11148,7 @@ static PyTypeObject __pyx_type_3src_5TSSCB_5TSSCB_TSSCB = {
   0, /*tp_iternext*/
   __pyx_methods_3src_5TSSCB_5TSSCB_TSSCB, /*tp_methods*/
   0, /*tp_members*/
-  __pyx_getsets_3src_5TSSCB_5TSSCB_TSSCB, /*tp_getset*/
+  0, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -8828,8 +11173,12 @@ static PyTypeObject __pyx_type_3src_5TSSCB_5TSSCB_TSSCB = {
   #else
   NULL, /*tp_finalize*/
   #endif
-  #if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800
+  #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800) && (!CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #if CYTHON_VECTORCALL_TPNEW
   0, /*tp_vectorcall*/
+  #else
+  NULL, /*tp_vectorcall*/
+  #endif
   #endif
   #if __PYX_NEED_TP_PRINT_SLOT == 1
   0, /*tp_print*/
@@ -8840,7 +11189,7 @@ static PyTypeObject __pyx_type_3src_5TSSCB_5TSSCB_TSSCB = {
   #if PY_VERSION_HEX >= 0x030d00A4
   0, /*tp_versions_used*/
   #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x030a0000
   0, /*tp_pypy_flags*/
   #endif
 };
@@ -8853,73 +11202,80 @@ static PyMethodDef __pyx_methods[] = {
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
 static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitAfterSharedUtility(void); /*proto*/
 static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Exttype___pyx_obj_3src_5TSSCB_5TSSCB_TSSCB(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
 static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
 /* #### Code section: init_module ### */
 
-static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
+static int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Global_init_code", 0);
   /*--- Global init code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate) {
+static int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_export_code", 0);
   /*--- Variable export code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
+static int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_export_code", 0);
   /*--- Function export code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
+static int __Pyx_modinit_Exttype___pyx_obj_3src_5TSSCB_5TSSCB_TSSCB(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
-  /*--- Type init code ---*/
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Exttype___pyx_obj_3src_5TSSCB_5TSSCB_TSSCB", 0);
+  /*--- Exttype __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB ---*/
   __pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB = &__pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB;
+  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.__pyx_base = *__pyx_vtabptr_3src_17CUniaxialMaterial_CUniaxialMaterial;
+  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.__pyx_base.setTrialStrain = (void (*)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_17CUniaxialMaterial_17CUniaxialMaterial_setTrialStrain *__pyx_optional_args))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain;
+  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.__pyx_base.commitState = (void (*)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState;
+  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.__pyx_base.getStrain = (double (*)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStrain;
+  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.__pyx_base.getStress = (double (*)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress;
+  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.__pyx_base.getTangent = (double (*)(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial *, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent;
   __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB._check_paras = (void (*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__check_paras;
   __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB._init_paras = (void (*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__init_paras;
-  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.setTrialStrain = (PyObject *(*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain *__pyx_optional_args))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setTrialStrain;
   __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB._determineTrialState = (void (*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__determineTrialState;
   __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB._frictionModel = (double (*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, double, struct __pyx_opt_args_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel *__pyx_optional_args))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__frictionModel;
   __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB._SCModel = (double (*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, double, double))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB__SCModel;
-  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.commitState = (PyObject *(*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_commitState;
-  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.getStress = (double (*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getStress;
-  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.getTangent = (double (*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_getTangent;
-  __pyx_vtable_3src_5TSSCB_5TSSCB_TSSCB.setStrain = (PyObject *(*)(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB *, double, int __pyx_skip_dispatch))__pyx_f_3src_5TSSCB_5TSSCB_5TSSCB_setStrain;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_3src_5TSSCB_5TSSCB_TSSCB_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB)) __PYX_ERR(0, 6, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_3src_5TSSCB_5TSSCB_TSSCB_spec, __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_mstate_global->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_3src_5TSSCB_5TSSCB_TSSCB_spec, __pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(!__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB)) __PYX_ERR(0, 14, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB = &__pyx_type_3src_5TSSCB_5TSSCB_TSSCB;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
+  __pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB->tp_base = __pyx_mstate_global->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial;
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB);
@@ -8929,39 +11285,42 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 6, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 6, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_TSSCB, (PyObject *) __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 6, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_vtabptr_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_TSSCB, (PyObject *) __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
+  #if CYTHON_USE_TYPE_SLOTS
+  if (__pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB->tp_weaklistoffset == 0) __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB->tp_weaklistoffset = offsetof(struct __pyx_obj_3src_5TSSCB_5TSSCB_TSSCB, __pyx_base.__weakref__);
+  #endif
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_RefNannyFinishContext();
   return -1;
 }
 
-static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
+static int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Type_import_code", 0);
   /*--- Type import code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate) {
+static int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_import_code", 0);
   /*--- Variable import code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate) {
+static int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_import_code", 0);
   /*--- Function import code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -9036,12 +11395,15 @@ __Pyx_PyMODINIT_FUNC PyInit_TSSCB(void)
   return PyModuleDef_Init(&__pyx_moduledef);
 }
 /* ModuleCreationPEP489 */
-#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
-      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
 static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
     {
         PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
         if (!module) {
+            if (!PyErr_ExceptionMatches(PyExc_Exception)) {
+                goto bad; // BaseException
+            }
             PyErr_Clear(); // just try the 3.8-3.12 version
             module = PyImport_ImportModule("_xxsubinterpreters");
             if (!module) goto bad;
@@ -9071,8 +11433,8 @@ static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
     PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
 #elif CYTHON_COMPILING_IN_GRAAL
     PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
-#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
-      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
     PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
 #elif CYTHON_COMPILING_IN_LIMITED_API
     PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
@@ -9147,6 +11509,7 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_TSSCB(PyObject *__pyx_pyinit_modul
   __pyx_mstatetype *__pyx_mstate = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -9178,7 +11541,7 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_TSSCB(PyObject *__pyx_pyinit_modul
   __pyx_m = __pyx_t_1;
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_NOT_USED);
   #endif
   __pyx_mstate = __pyx_mstate_global;
   CYTHON_UNUSED_VAR(__pyx_t_1);
@@ -9191,8 +11554,10 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_TSSCB(PyObject *__pyx_pyinit_modul
   #if CYTHON_REFNANNY
   __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
   if (!__Pyx_RefNanny) {
-    PyErr_Clear();
-    __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    if (PyErr_ExceptionMatches(PyExc_Exception)) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    }
     if (!__Pyx_RefNanny)
         Py_FatalError("failed to import 'refnanny' module");
   }
@@ -9224,89 +11589,183 @@ __Pyx_RefNannySetupContext("PyInit_TSSCB", 0);
   if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Global type/function init code ---*/
-  (void)__Pyx_modinit_global_init_code(__pyx_mstate);
-  (void)__Pyx_modinit_variable_export_code(__pyx_mstate);
-  (void)__Pyx_modinit_function_export_code(__pyx_mstate);
-  if (unlikely((__Pyx_modinit_type_init_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-  (void)__Pyx_modinit_type_import_code(__pyx_mstate);
-  (void)__Pyx_modinit_variable_import_code(__pyx_mstate);
-  (void)__Pyx_modinit_function_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_export_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_export_code(__pyx_mstate);
+  /*--- Type init code ---*/
+  __pyx_t_2 = PyImport_ImportModule("src.CUniaxialMaterial"); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_mstate->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial = __Pyx_ImportType_3_3_0(__pyx_t_2, "src.CUniaxialMaterial", "CUniaxialMaterial",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial), __PYX_GET_STRUCT_ALIGNMENT_3_3_0(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial), __PYX_GET_STRUCT_ALIGNMENT_3_3_0(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial),
+  #else
+  sizeof(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial), __PYX_GET_STRUCT_ALIGNMENT_3_3_0(struct __pyx_obj_3src_17CUniaxialMaterial_CUniaxialMaterial),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_3_0); if (!__pyx_mstate->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_3src_17CUniaxialMaterial_CUniaxialMaterial, (void**)&__pyx_vtabptr_3src_17CUniaxialMaterial_CUniaxialMaterial) != 1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_Exttype___pyx_obj_3src_5TSSCB_5TSSCB_TSSCB(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  (void)__Pyx_modinit_Type_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_import_code(__pyx_mstate);
+  if (__Pyx_InitAfterSharedUtility() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Execution code ---*/
 
-  /* "src/TSSCB/TSSCB.pyx":95
+  /* "src/TSSCB/TSSCB.pyx":9
+ * # TSSCB.pxd(TSSCB_STAGE_11 ~ TSSCB_SC_ELASTIC)
+ * COUNTERS = (
+ *     'stage_1_1', 'stage_1_2', 'stage_2_2', 'stage_2_1', 'fractured', 'fracturing',             # <<<<<<<<<<<<<<
+ *     'sc_k2_reverse', 'sc_k1', 'sc_k2', 'sc_elastic',
+ * )
+*/
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_COUNTERS, __pyx_mstate_global->__pyx_tuple[0]) < (0)) __PYX_ERR(0, 8, __pyx_L1_error)
+
+  /* "src/TSSCB/TSSCB.pyx":84
  *         self.i = 0
  * 
- *     cpdef setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
  *         cdef double dStrain
  *         #
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_setTrialStrain, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_3setTrialStrain, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_setTrialStrain, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_setTrialStrain, __pyx_t_2) < (0)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[1]);
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_setTrialStrain, __pyx_t_2) < (0)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":344
+  /* "src/TSSCB/TSSCB.pyx":361
  *             return F
  * 
- *     cpdef commitState(self):             # <<<<<<<<<<<<<<
+ *     cpdef void commitState(self):             # <<<<<<<<<<<<<<
  *         #
  *         self.Cstrain = self.Tstrain
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_5commitState, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_commitState, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_5commitState, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_commitState, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_commitState, __pyx_t_2) < (0)) __PYX_ERR(0, 344, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_commitState, __pyx_t_2) < (0)) __PYX_ERR(0, 361, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":363
+  /* "src/TSSCB/TSSCB.pyx":380
  *         self.i += 1
  * 
+ *     cpdef double getStrain(self):             # <<<<<<<<<<<<<<
+ *         return self.Tstrain
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_7getStrain, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_getStrain, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_getStrain, __pyx_t_2) < (0)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "src/TSSCB/TSSCB.pyx":383
+ *         return self.Tstrain
+ * 
  *     cpdef double getStress(self):             # <<<<<<<<<<<<<<
  *         return self.Tstress4
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_7getStress, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_getStress, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_9getStress, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_getStress, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 383, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_getStress, __pyx_t_2) < (0)) __PYX_ERR(0, 363, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_getStress, __pyx_t_2) < (0)) __PYX_ERR(0, 383, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":366
+  /* "src/TSSCB/TSSCB.pyx":386
  *         return self.Tstress4
  * 
  *     cpdef double getTangent(self):             # <<<<<<<<<<<<<<
  *         return self.Ttangent
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_9getTangent, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_getTangent, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_11getTangent, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_getTangent, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_getTangent, __pyx_t_2) < (0)) __PYX_ERR(0, 366, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_getTangent, __pyx_t_2) < (0)) __PYX_ERR(0, 386, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "src/TSSCB/TSSCB.pyx":369
+  /* "src/TSSCB/TSSCB.pyx":389
  *         return self.Ttangent
  * 
- *     cpdef setStrain(self, double strain):             # <<<<<<<<<<<<<<
- *         self.setTrialStrain(strain)
- *         self.commitState()
+ *     def getCounters(self) -> dict:             # <<<<<<<<<<<<<<
+ *         if not MYOPENSEES_STATS:
+ *             return {}
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_n_u_dict) < (0)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_13getCounters, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_getCounters, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_3, __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_getCounters, __pyx_t_3) < (0)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "src/TSSCB/TSSCB.pyx":394
+ *         return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+ * 
+ *     def resetCounters(self):             # <<<<<<<<<<<<<<
+ *         memset(self.counts, 0, sizeof(self.counts))
+ * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_11setStrain, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_setStrain, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_15resetCounters, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_resetCounters, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_resetCounters, __pyx_t_3) < (0)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "src/TSSCB/TSSCB.pyx":397
+ *         memset(self.counts, 0, sizeof(self.counts))
+ * 
+ *     def getState(self) -> tuple:             # <<<<<<<<<<<<<<
+ *         return (
+ *             self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,
+*/
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_n_u_tuple) < (0)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_17getState, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_getState, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 397, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_setStrain, __pyx_t_2) < (0)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_2, __pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_getState, __pyx_t_2) < (0)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "src/TSSCB/TSSCB.pyx":405
+ *         )
+ * 
+ *     def setState(self, tuple state):             # <<<<<<<<<<<<<<
+ *         self.Cstage = self.Tstage = state[0]
+ *         self.Cstrain = self.Tstrain = state[1]
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_19setState, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB_setState, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[8])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_3src_5TSSCB_5TSSCB_TSSCB, __pyx_mstate_global->__pyx_n_u_setState, __pyx_t_2) < (0)) __PYX_ERR(0, 405, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "(tree fragment)":1
@@ -9314,7 +11773,7 @@ __Pyx_RefNannySetupContext("PyInit_TSSCB", 0);
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_13__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_21__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[9])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -9328,7 +11787,7 @@ __Pyx_RefNannySetupContext("PyInit_TSSCB", 0);
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_15__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_3src_5TSSCB_5TSSCB_5TSSCB_23__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_TSSCB___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_src_TSSCB_TSSCB, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[10])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -9337,7 +11796,7 @@ __Pyx_RefNannySetupContext("PyInit_TSSCB", 0);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "src/TSSCB/TSSCB.pyx":1
- * # cython: language_level=3, boundscheck=False, wraparound=False             # <<<<<<<<<<<<<<
+ * # cython: language_level=3, boundscheck=False, wraparound=False, freethreading_compatible=True             # <<<<<<<<<<<<<<
  * from libc.math cimport fabs
  * from libc.float cimport DBL_EPSILON
 */
@@ -9351,6 +11810,7 @@ __Pyx_RefNannySetupContext("PyInit_TSSCB", 0);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   if (__pyx_m) {
     if (__pyx_mstate->__pyx_d && stringtab_initialized) {
       __Pyx_AddTraceback("init src.TSSCB.TSSCB", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -9361,9 +11821,9 @@ __Pyx_RefNannySetupContext("PyInit_TSSCB", 0);
     Py_DECREF(__pyx_m);
     if (pystate_addmodule_run) {
       PyObject *tp, *value, *tb;
-      PyErr_Fetch(&tp, &value, &tb);
-      PyState_RemoveModule(&__pyx_moduledef);
-      PyErr_Restore(tp, value, tb);
+      __Pyx_PyErr_FetchException(&tp, &value, &tb);
+      __Pyx_State_RemoveModule(&__pyx_moduledef);
+      __Pyx_PyErr_RestoreException(tp, value, tb);
     }
     #endif
   } else if (!PyErr_Occurred()) {
@@ -9381,7 +11841,11 @@ __Pyx_RefNannySetupContext("PyInit_TSSCB", 0);
 /* #### Code section: cached_builtins ### */
 
 static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   CYTHON_UNUSED_VAR(__pyx_mstate);
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 392, __pyx_L1_error)
 
   /* Cached unbound methods */
   __pyx_mstate->__pyx_umethod_PyDict_Type_items.type = (PyObject*)&PyDict_Type;
@@ -9391,38 +11855,64 @@ static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   __pyx_mstate->__pyx_umethod_PyDict_Type_values.type = (PyObject*)&PyDict_Type;
   __pyx_mstate->__pyx_umethod_PyDict_Type_values.method_name = &__pyx_mstate->__pyx_n_u_values;
   return 0;
+  __pyx_L1_error:;
+  return -1;
 }
 /* #### Code section: cached_constants ### */
 
 static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   CYTHON_UNUSED_VAR(__pyx_mstate);
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "src/TSSCB/TSSCB.pyx":95
+  /* "src/TSSCB/TSSCB.pyx":9
+ * # TSSCB.pxd(TSSCB_STAGE_11 ~ TSSCB_SC_ELASTIC)
+ * COUNTERS = (
+ *     'stage_1_1', 'stage_1_2', 'stage_2_2', 'stage_2_1', 'fractured', 'fracturing',             # <<<<<<<<<<<<<<
+ *     'sc_k2_reverse', 'sc_k1', 'sc_k2', 'sc_elastic',
+ * )
+*/
+  {
+    PyObject* __pyx_temp[10] = {__pyx_mstate_global->__pyx_n_u_stage_1_1, __pyx_mstate_global->__pyx_n_u_stage_1_2, __pyx_mstate_global->__pyx_n_u_stage_2_2, __pyx_mstate_global->__pyx_n_u_stage_2_1, __pyx_mstate_global->__pyx_n_u_fractured, __pyx_mstate_global->__pyx_n_u_fracturing, __pyx_mstate_global->__pyx_n_u_sc_k2_reverse, __pyx_mstate_global->__pyx_n_u_sc_k1, __pyx_mstate_global->__pyx_n_u_sc_k2, __pyx_mstate_global->__pyx_n_u_sc_elastic};
+    __pyx_mstate_global->__pyx_tuple[0] = __Pyx_PyTuple_FromArray(__pyx_temp, 10); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+
+  /* "src/TSSCB/TSSCB.pyx":84
  *         self.i = 0
  * 
- *     cpdef setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
+ *     cpdef void setTrialStrain(self, double strain, double strainRate=0):             # <<<<<<<<<<<<<<
  *         cdef double dStrain
  *         #
 */
-  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_float_0_0); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+  {
+    PyObject* __pyx_temp[1] = {__pyx_mstate_global->__pyx_float_0_0};
+    __pyx_mstate_global->__pyx_tuple[1] = __Pyx_PyTuple_FromArray(__pyx_temp, 1); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
   #if CYTHON_IMMORTAL_CONSTANTS
   {
     PyObject **table = __pyx_mstate->__pyx_tuple;
-    for (Py_ssize_t i=0; i<1; ++i) {
-      #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    for (Py_ssize_t i=0; i<2; ++i) {
+      #if PY_VERSION_HEX >= 0x030F0000
+      PyUnstable_SetImmortal(table[i]);
+      #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
       #if PY_VERSION_HEX < 0x030E0000
       if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
       #else
       if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
       #endif
       {
-        Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
+        Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
       }
       #else
+      if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
       Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
       #endif
     }
@@ -9437,44 +11927,46 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 /* #### Code section: init_constants ### */
 
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 9; } index[] = {{1},{36},{33},{9},{11},{46},{7},{6},{2},{10},{43},{9},{7},{37},{50},{19},{14},{3},{30},{2},{2},{20},{5},{23},{25},{17},{15},{16},{15},{20},{18},{4},{18},{11},{11},{10},{8},{9},{10},{12},{9},{13},{5},{2},{2},{2},{8},{6},{10},{8},{3},{11},{14},{12},{2},{2},{2},{10},{17},{13},{4},{9},{14},{12},{10},{12},{19},{15},{6},{10},{3},{8},{2},{4},{2},{3},{2},{6},{11},{10},{145},{18},{9},{456},{9},{7},{3}};
-    #if (CYTHON_COMPRESS_STRINGS) == 3 && __PYX_LIMITED_VERSION_HEX >= 0x030e0000 /* compression: zstd (822 bytes) */
-const char* const cstring = "(\265/\375`D\005e\031\000v&\204: \221\333\000\234\002H\007\300&\001\341\026\241\3721\2030U\000B\275\354n7\t\233\366\273\205m\322\207\300C\255\347X{q{4\346T\211\311\270\216\353q\340\030M\373\237\260\035\001m\000l\000w\000\241\236us\363\277n\233\253\370\177\352o\323\256r3\274)\027\005\257\005C\\\266)\357\332[9LW\241\315\273\265~*\232-wk\313z\263\263\241\324\254\252\311};\\\345\371\251*\276P\236\355n\270\205P\363\342\243z\246\331qC\253m\276\024\353Y5\325\371\243\226\256\224L00\250\211\303nf\\u\005)\246\342\344\354G[\367$$,\rV\006\253\266\237\355\377\377vw\367\317\332\250\252n\177\355\177\033\325U\225\353\265z\2078\264\333}e\212\272\226f}\253w)*\347\212\253\007\243-\010\206\233\256\371\377\206+\375\332\272\372\242]\225\345\365fG\\/\227\177\021\211F\"\356O\211;\004R7\274\303\214u\366p\275D\214\214\r\347\177m\257\335>j[\026\353\320\r\357\014\234\202\\ \230!\024\000\010\324lfD84\032\251a\t\033\215\024\003\"IFrD\226(t\024\207\350\320\214|\304[N\374\303W6|\2044\241\\\202\263\2008G\242\2208\207\253\3104\256\311\024X\207`F\212\311u\213[\334\277\332\"\365v\267s\325\377\036\325/\031c\303\371\273\317U7\260\010k\370\243{TQ\335\022C\021\244\367\377\277~\233\013\237\202\377\"\226\026\342\016\235H\013\230\001G\266\211\2412%\231\207\030\252\024\225\016\010\234>R\255k\236\002\352\034/q\216\031\251w\372\250\037t\211\036\320_\n\034\223.\332O}\302C\343\351\314N\345\247\254h\240\031\371\300\310M|\203d\270X)\306Q\202J\256\227\372.\031{\302\354\324\021x\303gcD2xd\033\031\250\263\220\037\217L\213\351\322Tr\312\221\036\321\r:\007\244\247\263\300\013\310\0216\202\035,\004\200\202\250Q\241Q\212\031\232\td\246I\22610\204(\247\214u2\202\230l\020\207L\304$\205\312\376\261o\232\312\317\336[Zg\237]\224\026r\301\264g\027\n!\255EL\034I0\254^y%\360!d2\210\270\344\277\032\373\313\273o7\t\024\277\311\\c\304\031~\304A\034p\361\030\321\215-4\317\320\350\n\275^\345\010\252,\266\346'\336:V\201\017 s\372\377\2005H08\376$V\234\362\357WH\205a\235\001k\224\020<n\211\260\216\n\272\307\211\350;\017\200RlNR4*Mj\253""\251M\321\026\254\372\360\225\366\344MNu\245|`R\367\215\376\032\264\223\346^\350L\303L\243\355D\300<\300\250\010|\357\306\247\037\2754\020\246\336\026\355M\256#\261<$\025\261A \203M\265l\247\"\367+\225\007\006\333{\322\235\303\267m\266\204}\"G.\243B\304G\010\2200z\206oI\250\214\240\344(P\031\304Z\345\364CC\332\331~\241\323\363\006E'}Oj\251\001";
-    PyObject *data = __Pyx_DecompressString(cstring, 822, 3);
-    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
-    const char* const bytes = __Pyx_PyBytes_AsString(data);
-    #if !CYTHON_ASSUME_SAFE_MACROS
-    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    const struct { const unsigned int length: 8; } str_length_index[] = {{15},{9},{11},{10},{7},{3},{1},{36},{33},{179},{46},{30},{43},{37},{8},{7},{6},{2},{9},{50},{19},{8},{2},{2},{5},{23},{25},{17},{17},{14},{15},{15},{16},{19},{14},{20},{20},{12},{8},{12},{8},{10},{8},{11},{14},{12},{10},{17},{13},{12},{12},{19},{8},{11},{13},{3},{18},{4},{18},{11},{10},{4},{9},{9},{10},{11},{8},{9},{9},{10},{9},{1},{5},{2},{2},{2},{6},{4},{3},{2},{2},{2},{13},{6},{10},{5},{5},{13},{4},{8},{14},{10},{15},{9},{9},{9},{9},{5},{6},{10},{3},{5},{2},{4},{2},{2},{6}};
+    const struct { const unsigned int length: 9; } bytes_length_index[] = {{11},{10},{7},{3},{9},{229},{19},{9},{145},{73},{44},{456}};
+    #ifndef CYTHON_COMPRESS_STRINGS
+      #define CYTHON_COMPRESS_STRINGS 90
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (928 bytes) */
-const char* const cstring = "BZh91AY&SYxhg~\000\000\231\377\377\365\376\374Zv\257\3747\375\377\374\000\377\357\377`@@@@@@@@@\000@@@\000@\000P\003^P\350\001X`\224\212\021\246\215\030O\020\236\241\352\r\006\231\006A\240\003@h\365\000\364\200\311\206(p\320\000\r\006\203@`\200\032\032i\220\r\r\032d\000\304\r\000\rOD\324\364\250dh\000\032\000\000\000\006\200\000\000\000\000\001\303@\0004\032\r\001\202\000hi\246@44i\220\003\0204\000%4\202L\023&\247\244\304\324=&\02214\364\200\3104=@h\036\2404\r=G\352\233'\252G\235\216\237:?\337F\323\257\256C\020\226\350I\203ra\205_]\3223A\311\3152H\252@\315\021a8\031\310\240z\030\2411DZ\311M\032Y\246\315Bp\201nF\320#\301#n\345?\253\257\003\301n\205\337\220x\"\306X+\010jd\322\\*E\212\030\215Kw>[\035\177Vy\241\227o\246\037M\037`o!\237oB\327\230\305&1N\375\250\004\347=\n8\344\001\333 \344\256\273\006\364w23\035\342\224\216\206\032\003\335\257\316\303|\022-\335pd.\362\346\"\216\216G\002\002f4\243\215\020C\217\222\261V\252\344\312\303t\260\316\325\211\274\266Vh\343\372\347S\357z\224\310!\264k\313\353\032]\207\002\317\272\302\014A\235R\273t$\314\353D\207\345\236\3234\242\251<\324_MV`\024\002\311\006\"\020\221r\3771\235)+\273\302\300\213\3064\323R\342\377\242\016u \352\r\306\345CGX\253\262\346%P\033z\370\013X\345\326\334\"X\347\014}!u\346U\274\304t\305\315]\3775ji\021\322\341\304\016J\334\3661\\X\217\257\312a\207{\262\030W\257\023\212\n\361<V\224\205\004\222\272,\352W\260\270<#\317VM\217\213\315\204XH\266\212\210d$\t\262\301\362\250\243\177\253@Z\325\r\242\353h\230\332\346\021\242\004\rSU=!\022\210pq\"\340\2400\301\272n+\r\203e\n\324i-\014\213N,LyQ\2779\213\014\271\302\247\376<\025\330\030\261\244)\201\025\021[[\016\030\301gYM\204iqi\035\220\223\234\370\3125\363N\r@\310+\021\001\220\312\315\020\212\211\264\226\210\333y\030w\002\003l\340r\001\243I}\311\256\274l\331\242v`c\315\306r.FM\\\373\035\375\014\326+\313`\304\332\302F\256\350\345D-\301\352\320=/\233\177K\304,\2438KW\014\312\233\330\276\213\311#'7\367\275\263\301\2018\007 QF\215\006\300!!\224`HJ`\003\024\236\227\000Z""\006\240\317 \n\240~:C\204ml\033\017\016\356\350\331\254\355r\366\302[\304m&\224\346\325\225\347#\203\023\247\021R\226-\027*\031\215\2118$EQ$\217j\313\216\370\330@\362R [\364Do\244\346\366\324\013\317\",\276U;\303\373\001&\243\350,R\220\203\220P\203\253\024\211_\336\367a\260X!\230\203\nF\324\270\214\272\014(G\312\343E\3278\257\216\256|\362\3471\022\224Z\305\035\221\251\332\245\302y@\244\322\231\276`dd\264\315I\245\021\371x*\344fYns\016c\310}phN\255Oq\302\010Af$\022\020\"\364L+\304b\350\250\252PF(\361\n]\302\006B\352\025\"K\377\213\271\"\234(H<43\277\000";
-    PyObject *data = __Pyx_DecompressString(cstring, 928, 2);
+    #if (CYTHON_COMPRESS_STRINGS) == 1 /* compression: zlib (1186 bytes) */
+static const char cstring[] = "x\332\275TKo\0337\020\256\013%\361Cn\374:\004)\002P\255\r7m\344v\025\037\352&Ea\313v\342&q,[\275\024(hj\227\222\031\257\270\322\222\353X\350\2419\352\270\307=\362\310\243\216:\346\047\350\250\243\177B\177B\207\273\332\265\224\030H{\251\000\221\234o\036\234\371f\270\337H\237RT\367I\243I\271|\370\010U\205$\r\372s\321\366x\2355\252\235\026-\236\021\337\241\234\361F\261\311x\223\\\026\203\326/\007\374\202\270\314A-\342\223&\225\324\027\250\356\371\250zrR\336yE@f\304Mm \242\244H\372\204\013&\231\307\177B\345\344\222C\317\340gD\242rG\236y\0341\201\034\352\262\032\365\301\303\355\200\247\317l\010f\2148:\332;*n\376\270\211\010w\220O\337P[\n$\202\232\355\022!\250@^\035\325\002\346J\306\221\204\264\305\006:\250\243\216\027 N\251\203\244\007\271\212\t\007yF9\022T\232\003Z\047\234{\220(\344\207\301\035\252]G\016\363\341\022vA\215\367>q\005\3358\305\327\304\234\"q\346\005\256\203j\024\235\026\307qVG\rp\343\2478hMZ\0319\323f\304N\332\214\301\231i\302\374\244]\212\245F\304q0\324@\035&H\315\245\000\300\332\260\231HN\016\367\200\335:\t\\\2110\366\251\023\330\024c\344\004qy\334\343E`\373\002\372\006Z\233q&1\026\276\375}\334\322d\335hu.\313\257\177;\254\356\035\237\354[\373\245\030L4Y@;\356$\306)\014\374\306\375\377@a{\315&\223\047F\223\000\r*\313^\300\315$e\300\244\372\004&\210\361q\221\212k\333*\341\r\230\340D\006\315\207\341\304D8\220\252fD\223\230\030\037u.\341\277\013\303\206\017\351\245<\246u\214G\003\001\034a\\\017\270m\366FZ\r\374\232\261\047\354\236\023\2701\302\341)\230\035h\302#3s\274\220\206~\243h\007\304M\215\322\006|\304\\\006\320K#@\252Y`1v\375G\304b,\251\200\246\215M(f\002$\337\013\340QP\230E\":\334f\336F\206\211\032\225\304v\215\026\212\0012lZ#\366\371Xw\256\2039\346)\362\240\031?N\370b\3302\200DG\007\230\326\261\016\246\275\313\272\226\365\353\272S\331\2243&iS\234\377pn\235\227\222\2216\345\266\274\226o\371%\377\361D/}\nwqac\noX2\033N\347\226YJ\361\002\314]\200\025x\270\365\264\341\223\255\006i\364\006`\2667\222a\210\327\370\213\204-l\245\207Rr(\245H)F\014\305q\234x=""\006\031\2242h\2714\250\007\r\322\n\316\202\026|\365\002*>\361\005}75\314\315v\277\013+\357\266\207\323\371\356\257\241\023}\253\366\364\242.\030\361E(\243\047\212jK\307\332\227Q.z\251o\351\212&F<\214V#\256\367z\213\275\302\r\332\377$>\017w\243iuKUT,\276\212V\242?\364\232n\367\246\214\370:\332\214\376\322\264g\365\266o\310jR\034\344\037D\325A\241\324[\353\265\373\261\367\263p3|\033Qe\251mS\344\027]\322\225\341VT\216\336\032\047\003\335\005\000\016W\243`V\232\340\366\304\301pSH\353&7\333d\007S\320TZJe8\0369;\230\262\332i\312j1\315\325@\335\375\2600\310\3357\367\315\014\363\013\341\014D\371]I\375\244\347\364\013\006\230\003\337?\365\252>\357\257\364+\006\270\003Q\237\202\205e\204Y\310\360\215\316\r\036=\355\357\276\237\032\344\036\230\024\346\272\233\335\3660\277\034Z\246\342vx\033\352YW\213\352kU\325\313\372y\357\240_\351\223An\357}\345\357\333\237\315\314\377oT\\M/\205\353\321RBF\234$\224\273\024YI\231\326U>n\017\004\231U_\251]\235\323e-{\326pa%<T\300\305\244vj\270\260\014\034\312\3501\344\265r/\232W\225+\330\356\252\366\310\322\370=\203\273\002\265\243\034]\320[\275\235\230\323\330-\200\251h\217\334\314v\007\244\t\305\340\336C\275\242+W\371\205\301\302\232\231V\223\335e\350G\213\211]G}\256VU|\363\234\332T\3554\033\313 y\265}\365\257\254\222T\267\242\235\310\201\n!\341\027\221T\3265Jb1\306\333*\007Q\201\251y\030\241\373\272\244\253\275/\373;}\362\017\243\376\230\026";
+    PyObject *data = __Pyx_DecompressString(cstring, 1186, 1);
+    #define __Pyx_DecompressString_LZSS_UNUSED
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (797 bytes) */
-const char* const cstring = "x\332\275T=s\3230\030&\\\216\2176=\002t\340\340\270s88\216\203\024\\\272\224\343\253i\257|\027B\263+\252\255\270\272:\262cI\275d\353\230\321\243F\215\036;v\344't\314\230\237\300O\340\225\2258\t001Xz\336\347\375\324\373J~\363\201\035\343\220\372N\214\023\334%\202$\334\351D\211\323\332\337\337n|\301 S\034Nm\270\000\302\021\tf\234\n\032\261\027\3166P\001y\365\304iYP\367\"\326\241Ak\020\2236\232\303\016?\214d\350;\007\304i\317\3338\264\343\004\364\2300\237r|\020\022\302\314\032x\365C\234\370\204Q\026\264gh!\310\034=\215A\271u\367\353]\312\272\270\337\236l\013~Sn\352\304\"\307'\035,C\341 \224\020_z\004!\307\227p\316\310a\021\253\213\204\036C\017@\353QF\005B<\361\236\346\355\261\353Z<\350\277\344`\305\002\036\311\304#\257\3532n#\370\026\362\032y\232s\327\335]G\350\333\240\017\337\016\365\004\332#}\361\235t\362x6hQ\2137\020\207\021ChJs\"\3621\374\246\360\242n\227\212}\243\261D@@J\010\347\205\330\302, LX\231\347jLY!\266\314\244-\207\371\200y4\202\240I$\005e\204\037\020\201\275\020\020\242\014\201\215G\016\260w4\227tn\3303\204PG2\017\241\242\226Y\0259i\017\202\212Q\"\312Q\221\223\n\322\345G\317\216\334#\350U\027\252\2025\237\035\354\221/CpD\210\301\235E(\216bX\240\235\223\200\006\036\013s\025\214MO\342\320\332%n\262\236<\237\215\371\217&\027\004\351\233N\207\235\242M\213\r\312\3070I\016hr\201\346\206\203\3762(\2707k\266\333\371\312m\334|\375\016v\360~\020\022\204C\030\331\221\001\216\345!\\\"\031\303\323\223\204\317=\232\331\325?\331\032_\251\014?\245B\271#\000\237UYm-\200\217\251\257j\006\354\251\373\n\377\335\246\000\357\323\035U2\340\213ZU\315\321|\344\002|U\033\252\007\340\274rW\265\364uC\275K7RC\rw\323\332\311\2265r\247\241K\206\2716\024\251{^~\373\243\364\363\322\205\253+\377\255\340\361\225\033\351Cu\303\226\274<\334\030\366\322\253 \272\243J5]\006u%/\014\202,\351{z'+g\333\2318uG\325\325tO\327F\277iK\243\352M8\251P\317\241\256\325[jE7\307\260]\323\275\211\245\361{\007\271\244nh?\253e\233\247\215S\377\254f\335\244\332\206\"\254\233\331.\203\264\2408\277\365([\315\232""\343J\365\274\372@756\325\365\323D]\267v\003}Q\337\327y\346e\275\241{\323j\\\303T\364\326\370\237\254l\251\233\252\241|8!\024\374I\t\355\316X\234\2139\337\323e\210\n\235Z\201A\337\316\326\263\326\351\235\263\306\031>)\215\312K\303\307is\362'\255\313\370\0278Hg\260";
-    PyObject *data = __Pyx_DecompressString(cstring, 797, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) > 0 && (CYTHON_COMPRESS_STRINGS) <= 90 /* compression: lzss (1530 bytes) */
+static const char cstring[] = "\377(tree fr\377agment),\377 Tstage=\377-configT\377ype-hard\377ening-mi\377nmax-up?\377Invalid \377paramete\377rs for T\277SSCBMa\r\000i\363al\034\005O\000te t\377ransitioon: C_\003No\024\001\377hat Cyth\377on is de\337liber@\000ly\277 stricZ\000 \377than PEP\377-484 and\377 rejects\377 subclas\377ses of b\377uiltin t\376\264\000s. If y\377ou need \353to\251\000s$\nthe\337n set[\000e \177\047annota\234\001\371_<\000\353\000\047 dir\366b\000iv\272\000o Fa\277lse.`_\217\047`\377 should \357be `\246(` i\367f g4\000n`_u\001p\030\013\014\001\025\006\320&<\013\014\010@\006\360\364#d\013\014\005f\005add_\376\301\000edisabl\367een\002\001gcis\356\004\003dno\333 fau\377lt __red\377uce__ du^\332\002non-\353 v\265@\376\033\000cinit__\317src/\316B\000\003.p\377yxCOUNTE?RSF1F2\351B\356B5.H\006c\305B__\017\005\335 \372\373B_\013\013commi\353tS\356 e;\003get\217Coun\306a\010\006\021\013S\366\277`in\022\010ress\3764\006Tangent\300\210\003\027\000?\r\345@c\010\363@Tr\367ialN\003__Py\365x\001\000D\352`_Nex?tRef__\212d\241 \377__func__\343__\243\000\310\003\n\000mai}n\020\001modul!\002\047nam)\002\244 _ \004\007\001\363vt\213A;\001qual\260\035\005\371%\251.\223Fexo\001s\207et_Q\005\304&\211\000\310._\317_tes\262@\227\204\010_i\377s_corout\377ine_upas\277yncio.\013\006s?betacl\032\001\312\000\377tracebac\351k\223H\376\206\007d\207\206\001num\232\230\206\002f(\000tu\302`\002\004iCng\267H\312@\326B\003\002r\245 \340\003\003\255@\344@\243D\315\207\006iit\377emsk0k1k\3712\333\207\003\304!popr1or2r3\277Jrer\000\377nsc_elas\267tic\007\000k1\001\0012\376\000\002_revers\237eself\351E\335Ks\357etde\377\204\002src\361.\266\204\003\260\210\002\362\210\002_1_1j\001\0052\014\0032\n\0052_\016\001t\337!\315\001s\210\204\002Rat\275 \377gtupleuf\377ugapuhup\277values\243\211\034\200\377\001\330\004\n\210+\220Q\377\200A\330\010\014\210J\220\377d\230*\240E\250\021\250\375!\013\001K\220t\230;\240\357e\2501\250\031\002L\230\004\377\230L\250\005\250Q\250a\376)\001N\230$\230n\250E\207\260\021\260(\002\017""\014\036\014\000\033H\377\220D\230\010\240\005\240Q\375\240U\002M\230\024\230]\250\337%\250q\260\001\222\001O\230\3774\230\177\250e\2601\260\371A\203\020\227\013\320\014\035\230T\377\320!2\260%\260q\270\3769\002G\2204\220w\230e\357\2401\240A\341\001\016\210a\377\210t\2209\230C\230w\364\326\001\364\001\017\016\0001\200A\340\204\376\000\356\0011\206!\350\001\354\006\223&!\202\360\005a\016\023-\006\315\001\267\002\307\001Q\221\330N\tZ\006\323\001q\363 \256\002\240\361\021\374!\250\001\017\001\210F\220!\357\320\004\032\230\203@\t\330\014\367\020\220\t\216 Z\240t\250_;\260d\270!\r\001\013\220 \377{\250$\250k\270\024\270UQ\036\001\007\250@<\037\0001+\001\375\n\227@j\250\004\320,<\377\270D\300\001\320\004\035\230\376\200\000\013\2104\210q\330\014\373\023\220\335\000\017\210q\220\006\376\351@\047\240\021\240#\240T\377\250\023\250H\260I\270Q\377\270a\320\004E\300Q\360\337\006\000\t\r\210\243\200e\340\010\037\022\220\047\230\022\341@\212 \240\002\366\354\000\022\230\304\002\013\2301\340\371\014\232B\236`\n\240\"\240D\377\250\004\250C\250t\2601?\330\020\024\220N\240\211 \020\013\357\001\330\020\023\355@t\2303\377\230a\330\024\030\230\r\240\033Q\340\004\000\017\240\367\000\342B4\001\375G\315`u\240B\240d\250\237!\2509\260B\317\"2\002u\362\223`q0\004:\001\007\230q\330\376\014\n\320\030)\250\024\250Q?\340\014\020\320\020%\252\204\001\232\001\337x\220r\230\021r\003y\240\357\002\240$\240u\002\013\2404\345\2407\004t\312\000\211\000\014\240A\351\340\231\002\006\035\330\356\0029\230B\363\230d\337\000\346\000K\230t\240\3451\014\007a\n\002\023\002q\240\004\374S\000\237`\r\230T\240\032\250\3772\250T\260\033\270B\270\001a";
+    PyObject *data = __Pyx_DecompressString_LZSS(cstring, 1530, 2385);
+    #define __Pyx_DecompressString_UNUSED
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (1604 bytes) */
-const char* const bytes = "?Invalid parameters for TSSCBMaterialInvalid state transition: Cstage=, Tstage=-configType`_configType` should be `-configType` if givendisableenablegc-hardening`hardening` should be `-hardening` if givenisenabled-minmax`minmax` should be `-minmax` if givenno default __reduce__ due to non-trivial __cinit__src/TSSCB/TSSCB.pyx<stringsource>-up`_up` should be `-up` if givenF1F2__Pyx_PyDict_NextRefTSSCBTSSCB.__reduce_cython__TSSCB.__setstate_cython__TSSCB.commitStateTSSCB.getStressTSSCB.getTangentTSSCB.setStrainTSSCB.setTrialStrainasyncio.coroutinesbetacline_in_tracebackcommitState_configTypeconfigType__func__getStressgetTangent__getstate__hardening_is_coroutineitemsk0k1k2__main__minmax__module____name__pop__pyx_state__pyx_vtable____qualname__r1r2r3__reduce____reduce_cython____reduce_ex__selfsetStrainsetTrialStrain__set_name__setdefault__setstate____setstate_cython__src.TSSCB.TSSCBstrainstrainRatetag__test__ufugapuh_upupvalues-configType-hardening\200A\340\010\014\210K\220t\2301\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210J\220d\230!\330\010\014\210N\230$\230a\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210H\220D\230\001\330\010\014\210M\230\024\230Q\330\010\014\210K\220t\2301\330\010\014\210K\220t\2301\330\010\014\210O\2304\230q\330\010\014\320\014\035\230T\240\021\330\010\014\210G\2204\220q\330\010\014\210F\220!\200A\330\010\014\210O\2301\230A\330\010\014\210L\230\001\200A\330\010\017\210t\2201\320\004@\300\001\360\006\000\t\r\210K\220t\2301\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210J\220d\230!\330\010\014\210N\230$\230a\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210H\220D\230\001\330\010\014\210M\230\024\230Q\330\010\014\210K\220t\2301\330\010\014\210K\220t\2301\340\010\022\220'\230\022\2304\230q\330\010\013\2104\210q\220\t\230\022\2301\330\014\020\220\013\2301\340\014\017\210t\2201\220D""\230\n\240\"\240D\250\004\250C\250t\2601\330\020\024\220N\240!\330\014\017\210t\2201\220D\230\n\240\"\240D\250\001\330\020\023\2204\220t\2303\230a\330\024\030\230\r\240Q\340\024\030\230\017\240q\330\014\017\210t\2201\330\020\024\220G\2304\230u\240B\240d\250!\2509\260B\260d\270!\330\020\023\2204\220u\230C\230q\330\024\030\230\r\240Q\330\024\030\230\007\230q\330\020\023\2204\220u\230C\230q\330\024\030\320\030)\250\024\250Q\340\014\020\320\020%\240Q\240a\340\014\017\210x\220r\230\021\330\020\023\2204\220y\240\002\240$\240a\330\024\030\230\013\2404\240q\330\020\023\2204\220t\2301\330\024\030\230\014\240A\340\020\023\2204\220y\240\002\240$\240a\330\024\030\230\013\2404\240q\330\020\023\2204\220t\2301\330\024\030\230\014\240A\330\014\017\210t\2209\230B\230d\240!\330\020\024\220K\230t\2401\330\014\017\210t\2209\230B\230a\230t\2401\330\020\024\220K\230q\240\004\240A\340\014\020\220\r\230T\240\032\2502\250T\260\033\270B\270a\200\001\330\004\n\210+\220Q-minmax-up";
+    #else /* compression: none (2385 bytes) */
+static const char bytes[] = "(tree fragment), Tstage=-configType-hardening-minmax-up?Invalid parameters for TSSCBMaterialInvalid state transition: Cstage=Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the \047annotation_typing\047 directive to False.`_configType` should be `-configType` if given`_up` should be `-up` if given`hardening` should be `-hardening` if given`minmax` should be `-minmax` if givenadd_notedisableenablegcisenabledno default __reduce__ due to non-trivial __cinit__src/TSSCB/TSSCB.pyxCOUNTERSF1F2TSSCBTSSCB.__reduce_cython__TSSCB.__setstate_cython__TSSCB.commitStateTSSCB.getCountersTSSCB.getStateTSSCB.getStrainTSSCB.getStressTSSCB.getTangentTSSCB.resetCountersTSSCB.setStateTSSCB.setTrialStrain__Pyx_PyDict_NextRef__annotate____func____getstate____main____module____name____pyx_state__pyx_vtable____qualname____reduce____reduce_cython____reduce_ex____set_name____setstate____setstate_cython____test___configType_is_coroutine_upasyncio.coroutinesbetacline_in_tracebackcommitStateconfigTypedictenumeratefracturedfracturinggetCountersgetStategetStraingetStressgetTangenthardeningiitemsk0k1k2minmaxnamepopr1r2r3resetCountersreturnsc_elasticsc_k1sc_k2sc_k2_reverseselfsetStatesetTrialStrainsetdefaultsrc.TSSCB.TSSCBstage_1_1stage_1_2stage_2_1stage_2_2statestrainstrainRatetagtupleufugapuhupvalues-configType-hardening-minmax-up\200\001\330\004\n\210+\220Q\200A\330\010\014\210J\220d\230*\240E\250\021\250!\330\010\014\210K\220t\230;\240e\2501\250A\330\010\014\210L\230\004\230L\250\005\250Q\250a\330\010\014\210N\230$\230n\250E\260\021\260!\330\010\014\210L\230\004\230L\250\005\250Q\250a\330\010\014\210L\230\004\230L\250\005\250Q\250a\330\010\014\210L\230\004\230L\250\005\250Q\250a\330\010\014\210L\230\004\230L\250\005\250Q\250a\330\010\014\210H\220D\230\010\240\005\240Q\240a\330\010\014\210M\230\024\230]\250%\250q\260\001\330\010\014\210O\2304\230\177\250e\2601\260A\330\010\014\210K\220t\230;\240e\2501\250A\330""\010\014\210K\220t\230;\240e\2501\250A\330\010\014\320\014\035\230T\320!2\260%\260q\270\001\330\010\014\210G\2204\220w\230e\2401\240A\200A\330\010\016\210a\210t\2209\230C\230w\240e\2501\200A\330\010\017\210t\2201\200A\340\010\014\210K\220t\2301\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210J\220d\230!\330\010\014\210N\230$\230a\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210H\220D\230\001\330\010\014\210M\230\024\230Q\330\010\014\210K\220t\2301\330\010\014\210K\220t\2301\330\010\014\210O\2304\230q\330\010\014\320\014\035\230T\240\021\330\010\014\210G\2204\220q\330\010\014\210F\220!\320\004\032\230!\330\010\t\330\014\020\220\t\230\024\230Z\240t\250;\260d\270!\330\014\020\220\013\2304\230{\250$\250k\270\024\270Q\330\014\020\220\007\220t\230<\240t\2501\330\014\020\220\n\230$\230j\250\004\320,<\270D\300\001\320\004\035\230Q\330\010\013\2104\210q\330\014\023\2201\330\010\017\210q\220\006\220d\230\047\240\021\240#\240T\250\023\250H\260I\270Q\270a\320\004E\300Q\360\006\000\t\r\210K\220t\2301\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210J\220d\230!\330\010\014\210N\230$\230a\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210L\230\004\230A\330\010\014\210H\220D\230\001\330\010\014\210M\230\024\230Q\330\010\014\210K\220t\2301\330\010\014\210K\220t\2301\340\010\022\220\047\230\022\2304\230q\330\010\013\2104\210q\220\t\230\022\2301\330\014\020\220\013\2301\340\014\017\210t\2201\220D\230\n\240\"\240D\250\004\250C\250t\2601\330\020\024\220N\240!\330\014\017\210t\2201\220D\230\n\240\"\240D\250\001\330\020\023\2204\220t\2303\230a\330\024\030\230\r\240Q\340\024\030\230\017\240q\330\014\017\210t\2201\330\020\024\220G\2304\230u\240B\240d\250!\2509\260B\260d\270!\330\020\023\2204\220u\230C\230q\330\024\030\230\r\240Q\330\024\030\230\007\230q\330\020\023\2204\220u\230C\230q\330\024\030\320\030)\250\024\250Q\340\014\020\320\020%\240Q\240a\340\014""\017\210x\220r\230\021\330\020\023\2204\220y\240\002\240$\240a\330\024\030\230\013\2404\240q\330\020\023\2204\220t\2301\330\024\030\230\014\240A\340\020\023\2204\220y\240\002\240$\240a\330\024\030\230\013\2404\240q\330\020\023\2204\220t\2301\330\024\030\230\014\240A\330\014\017\210t\2209\230B\230d\240!\330\020\024\220K\230t\2401\330\014\017\210t\2209\230B\230a\230t\2401\330\020\024\220K\230q\240\004\240A\340\014\020\220\r\230T\240\032\2502\250T\260\033\270B\270a";
     PyObject *data = NULL;
-    CYTHON_UNUSED_VAR(__Pyx_DecompressString);
+    #define __Pyx_DecompressString_UNUSED
+    #define __Pyx_DecompressString_LZSS_UNUSED
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 78; i++) {
-      Py_ssize_t bytes_length = index[i].length;
+    for (int i = 0; i < 107; i++) {
+      Py_ssize_t bytes_length = str_length_index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
-      if (likely(string) && i >= 19) PyUnicode_InternInPlace(&string);
+      if (likely(string) && i >= 21) PyUnicode_InternInPlace(&string);
       if (unlikely(!string)) {
         Py_XDECREF(data);
         __PYX_ERR(0, 1, __pyx_L1_error)
@@ -9482,8 +11974,8 @@ const char* const bytes = "?Invalid parameters for TSSCBMaterialInvalid state tr
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 78; i < 87; i++) {
-      Py_ssize_t bytes_length = index[i].length;
+    for (int i = 107; i < 119; i++) {
+      Py_ssize_t bytes_length = bytes_length_index[i-107].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
       pos += bytes_length;
@@ -9493,25 +11985,29 @@ const char* const bytes = "?Invalid parameters for TSSCBMaterialInvalid state tr
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 87; i++) {
+    for (Py_ssize_t i = 0; i < 119; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 78;
-      for (Py_ssize_t i=0; i<9; ++i) {
-        #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      PyObject **table = stringtab + 107;
+      for (Py_ssize_t i=0; i<12; ++i) {
+        #if PY_VERSION_HEX >= 0x030F0000
+        PyUnstable_SetImmortal(table[i]);
+        #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+        if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
         #if PY_VERSION_HEX < 0x030E0000
         if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
         #else
         if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
         #endif
         {
-          Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
+          Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
         }
         #else
+        if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
         Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
         #endif
       }
@@ -9526,20 +12022,32 @@ const char* const bytes = "?Invalid parameters for TSSCBMaterialInvalid state tr
       if (unlikely(!numbertab[i])) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
+  {
+    PyObject **numbertab = __pyx_mstate->__pyx_number_tab + 1;
+    int8_t const cint_constants_1[] = {0,1};
+    for (int i = 0; i < 2; i++) {
+      numbertab[i] = PyLong_FromLong(cint_constants_1[i - 0]);
+      if (unlikely(!numbertab[i])) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
   #if CYTHON_IMMORTAL_CONSTANTS
   {
     PyObject **table = __pyx_mstate->__pyx_number_tab;
-    for (Py_ssize_t i=0; i<1; ++i) {
-      #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    for (Py_ssize_t i=0; i<3; ++i) {
+      #if PY_VERSION_HEX >= 0x030F0000
+      PyUnstable_SetImmortal(table[i]);
+      #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
       #if PY_VERSION_HEX < 0x030E0000
       if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
       #else
       if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
       #endif
       {
-        Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
+        Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
       }
       #else
+      if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
       Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
       #endif
     }
@@ -9550,6 +12058,9 @@ const char* const bytes = "?Invalid parameters for TSSCBMaterialInvalid state tr
   return -1;
 }
 /* #### Code section: init_codeobjects ### */
+#ifdef __cplusplus
+namespace {
+#endif
 typedef struct {
     unsigned int argcount : 2;
     unsigned int num_posonly_args : 1;
@@ -9558,6 +12069,9 @@ typedef struct {
     unsigned int flags : 10;
     unsigned int first_line : 9;
 } __Pyx_PyCode_New_function_description;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
         const __Pyx_PyCode_New_function_description descr,
@@ -9573,39 +12087,59 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 95};
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 84};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_strain, __pyx_mstate->__pyx_n_u_strainRate};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_setTrialStrain, __pyx_mstate->__pyx_kp_b_iso88591_Kt1_L_A_L_A_Jd_N_a_L_A_L_A_L_A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_setTrialStrain, __pyx_mstate->__pyx_kp_b_iso88591_EQ_Kt1_L_A_L_A_Jd_N_a_L_A_L_A_L, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 344};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 361};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_commitState, __pyx_mstate->__pyx_kp_b_iso88591_A_Kt1_L_A_L_A_Jd_N_a_L_A_L_A_L_A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 363};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 380};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_getStrain, __pyx_mstate->__pyx_kp_b_iso88591_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 383};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
-    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_getStress, __pyx_mstate->__pyx_kp_b_iso88591_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_getStress, __pyx_mstate->__pyx_kp_b_iso88591_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 366};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 386};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
-    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_getTangent, __pyx_mstate->__pyx_kp_b_iso88591_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_getTangent, __pyx_mstate->__pyx_kp_b_iso88591_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 369};
-    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_strain};
-    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_setStrain, __pyx_mstate->__pyx_kp_b_iso88591_A_O1A_L, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 389};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_name_2};
+    __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_getCounters, __pyx_mstate->__pyx_kp_b_iso88591_Q_4q_1_q_d_T_HIQa, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 394};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_resetCounters, __pyx_mstate->__pyx_kp_b_iso88591_A_at9Cwe1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 397};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[7] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_getState, __pyx_mstate->__pyx_kp_b_iso88591_Zt_d_4_k_Q_t_t1_j_D, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[7])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 405};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_state};
+    __pyx_mstate_global->__pyx_codeobj_tab[8] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_TSSCB_TSSCB_pyx, __pyx_mstate->__pyx_n_u_setState, __pyx_mstate->__pyx_kp_b_iso88591_A_Jd_E_Kt_e1A_L_L_Qa_N_nE_L_L_Qa, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[8])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
-    __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[9] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[9])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 3};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
-    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[10] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_tree_fragment, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[10])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -9616,8 +12150,11 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
 /* #### Code section: init_globals ### */
 
 static int __Pyx_InitGlobals(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   /* PythonCompatibility.init */
-  if (likely(__Pyx_init_co_variables() == 0)); else
+  if (likely(__Pyx_init_co_variables() == 0 && __Pyx_init_tpflags_variables() == 0)); else
   
   if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
 
@@ -9640,7 +12177,17 @@ static int __Pyx_InitGlobals(void) {
   
   if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
 
-  /* CythonFunctionShared.init */
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_after_shared_utility ### */
+
+static int __Pyx_InitAfterSharedUtility(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  /* CythonFunctionPerModule.init */
   if (likely(__pyx_CyFunction_init(__pyx_m) == 0)); else
   
   if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -9649,63 +12196,283 @@ static int __Pyx_InitGlobals(void) {
   __pyx_L1_error:;
   return -1;
 }
-/* #### Code section: cleanup_globals ### */
-/* #### Code section: cleanup_module ### */
-/* #### Code section: main_method ### */
-/* #### Code section: utility_code_pragmas ### */
-#ifdef _MSC_VER
-#pragma warning( push )
-/* Warning 4127: conditional expression is constant
- * Cython uses constant conditional expressions to allow in inline functions to be optimized at
- * compile-time, so this warning is not useful
- */
-#pragma warning( disable : 4127 )
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* FastTypeChecks (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#endif
+
+/* PyErrFetchRestore (used by GivenExceptionMatches) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
 #endif
 
+/* GivenExceptionMatches (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
 
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
 
-/* #### Code section: utility_code_def ### */
-
-/* --- Runtime support code --- */
-/* Refnanny */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule(modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, "RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
+/* PyObjectGetAttrStr (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
 }
 #endif
 
-/* TupleAndListFromArray (used by fastcall) */
-#if !CYTHON_COMPILING_IN_CPYTHON && CYTHON_METH_FASTCALL
-static CYTHON_INLINE PyObject *
-__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
-{
-    PyObject *res;
-    Py_ssize_t i;
-    if (n <= 0) {
-        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
     }
-    res = PyTuple_New(n);
-    if (unlikely(res == NULL)) return NULL;
-    for (i = 0; i < n; i++) {
-        if (unlikely(__Pyx_PyTuple_SET_ITEM(res, i, src[i]) < (0))) {
-            Py_DECREF(res);
-            return NULL;
-        }
-        Py_INCREF(src[i]);
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
     }
-    return res;
+    return result;
+#endif
 }
-#elif CYTHON_COMPILING_IN_CPYTHON
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
+    return result;
+}
+
+/* CopyObjectArray (used by TupleOrListFromArrayImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
     PyObject *v;
     Py_ssize_t i;
@@ -9714,156 +12481,84 @@ static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRI
         Py_INCREF(v);
     }
 }
-static CYTHON_INLINE PyObject *
-__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
-{
-    PyObject *res;
+#endif
+
+/* TupleOrListFromArrayImpl (used by TupleFromArray) */
+#if !(PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API)
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n) {
     if (n <= 0) {
         return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
     }
-    res = PyTuple_New(n);
+    PyObject *res = PyTuple_New(n);
     if (unlikely(res == NULL)) return NULL;
+    #if CYTHON_COMPILING_IN_CPYTHON
     __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
-    return res;
-}
-static CYTHON_INLINE PyObject *
-__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n)
-{
-    PyObject *res;
-    if (n <= 0) {
-        return PyList_New(0);
+    #else
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        Py_INCREF(src[i]);
+        if (unlikely(__Pyx_PyTuple_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
     }
-    res = PyList_New(n);
-    if (unlikely(res == NULL)) return NULL;
-    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    #endif
     return res;
 }
 #endif
 
-/* BytesEquals (used by UnicodeEquals) */
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_GRAAL ||\
-        !(CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS)
-    return PyObject_RichCompareBool(s1, s2, equals);
-#else
-    if (s1 == s2) {
-        return (equals == Py_EQ);
-    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
-        const char *ps1, *ps2;
-        Py_ssize_t length = PyBytes_GET_SIZE(s1);
-        if (length != PyBytes_GET_SIZE(s2))
-            return (equals == Py_NE);
-        ps1 = PyBytes_AS_STRING(s1);
-        ps2 = PyBytes_AS_STRING(s2);
-        if (ps1[0] != ps2[0]) {
-            return (equals == Py_NE);
-        } else if (length == 1) {
-            return (equals == Py_EQ);
-        } else {
-            int result;
-#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
-            Py_hash_t hash1, hash2;
-            hash1 = ((PyBytesObject*)s1)->ob_shash;
-            hash2 = ((PyBytesObject*)s2)->ob_shash;
-            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
-                return (equals == Py_NE);
-            }
+/* PyObjectCompare (used by UnicodeEquals) */
+#ifndef __Pyx_DEFINED_PyObject_CompareStrStrBoolEq
+#define __Pyx_DEFINED_PyObject_CompareStrStrBoolEq
+static CYTHON_INLINE int __Pyx_PyObject_CompareStrStrBoolEq(PyObject* s1, PyObject* s2) {
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    int result = PyUnicode_Equal(s1, s2);
+    #if !CYTHON_COMPILING_IN_CPYTHON
+    if (unlikely(result == -1)) return -1;
+    #endif
+    if (result == 0) goto __pyx_return_false; else goto __pyx_return_true;
+    #else
+    int result = PyUnicode_Compare(s1, s2);
+    if (unlikely((result == -1) && PyErr_Occurred())) return -1;
+    if (result == 0) goto __pyx_return_true; else goto __pyx_return_false;
+    #endif
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
 #endif
-            result = memcmp(ps1, ps2, (size_t)length);
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
-        return (equals == Py_NE);
-    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
-        return (equals == Py_NE);
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolEq_str_str(PyObject *op1, PyObject *op2, int pyop) {
+    CYTHON_UNUSED_VAR(pyop);
+    if (unlikely(op1 == Py_None)) {
+        if (op2 == Py_None) goto __pyx_return_true; else goto __pyx_return_false;
     }
-#endif
-}
-
-/* UnicodeEquals (used by fastcall) */
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_GRAAL
-    return PyObject_RichCompareBool(s1, s2, equals);
-#else
-    int s1_is_unicode, s2_is_unicode;
-    if (s1 == s2) {
-        goto return_eq;
+    if (unlikely(op2 == Py_None)) {
+        if (op1 == Py_None) goto __pyx_return_true; else goto __pyx_return_false;
     }
-    s1_is_unicode = PyUnicode_CheckExact(s1);
-    s2_is_unicode = PyUnicode_CheckExact(s2);
-    if (s1_is_unicode & s2_is_unicode) {
-        Py_ssize_t length, length2;
-        int kind;
-        void *data1, *data2;
-        #if !CYTHON_COMPILING_IN_LIMITED_API
-        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
-            return -1;
-        #endif
-        length = __Pyx_PyUnicode_GET_LENGTH(s1);
-        #if !CYTHON_ASSUME_SAFE_SIZE
-        if (unlikely(length < 0)) return -1;
-        #endif
-        length2 = __Pyx_PyUnicode_GET_LENGTH(s2);
-        #if !CYTHON_ASSUME_SAFE_SIZE
-        if (unlikely(length2 < 0)) return -1;
-        #endif
-        if (length != length2) {
-            goto return_ne;
-        }
-#if CYTHON_USE_UNICODE_INTERNALS
-        {
-            Py_hash_t hash1, hash2;
-            hash1 = ((PyASCIIObject*)s1)->hash;
-            hash2 = ((PyASCIIObject*)s2)->hash;
-            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
-                goto return_ne;
-            }
-        }
-#endif
-        kind = __Pyx_PyUnicode_KIND(s1);
-        if (kind != __Pyx_PyUnicode_KIND(s2)) {
-            goto return_ne;
-        }
-        data1 = __Pyx_PyUnicode_DATA(s1);
-        data2 = __Pyx_PyUnicode_DATA(s2);
-        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
-            goto return_ne;
-        } else if (length == 1) {
-            goto return_eq;
-        } else {
-            int result = memcmp(data1, data2, (size_t)(length * kind));
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+    
+    if (likely(op1 != Py_None)) {
+        if (op1 == op2) goto __pyx_return_true;
+        if (likely(op2 != Py_None)) {
+            return __Pyx_PyObject_CompareStrStrBoolEq(op1, op2);
         }
-    } else if ((s1 == Py_None) & s2_is_unicode) {
-        goto return_ne;
-    } else if ((s2 == Py_None) & s1_is_unicode) {
-        goto return_ne;
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-return_eq:
-    return (equals == Py_EQ);
-return_ne:
-    return (equals == Py_NE);
-#endif
+        goto __pyx_richcmp;
+    }
+    
+    if ((0)) goto __pyx_richcmp;
+    if ((0)) goto __pyx_return_true;
+    if ((0)) goto __pyx_return_false;
+__pyx_richcmp:
+    return __Pyx_PyObject_RichCompareBool(op1, op2, Py_EQ);
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
 }
 
 /* fastcall */
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
 {
     Py_ssize_t i, n = __Pyx_PyTuple_GET_SIZE(kwnames);
@@ -9884,7 +12579,7 @@ static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyO
         #if !CYTHON_ASSUME_SAFE_MACROS
         if (unlikely(!namei)) return NULL;
         #endif
-        int eq = __Pyx_PyUnicode_Equals(s, namei, Py_EQ);
+        int eq = __Pyx_PyUnicode_Equals(s, namei);
         if (unlikely(eq != 0)) {
             if (unlikely(eq < 0)) return NULL;
             return kwvalues[i];
@@ -9892,7 +12587,7 @@ static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyO
     }
     return NULL;
 }
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL
 CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
     Py_ssize_t i, nkwargs;
     PyObject *dict;
@@ -9964,7 +12659,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 #endif
 
 /* PyObjectFastCall (used by PyObjectCallOneArg) */
-#if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
+#if CYTHON_COMPILING_IN_LIMITED_API
 static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
     PyObject *argstuple;
     PyObject *result = 0;
@@ -9981,10 +12676,8 @@ static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * con
     return result;
 }
 #endif
-#if CYTHON_VECTORCALL && !CYTHON_COMPILING_IN_LIMITED_API
-  #if PY_VERSION_HEX < 0x03090000
-    #define __Pyx_PyVectorcall_Function(callable) _PyVectorcall_Function(callable)
-  #elif CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_VECTORCALL && !(CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY)
+  #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callable) {
     PyTypeObject *tp = Py_TYPE(callable);
     #if defined(__Pyx_CyFunction_USED)
@@ -10006,8 +12699,8 @@ static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callab
     #define __Pyx_PyVectorcall_Function(callable) PyVectorcall_Function(callable)
   #endif
 #endif
-static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t _nargs, PyObject *kwargs) {
-    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(nargsf);
 #if CYTHON_COMPILING_IN_CPYTHON
     if (nargs == 0 && kwargs == NULL) {
         if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
@@ -10020,12 +12713,12 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObj
 #endif
     if (kwargs == NULL) {
         #if CYTHON_VECTORCALL
-          #if CYTHON_COMPILING_IN_LIMITED_API
-            return PyObject_Vectorcall(func, args, _nargs, NULL);
+          #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+            return PyObject_Vectorcall(func, args, nargsf, NULL);
           #else
             vectorcallfunc f = __Pyx_PyVectorcall_Function(func);
             if (f) {
-                return f(func, args, _nargs, NULL);
+                return f(func, args, nargsf, NULL);
             }
           #endif
         #endif
@@ -10033,10 +12726,12 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObj
     if (nargs == 0) {
         return __Pyx_PyObject_Call(func, __pyx_mstate_global->__pyx_empty_tuple, kwargs);
     }
-    #if PY_VERSION_HEX >= 0x03090000 && !CYTHON_COMPILING_IN_LIMITED_API
-    return PyObject_VectorcallDict(func, args, (size_t)nargs, kwargs);
-    #else
+    #if CYTHON_COMPILING_IN_LIMITED_API
     return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #elif CYTHON_COMPILING_IN_PYPY
+    return PyObject_VectorcallDict(func, args, (size_t) nargs, kwargs);
+    #else
+    return PyObject_VectorcallDict(func, args, nargsf, kwargs);
     #endif
 }
 
@@ -10046,17 +12741,16 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
     return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
 }
 
-/* PyObjectGetAttrStr (used by UnpackUnboundCMethod) */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-    return PyObject_GetAttr(obj, attr_name);
+/* IgnoreException (used by UnpackUnboundCMethod_impl) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception) {
+    if (PyErr_GivenExceptionMatches(given_exception ? given_exception : PyErr_Occurred(), ignorable_exception)) {
+        PyErr_Clear();
+        return 1;
+    }
+    return 0;
 }
-#endif
 
-/* UnpackUnboundCMethod (used by CallUnboundCMethod0) */
+/* UnpackUnboundCMethod_impl (used by UnpackUnboundCMethod) */
 #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
 static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *kwargs) {
     PyObject *result;
@@ -10066,20 +12760,9 @@ static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *
     Py_DECREF(selfless_args);
     return result;
 }
-#elif CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x03090000
-static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject **args, Py_ssize_t nargs, PyObject *kwnames) {
-        return _PyObject_Vectorcall
-            (method, args ? args+1 : NULL, nargs ? nargs-1 : 0, kwnames);
-}
 #else
 static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
-    return
-#if PY_VERSION_HEX < 0x03090000
-    _PyObject_Vectorcall
-#else
-    PyObject_Vectorcall
-#endif
-        (method, args ? args+1 : NULL, nargs ? (size_t) nargs-1 : 0, kwnames);
+    return PyObject_Vectorcall(method, args ? args+1 : NULL, nargs ? (size_t) nargs-1 : 0, kwnames);
 }
 #endif
 static PyMethodDef __Pyx_UnboundCMethod_Def = {
@@ -10103,7 +12786,7 @@ static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
     {
         PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
         target->func = descr->d_method->ml_meth;
-        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST);
     } else
 #endif
 #if CYTHON_COMPILING_IN_PYPY
@@ -10115,8 +12798,8 @@ static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
         int self_found;
 #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
         self = PyObject_GetAttrString(method, "__self__");
-        if (!self) {
-            PyErr_Clear();
+        if (!self && !__Pyx_IgnoreException(PyExc_AttributeError)) {
+            return -1;
         }
 #else
         self = PyCFunction_GET_SELF(method);
@@ -10473,13 +13156,13 @@ static void __Pyx_RejectUnknownKeyword(
     #endif
     PyObject *key = NULL;
     __Pyx_BEGIN_CRITICAL_SECTION(kwds);
-    while (
-        #if CYTHON_AVOID_BORROWED_REFS
-        __Pyx_PyDict_NextRef(kwds, &pos, &key, NULL)
-        #else
-        PyDict_Next(kwds, &pos, &key, NULL)
-        #endif
-    ) {
+    #if CYTHON_AVOID_BORROWED_REFS
+    while (__Pyx_PyDict_NextRef(kwds, &pos, &key, NULL))
+    #else
+    (void) __Pyx_PyDict_NextRef;
+    while (PyDict_Next(kwds, &pos, &key, NULL))
+    #endif
+    {
         PyObject** const *name = first_kw_arg;
         while (*name && (**name != key)) name++;
         if (!*name) {
@@ -10689,7 +13372,7 @@ static int __Pyx_ParseKeywords(
     const char* function_name,
     int ignore_unknown_kwargs)
 {
-    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds)))
+    if (CYTHON_VECTORCALL && likely(PyTuple_Check(kwds)))
         return __Pyx_ParseKeywordsTuple(kwds, kwvalues, argnames, kwds2, values, num_pos_args, num_kwargs, function_name, ignore_unknown_kwargs);
     else if (kwds2)
         return __Pyx_ParseKeywordDictToDict(kwds, argnames, kwds2, values, num_pos_args, function_name);
@@ -10723,64 +13406,160 @@ static void __Pyx_RaiseArgtupleInvalid(
                  (num_expected == 1) ? "" : "s", num_found);
 }
 
-/* PyErrFetchRestore (used by RaiseException) */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *tmp_value;
-    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
-    if (value) {
-        #if CYTHON_COMPILING_IN_CPYTHON
-        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
-        #endif
-            PyException_SetTraceback(value, tb);
-    }
-    tmp_value = tstate->current_exception;
-    tstate->current_exception = value;
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-#else
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
+/* PyObjectCompare */
+#if !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL)
+#ifndef __Pyx_DEFINED_PyObject_ComparePyBytesPyBytesBoolNe
+#define __Pyx_DEFINED_PyObject_ComparePyBytesPyBytesBoolNe
+static CYTHON_INLINE int __Pyx_PyObject_ComparePyBytesPyBytesBoolNe(PyObject* s1, PyObject* s2) {
+    #if CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS
+    const char *ps1, *ps2;
+    Py_ssize_t length = PyBytes_GET_SIZE(s1);
+    if (length != PyBytes_GET_SIZE(s2)) goto __pyx_return_true;
+    ps1 = PyBytes_AS_STRING(s1);
+    ps2 = PyBytes_AS_STRING(s2);
+    #else
+    char *ps1, *ps2;
+    Py_ssize_t length, length2;
+    if (unlikely(PyBytes_AsStringAndSize(s1, &ps1, &length) == -1)) return -1;
+    if (unlikely(PyBytes_AsStringAndSize(s2, &ps2, &length2) == -1)) return -1;
+    if (length != length2) goto __pyx_return_true;
+    #endif
+    if (ps1[0] != ps2[0]) goto __pyx_return_true;
+    if (length == 1) goto __pyx_return_false;
+    {
+        int cmp;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+        Py_hash_t hash1 = ((PyBytesObject*)s1)->ob_shash;
+        Py_hash_t hash2 = ((PyBytesObject*)s2)->ob_shash;
+        if (hash1 != hash2 && hash1 != -1 && hash2 != -1) goto __pyx_return_true;
 #endif
+        cmp = memcmp(ps1, ps2, (size_t)length);
+        if (cmp != 0) goto __pyx_return_true; else goto __pyx_return_false;
+    }
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
 }
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject* exc_value;
-    exc_value = tstate->current_exception;
-    tstate->current_exception = 0;
-    *value = exc_value;
-    *type = NULL;
-    *tb = NULL;
-    if (exc_value) {
-        *type = (PyObject*) Py_TYPE(exc_value);
-        Py_INCREF(*type);
-        #if CYTHON_COMPILING_IN_CPYTHON
-        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
-        Py_XINCREF(*tb);
-        #else
-        *tb = PyException_GetTraceback(exc_value);
-        #endif
+#endif
+#endif
+#if !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL)
+#ifndef __Pyx_DEFINED_PyObject_ComparePyByteArrayPyBytesBoolNe
+#define __Pyx_DEFINED_PyObject_ComparePyByteArrayPyBytesBoolNe
+static CYTHON_INLINE int __Pyx_PyObject_ComparePyByteArrayPyBytesBoolNe(PyObject* s1, PyObject* s2) {
+    #if CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS
+    const char *ps1, *ps2;
+    Py_ssize_t length = PyByteArray_GET_SIZE(s1);
+    if (length != PyBytes_GET_SIZE(s2)) goto __pyx_return_true;
+    ps1 = PyByteArray_AS_STRING(s1);
+    ps2 = PyBytes_AS_STRING(s2);
+    #else
+    char *ps1, *ps2;
+    Py_ssize_t length, length2;
+    ps1 = __Pyx_PyByteArray_AsString(s1); if (unlikely(!ps1)) return -1;
+    length = __Pyx_PyByteArray_GET_SIZE(s1); if (unlikely(length == -1)) return -1;
+    if (unlikely(PyBytes_AsStringAndSize(s2, &ps2, &length2) == -1)) return -1;
+    if (length != length2) goto __pyx_return_true;
+    #endif
+    if (length == 0) goto __pyx_return_false;
+    if (ps1[0] != ps2[0]) goto __pyx_return_true;
+    if (length == 1) goto __pyx_return_false;
+    {
+        int cmp;
+        cmp = memcmp(ps1, ps2, (size_t)length);
+        if (cmp != 0) goto __pyx_return_true; else goto __pyx_return_false;
     }
-#else
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
+#endif
 #endif
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolNe_object_bytes(PyObject *op1, PyObject *op2, int pyop) {
+    CYTHON_UNUSED_VAR(pyop);
+    if (unlikely(op2 == Py_None)) {
+        if (op1 == Py_None) goto __pyx_return_false; else goto __pyx_richcmp;
+    }
+    if (PyFloat_CheckExact(op1)) {
+        goto __pyx_richcmp;
+    }
+    if (PyLong_CheckExact(op1)) {
+        if (op1 == op2) goto __pyx_return_false;
+        goto __pyx_richcmp;
+    }
+    #if !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_GRAAL)
+    if (likely(PyBytes_CheckExact(op1))) {
+        if (op1 == op2) goto __pyx_return_false;
+        if (likely(op2 != Py_None)) {
+            return __Pyx_PyObject_ComparePyBytesPyBytesBoolNe(op1, op2);
+        }
+        goto __pyx_richcmp;
+    }
+    #endif
+    if ((0)) goto __pyx_richcmp;
+    if ((0)) goto __pyx_return_true;
+    if ((0)) goto __pyx_return_false;
+__pyx_richcmp:
+    return __Pyx_PyObject_RichCompareBool(op1, op2, Py_NE);
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
+
+/* PyObjectCompare */
+#ifndef __Pyx_DEFINED_PyObject_CompareStrStrBoolNe
+#define __Pyx_DEFINED_PyObject_CompareStrStrBoolNe
+static CYTHON_INLINE int __Pyx_PyObject_CompareStrStrBoolNe(PyObject* s1, PyObject* s2) {
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    int result = PyUnicode_Equal(s1, s2);
+    #if !CYTHON_COMPILING_IN_CPYTHON
+    if (unlikely(result == -1)) return -1;
+    #endif
+    if (result != 0) goto __pyx_return_false; else goto __pyx_return_true;
+    #else
+    int result = PyUnicode_Compare(s1, s2);
+    if (unlikely((result == -1) && PyErr_Occurred())) return -1;
+    if (result != 0) goto __pyx_return_true; else goto __pyx_return_false;
+    #endif
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
 }
 #endif
+static CYTHON_INLINE int __Pyx_PyObject_CompareBoolNe_object_str(PyObject *op1, PyObject *op2, int pyop) {
+    CYTHON_UNUSED_VAR(pyop);
+    if (unlikely(op2 == Py_None)) {
+        if (op1 == Py_None) goto __pyx_return_false; else goto __pyx_richcmp;
+    }
+    if (PyFloat_CheckExact(op1)) {
+        goto __pyx_richcmp;
+    }
+    if (PyLong_CheckExact(op1)) {
+        if (op1 == op2) goto __pyx_return_false;
+        goto __pyx_richcmp;
+    }
+    
+    if (likely(PyUnicode_CheckExact(op1))) {
+        if (op1 == op2) goto __pyx_return_false;
+        if (likely(op2 != Py_None)) {
+            return __Pyx_PyObject_CompareStrStrBoolNe(op1, op2);
+        }
+        goto __pyx_richcmp;
+    }
+    
+    if ((0)) goto __pyx_richcmp;
+    if ((0)) goto __pyx_return_true;
+    if ((0)) goto __pyx_return_false;
+__pyx_richcmp:
+    return __Pyx_PyObject_RichCompareBool(op1, op2, Py_NE);
+__pyx_return_true:
+    return 1;
+__pyx_return_false:
+    return 0;
+}
 
 /* RaiseException */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
@@ -11161,18 +13940,19 @@ static CYTHON_INLINE PyObject* __Pyx____Pyx_PyUnicode_From_int(int value, Py_ssi
 }
 
 /* JoinPyUnicode */
-static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength,
-                                      Py_UCS4 max_char) {
-#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength, int kind) {
+#if __Pyx_PyUnicode_Join_CAN_USE_KIND_AND_LENGTH && CYTHON_USE_UNICODE_INTERNALS
     PyObject *result_uval;
     int result_ukind, kind_shift;
     Py_ssize_t i, char_pos;
     void *result_udata;
-    if (max_char > 1114111) max_char = 1114111;
-    result_uval = PyUnicode_New(result_ulength, max_char);
+    static const Py_UCS4 max_char[5] = {0x7fU, 0xffU, 0xffffU, 0xffffU, 0x10ffffU};
+    assert (kind >= 0);
+    if (kind > PyUnicode_4BYTE_KIND) kind = PyUnicode_4BYTE_KIND;
+    result_uval = PyUnicode_New(result_ulength, max_char[kind]);
     if (unlikely(!result_uval)) return NULL;
-    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
-    kind_shift = (result_ukind == PyUnicode_4BYTE_KIND) ? 2 : result_ukind - 1;
+    kind_shift = kind >> 1;  // 0, 1, 2
+    result_ukind = 1 << kind_shift;  // 1, 2, 4
     result_udata = PyUnicode_DATA(result_uval);
     assert(kind_shift == 2 || kind_shift == 1 || kind_shift == 0);
     if (unlikely((PY_SSIZE_T_MAX >> kind_shift) - result_ulength < 0))
@@ -11183,10 +13963,8 @@ static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count,
         Py_ssize_t ulength;
         void *udata;
         PyObject *uval = values[i];
-        #if !CYTHON_COMPILING_IN_LIMITED_API
         if (__Pyx_PyUnicode_READY(uval) == (-1))
             goto bad;
-        #endif
         ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
         #if !CYTHON_ASSUME_SAFE_SIZE
         if (unlikely(ulength < 0)) goto bad;
@@ -11225,11 +14003,11 @@ bad:
     PyObject *result = NULL;
     PyObject *value_tuple = PyTuple_New(value_count);
     if (unlikely(!value_tuple)) return NULL;
-    CYTHON_UNUSED_VAR(max_char);
+    CYTHON_UNUSED_VAR(kind);
     CYTHON_UNUSED_VAR(result_ulength);
     for (i=0; i<value_count; i++) {
-        if (__Pyx_PyTuple_SET_ITEM(value_tuple, i, values[i]) != (0)) goto bad;
         Py_INCREF(values[i]);
+        if (__Pyx_PyTuple_SET_ITEM(value_tuple, i, values[i]) != (0)) goto bad;
     }
     result = PyUnicode_Join(__pyx_mstate_global->__pyx_empty_unicode, value_tuple);
 bad:
@@ -11241,7 +14019,7 @@ bad:
 /* RejectKeywords */
 static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds) {
     PyObject *key = NULL;
-    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds))) {
+    if (CYTHON_VECTORCALL && likely(PyTuple_Check(kwds))) {
         key = __Pyx_PySequence_ITEM(kwds, 0);
     } else {
 #if CYTHON_AVOID_BORROWED_REFS
@@ -11257,51 +14035,417 @@ static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds) {
         Py_XDECREF(pos);
 #endif
     }
-    if (likely(key)) {
-        PyErr_Format(PyExc_TypeError,
-            "%s() got an unexpected keyword argument '%U'",
-            function_name, key);
-        Py_DECREF(key);
-    }
+    if (likely(key)) {
+        PyErr_Format(PyExc_TypeError,
+            "%s() got an unexpected keyword argument '%U'",
+            function_name, key);
+        Py_DECREF(key);
+    }
+}
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    if (!__Pyx_IgnoreException(PyExc_Exception)) {
+        return NULL; // BaseException
+    }
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) {
+        if (!__Pyx_IgnoreException(PyExc_Exception)) {
+            return NULL; // BaseException
+        }
+    }
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyObject *exc = PyErr_Occurred();
+    if (unlikely(exc) && !__Pyx_IgnoreGivenException(exc, PyExc_Exception)) {
+        return NULL; // BaseException
+    }
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyLongBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_Fallback___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, int inplace) {
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#if CYTHON_USE_PYLONG_INTERNALS
+static PyObject* __Pyx_Unpacked___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    long a;
+    const PY_LONG_LONG llb = intval;
+    PY_LONG_LONG lla;
+    if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+        return __Pyx_NewRef(op2);
+    }
+    const int is_positive = __Pyx_PyLong_IsPos(op1);
+    const digit* digits = __Pyx_PyLong_Digits(op1);
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(op1);
+    if (likely(size == 1)) {
+        a = (long) digits[0];
+        if (!is_positive) a *= -1;
+    } else {
+        if (size == 2 && 8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+            a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+            if (!is_positive) a *= -1;
+            goto calculate_long;
+        } else if (size == 2 && 8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+            lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+            if (!is_positive) lla *= -1;
+            goto calculate_long_long;
+        } else
+        if (size == 3 && 8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+            a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+            if (!is_positive) a *= -1;
+            goto calculate_long;
+        } else if (size == 3 && 8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+            lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+            if (!is_positive) lla *= -1;
+            goto calculate_long_long;
+        } else
+        if (size == 4 && 8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+            a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+            if (!is_positive) a *= -1;
+            goto calculate_long;
+        } else if (size == 4 && 8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+            lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+            if (!is_positive) lla *= -1;
+            goto calculate_long_long;
+        } else
+        {}
+        return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    calculate_long:
+        {
+            long x;
+            x = a + b;
+            return PyLong_FromLong(x);
+        }
+    calculate_long_long:
+        {
+            PY_LONG_LONG llx;
+            llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+        }
+    
+}
+#endif
+static PyObject* __Pyx_Float___Pyx_PyLong_AddObjC(PyObject *float_val, long intval, int zerodivision_check) {
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    double a = __Pyx_PyFloat_AS_DOUBLE(float_val);
+        double result;
+        
+        result = ((double)a) + (double)b;
+        return PyFloat_FromDouble(result);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        return __Pyx_Unpacked___Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check);
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        return __Pyx_Float___Pyx_PyLong_AddObjC(op1, intval, zerodivision_check);
+    }
+    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
+}
+#endif
+
+/* ArgTypeTestError (used by ArgTypeTest) */
+static void __Pyx_ArgTypeError(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    __Pyx_TypeName type_name;
+    __Pyx_TypeName obj_type_name;
+    PyObject *extra_info = __pyx_mstate_global->__pyx_empty_unicode;
+    int from_annotation_subclass = 0;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return;
+    } else if (exact == 2) {
+        if (__Pyx_TypeCheck(obj, type)) {
+            from_annotation_subclass = 1;
+            extra_info = __pyx_mstate_global->__pyx_kp_u_Note_that_Cython_is_deliberately;
+        }
+    }
+    type_name = __Pyx_PyType_GetFullyQualifiedName(type);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name)) return;
+    #endif
+    obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!obj_type_name)) goto obj_type_name_failed;
+    #endif
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected " __Pyx_FMT_TYPENAME ", got " __Pyx_FMT_TYPENAME ")"
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+        "%s%U"
+#endif
+        , name, type_name, obj_type_name
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+        , (from_annotation_subclass ? ". " : ""), extra_info
+#endif
+        );
+#if __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    if (exact == 2 && from_annotation_subclass) {
+        PyObject *res;
+        PyObject *vargs[2];
+        vargs[0] = PyErr_GetRaisedException();
+        vargs[1] = extra_info;
+        res = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_kp_u_add_note, vargs, 2, NULL);
+        Py_XDECREF(res);
+        PyErr_SetRaisedException(vargs[0]);
+    }
+#endif
+    __Pyx_DECREF_TypeName(obj_type_name);
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+obj_type_name_failed:
+#endif
+    __Pyx_DECREF_TypeName(type_name);
+    return;
+}
+
+/* ArgTypeTest */
+static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed, const char *name, int exact) {
+    if (likely(Py_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None))))
+        return 1;
+    if (!exact && likely(type) && likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    __Pyx_ArgTypeError(obj, type, name, exact);
+    return 0;
+}
+
+/* FormatTypeName (used by RaiseErrorWithObjectTypes) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static __Pyx_TypeName
+__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
+{
+    PyObject *module = NULL, *name = NULL, *result = NULL;
+    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_qualname);
+    #else
+    name = PyType_GetQualName(tp);
+    #endif
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
+    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_module);
+    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
+    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
+        result = name;
+        name = NULL;
+        goto done;
+    }
+    result = PyUnicode_FromFormat("%U.%U", module, name);
+    if (unlikely(result == NULL)) goto bad;
+  done:
+    Py_XDECREF(name);
+    Py_XDECREF(module);
+    return result;
+  bad:
+    PyErr_Clear();
+    if (name) {
+        result = name;
+        name = NULL;
+    } else {
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u_);
+    }
+    goto done;
+}
+#endif
+
+/* RaiseErrorWithObjectTypes */
+static void __Pyx_RaiseErrorWithTypes1(PyObject* exc_type, const char *message, const char *arg, PyTypeObject *type_obj1, PyTypeObject *type_obj2) {
+    __Pyx_TypeName type_name1 = __Pyx_PyType_GetFullyQualifiedName(type_obj1);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name1)) return;
+    #endif
+    __Pyx_TypeName type_name2 = __Pyx_PyType_GetFullyQualifiedName(type_obj2);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name2)) goto type2_failed;
+    #endif
+    PyErr_Format(exc_type, message, arg, type_name1, type_name2);
+    __Pyx_DECREF_TypeName(type_name2);
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+type2_failed:
+#endif
+    __Pyx_DECREF_TypeName(type_name1);
+}
+
+/* CallNextTpDealloc */
+static void __Pyx_call_next_tp_dealloc(PyObject* obj, destructor current_tp_dealloc) {
+    PyTypeObject* type = Py_TYPE(obj);
+    destructor tp_dealloc = NULL;
+    while (type && __Pyx_PyType_GetSlot(type, tp_dealloc, destructor) != current_tp_dealloc)
+        type = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+    while (type && (tp_dealloc = __Pyx_PyType_GetSlot(type, tp_dealloc, destructor)) == current_tp_dealloc)
+        type = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+    if (type)
+        tp_dealloc(obj);
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_3_3_0
+#define __PYX_HAVE_RT_ImportType_3_3_0
+static PyTypeObject *__Pyx_ImportType_3_3_0(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_3_0 check_size)
+{
+    PyObject *result = 0;
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#if defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API)
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#if !( defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API) )
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    if (size == 0) {
+        return (PyTypeObject *)result;
+    }
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize+itemsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_3_3_0 &&
+            ((size_t)basicsize > size || (size_t)(basicsize + itemsize) < size)) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd-%zd from PyObject",
+            module_name, class_name, size, basicsize, basicsize+itemsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_3_3_0 && (size_t)basicsize > size) {
+        if (PyErr_WarnFormat(NULL, 0,
+                "%.200s.%.200s size changed, may indicate binary incompatibility. "
+                "Expected %zd from C header, got %zd from PyObject",
+                module_name, class_name, size, basicsize) < 0) {
+            goto bad;
+        }
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* GetVTable */
+static int __Pyx_GetVtable(PyTypeObject *type, void** table) {
+    void* ptr;
+    *table = NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#endif
+    if (!ob)
+        goto no_attr;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    *table = ptr;
+    return 1;
+no_attr:
+    if (PyErr_ExceptionMatches(CYTHON_COMPILING_IN_LIMITED_API ? PyExc_AttributeError : PyExc_KeyError)) {
+        return 0;
+    }
+    Py_XDECREF(ob);
+    return -1;
 }
 
-/* AllocateExtensionType */
-static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final) {
-    if (is_final || likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
-        allocfunc alloc_func = __Pyx_PyType_GetSlot(t, tp_alloc, allocfunc);
-        return alloc_func(t, 0);
-    } else {
-        newfunc tp_new = __Pyx_PyType_TryGetSlot(&PyBaseObject_Type, tp_new, newfunc);
-    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
-        if (!tp_new) {
-            PyObject *new_str = PyUnicode_FromString("__new__");
-            if (likely(new_str)) {
-                PyObject *o = PyObject_CallMethodObjArgs((PyObject *)&PyBaseObject_Type, new_str, t, NULL);
-                Py_DECREF(new_str);
-                return o;
-            } else
-                return NULL;
-        } else
-    #endif
-        return tp_new(t, __pyx_mstate_global->__pyx_empty_tuple, 0);
-    }
+/* PyObjectCallMethod0 (used by PyType_Ready) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+#if CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || !CYTHON_COMPILING_IN_LIMITED_API)
+    return PyObject_VectorcallMethod(method_name, &obj, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_CallMethodObjArgs(obj, method_name, NULL);
+#else
+    return PyObject_CallMethodNoArgs(obj, method_name);
+#endif
 }
 
-/* LimitedApiGetTypeDict (used by SetItemOnTypeDict) */
-#if CYTHON_COMPILING_IN_LIMITED_API
-static Py_ssize_t __Pyx_GetTypeDictOffset(void) {
+/* GetTypeDictOffset (used by ValidateBasesTuple) */
+#if !CYTHON_USE_TYPE_SLOTS
+CYTHON_UNUSED static Py_ssize_t __Pyx_GetTypeDictOffset(PyObject *tp, int require_cython_valid_result) {
     PyObject *tp_dictoffset_o;
     Py_ssize_t tp_dictoffset;
-    tp_dictoffset_o = PyObject_GetAttrString((PyObject*)(&PyType_Type), "__dictoffset__");
+    tp_dictoffset_o = PyObject_GetAttrString(tp, "__dictoffset__");
     if (unlikely(!tp_dictoffset_o)) return -1;
     tp_dictoffset = PyLong_AsSsize_t(tp_dictoffset_o);
     Py_DECREF(tp_dictoffset_o);
-    if (unlikely(tp_dictoffset == 0)) {
+    if (unlikely(require_cython_valid_result && tp_dictoffset == 0)) {
         PyErr_SetString(
             PyExc_TypeError,
             "'type' doesn't have a dictoffset");
         return -1;
-    } else if (unlikely(tp_dictoffset < 0)) {
+    } else if (unlikely(require_cython_valid_result && tp_dictoffset < 0)) {
         PyErr_SetString(
             PyExc_TypeError,
             "'type' has an unexpected negative dictoffset. "
@@ -11310,266 +14454,31 @@ static Py_ssize_t __Pyx_GetTypeDictOffset(void) {
     }
     return tp_dictoffset;
 }
-static PyObject *__Pyx_GetTypeDict(PyTypeObject *tp) {
-    static Py_ssize_t tp_dictoffset = 0;
-    if (unlikely(tp_dictoffset == 0)) {
-        tp_dictoffset = __Pyx_GetTypeDictOffset();
-        if (unlikely(tp_dictoffset == -1 && PyErr_Occurred())) {
-            tp_dictoffset = 0; // try again next time?
-            return NULL;
-        }
-    }
-    return *(PyObject**)((char*)tp + tp_dictoffset);
-}
-#endif
-
-/* SetItemOnTypeDict (used by FixUpExtensionType) */
-static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v) {
-    int result;
-    PyObject *tp_dict;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    tp_dict = __Pyx_GetTypeDict(tp);
-    if (unlikely(!tp_dict)) return -1;
-#else
-    tp_dict = tp->tp_dict;
 #endif
-    result = PyDict_SetItem(tp_dict, k, v);
-    if (likely(!result)) {
-        PyType_Modified(tp);
-        if (unlikely(PyObject_HasAttr(v, __pyx_mstate_global->__pyx_n_u_set_name))) {
-            PyObject *setNameResult = PyObject_CallMethodObjArgs(v, __pyx_mstate_global->__pyx_n_u_set_name,  (PyObject *) tp, k, NULL);
-            if (!setNameResult) return -1;
-            Py_DECREF(setNameResult);
-        }
-    }
-    return result;
-}
-
-/* FixUpExtensionType */
-static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
-#if __PYX_LIMITED_VERSION_HEX > 0x030900B1
-    CYTHON_UNUSED_VAR(spec);
-    CYTHON_UNUSED_VAR(type);
-    CYTHON_UNUSED_VAR(__Pyx__SetItemOnTypeDict);
-#else
-    const PyType_Slot *slot = spec->slots;
-    int changed = 0;
-#if !CYTHON_COMPILING_IN_LIMITED_API
-    while (slot && slot->slot && slot->slot != Py_tp_members)
-        slot++;
-    if (slot && slot->slot == Py_tp_members) {
-#if !CYTHON_COMPILING_IN_CPYTHON
-        const
-#endif  // !CYTHON_COMPILING_IN_CPYTHON)
-            PyMemberDef *memb = (PyMemberDef*) slot->pfunc;
-        while (memb && memb->name) {
-            if (memb->name[0] == '_' && memb->name[1] == '_') {
-                if (strcmp(memb->name, "__weaklistoffset__") == 0) {
-                    assert(memb->type == T_PYSSIZET);
-                    assert(memb->flags == READONLY);
-                    type->tp_weaklistoffset = memb->offset;
-                    changed = 1;
-                }
-                else if (strcmp(memb->name, "__dictoffset__") == 0) {
-                    assert(memb->type == T_PYSSIZET);
-                    assert(memb->flags == READONLY);
-                    type->tp_dictoffset = memb->offset;
-                    changed = 1;
-                }
-#if CYTHON_METH_FASTCALL
-                else if (strcmp(memb->name, "__vectorcalloffset__") == 0) {
-                    assert(memb->type == T_PYSSIZET);
-                    assert(memb->flags == READONLY);
-                    type->tp_vectorcall_offset = memb->offset;
-                    changed = 1;
-                }
-#endif  // CYTHON_METH_FASTCALL
-#if !CYTHON_COMPILING_IN_PYPY
-                else if (strcmp(memb->name, "__module__") == 0) {
-                    PyObject *descr;
-                    assert(memb->type == T_OBJECT);
-                    assert(memb->flags == 0 || memb->flags == READONLY);
-                    descr = PyDescr_NewMember(type, memb);
-                    if (unlikely(!descr))
-                        return -1;
-                    int set_item_result = PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr);
-                    Py_DECREF(descr);
-                    if (unlikely(set_item_result < 0)) {
-                        return -1;
-                    }
-                    changed = 1;
-                }
-#endif  // !CYTHON_COMPILING_IN_PYPY
-            }
-            memb++;
-        }
-    }
-#endif  // !CYTHON_COMPILING_IN_LIMITED_API
-#if !CYTHON_COMPILING_IN_PYPY
-    slot = spec->slots;
-    while (slot && slot->slot && slot->slot != Py_tp_getset)
-        slot++;
-    if (slot && slot->slot == Py_tp_getset) {
-        PyGetSetDef *getset = (PyGetSetDef*) slot->pfunc;
-        while (getset && getset->name) {
-            if (getset->name[0] == '_' && getset->name[1] == '_' && strcmp(getset->name, "__module__") == 0) {
-                PyObject *descr = PyDescr_NewGetSet(type, getset);
-                if (unlikely(!descr))
-                    return -1;
-                #if CYTHON_COMPILING_IN_LIMITED_API
-                PyObject *pyname = PyUnicode_FromString(getset->name);
-                if (unlikely(!pyname)) {
-                    Py_DECREF(descr);
-                    return -1;
-                }
-                int set_item_result = __Pyx_SetItemOnTypeDict(type, pyname, descr);
-                Py_DECREF(pyname);
-                #else
-                CYTHON_UNUSED_VAR(__Pyx__SetItemOnTypeDict);
-                int set_item_result = PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr);
-                #endif
-                Py_DECREF(descr);
-                if (unlikely(set_item_result < 0)) {
-                    return -1;
-                }
-                changed = 1;
-            }
-            ++getset;
-        }
-    }
-#else
-    CYTHON_UNUSED_VAR(__Pyx__SetItemOnTypeDict);
-#endif  // !CYTHON_COMPILING_IN_PYPY
-    if (changed)
-        PyType_Modified(type);
-#endif  // PY_VERSION_HEX > 0x030900B1
-    return 0;
-}
-
-/* PyObjectCallNoArg (used by PyObjectCallMethod0) */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-    PyObject *arg[2] = {NULL, NULL};
-    return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
-}
 
-/* PyObjectGetMethod (used by PyObjectCallMethod0) */
-#if !(CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000)))
-static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
-    PyObject *attr;
-#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
-    __Pyx_TypeName type_name;
-    PyTypeObject *tp = Py_TYPE(obj);
-    PyObject *descr;
-    descrgetfunc f = NULL;
-    PyObject **dictptr, *dict;
-    int meth_found = 0;
-    assert (*method == NULL);
-    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
-        attr = __Pyx_PyObject_GetAttrStr(obj, name);
-        goto try_unpack;
-    }
-    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
-        return 0;
-    }
-    descr = _PyType_Lookup(tp, name);
-    if (likely(descr != NULL)) {
-        Py_INCREF(descr);
-#if defined(Py_TPFLAGS_METHOD_DESCRIPTOR) && Py_TPFLAGS_METHOD_DESCRIPTOR
-        if (__Pyx_PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_METHOD_DESCRIPTOR))
-#else
-        #ifdef __Pyx_CyFunction_USED
-        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
-        #else
-        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type)))
-        #endif
-#endif
-        {
-            meth_found = 1;
-        } else {
-            f = Py_TYPE(descr)->tp_descr_get;
-            if (f != NULL && PyDescr_IsData(descr)) {
-                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
-                Py_DECREF(descr);
-                goto try_unpack;
-            }
-        }
-    }
-    dictptr = _PyObject_GetDictPtr(obj);
-    if (dictptr != NULL && (dict = *dictptr) != NULL) {
-        Py_INCREF(dict);
-        attr = __Pyx_PyDict_GetItemStr(dict, name);
-        if (attr != NULL) {
-            Py_INCREF(attr);
-            Py_DECREF(dict);
-            Py_XDECREF(descr);
-            goto try_unpack;
-        }
-        Py_DECREF(dict);
-    }
-    if (meth_found) {
-        *method = descr;
-        return 1;
-    }
-    if (f != NULL) {
-        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
-        Py_DECREF(descr);
-        goto try_unpack;
-    }
-    if (likely(descr != NULL)) {
-        *method = descr;
-        return 0;
-    }
-    type_name = __Pyx_PyType_GetFullyQualifiedName(tp);
-    PyErr_Format(PyExc_AttributeError,
-                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%U'",
-                 type_name, name);
+/* RaiseErrorWithObjectType (used by ValidateBasesTuple) */
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetFullyQualifiedName(type_obj);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name)) return;
+    #endif
+    PyErr_Format(exc_type, message, type_name);
     __Pyx_DECREF_TypeName(type_name);
-    return 0;
-#else
-    attr = __Pyx_PyObject_GetAttrStr(obj, name);
-    goto try_unpack;
-#endif
-try_unpack:
-#if CYTHON_UNPACK_METHODS
-    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
-        PyObject *function = PyMethod_GET_FUNCTION(attr);
-        Py_INCREF(function);
-        Py_DECREF(attr);
-        *method = function;
-        return 1;
-    }
-#endif
-    *method = attr;
-    return 0;
 }
-#endif
 
-/* PyObjectCallMethod0 (used by PyType_Ready) */
-static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
-#if CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000))
-    PyObject *args[1] = {obj};
-    (void) __Pyx_PyObject_CallOneArg;
-    (void) __Pyx_PyObject_CallNoArg;
-    return PyObject_VectorcallMethod(method_name, args, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
-#else
-    PyObject *method = NULL, *result = NULL;
-    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
-    if (likely(is_method)) {
-        result = __Pyx_PyObject_CallOneArg(method, obj);
-        Py_DECREF(method);
-        return result;
-    }
-    if (unlikely(!method)) goto bad;
-    result = __Pyx_PyObject_CallNoArg(method);
-    Py_DECREF(method);
-bad:
-    return result;
-#endif
+/* RaiseErrorWithObjectType1 (used by ValidateBasesTuple) */
+static void __Pyx_RaiseErrorWithType1(PyObject* exc_type, const char* message, const char *arg, PyTypeObject *type_obj) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetFullyQualifiedName(type_obj);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name)) return;
+    #endif
+    PyErr_Format(exc_type, message, arg, type_name);
+    __Pyx_DECREF_TypeName(type_name);
 }
 
 /* ValidateBasesTuple (used by PyType_Ready) */
 #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
-static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases) {
+static int __Pyx_validate_bases_tuple(const char *type_name, int has_dictoffset, PyObject *bases) {
     Py_ssize_t i, n;
 #if CYTHON_ASSUME_SAFE_SIZE
     n = PyTuple_GET_SIZE(bases);
@@ -11577,6 +14486,30 @@ static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffs
     n = PyTuple_Size(bases);
     if (unlikely(n < 0)) return -1;
 #endif
+    if (!has_dictoffset) {
+        PyObject *b;
+#if CYTHON_AVOID_BORROWED_REFS
+        b = PySequence_GetItem(bases, 0);
+        if (!b) return -1;
+#elif CYTHON_ASSUME_SAFE_MACROS
+        b = PyTuple_GET_ITEM(bases, 0);
+#else
+        b = PyTuple_GetItem(bases, 0);
+        if (!b) return -1;
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+        has_dictoffset = ((PyTypeObject*)b)->tp_dictoffset != 0;
+#else
+        Py_ssize_t dictoffset = __Pyx_GetTypeDictOffset(b, 0);
+        has_dictoffset = dictoffset != 0;
+#endif
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(b);
+#endif
+#if !CYTHON_USE_TYPE_SLOTS
+        if (dictoffset == -1 && PyErr_Occurred()) return -1;
+#endif
+    }
     for (i = 1; i < n; i++)
     {
         PyTypeObject *b;
@@ -11592,38 +14525,30 @@ static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffs
         b = (PyTypeObject*) b0;
         if (!__Pyx_PyType_HasFeature(b, Py_TPFLAGS_HEAPTYPE))
         {
-            __Pyx_TypeName b_name = __Pyx_PyType_GetFullyQualifiedName(b);
-            PyErr_Format(PyExc_TypeError,
-                "base class '" __Pyx_FMT_TYPENAME "' is not a heap type", b_name);
-            __Pyx_DECREF_TypeName(b_name);
+            __Pyx_RaiseErrorWithType(
+                PyExc_TypeError, "base class '" __Pyx_FMT_TYPENAME "' is not a heap type", b);
 #if CYTHON_AVOID_BORROWED_REFS
             Py_DECREF(b0);
 #endif
             return -1;
         }
-        if (dictoffset == 0)
+        if (!has_dictoffset)
         {
             Py_ssize_t b_dictoffset = 0;
 #if CYTHON_USE_TYPE_SLOTS
             b_dictoffset = b->tp_dictoffset;
 #else
-            PyObject *py_b_dictoffset = PyObject_GetAttrString((PyObject*)b, "__dictoffset__");
-            if (!py_b_dictoffset) goto dictoffset_return;
-            b_dictoffset = PyLong_AsSsize_t(py_b_dictoffset);
-            Py_DECREF(py_b_dictoffset);
+            b_dictoffset = __Pyx_GetTypeDictOffset((PyObject*)b, 0);
             if (b_dictoffset == -1 && PyErr_Occurred()) goto dictoffset_return;
 #endif
             if (b_dictoffset) {
-                {
-                    __Pyx_TypeName b_name = __Pyx_PyType_GetFullyQualifiedName(b);
-                    PyErr_Format(PyExc_TypeError,
-                        "extension type '%.200s' has no __dict__ slot, "
-                        "but base type '" __Pyx_FMT_TYPENAME "' has: "
-                        "either add 'cdef dict __dict__' to the extension type "
-                        "or add '__slots__ = [...]' to the base type",
-                        type_name, b_name);
-                    __Pyx_DECREF_TypeName(b_name);
-                }
+                __Pyx_RaiseErrorWithType1(
+                    PyExc_TypeError,
+                    "extension type '%.200s' has no __dict__ slot, "
+                    "but base type '" __Pyx_FMT_TYPENAME "' has: "
+                    "either add 'cdef dict __dict__' to the extension type "
+                    "or add '__slots__ = [...]' to the base type",
+                    type_name, b);
 #if !CYTHON_USE_TYPE_SLOTS
               dictoffset_return:
 #endif
@@ -11653,7 +14578,7 @@ CYTHON_UNUSED static int __Pyx_PyType_HasMultipleInheritance(PyTypeObject *t) {
     return 0;
 }
 static int __Pyx_PyType_Ready(PyTypeObject *t) {
-#if CYTHON_USE_TYPE_SPECS || !CYTHON_COMPILING_IN_CPYTHON || defined(PYSTON_MAJOR_VERSION)
+#if CYTHON_USE_TYPE_SPECS || !CYTHON_COMPILING_IN_CPYTHON
     (void)__Pyx_PyObject_CallMethod0;
 #if CYTHON_USE_TYPE_SPECS
     (void)__Pyx_validate_bases_tuple;
@@ -11665,9 +14590,8 @@ static int __Pyx_PyType_Ready(PyTypeObject *t) {
         return PyType_Ready(t);
     }
     PyObject *bases = __Pyx_PyType_GetSlot(t, tp_bases, PyObject*);
-    if (bases && unlikely(__Pyx_validate_bases_tuple(t->tp_name, t->tp_dictoffset, bases) == -1))
+    if (bases && unlikely(__Pyx_validate_bases_tuple(t->tp_name, t->tp_dictoffset != 0, bases) == -1))
         return -1;
-#if !defined(PYSTON_MAJOR_VERSION)
     {
         int gc_was_enabled;
     #if PY_VERSION_HEX >= 0x030A00b1
@@ -11705,11 +14629,7 @@ static int __Pyx_PyType_Ready(PyTypeObject *t) {
 #if PY_VERSION_HEX >= 0x030A0000
         t->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
 #endif
-#else
-        (void)__Pyx_PyObject_CallMethod0;
-#endif
-    r = PyType_Ready(t);
-#if !defined(PYSTON_MAJOR_VERSION)
+        r = PyType_Ready(t);
         t->tp_flags &= ~Py_TPFLAGS_HEAPTYPE;
     #if PY_VERSION_HEX >= 0x030A00b1
         if (gc_was_enabled)
@@ -11732,56 +14652,15 @@ static int __Pyx_PyType_Ready(PyTypeObject *t) {
         Py_DECREF(gc);
     #endif
     }
-#endif
     return r;
 #endif
 }
 
-/* SetVTable */
-static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-    if (unlikely(!ob))
-        goto bad;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
-#else
-    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
-#endif
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
-}
-
-/* GetVTable (used by MergeVTables) */
-static void* __Pyx_GetVtable(PyTypeObject *type) {
-    void* ptr;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
-#else
-    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
-#endif
-    if (!ob)
-        goto bad;
-    ptr = PyCapsule_GetPointer(ob, 0);
-    if (!ptr && !PyErr_Occurred())
-        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
-    Py_DECREF(ob);
-    return ptr;
-bad:
-    Py_XDECREF(ob);
-    return NULL;
-}
-
-/* MergeVTables */
+/* MergeVTables (used by SetVTable) */
 static int __Pyx_MergeVtables(PyTypeObject *type) {
     int i=0;
     Py_ssize_t size;
     void** base_vtables;
-    __Pyx_TypeName tp_base_name = NULL;
-    __Pyx_TypeName base_name = NULL;
     void* unknown = (void*)-1;
     PyObject* bases = __Pyx_PyType_GetSlot(type, tp_bases, PyObject*);
     int base_depth = 0;
@@ -11789,10 +14668,14 @@ static int __Pyx_MergeVtables(PyTypeObject *type) {
         PyTypeObject* base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
         while (base) {
             base_depth += 1;
-            base = __Pyx_PyType_GetSlot(base, tp_base, PyTypeObject*);
+            base = __Pyx_PyType_TryGetSlot(base, tp_base, PyTypeObject*);
         }
     }
     base_vtables = (void**) PyMem_Malloc(sizeof(void*) * (size_t)(base_depth + 1));
+    if (unlikely(!base_vtables)) {
+        PyErr_NoMemory();
+        return -1;
+    }
     base_vtables[0] = unknown;
 #if CYTHON_COMPILING_IN_LIMITED_API
     size = PyTuple_Size(bases);
@@ -11812,146 +14695,140 @@ static int __Pyx_MergeVtables(PyTypeObject *type) {
 #else
         basei = PyTuple_GET_ITEM(bases, i);
 #endif
-        base_vtable = __Pyx_GetVtable((PyTypeObject*)basei);
+        int get_vtable_result = __Pyx_GetVtable((PyTypeObject*)basei, &base_vtable);
 #if CYTHON_AVOID_BORROWED_REFS
         Py_DECREF(basei);
 #endif
-        if (base_vtable != NULL) {
+        if (get_vtable_result != 1) {
+            if (get_vtable_result == -1) {
+                goto other_failure;
+            }
+            PyErr_Clear(); // Class doesn't have a vtable.
+        } else {
+            assert(base_vtable != NULL);
             int j;
-            PyTypeObject* base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+            PyTypeObject* base = __Pyx_PyType_TryGetSlot(type, tp_base, PyTypeObject*);
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+            if (!base) goto bad;
+#endif
             for (j = 0; j < base_depth; j++) {
                 if (base_vtables[j] == unknown) {
-                    base_vtables[j] = __Pyx_GetVtable(base);
+                    switch (__Pyx_GetVtable(base, &base_vtables[j])) {
+                        case 1:
+                            assert(base_vtables[j] == NULL);
+                            break;
+                        case 0:
+                            goto bad;
+                        case -1:
+                        default:
+                            goto other_failure;
+                    }
                     base_vtables[j + 1] = unknown;
                 }
                 if (base_vtables[j] == base_vtable) {
                     break;
-                } else if (base_vtables[j] == NULL) {
-                    goto bad;
                 }
-                base = __Pyx_PyType_GetSlot(base, tp_base, PyTypeObject*);
+                base = __Pyx_PyType_TryGetSlot(base, tp_base, PyTypeObject*);
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+                if (!base) goto bad;
+#endif
             }
         }
     }
-    PyErr_Clear();
     PyMem_Free(base_vtables);
     return 0;
 bad:
     {
-        PyTypeObject* basei = NULL;
         PyTypeObject* tp_base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
-        tp_base_name = __Pyx_PyType_GetFullyQualifiedName(tp_base);
+        PyTypeObject* basei;
 #if CYTHON_AVOID_BORROWED_REFS
         basei = (PyTypeObject*)PySequence_GetItem(bases, i);
-        if (unlikely(!basei)) goto really_bad;
+        if (unlikely(!basei)) goto other_failure;
 #elif !CYTHON_ASSUME_SAFE_MACROS
         basei = (PyTypeObject*)PyTuple_GetItem(bases, i);
-        if (unlikely(!basei)) goto really_bad;
+        if (unlikely(!basei)) goto other_failure;
 #else
         basei = (PyTypeObject*)PyTuple_GET_ITEM(bases, i);
 #endif
-        base_name = __Pyx_PyType_GetFullyQualifiedName(basei);
+    __Pyx_RaiseTypeErrorWithTypes(
+        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base, basei);
 #if CYTHON_AVOID_BORROWED_REFS
         Py_DECREF(basei);
 #endif
     }
-    PyErr_Format(PyExc_TypeError,
-        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base_name, base_name);
-#if CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
-really_bad: // bad has failed!
-#endif
-    __Pyx_DECREF_TypeName(tp_base_name);
-    __Pyx_DECREF_TypeName(base_name);
-#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
 other_failure:
-#endif
     PyMem_Free(base_vtables);
     return -1;
 }
 
-/* DelItemOnTypeDict (used by SetupReduce) */
-static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k) {
-    int result;
-    PyObject *tp_dict;
+/* SetVTable */
+static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    if (unlikely(!ob))
+        goto bad;
 #if CYTHON_COMPILING_IN_LIMITED_API
-    tp_dict = __Pyx_GetTypeDict(tp);
-    if (unlikely(!tp_dict)) return -1;
+    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
 #else
-    tp_dict = tp->tp_dict;
+    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
 #endif
-    result = PyDict_DelItem(tp_dict, k);
-    if (likely(!result)) PyType_Modified(tp);
-    return result;
+        goto bad;
+    Py_DECREF(ob);
+    return __Pyx_MergeVtables(type);
+bad:
+    Py_XDECREF(ob);
+    return -1;
 }
 
-/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    n = PyTuple_GET_SIZE(tuple);
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
-    for (i=0; i<n; i++) {
-        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
-    int result;
-    PyObject *exc_type;
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *current_exception = tstate->current_exception;
-    if (unlikely(!current_exception)) return 0;
-    exc_type = (PyObject*) Py_TYPE(current_exception);
-    if (exc_type == err) return 1;
-#else
-    exc_type = tstate->curexc_type;
-    if (exc_type == err) return 1;
-    if (unlikely(!exc_type)) return 0;
-#endif
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_INCREF(exc_type);
-    #endif
-    if (unlikely(PyTuple_Check(err))) {
-        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
-    } else {
-        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
-    }
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_DECREF(exc_type);
-    #endif
-    return result;
+/* LimitedApiGetTypeTypeDict (used by DelItemOnTypeDict) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_GetTypeTypeDict(PyTypeObject *tp) {
+    static Py_ssize_t tp_dictoffset = 0;
+    if (unlikely(tp_dictoffset == 0)) {
+        tp_dictoffset = __Pyx_GetTypeDictOffset((PyObject*)(&PyType_Type), 1);
+        if (unlikely(tp_dictoffset == -1 && PyErr_Occurred())) {
+            tp_dictoffset = 0; // try again next time?
+            return NULL;
+        }
+    }
+    return *(PyObject**)((char*)tp + tp_dictoffset);
 }
 #endif
 
-/* PyObjectGetAttrStrNoError (used by SetupReduce) */
-#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
-static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
-        __Pyx_PyErr_Clear();
-}
+/* DelItemOnTypeDict (used by SetupReduce) */
+static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k) {
+    int result;
+    PyObject *tp_dict;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    tp_dict = __Pyx_GetTypeTypeDict(tp);
+    if (unlikely(!tp_dict)) return -1;
+#else
+    tp_dict = tp->tp_dict;
 #endif
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
-    PyObject *result;
-#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    result = PyDict_DelItem(tp_dict, k);
+    if (likely(!result)) PyType_Modified(tp);
     return result;
+}
+
+/* SetItemOnTypeDict (used by SetupReduce) */
+static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v) {
+    int result;
+    PyObject *tp_dict;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    tp_dict = __Pyx_GetTypeTypeDict(tp);
+    if (unlikely(!tp_dict)) return -1;
 #else
-#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
-        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
-    }
+    tp_dict = tp->tp_dict;
 #endif
-    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
-    if (unlikely(!result)) {
-        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    result = PyDict_SetItem(tp_dict, k, v);
+    if (likely(!result)) {
+        PyType_Modified(tp);
+        if (unlikely(PyObject_HasAttr(v, __pyx_mstate_global->__pyx_n_u_set_name))) {
+            PyObject *setNameResult = PyObject_CallMethodObjArgs(v, __pyx_mstate_global->__pyx_n_u_set_name,  (PyObject *) tp, k, NULL);
+            if (!setNameResult) return -1;
+            Py_DECREF(setNameResult);
+        }
     }
     return result;
-#endif
 }
 
 /* SetupReduce */
@@ -11964,13 +14841,24 @@ static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
   } else {
       ret = -1;
   }
-  if (unlikely(ret < 0)) {
-      PyErr_Clear();
-      ret = 0;
+  if (unlikely(ret < 0) && __Pyx_IgnoreException(PyExc_Exception)) {
+      ret = 0;  // But BaseException is still propagated.
   }
   Py_XDECREF(name_attr);
   return ret;
 }
+static PyObject *__Pyx_setup_reduce_get_reduce_attribute(PyObject *type_obj, PyObject *name, int allow_not_present) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+    CYTHON_UNUSED_VAR(allow_not_present);
+    return _PyType_Lookup((PyTypeObject*)type_obj, name);
+#else
+    if (allow_not_present) {
+        return __Pyx_PyObject_GetAttrStrNoError(type_obj, name);
+    } else {
+        return __Pyx_PyObject_GetAttrStr(type_obj, name);
+    }
+#endif
+}
 static int __Pyx_setup_reduce(PyObject* type_obj) {
     int ret = 0;
     PyObject *object_reduce = NULL;
@@ -11982,41 +14870,34 @@ static int __Pyx_setup_reduce(PyObject* type_obj) {
     PyObject *setstate = NULL;
     PyObject *setstate_cython = NULL;
     PyObject *getstate = NULL;
-#if CYTHON_USE_PYTYPE_LOOKUP
-    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_getstate);
-#else
-    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_getstate);
+    getstate = __Pyx_setup_reduce_get_reduce_attribute(type_obj, __pyx_mstate_global->__pyx_n_u_getstate, 1);
     if (!getstate && PyErr_Occurred()) {
         goto __PYX_BAD;
     }
-#endif
     if (getstate) {
-#if CYTHON_USE_PYTYPE_LOOKUP
-        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_getstate);
-#else
-        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_getstate);
+        object_getstate = __Pyx_setup_reduce_get_reduce_attribute((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_getstate, 1);
         if (!object_getstate && PyErr_Occurred()) {
             goto __PYX_BAD;
         }
-#endif
         if (object_getstate != getstate) {
             goto __PYX_GOOD;
         }
     }
-#if CYTHON_USE_PYTYPE_LOOKUP
-    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
-#else
-    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
-#endif
+    object_reduce_ex = __Pyx_setup_reduce_get_reduce_attribute((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce_ex, 0);
+    if (unlikely(!object_reduce_ex)) goto __PYX_BAD;
     reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_mstate_global->__pyx_n_u_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
     if (reduce_ex == object_reduce_ex) {
-#if CYTHON_USE_PYTYPE_LOOKUP
-        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce); if (!object_reduce) goto __PYX_BAD;
-#else
-        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce); if (!object_reduce) goto __PYX_BAD;
-#endif
+        object_reduce = __Pyx_setup_reduce_get_reduce_attribute((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce, 0);
+        if (!object_reduce) goto __PYX_BAD;
         reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_mstate_global->__pyx_n_u_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
-        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_mstate_global->__pyx_n_u_reduce_cython)) {
+        int try_to_replace_reduce = (reduce == object_reduce);
+        if (!try_to_replace_reduce) {
+            try_to_replace_reduce = __Pyx_setup_reduce_is_named(reduce, __pyx_mstate_global->__pyx_n_u_reduce_cython);
+            if (unlikely(try_to_replace_reduce < 0)) {
+                goto __PYX_BAD;
+            }
+        }
+        if (try_to_replace_reduce) {
             reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_reduce_cython);
             if (likely(reduce_cython)) {
                 ret = __Pyx_SetItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
@@ -12025,8 +14906,20 @@ static int __Pyx_setup_reduce(PyObject* type_obj) {
                 goto __PYX_BAD;
             }
             setstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_setstate);
-            if (!setstate) PyErr_Clear();
-            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_mstate_global->__pyx_n_u_setstate_cython)) {
+            int try_to_replace_setstate;
+            if (!setstate) {
+                PyObject *exc = PyErr_Occurred();
+                if (exc && !__Pyx_IgnoreGivenException(exc, PyExc_Exception)) {
+                    goto __PYX_BAD;
+                }
+                try_to_replace_setstate = 1;
+            } else {
+                try_to_replace_setstate = __Pyx_setup_reduce_is_named(setstate, __pyx_mstate_global->__pyx_n_u_setstate_cython);
+                if (unlikely(try_to_replace_setstate < 0)) {
+                    goto __PYX_BAD;
+                }
+            }
+            if (try_to_replace_setstate) {
                 setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_setstate_cython);
                 if (likely(setstate_cython)) {
                     ret = __Pyx_SetItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
@@ -12041,11 +14934,10 @@ static int __Pyx_setup_reduce(PyObject* type_obj) {
     goto __PYX_GOOD;
 __PYX_BAD:
     if (!PyErr_Occurred()) {
-        __Pyx_TypeName type_obj_name =
-            __Pyx_PyType_GetFullyQualifiedName((PyTypeObject*)type_obj);
-        PyErr_Format(PyExc_RuntimeError,
-            "Unable to initialize pickling for " __Pyx_FMT_TYPENAME, type_obj_name);
-        __Pyx_DECREF_TypeName(type_obj_name);
+        __Pyx_RaiseErrorWithType(
+            PyExc_RuntimeError,
+            "Unable to initialize pickling for " __Pyx_FMT_TYPENAME,
+            (PyTypeObject*)type_obj);
     }
     ret = -1;
 __PYX_GOOD:
@@ -12082,7 +14974,7 @@ static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *ke
 }
 
 /* AddModuleRef (used by FetchSharedCythonModule) */
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3
   static PyObject *__Pyx_PyImport_AddModuleObjectRef(PyObject *name) {
       PyObject *module_dict = PyImport_GetModuleDict();
       PyObject *m;
@@ -12110,15 +15002,16 @@ static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *ke
       }
   }
   static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      if ((PY_VERSION_HEX >= 0x030E0000) &&  Py_Version >= 0x030E0100) {
+          return PyImport_AddModuleRef(name);
+      }
       PyObject *py_name = PyUnicode_FromString(name);
       if (!py_name) return NULL;
       PyObject *module = __Pyx_PyImport_AddModuleObjectRef(py_name);
       Py_DECREF(py_name);
       return module;
   }
-#elif __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
-#else
+#elif __PYX_LIMITED_VERSION_HEX < 0x030d0000
   static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
       PyObject *module = PyImport_AddModule(name);
       Py_XINCREF(module);
@@ -12131,25 +15024,7 @@ static PyObject *__Pyx_FetchSharedCythonABIModule(void) {
     return __Pyx_PyImport_AddModuleRef(__PYX_ABI_MODULE_NAME);
 }
 
-/* FetchCommonType (used by CommonTypesMetaclass) */
-#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
-static PyObject* __Pyx_PyType_FromMetaclass(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
-    PyObject *result = __Pyx_PyType_FromModuleAndSpec(module, spec, bases);
-    if (result && metaclass) {
-        PyObject *old_tp = (PyObject*)Py_TYPE(result);
-    Py_INCREF((PyObject*)metaclass);
-#if __PYX_LIMITED_VERSION_HEX >= 0x03090000
-        Py_SET_TYPE(result, metaclass);
-#else
-        result->ob_type = metaclass;
-#endif
-        Py_DECREF(old_tp);
-    }
-    return result;
-}
-#else
-#define __Pyx_PyType_FromMetaclass(me, mo, s, b) PyType_FromMetaclass(me, mo, s, b)
-#endif
+/* VerifyCachedType (used by FetchCommonType) */
 static int __Pyx_VerifyCachedType(PyObject *cached_type,
                                const char *name,
                                Py_ssize_t expected_basicsize) {
@@ -12162,18 +15037,27 @@ static int __Pyx_VerifyCachedType(PyObject *cached_type,
     if (expected_basicsize == 0) {
         return 0; // size is inherited, nothing useful to check
     }
-#if CYTHON_COMPILING_IN_LIMITED_API
-    PyObject *py_basicsize;
-    py_basicsize = PyObject_GetAttrString(cached_type, "__basicsize__");
-    if (unlikely(!py_basicsize)) return -1;
-    basicsize = PyLong_AsSsize_t(py_basicsize);
-    Py_DECREF(py_basicsize);
-    py_basicsize = NULL;
-    if (unlikely(basicsize == (Py_ssize_t)-1) && PyErr_Occurred()) return -1;
-#else
-    basicsize = ((PyTypeObject*) cached_type)->tp_basicsize;
+#if CYTHON_COMPILING_IN_LIMITED_API && CYTHON_OPAQUE_OBJECTS
+    if (expected_basicsize < 0) {
+        basicsize = PyType_GetTypeDataSize((PyTypeObject*)cached_type);
+    } else
 #endif
-    if (basicsize != expected_basicsize) {
+    {
+    #if CYTHON_COMPILING_IN_LIMITED_API
+        PyObject *py_basicsize;
+        py_basicsize = PyObject_GetAttrString(cached_type, "__basicsize__");
+        if (unlikely(!py_basicsize)) return -1;
+        basicsize = PyLong_AsSsize_t(py_basicsize);
+        Py_DECREF(py_basicsize);
+        py_basicsize = NULL;
+        if (unlikely(basicsize == (Py_ssize_t)-1) && PyErr_Occurred()) return -1;
+    #else
+        basicsize = ((PyTypeObject*) cached_type)->tp_basicsize;
+    #endif
+    }
+    if ((expected_basicsize >= 0) ?
+            (basicsize != expected_basicsize) :
+            (basicsize < -expected_basicsize)) {
         PyErr_Format(PyExc_TypeError,
             "Shared Cython type %.200s has the wrong size, try recompiling",
             name);
@@ -12181,6 +15065,23 @@ static int __Pyx_VerifyCachedType(PyObject *cached_type,
     }
     return 0;
 }
+
+/* FetchCommonType (used by CommonTypesMetaclass) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+static PyObject* __Pyx_PyType_FromMetaclass(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *result = __Pyx_PyType_FromModuleAndSpec(module, spec, bases);
+    if (result && metaclass) {
+        PyObject *old_tp = (PyObject*)Py_TYPE(result);
+        Py_INCREF((PyObject*)metaclass);
+        Py_SET_TYPE(result, metaclass);
+        Py_DECREF(old_tp);
+        PyType_Modified((PyTypeObject*)result);
+    }
+    return result;
+}
+#else
+#define __Pyx_PyType_FromMetaclass(me, mo, s, b) PyType_FromMetaclass(me, mo, s, b)
+#endif
 static PyTypeObject *__Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
     PyObject *abi_module = NULL, *cached_type = NULL, *abi_module_dict, *new_cached_type, *py_object_name;
     int get_item_ref_result;
@@ -12209,7 +15110,6 @@ static PyTypeObject *__Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyOb
         CYTHON_USE_MODULE_STATE ? module : abi_module,
         spec, bases);
     if (unlikely(!cached_type)) goto bad;
-    if (unlikely(__Pyx_fix_up_extension_type_from_spec(spec, (PyTypeObject *) cached_type) < 0)) goto bad;
     new_cached_type = __Pyx_PyDict_SetDefault(abi_module_dict, py_object_name, cached_type);
     if (unlikely(new_cached_type != cached_type)) {
         if (unlikely(!new_cached_type)) goto bad;
@@ -12286,13 +15186,76 @@ static int __pyx_CommonTypesMetaclass_init(PyObject *module) {
     return 0;
 }
 
+/* CythonFunctionPerModule (used by CythonFunctionShared) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunctionNoMethod(PyObject *func, void (*cfunc)(void)) {
+    if (__Pyx_CyFunction_Check(func)) {
+        return __Pyx_as_CyFunctionObject(func)->func_methoddef->ml_meth == (PyCFunction) cfunc;
+    } else if (PyCFunction_Check(func)) {
+        return PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if ((PyObject*)Py_TYPE(func) == __pyx_mstate_global->__Pyx_CachedMethodType) {
+        int result;
+        PyObject *newFunc = PyObject_GetAttr(func, __pyx_mstate_global->__pyx_n_u_func);
+        if (unlikely(!newFunc)) {
+            PyErr_Clear(); // It's only an optimization, so don't throw an error
+            return 0;
+        }
+        result = __Pyx__IsSameCyOrCFunctionNoMethod(newFunc, cfunc);
+        Py_DECREF(newFunc);
+        return result;
+    }
+    return __Pyx__IsSameCyOrCFunctionNoMethod(func, cfunc);
+}
+#else
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if (PyMethod_Check(func)) {
+        func = PyMethod_GET_FUNCTION(func);
+    }
+    return __Pyx_CyOrPyCFunction_Check(func) && __Pyx_CyOrPyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+}
+#endif
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    __Pyx_Py_XDECREF_SET(
+        __Pyx__CyFunction_GetClassObj(f),
+            ((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#else
+    __Pyx_Py_XDECREF_SET(
+        ((PyCMethodObject *) (f))->mm_class,
+        (PyTypeObject*)((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func, PyTypeObject *defaults_type) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults = PyObject_CallObject((PyObject*)defaults_type, NULL); // _PyObject_New(defaults_type);
+    if (unlikely(!m->defaults))
+        return NULL;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(func);
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
 /* CallTypeTraverse (used by CythonFunctionShared) */
-#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
+#if !CYTHON_USE_TYPE_SPECS
 #else
 static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg) {
-    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x03090000
-    if (__Pyx_get_runtime_version() < 0x03090000) return 0;
-    #endif
     if (!always_call) {
         PyTypeObject *base = __Pyx_PyObject_GetSlot(o, tp_base, PyTypeObject*);
         unsigned long flags = PyType_GetFlags(base);
@@ -12332,7 +15295,7 @@ static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *ty
 #endif
 
 /* PyVectorcallFastCallDict (used by CythonFunctionShared) */
-#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
+#if CYTHON_VECTORCALL
 static PyObject *__Pyx_PyVectorcall_FastCallDict_kw(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
 {
     PyObject *res = NULL;
@@ -12422,87 +15385,47 @@ static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, _
 #endif
 
 /* CythonFunctionShared (used by CythonFunction) */
-#if CYTHON_COMPILING_IN_LIMITED_API
-static CYTHON_INLINE int __Pyx__IsSameCyOrCFunctionNoMethod(PyObject *func, void (*cfunc)(void)) {
-    if (__Pyx_CyFunction_Check(func)) {
-        return PyCFunction_GetFunction(((__pyx_CyFunctionObject*)func)->func) == (PyCFunction) cfunc;
-    } else if (PyCFunction_Check(func)) {
-        return PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
-    if ((PyObject*)Py_TYPE(func) == __pyx_mstate_global->__Pyx_CachedMethodType) {
-        int result;
-        PyObject *newFunc = PyObject_GetAttr(func, __pyx_mstate_global->__pyx_n_u_func);
-        if (unlikely(!newFunc)) {
-            PyErr_Clear(); // It's only an optimization, so don't throw an error
-            return 0;
-        }
-        result = __Pyx__IsSameCyOrCFunctionNoMethod(newFunc, cfunc);
-        Py_DECREF(newFunc);
-        return result;
-    }
-    return __Pyx__IsSameCyOrCFunctionNoMethod(func, cfunc);
-}
-#else
-static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
-    if (PyMethod_Check(func)) {
-        func = PyMethod_GET_FUNCTION(func);
-    }
-    return __Pyx_CyOrPyCFunction_Check(func) && __Pyx_CyOrPyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
-}
-#endif
-static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj) {
-#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
-    __Pyx_Py_XDECREF_SET(
-        __Pyx_CyFunction_GetClassObj(f),
-            ((classobj) ? __Pyx_NewRef(classobj) : NULL));
-#else
-    __Pyx_Py_XDECREF_SET(
-        ((PyCMethodObject *) (f))->mm_class,
-        (PyTypeObject*)((classobj) ? __Pyx_NewRef(classobj) : NULL));
-#endif
-}
 static PyObject *
 __Pyx_CyFunction_get_doc_locked(__pyx_CyFunctionObject *op)
 {
     if (unlikely(op->func_doc == NULL)) {
 #if CYTHON_COMPILING_IN_LIMITED_API
-        op->func_doc = PyObject_GetAttrString(op->func, "__doc__");
-        if (unlikely(!op->func_doc)) return NULL;
+        const char *doc = op->func_methoddef->ml_doc;
 #else
-        if (((PyCFunctionObject*)op)->m_ml->ml_doc) {
-            op->func_doc = PyUnicode_FromString(((PyCFunctionObject*)op)->m_ml->ml_doc);
+        const char *doc = ((PyCFunctionObject*)op)->m_ml->ml_doc;
+#endif
+        if (doc) {
+            op->func_doc = PyUnicode_FromString(doc);
             if (unlikely(op->func_doc == NULL))
                 return NULL;
         } else {
             Py_INCREF(Py_None);
             return Py_None;
         }
-#endif
     }
     Py_INCREF(op->func_doc);
     return op->func_doc;
 }
 static PyObject *
-__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, void *closure) {
+__Pyx_CyFunction_get_doc(PyObject *op_in, void *closure) {
     PyObject *result;
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     CYTHON_UNUSED_VAR(closure);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     result = __Pyx_CyFunction_get_doc_locked(op);
     __Pyx_END_CRITICAL_SECTION();
     return result;
 }
 static int
-__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+__Pyx_CyFunction_set_doc(PyObject *op_in, PyObject *value, void *context)
 {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     CYTHON_UNUSED_VAR(context);
     if (value == NULL) {
         value = Py_None;
     }
     Py_INCREF(value);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     __Pyx_Py_XDECREF_SET(op->func_doc, value);
     __Pyx_END_CRITICAL_SECTION();
     return 0;
@@ -12512,10 +15435,11 @@ __Pyx_CyFunction_get_name_locked(__pyx_CyFunctionObject *op)
 {
     if (unlikely(op->func_name == NULL)) {
 #if CYTHON_COMPILING_IN_LIMITED_API
-        op->func_name = PyObject_GetAttrString(op->func, "__name__");
+        const char *name = op->func_methoddef->ml_name;
 #else
-        op->func_name = PyUnicode_InternFromString(((PyCFunctionObject*)op)->m_ml->ml_name);
+        const char *name = ((PyCFunctionObject*)op)->m_ml->ml_name;
 #endif
+        op->func_name = PyUnicode_InternFromString(name);
         if (unlikely(op->func_name == NULL))
             return NULL;
     }
@@ -12523,17 +15447,17 @@ __Pyx_CyFunction_get_name_locked(__pyx_CyFunctionObject *op)
     return op->func_name;
 }
 static PyObject *
-__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, void *context)
+__Pyx_CyFunction_get_name(PyObject *op, void *context)
 {
     PyObject *result = NULL;
     CYTHON_UNUSED_VAR(context);
     __Pyx_BEGIN_CRITICAL_SECTION(op);
-    result = __Pyx_CyFunction_get_name_locked(op);
+    result = __Pyx_CyFunction_get_name_locked(__Pyx_as_CyFunctionObject(op));
     __Pyx_END_CRITICAL_SECTION();
     return result;
 }
 static int
-__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+__Pyx_CyFunction_set_name(PyObject *op_in, PyObject *value, void *context)
 {
     CYTHON_UNUSED_VAR(context);
     if (unlikely(value == NULL || !PyUnicode_Check(value))) {
@@ -12541,25 +15465,27 @@ __Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, void *con
                         "__name__ must be set to a string object");
         return -1;
     }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     Py_INCREF(value);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     __Pyx_Py_XDECREF_SET(op->func_name, value);
     __Pyx_END_CRITICAL_SECTION();
     return 0;
 }
 static PyObject *
-__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, void *context)
+__Pyx_CyFunction_get_qualname(PyObject *op_in, void *context)
 {
     CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     PyObject *result;
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     Py_INCREF(op->func_qualname);
     result = op->func_qualname;
     __Pyx_END_CRITICAL_SECTION();
     return result;
 }
 static int
-__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+__Pyx_CyFunction_set_qualname(PyObject *op_in, PyObject *value, void *context)
 {
     CYTHON_UNUSED_VAR(context);
     if (unlikely(value == NULL || !PyUnicode_Check(value))) {
@@ -12567,8 +15493,9 @@ __Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, void
                         "__qualname__ must be set to a string object");
         return -1;
     }
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     Py_INCREF(value);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     __Pyx_Py_XDECREF_SET(op->func_qualname, value);
     __Pyx_END_CRITICAL_SECTION();
     return 0;
@@ -12588,14 +15515,15 @@ __Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, void *context)
 }
 #endif
 static PyObject *
-__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, void *context)
+__Pyx_CyFunction_get_globals(PyObject *op_in, void *context)
 {
     CYTHON_UNUSED_VAR(context);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     Py_INCREF(op->func_globals);
     return op->func_globals;
 }
 static PyObject *
-__Pyx_CyFunction_get_closure(__pyx_CyFunctionObject *op, void *context)
+__Pyx_CyFunction_get_closure(PyObject *op, void *context)
 {
     CYTHON_UNUSED_VAR(op);
     CYTHON_UNUSED_VAR(context);
@@ -12603,17 +15531,18 @@ __Pyx_CyFunction_get_closure(__pyx_CyFunctionObject *op, void *context)
     return Py_None;
 }
 static PyObject *
-__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, void *context)
+__Pyx_CyFunction_get_code(PyObject *op_in, void *context)
 {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     PyObject* result = (op->func_code) ? op->func_code : Py_None;
     CYTHON_UNUSED_VAR(context);
     Py_INCREF(result);
     return result;
 }
 static int
-__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op, PyObject *op_obj) {
     int result = 0;
-    PyObject *res = op->defaults_getter((PyObject *) op);
+    PyObject *res = op->defaults_getter(op_obj);
     if (unlikely(!res))
         return -1;
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
@@ -12633,7 +15562,8 @@ __Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
     return result;
 }
 static int
-__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+__Pyx_CyFunction_set_defaults(PyObject *op_in, PyObject* value, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     CYTHON_UNUSED_VAR(context);
     if (!value) {
         value = Py_None;
@@ -12645,17 +15575,18 @@ __Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, void
     PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__defaults__ will not "
                  "currently affect the values used in function calls", 1);
     Py_INCREF(value);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     __Pyx_Py_XDECREF_SET(op->defaults_tuple, value);
     __Pyx_END_CRITICAL_SECTION();
     return 0;
 }
 static PyObject *
-__Pyx_CyFunction_get_defaults_locked(__pyx_CyFunctionObject *op) {
+__Pyx_CyFunction_get_defaults_locked(PyObject *op_in) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     PyObject* result = op->defaults_tuple;
     if (unlikely(!result)) {
         if (op->defaults_getter) {
-            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            if (unlikely(__Pyx_CyFunction_init_defaults(op, op_in) < 0)) return NULL;
             result = op->defaults_tuple;
         } else {
             result = Py_None;
@@ -12665,7 +15596,7 @@ __Pyx_CyFunction_get_defaults_locked(__pyx_CyFunctionObject *op) {
     return result;
 }
 static PyObject *
-__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, void *context) {
+__Pyx_CyFunction_get_defaults(PyObject *op, void *context) {
     PyObject* result = NULL;
     CYTHON_UNUSED_VAR(context);
     __Pyx_BEGIN_CRITICAL_SECTION(op);
@@ -12674,7 +15605,8 @@ __Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, void *context) {
     return result;
 }
 static int
-__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+__Pyx_CyFunction_set_kwdefaults(PyObject *op_in, PyObject* value, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     CYTHON_UNUSED_VAR(context);
     if (!value) {
         value = Py_None;
@@ -12686,17 +15618,18 @@ __Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, voi
     PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__kwdefaults__ will not "
                  "currently affect the values used in function calls", 1);
     Py_INCREF(value);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     __Pyx_Py_XDECREF_SET(op->defaults_kwdict, value);
     __Pyx_END_CRITICAL_SECTION();
     return 0;
 }
 static PyObject *
-__Pyx_CyFunction_get_kwdefaults_locked(__pyx_CyFunctionObject *op) {
+__Pyx_CyFunction_get_kwdefaults_locked(PyObject *op_in) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     PyObject* result = op->defaults_kwdict;
     if (unlikely(!result)) {
         if (op->defaults_getter) {
-            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            if (unlikely(__Pyx_CyFunction_init_defaults(op, op_in) < 0)) return NULL;
             result = op->defaults_kwdict;
         } else {
             result = Py_None;
@@ -12706,7 +15639,7 @@ __Pyx_CyFunction_get_kwdefaults_locked(__pyx_CyFunctionObject *op) {
     return result;
 }
 static PyObject *
-__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, void *context) {
+__Pyx_CyFunction_get_kwdefaults(PyObject *op, void *context) {
     PyObject* result;
     CYTHON_UNUSED_VAR(context);
     __Pyx_BEGIN_CRITICAL_SECTION(op);
@@ -12714,8 +15647,9 @@ __Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, void *context) {
     __Pyx_END_CRITICAL_SECTION();
     return result;
 }
+static int __Pyx_CyFunction_set_annotate_in_dict_if_exists(PyObject *op_in, PyObject *value);
 static int
-__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+__Pyx_CyFunction_set_annotations(PyObject *op_in, PyObject* value, void *context) {
     CYTHON_UNUSED_VAR(context);
     if (!value || value == Py_None) {
         value = NULL;
@@ -12724,11 +15658,70 @@ __Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, vo
                         "__annotations__ must be set to a dict object");
         return -1;
     }
-    Py_XINCREF(value);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
-    __Pyx_Py_XDECREF_SET(op->func_annotations, value);
-    __Pyx_END_CRITICAL_SECTION();
-    return 0;
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_XINCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, value);
+    __Pyx_END_CRITICAL_SECTION();
+    if (unlikely(__Pyx_CyFunction_set_annotate_in_dict_if_exists(op_in, Py_None) < 0)) return -1;
+    return 0;
+}
+static int
+__Pyx_CyFunction_get_dict_if_exists(PyObject *op_in, PyObject **dict) {
+    /* Return 1 if the function dict exists, 0 otherwise.  This cannot fail:
+     * _PyObject_GetDictPtr() may clear errors internally, but never reports them. */
+#if CYTHON_COMPILING_IN_PYPY
+    *dict = PyObject_GenericGetDict(op_in, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030C0000
+    *dict = __Pyx_as_CyFunctionObject(op_in)->func_dict;
+#else
+    PyObject **dictptr = _PyObject_GetDictPtr(op_in);
+    *dict = likely(dictptr) ? *dictptr : NULL;
+#endif
+    return *dict ? 1 : 0;
+}
+static int
+__Pyx_CyFunction_get_annotate_from_dict_if_exists(PyObject *op_in, PyObject **annotate) {
+    PyObject *dict;
+    int dict_found;
+    *annotate = NULL;
+    dict_found = __Pyx_CyFunction_get_dict_if_exists(op_in, &dict);
+    if (!dict_found) return 0;
+    return __Pyx_PyDict_GetItemRef(dict, __pyx_mstate_global->__pyx_n_u_annotate, annotate);
+}
+static int
+__Pyx_CyFunction_set_annotate_in_dict_if_exists(PyObject *op_in, PyObject *value) {
+    PyObject *dict;
+    int dict_found;
+    dict_found = __Pyx_CyFunction_get_dict_if_exists(op_in, &dict);
+    if (!dict_found) return 0;
+    if (value) {
+        return PyDict_SetItem(dict, __pyx_mstate_global->__pyx_n_u_annotate, value);
+    } else {
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+        return PyDict_Pop(dict, __pyx_mstate_global->__pyx_n_u_annotate, NULL);
+#else
+        int result = PyDict_Contains(dict, __pyx_mstate_global->__pyx_n_u_annotate);
+        if (result == 1) {
+            result = PyDict_DelItem(dict, __pyx_mstate_global->__pyx_n_u_annotate);
+        }
+        return result;
+#endif
+    }
+}
+static int
+__Pyx_CyFunction_set_annotate_in_dict(PyObject *op_in, PyObject *value) {
+    PyObject *dict;
+    int result;
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    dict = __Pyx_CyFunction_get_dict(__Pyx_as_CyFunctionObject(op_in), NULL);
+#else
+    dict = PyObject_GenericGetDict(op_in, NULL);
+#endif
+    if (unlikely(!dict)) return -1;
+    result = PyDict_SetItem(dict, __pyx_mstate_global->__pyx_n_u_annotate, value);
+    Py_DECREF(dict);
+    return result;
 }
 static PyObject *
 __Pyx_CyFunction_get_annotations_locked(__pyx_CyFunctionObject *op) {
@@ -12742,14 +15735,93 @@ __Pyx_CyFunction_get_annotations_locked(__pyx_CyFunctionObject *op) {
     return result;
 }
 static PyObject *
-__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, void *context) {
-    PyObject *result;
+__Pyx_CyFunction_get_annotations(PyObject *op_in, void *context) {
+    PyObject *annotate = NULL;
+    PyObject *result = NULL;
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     CYTHON_UNUSED_VAR(context);
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
-    result = __Pyx_CyFunction_get_annotations_locked(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    result = __Pyx_XNewRef(op->func_annotations);
+    __Pyx_END_CRITICAL_SECTION();
+    if (result) return result;
+    if (unlikely(__Pyx_CyFunction_get_annotate_from_dict_if_exists(op_in, &annotate) < 0)) return NULL;
+    if (!annotate || annotate == Py_None) {
+        Py_XDECREF(annotate);
+        __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+        result = __Pyx_CyFunction_get_annotations_locked(op);
+        __Pyx_END_CRITICAL_SECTION();
+        return result;
+    }
+    PyObject *format = PyLong_FromLong(1L);  // annotationlib.Format.VALUE
+    if (likely(format)) {
+        if (!Py_EnterRecursiveCall(" cyfunction __annotations__.__get__")) {
+            result = __Pyx_PyObject_CallOneArg(annotate, format);
+            Py_LeaveRecursiveCall();
+            Py_DECREF(format);
+        }
+    }
+    Py_DECREF(annotate);
+    if (unlikely(!result)) return NULL;
+    if (unlikely(!PyDict_Check(result))) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ must return a dict");
+        Py_DECREF(result);
+        return NULL;
+    }
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, __Pyx_NewRef(result));
     __Pyx_END_CRITICAL_SECTION();
     return result;
 }
+static PyObject *__Pyx_CyFunction_annotate_impl(PyObject *self, PyObject *arg) {
+    CYTHON_UNUSED_VAR(arg);
+    if (unlikely(!self)) {
+        PyErr_SetString(PyExc_SystemError, "cython __annotate__ called without 'self' argument");
+        return NULL;
+    }
+    PyObject *result;
+    if (Py_EnterRecursiveCall(" in cyfunction annotate")) {
+        return NULL;
+    }
+    result = __Pyx_CyFunction_get_annotations(self, NULL);
+    Py_LeaveRecursiveCall();
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotate(PyObject *op_in, void *context);
+static int
+__Pyx_CyFunction_set_annotate(PyObject *op_in, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ cannot be deleted");
+        return -1;
+    }
+    if (unlikely(value != Py_None && !PyCallable_Check(value))) {
+        PyErr_SetString(PyExc_TypeError, "__annotate__ must be callable or None");
+        return -1;
+    }
+    if (unlikely(__Pyx_TypeCheck(value, &PyCFunction_Type))) {
+#if !CYTHON_ASSUME_SAFE_MACROS && !CYTHON_COMPILING_IN_PYPY
+        PyCFunction cfunction = PyCFunction_GetFunction(value);
+        if (unlikely(!cfunction)) return -1;
+        PyObject *value_self = PyCFunction_GetSelf(value);
+        if (unlikely(!value_self && PyErr_Occurred())) return -1;
+#else
+        PyCFunction cfunction = PyCFunction_GET_FUNCTION(value);
+        PyObject *value_self = PyCFunction_GET_SELF(value);
+#endif
+        if (cfunction == __Pyx_CyFunction_annotate_impl && value_self == op_in) {
+            return __Pyx_CyFunction_set_annotate_in_dict_if_exists(op_in, NULL);
+        }
+    }
+    if (value != Py_None) {
+        __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+        __Pyx_BEGIN_CRITICAL_SECTION(op_in);
+        Py_CLEAR(op->func_annotations);
+        __Pyx_END_CRITICAL_SECTION();
+    }
+    return __Pyx_CyFunction_set_annotate_in_dict(op_in, value);
+}
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
 static PyObject *
 __Pyx_CyFunction_get_is_coroutine_value(__pyx_CyFunctionObject *op) {
     int is_coroutine = op->flags & __Pyx_CYFUNCTION_COROUTINE;
@@ -12762,26 +15834,30 @@ __Pyx_CyFunction_get_is_coroutine_value(__pyx_CyFunctionObject *op) {
         PyList_SET_ITEM(fromlist, 0, marker);
 #else
         if (unlikely(PyList_SetItem(fromlist, 0, marker) < 0)) {
-            Py_DECREF(marker);
             Py_DECREF(fromlist);
             return NULL;
         }
 #endif
         module = PyImport_ImportModuleLevelObject(__pyx_mstate_global->__pyx_n_u_asyncio_coroutines, NULL, NULL, fromlist, 0);
         Py_DECREF(fromlist);
-        if (unlikely(!module)) goto ignore;
+        if (unlikely(!module)) {
+            goto ignore_or_error;
+        }
         is_coroutine_value = __Pyx_PyObject_GetAttrStr(module, marker);
         Py_DECREF(module);
         if (likely(is_coroutine_value)) {
             return is_coroutine_value;
         }
-ignore:
-        PyErr_Clear();
+ignore_or_error:
+        if (!__Pyx_IgnoreException(PyExc_Exception)) {
+            return NULL;
+        }
     }
     return __Pyx_PyBool_FromLong(is_coroutine);
 }
 static PyObject *
-__Pyx_CyFunction_get_is_coroutine(__pyx_CyFunctionObject *op, void *context) {
+__Pyx_CyFunction_get_is_coroutine(PyObject *op_in, void *context) {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     PyObject *result;
     CYTHON_UNUSED_VAR(context);
     if (op->func_is_coroutine) {
@@ -12790,7 +15866,7 @@ __Pyx_CyFunction_get_is_coroutine(__pyx_CyFunctionObject *op, void *context) {
     result = __Pyx_CyFunction_get_is_coroutine_value(op);
     if (unlikely(!result))
         return NULL;
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     if (op->func_is_coroutine) {
         Py_DECREF(result);
         result = __Pyx_NewRef(op->func_is_coroutine);
@@ -12800,7 +15876,8 @@ __Pyx_CyFunction_get_is_coroutine(__pyx_CyFunctionObject *op, void *context) {
     __Pyx_END_CRITICAL_SECTION();
     return result;
 }
-static void __Pyx_CyFunction_raise_argument_count_error(__pyx_CyFunctionObject *func, const char* message, Py_ssize_t size) {
+#endif
+static void __Pyx_CyFunction_raise_argument_count_error(PyObject *func, const char* message, Py_ssize_t size) {
 #if CYTHON_COMPILING_IN_LIMITED_API
     PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
     if (!py_name) return;
@@ -12815,7 +15892,7 @@ static void __Pyx_CyFunction_raise_argument_count_error(__pyx_CyFunctionObject *
         name, message, size);
 #endif
 }
-static void __Pyx_CyFunction_raise_type_error(__pyx_CyFunctionObject *func, const char* message) {
+static void __Pyx_CyFunction_raise_type_error(PyObject *func, const char* message) {
 #if CYTHON_COMPILING_IN_LIMITED_API
     PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
     if (!py_name) return;
@@ -12832,14 +15909,24 @@ static void __Pyx_CyFunction_raise_type_error(__pyx_CyFunctionObject *func, cons
 }
 #if CYTHON_COMPILING_IN_LIMITED_API
 static PyObject *
-__Pyx_CyFunction_get_module(__pyx_CyFunctionObject *op, void *context) {
+__Pyx_CyFunction_get_module(PyObject *op_in, void *context) {
     CYTHON_UNUSED_VAR(context);
-    return PyObject_GetAttrString(op->func, "__module__");
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    Py_INCREF(op->func_module);
+    return op->func_module;
 }
 static int
-__Pyx_CyFunction_set_module(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+__Pyx_CyFunction_set_module(PyObject *op_in, PyObject* value, void *context) {
     CYTHON_UNUSED_VAR(context);
-    return PyObject_SetAttrString(op->func, "__module__", value);
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    PyObject *old = op->func_module;
+    op->func_module = value;
+    Py_DECREF(old);
+    return 0;
 }
 #endif
 static PyGetSetDef __pyx_CyFunction_getsets[] = {
@@ -12865,7 +15952,10 @@ static PyGetSetDef __pyx_CyFunction_getsets[] = {
     {"__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
     {"__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
     {"__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {"__annotate__", (getter)__Pyx_CyFunction_get_annotate, (setter)__Pyx_CyFunction_set_annotate, 0, 0},
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
     {"_is_coroutine", (getter)__Pyx_CyFunction_get_is_coroutine, 0, 0, 0},
+#endif
 #if CYTHON_COMPILING_IN_LIMITED_API
     {"__module__", (getter)__Pyx_CyFunction_get_module, (setter)__Pyx_CyFunction_set_module, 0, 0},
 #endif
@@ -12876,16 +15966,19 @@ static PyMemberDef __pyx_CyFunction_members[] = {
     {"__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), 0, 0},
 #endif
 #if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
-    {"__dictoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_dict), READONLY, 0},
+    {"__dictoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_dict),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
 #endif
-#if CYTHON_METH_FASTCALL
-#if CYTHON_COMPILING_IN_LIMITED_API
-    {"__vectorcalloffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_vectorcall), READONLY, 0},
+#if CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+    {"__vectorcalloffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_vectorcall),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
 #else
     {"__vectorcalloffset__", T_PYSSIZET, offsetof(PyCFunctionObject, vectorcall), READONLY, 0},
 #endif
 #if CYTHON_COMPILING_IN_LIMITED_API
-    {"__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_weakreflist), READONLY, 0},
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_weakreflist),
+        __PYX_SHARED_RELATIVE_OFFSET | READONLY, 0},
 #else
     {"__weaklistoffset__", T_PYSSIZET, offsetof(PyCFunctionObject, m_weakreflist), READONLY, 0},
 #endif
@@ -12893,35 +15986,53 @@ static PyMemberDef __pyx_CyFunction_members[] = {
     {0, 0, 0,  0, 0}
 };
 static PyObject *
-__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, PyObject *args)
+__Pyx_CyFunction_reduce(PyObject *m_in, PyObject *args)
 {
     PyObject *result = NULL;
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(m_in);
     CYTHON_UNUSED_VAR(args);
-    __Pyx_BEGIN_CRITICAL_SECTION(m);
+    __Pyx_BEGIN_CRITICAL_SECTION(m_in);
     Py_INCREF(m->func_qualname);
     result = m->func_qualname;
     __Pyx_END_CRITICAL_SECTION();
     return result;
 }
 static PyMethodDef __pyx_CyFunction_methods[] = {
-    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {"__annotate_cython__", __Pyx_CyFunction_annotate_impl, METH_O,
+        "Placeholder __annotate__ function to allow 'functools.wraps' to work "
+        "on Cython functions."},
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_NOARGS, 0},
     {0, 0, 0, 0}
 };
+static PyObject *
+__Pyx_CyFunction_get_annotate(PyObject *op_in, void *context) {
+    PyObject *annotate = NULL;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(__Pyx_CyFunction_get_annotate_from_dict_if_exists(op_in, &annotate) < 0)) return NULL;
+    if (annotate) return annotate;
+    PyObject *method = PyCFunction_New(
+        &__pyx_CyFunction_methods[0],
+        op_in);
+    return method;
+}
 #if CYTHON_COMPILING_IN_LIMITED_API
 #define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
 #else
 #define __Pyx_CyFunction_weakreflist(cyfunc) (((PyCFunctionObject*)cyfunc)->m_weakreflist)
 #endif
-static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+static PyObject *__Pyx_CyFunction_Init(PyObject *op_in,
+                                       PyMethodDef *ml, int flags, PyObject* qualname,
                                        PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    __pyx_CyFunctionObject* op = __Pyx_as_CyFunctionObject(op_in);
 #if !CYTHON_COMPILING_IN_LIMITED_API
     PyCFunctionObject *cf = (PyCFunctionObject*) op;
 #endif
     if (unlikely(op == NULL))
         return NULL;
 #if CYTHON_COMPILING_IN_LIMITED_API
-    op->func = PyCFunction_NewEx(ml, (PyObject*)op, module);
-    if (unlikely(!op->func)) return NULL;
+    op->func_methoddef = ml;
+    Py_INCREF(module);
+    op->func_module = module;
 #endif
     op->flags = flags;
     __Pyx_CyFunction_weakreflist(op) = NULL;
@@ -12942,7 +16053,7 @@ static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *
     Py_INCREF(qualname);
     op->func_qualname = qualname;
     op->func_doc = NULL;
-#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+#if CYTHON_COMPILING_IN_LIMITED_API
     op->func_classobj = NULL;
 #else
     ((PyCMethodObject*)op)->mm_class = NULL;
@@ -12956,8 +16067,10 @@ static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *
     op->defaults_kwdict = NULL;
     op->defaults_getter = NULL;
     op->func_annotations = NULL;
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
     op->func_is_coroutine = NULL;
-#if CYTHON_METH_FASTCALL
+#endif
+#if CYTHON_VECTORCALL
     switch (ml->ml_flags & (METH_VARARGS | METH_FASTCALL | METH_NOARGS | METH_O | METH_KEYWORDS | METH_METHOD)) {
     case METH_NOARGS:
         __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_NOARGS;
@@ -12976,18 +16089,17 @@ static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *
         break;
     default:
         PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
-        Py_DECREF(op);
+        Py_DECREF(op_in);
         return NULL;
     }
 #endif
-    return (PyObject *) op;
+    return op_in;
 }
-static int
-__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+static int __Pyx__CyFunction_clear(__pyx_CyFunctionObject *m)
 {
     Py_CLEAR(m->func_closure);
 #if CYTHON_COMPILING_IN_LIMITED_API
-    Py_CLEAR(m->func);
+    Py_CLEAR(m->func_module);
 #else
     Py_CLEAR(((PyCFunctionObject*)m)->m_module);
 #endif
@@ -13003,45 +16115,52 @@ __Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
     Py_CLEAR(m->func_doc);
     Py_CLEAR(m->func_globals);
     Py_CLEAR(m->func_code);
-#if !CYTHON_COMPILING_IN_LIMITED_API
-#if PY_VERSION_HEX < 0x030900B1
-    Py_CLEAR(__Pyx_CyFunction_GetClassObj(m));
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_classobj);
 #else
     {
         PyObject *cls = (PyObject*) ((PyCMethodObject *) (m))->mm_class;
         ((PyCMethodObject *) (m))->mm_class = NULL;
         Py_XDECREF(cls);
     }
-#endif
 #endif
     Py_CLEAR(m->defaults_tuple);
     Py_CLEAR(m->defaults_kwdict);
     Py_CLEAR(m->func_annotations);
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
     Py_CLEAR(m->func_is_coroutine);
+#endif
     Py_CLEAR(m->defaults);
     return 0;
 }
-static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+static int
+__Pyx_CyFunction_clear(PyObject *m)
+{
+    return __Pyx__CyFunction_clear(__Pyx_as_CyFunctionObject(m));
+}
+static void __Pyx__CyFunction_dealloc(PyObject *m)
 {
-    if (__Pyx_CyFunction_weakreflist(m) != NULL)
-        PyObject_ClearWeakRefs((PyObject *) m);
-    __Pyx_CyFunction_clear(m);
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(m);
+    if (__Pyx_CyFunction_weakreflist(cyfunc) != NULL)
+        PyObject_ClearWeakRefs(m);
+    __Pyx__CyFunction_clear(cyfunc);
     __Pyx_PyHeapTypeObject_GC_Del(m);
 }
-static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+static void __Pyx_CyFunction_dealloc(PyObject *m)
 {
     PyObject_GC_UnTrack(m);
     __Pyx__CyFunction_dealloc(m);
 }
-static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+static int __Pyx_CyFunction_traverse(PyObject *m_in, visitproc visit, void *arg)
 {
+    __pyx_CyFunctionObject *m = __Pyx_as_CyFunctionObject(m_in);
     {
-        int e = __Pyx_call_type_traverse((PyObject*)m, 1, visit, arg);
+        int e = __Pyx_call_type_traverse(m_in, 1, visit, arg);
         if (e) return e;
     }
     Py_VISIT(m->func_closure);
 #if CYTHON_COMPILING_IN_LIMITED_API
-    Py_VISIT(m->func);
+    Py_VISIT(m->func_module);
 #else
     Py_VISIT(((PyCFunctionObject*)m)->m_module);
 #endif
@@ -13064,20 +16183,22 @@ static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit,
     Py_VISIT(m->func_doc);
     Py_VISIT(m->func_globals);
     __Pyx_VISIT_CONST(m->func_code);
-#if !CYTHON_COMPILING_IN_LIMITED_API
-    Py_VISIT(__Pyx_CyFunction_GetClassObj(m));
-#endif
+    Py_VISIT(__Pyx__CyFunction_GetClassObj(m));
     Py_VISIT(m->defaults_tuple);
     Py_VISIT(m->defaults_kwdict);
+    Py_VISIT(m->func_annotations);
+#if __PYX_LIMITED_VERSION_HEX < 0x030B0000
     Py_VISIT(m->func_is_coroutine);
+#endif
     Py_VISIT(m->defaults);
     return 0;
 }
 static PyObject*
-__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+__Pyx_CyFunction_repr(PyObject *op_in)
 {
+    __pyx_CyFunctionObject *op = __Pyx_as_CyFunctionObject(op_in);
     PyObject *repr;
-    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_BEGIN_CRITICAL_SECTION(op_in);
     repr = PyUnicode_FromFormat("<cyfunction %U at %p>",
                                 op->func_qualname, (void *)op);
     __Pyx_END_CRITICAL_SECTION();
@@ -13085,13 +16206,9 @@ __Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
 }
 static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
 #if CYTHON_COMPILING_IN_LIMITED_API
-    PyObject *f = ((__pyx_CyFunctionObject*)func)->func;
-    PyCFunction meth;
-    int flags;
-    meth = PyCFunction_GetFunction(f);
-    if (unlikely(!meth)) return NULL;
-    flags = PyCFunction_GetFlags(f);
-    if (unlikely(flags < 0)) return NULL;
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
+    int flags = cyfunc->func_methoddef->ml_flags;
 #else
     PyCFunctionObject* f = (PyCFunctionObject*)func;
     PyCFunction meth = f->m_ml->ml_meth;
@@ -13116,7 +16233,7 @@ static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, Py
             if (likely(size == 0))
                 return (*meth)(self, NULL);
             __Pyx_CyFunction_raise_argument_count_error(
-                (__pyx_CyFunctionObject*)func,
+                func,
                 "takes no arguments", size);
             return NULL;
         }
@@ -13143,7 +16260,7 @@ static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, Py
                 return result;
             }
             __Pyx_CyFunction_raise_argument_count_error(
-                (__pyx_CyFunctionObject*)func,
+                func,
                 "takes exactly one argument", size);
             return NULL;
         }
@@ -13153,24 +16270,18 @@ static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, Py
         return NULL;
     }
     __Pyx_CyFunction_raise_type_error(
-        (__pyx_CyFunctionObject*)func, "takes no keyword arguments");
+        func, "takes no keyword arguments");
     return NULL;
 }
 static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *self, *result;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)func)->func);
-    if (unlikely(!self) && PyErr_Occurred()) return NULL;
-#else
-    self = ((PyCFunctionObject*)func)->m_self;
-#endif
-    result = __Pyx_CyFunction_CallMethod(func, self, arg, kw);
+    PyObject *result;
+    result = __Pyx_CyFunction_CallMethod(func, func, arg, kw);
     return result;
 }
 static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
     PyObject *result;
-    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
-#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+#if CYTHON_VECTORCALL
      __pyx_vectorcallfunc vc = __Pyx_CyFunction_func_vectorcall(cyfunc);
     if (vc) {
 #if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
@@ -13209,119 +16320,104 @@ static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, P
     }
     return result;
 }
-#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
-static CYTHON_INLINE int __Pyx_CyFunction_Vectorcall_CheckArgs(__pyx_CyFunctionObject *cyfunc, Py_ssize_t nargs, PyObject *kwnames)
+#if CYTHON_VECTORCALL
+static CYTHON_INLINE int __Pyx_CyFunction_Vectorcall_CheckArgs(PyObject *func, __pyx_CyFunctionObject *cyfunc, Py_ssize_t nargs, PyObject *kwnames)
 {
     int ret = 0;
     if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
         if (unlikely(nargs < 1)) {
             __Pyx_CyFunction_raise_type_error(
-                cyfunc, "needs an argument");
+                func, "needs an argument");
             return -1;
         }
         ret = 1;
     }
     if (unlikely(kwnames) && unlikely(__Pyx_PyTuple_GET_SIZE(kwnames))) {
         __Pyx_CyFunction_raise_type_error(
-            cyfunc, "takes no keyword arguments");
+            func, "takes no keyword arguments");
         return -1;
     }
     return ret;
 }
 static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
 {
-    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
     Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
     PyObject *self;
 #if CYTHON_COMPILING_IN_LIMITED_API
-    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
     if (unlikely(!meth)) return NULL;
 #else
     PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
 #endif
-    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, kwnames)) {
     case 1:
         self = args[0];
         args += 1;
         nargs -= 1;
         break;
     case 0:
-#if CYTHON_COMPILING_IN_LIMITED_API
-        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
-        if (unlikely(!self) && PyErr_Occurred()) return NULL;
-#else
-        self = ((PyCFunctionObject*)cyfunc)->m_self;
-#endif
+        self = func;
         break;
     default:
         return NULL;
     }
     if (unlikely(nargs != 0)) {
         __Pyx_CyFunction_raise_argument_count_error(
-            cyfunc, "takes no arguments", nargs);
+            func, "takes no arguments", nargs);
         return NULL;
     }
     return meth(self, NULL);
 }
 static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
 {
-    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
     Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
     PyObject *self;
 #if CYTHON_COMPILING_IN_LIMITED_API
-    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
     if (unlikely(!meth)) return NULL;
 #else
     PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
 #endif
-    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, kwnames)) {
     case 1:
         self = args[0];
         args += 1;
         nargs -= 1;
         break;
     case 0:
-#if CYTHON_COMPILING_IN_LIMITED_API
-        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
-        if (unlikely(!self) && PyErr_Occurred()) return NULL;
-#else
-        self = ((PyCFunctionObject*)cyfunc)->m_self;
-#endif
+        self = func;
         break;
     default:
         return NULL;
     }
     if (unlikely(nargs != 1)) {
         __Pyx_CyFunction_raise_argument_count_error(
-            cyfunc, "takes exactly one argument", nargs);
+            func, "takes exactly one argument", nargs);
         return NULL;
     }
     return meth(self, args[0]);
 }
 static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
 {
-    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
     Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
     PyObject *self;
 #if CYTHON_COMPILING_IN_LIMITED_API
-    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
     if (unlikely(!meth)) return NULL;
 #else
     PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
 #endif
-    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, NULL)) {
     case 1:
         self = args[0];
         args += 1;
         nargs -= 1;
         break;
     case 0:
-#if CYTHON_COMPILING_IN_LIMITED_API
-        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
-        if (unlikely(!self) && PyErr_Occurred()) return NULL;
-#else
-        self = ((PyCFunctionObject*)cyfunc)->m_self;
-#endif
+        self = func;
         break;
     default:
         return NULL;
@@ -13330,29 +16426,24 @@ static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func,
 }
 static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
 {
-    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
-    PyTypeObject *cls = (PyTypeObject *) __Pyx_CyFunction_GetClassObj(cyfunc);
+    __pyx_CyFunctionObject *cyfunc = __Pyx_as_CyFunctionObject(func);
+    PyTypeObject *cls = (PyTypeObject *) __Pyx__CyFunction_GetClassObj(cyfunc);
     Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
     PyObject *self;
 #if CYTHON_COMPILING_IN_LIMITED_API
-    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    PyCFunction meth = cyfunc->func_methoddef->ml_meth;
     if (unlikely(!meth)) return NULL;
 #else
     PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
 #endif
-    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(func, cyfunc, nargs, NULL)) {
     case 1:
         self = args[0];
         args += 1;
         nargs -= 1;
         break;
     case 0:
-#if CYTHON_COMPILING_IN_LIMITED_API
-        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
-        if (unlikely(!self) && PyErr_Occurred()) return NULL;
-#else
-        self = ((PyCFunctionObject*)cyfunc)->m_self;
-#endif
+        self = func;
         break;
     default:
         return NULL;
@@ -13379,18 +16470,18 @@ static PyType_Slot __pyx_CyFunctionType_slots[] = {
 };
 static PyType_Spec __pyx_CyFunctionType_spec = {
     __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
-    sizeof(__pyx_CyFunctionObject),
+    __PYX_SHARED_SIZEOF(__pyx_CyFunctionObject),
     0,
 #ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
     Py_TPFLAGS_METHOD_DESCRIPTOR |
 #endif
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
 #if defined(Py_TPFLAGS_HAVE_VECTORCALL)
     Py_TPFLAGS_HAVE_VECTORCALL |
 #elif defined(_Py_TPFLAGS_HAVE_VECTORCALL)
     _Py_TPFLAGS_HAVE_VECTORCALL |
 #endif
-#endif // CYTHON_METH_FASTCALL
+#endif // CYTHON_VECTORCALL
 #if PY_VERSION_HEX >= 0x030C0000 && !CYTHON_COMPILING_IN_LIMITED_API
     Py_TPFLAGS_MANAGED_DICT |
 #endif
@@ -13407,34 +16498,13 @@ static int __pyx_CyFunction_init(PyObject *module) {
     }
     return 0;
 }
-static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func, PyTypeObject *defaults_type) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->defaults = PyObject_CallObject((PyObject*)defaults_type, NULL); // _PyObject_New(defaults_type);
-    if (unlikely(!m->defaults))
-        return NULL;
-    return m->defaults;
-}
-static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->defaults_tuple = tuple;
-    Py_INCREF(tuple);
-}
-static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->defaults_kwdict = dict;
-    Py_INCREF(dict);
-}
-static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
-    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
-    m->func_annotations = dict;
-    Py_INCREF(dict);
-}
 
 /* CythonFunction */
 static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    (void)&__Pyx_Get_CyFunction_Type;
     PyObject *op = __Pyx_CyFunction_Init(
-        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_mstate_global->__pyx_CyFunctionType),
+        PyObject_GC_New(PyObject, __pyx_mstate_global->__pyx_CyFunctionType),
         ml, flags, qualname, closure, module, globals, code
     );
     if (likely(op)) {
@@ -13442,6 +16512,11 @@ static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qual
     }
     return op;
 }
+static PyTypeObject *__Pyx_Get_CyFunction_Type(void) {
+    PyTypeObject *tp = __pyx_mstate_global->__pyx_CyFunctionType;
+    Py_INCREF((PyObject*)tp);
+    return tp;
+}
 
 /* CLineInTraceback (used by AddTraceback) */
 #if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
@@ -13622,7 +16697,6 @@ static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject
         Py_DECREF(replace);
         return result;
     }
-    PyErr_Clear();
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -13634,7 +16708,7 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
     }
-    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
+    __Pyx_PyErr_FetchException(&exc_type, &exc_value, &exc_traceback);
     code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!code_object) {
         code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
@@ -13666,7 +16740,7 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     if (unlikely(!frame) || frame == Py_None) goto bad;
     success = 1;
   bad:
-    PyErr_Restore(exc_type, exc_value, exc_traceback);
+    __Pyx_PyErr_RestoreException(exc_type, exc_value, exc_traceback);
     Py_XDECREF(code_object);
     Py_XDECREF(py_py_line);
     Py_XDECREF(py_funcname);
@@ -13759,287 +16833,433 @@ bad:
         return (target_type) value;\
     }
 
-/* CIntFromPy */
-static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+/* CIntFromPy */
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x);
+static int __Pyx_raise_neg_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (int) -1;
+}
+static int __Pyx_raise_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (int) -1;
+}
+static CYTHON_INLINE int __Pyx_PyULong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (int) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(int) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PySLong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(int) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(int) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+    } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    int val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (int) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (int) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to int");
+        return (int) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (int) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (int) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((int) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((int) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (int) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_int(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_int(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+#endif
+}
+static int __Pyx_NonPyLong___Pyx_PyLong_As_int(PyObject *x) {
+    int val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (int) -1;
+    val = __Pyx_PyLong_As_int(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_int(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_int(x);
+    }
+}
+
+/* PyObjectVectorcallKwds (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i) {
+    PyObject *key = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+#if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!key)) return -1;
+#endif
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#else
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n) {
+    PyObject *out = PyDict_New();
+    if (unlikely(!out)) return NULL;
+    for (Py_ssize_t i=0; i<n; ++i) {
+        if (unlikely(PyDict_SetItem(out, keys[i], values[i]) < 0)) {
+            Py_DECREF(out);
+            return NULL;
+        }
+    }
+    return out;
+}
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i) {
+    PyObject *key = kwnames[i];
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#endif
+
+/* PyObjectVectorcallMethodKwds (used by CIntToPy) */
+#if !CYTHON_VECTORCALL
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+    PyObject *result;
+    PyObject *obj = PyObject_GetAttr(args[0], name);
+    if (unlikely(!obj))
+        return NULL;
+    result = __Pyx_Object_VectorcallKwds(obj, args+1, nargsf-1, kwnames);
+    Py_DECREF(obj);
+    return result;
+}
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
-    if (unlikely(!PyLong_Check(x))) {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_Long(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyLong_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
     if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
-            goto raise_neg_overflow;
-        } else if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_DigitCount(x)) {
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-            }
-        }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
-        if (unlikely(Py_SIZE(x) < 0)) {
-            goto raise_neg_overflow;
-        }
-#else
-        {
-            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-            if (unlikely(result < 0))
-                return (int) -1;
-            if (unlikely(result == 1))
-                goto raise_neg_overflow;
-        }
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
-        if ((sizeof(int) <= sizeof(unsigned long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
         }
     } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-        if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_SignedDigitCount(x)) {
-                case -2:
-                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-            }
-        }
-#endif
-        if ((sizeof(int) <= sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
         }
     }
     {
-        int val;
-        int ret = -1;
-#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
-        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
-            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
-        if (unlikely(bytes_copied == -1)) {
-        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
-            goto raise_overflow;
-        } else {
-            ret = 0;
-        }
-#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
-        int one = 1; int is_little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        ret = _PyLong_AsByteArray((PyLongObject *)x,
-                                    bytes, sizeof(val),
-                                    is_little, !is_unsigned);
-#else
-        PyObject *v;
-        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
-        int bits, remaining_bits, is_negative = 0;
-        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
-        if (likely(PyLong_CheckExact(x))) {
-            v = __Pyx_NewRef(x);
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
         } else {
-            v = PyNumber_Long(x);
-            if (unlikely(!v)) return (int) -1;
-            assert(PyLong_CheckExact(v));
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
         }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(PY_LONG_LONG));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
         {
-            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
-            if (unlikely(result < 0)) {
-                Py_DECREF(v);
-                return (int) -1;
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
             }
-            is_negative = result == 1;
-        }
-        if (is_unsigned && unlikely(is_negative)) {
-            Py_DECREF(v);
-            goto raise_neg_overflow;
-        } else if (is_negative) {
-            stepval = PyNumber_Invert(v);
-            Py_DECREF(v);
-            if (unlikely(!stepval))
-                return (int) -1;
-        } else {
-            stepval = v;
-        }
-        v = NULL;
-        val = (int) 0;
-        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
-        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
-        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
-            PyObject *tmp, *digit;
-            long idigit;
-            digit = PyNumber_And(stepval, mask);
-            if (unlikely(!digit)) goto done;
-            idigit = PyLong_AsLong(digit);
-            Py_DECREF(digit);
-            if (unlikely(idigit < 0)) goto done;
-            val |= ((int) idigit) << bits;
-            tmp = PyNumber_Rshift(stepval, shift);
-            if (unlikely(!tmp)) goto done;
-            Py_DECREF(stepval); stepval = tmp;
-        }
-        Py_DECREF(shift); shift = NULL;
-        Py_DECREF(mask); mask = NULL;
-        {
-            long idigit = PyLong_AsLong(stepval);
-            if (unlikely(idigit < 0)) goto done;
-            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
-            if (unlikely(idigit >= (1L << remaining_bits)))
-                goto raise_overflow;
-            val |= ((int) idigit) << bits;
-        }
-        if (!is_unsigned) {
-            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
-                goto raise_overflow;
-            if (is_negative)
-                val = ~val;
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
         }
-        ret = 0;
-    done:
-        Py_XDECREF(shift);
-        Py_XDECREF(mask);
-        Py_XDECREF(stepval);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
 #endif
-        if (unlikely(ret))
-            return (int) -1;
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
-/* PyObjectVectorCallKwBuilder (used by CIntToPy) */
-#if CYTHON_VECTORCALL
-static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_PyObject_FastCallDict;
-    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
-    Py_INCREF(key);
-    args[n] = value;
-    return 0;
-}
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_VectorcallBuilder_AddArgStr;
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
-    }
-    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
-}
-static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    PyObject *pyKey = PyUnicode_FromString(key);
-    if (!pyKey) return -1;
-    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
-}
-#else // CYTHON_VECTORCALL
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
     }
-    return PyDict_SetItem(builder, key, value);
 }
-#endif
 
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
@@ -14083,72 +17303,43 @@ static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
                                      little, !is_unsigned);
 #else
         int one = 1; int little = (int)*(unsigned char *)&one;
-        PyObject *from_bytes, *result = NULL, *kwds = NULL;
-        PyObject *py_bytes = NULL, *order_str = NULL;
-        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
-        if (!from_bytes) return NULL;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
         py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
         if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
         order_str = PyUnicode_FromString(little ? "little" : "big");
         if (!order_str) goto limited_bad;
         {
-            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
             if (!is_unsigned) {
-                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
-                if (!kwds) goto limited_bad;
-                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
             }
-            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
         }
         limited_bad:
         Py_XDECREF(kwds);
         Py_XDECREF(order_str);
         Py_XDECREF(py_bytes);
-        Py_XDECREF(from_bytes);
+        Py_XDECREF(from_bytes_str);
         return result;
 #endif
     }
 }
 
-/* FormatTypeName */
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
-static __Pyx_TypeName
-__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
-{
-    PyObject *module = NULL, *name = NULL, *result = NULL;
-    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
-    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
-                                               __pyx_mstate_global->__pyx_n_u_qualname);
-    #else
-    name = PyType_GetQualName(tp);
-    #endif
-    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
-    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
-                                               __pyx_mstate_global->__pyx_n_u_module);
-    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
-    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
-        result = name;
-        name = NULL;
-        goto done;
-    }
-    result = PyUnicode_FromFormat("%U.%U", module, name);
-    if (unlikely(result == NULL)) goto bad;
-  done:
-    Py_XDECREF(name);
-    Py_XDECREF(module);
-    return result;
-  bad:
-    PyErr_Clear();
-    if (name) {
-        result = name;
-        name = NULL;
-    } else {
-        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u_);
-    }
-    goto done;
-}
-#endif
-
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -14169,57 +17360,313 @@ static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
         } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
             return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
-        }
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x);
+static long __Pyx_raise_neg_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (long) -1;
+}
+static long __Pyx_raise_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (long) -1;
+}
+static CYTHON_INLINE long __Pyx_PyULong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (long) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(long) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PySLong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(long) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(long) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+    } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    long val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
     } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyLong_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-        }
+        ret = 0;
     }
-    {
-        unsigned char *bytes = (unsigned char *)&value;
-#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
-        if (is_unsigned) {
-            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
-        } else {
-            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
-        }
-#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
 #else
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        PyObject *from_bytes, *result = NULL, *kwds = NULL;
-        PyObject *py_bytes = NULL, *order_str = NULL;
-        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
-        if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
-        if (!py_bytes) goto limited_bad;
-        order_str = PyUnicode_FromString(little ? "little" : "big");
-        if (!order_str) goto limited_bad;
-        {
-            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
-            if (!is_unsigned) {
-                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
-                if (!kwds) goto limited_bad;
-                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
-            }
-            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (long) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (long) -1;
         }
-        limited_bad:
-        Py_XDECREF(kwds);
-        Py_XDECREF(order_str);
-        Py_XDECREF(py_bytes);
-        Py_XDECREF(from_bytes);
-        return result;
-#endif
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to long");
+        return (long) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (long) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (long) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((long) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((long) idigit) << bits;
     }
+    if (!is_unsigned) {
+        if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (long) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
 }
-
-/* CIntFromPy */
-static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+static CYTHON_INLINE long __Pyx_PyLong___Pyx_PyLong_As_long(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
@@ -14229,331 +17676,49 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
-    if (unlikely(!PyLong_Check(x))) {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Long(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyLong_As_long(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
     if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
+        #if CYTHON_USE_PYLONG_INTERNALS
         if (unlikely(__Pyx_PyLong_IsNeg(x))) {
             goto raise_neg_overflow;
         } else if (__Pyx_PyLong_IsCompact(x)) {
             __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_DigitCount(x)) {
-                case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-            }
-        }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
-        if (unlikely(Py_SIZE(x) < 0)) {
-            goto raise_neg_overflow;
-        }
-#else
+        } else
+        #endif
         {
-            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-            if (unlikely(result < 0))
-                return (long) -1;
-            if (unlikely(result == 1))
-                goto raise_neg_overflow;
-        }
-#endif
-        if ((sizeof(long) <= sizeof(unsigned long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
-        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            return __Pyx_PyULong___Pyx_PyLong_As_long(x);
         }
     } else {
-#if CYTHON_USE_PYLONG_INTERNALS
+        #if CYTHON_USE_PYLONG_INTERNALS
         if (__Pyx_PyLong_IsCompact(x)) {
             __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_SignedDigitCount(x)) {
-                case -2:
-                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-            }
-        }
-#endif
-        if ((sizeof(long) <= sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
-        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
-        }
-    }
-    {
-        long val;
-        int ret = -1;
-#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
-        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
-            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
-        if (unlikely(bytes_copied == -1)) {
-        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
-            goto raise_overflow;
-        } else {
-            ret = 0;
-        }
-#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
-        int one = 1; int is_little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        ret = _PyLong_AsByteArray((PyLongObject *)x,
-                                    bytes, sizeof(val),
-                                    is_little, !is_unsigned);
-#else
-        PyObject *v;
-        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
-        int bits, remaining_bits, is_negative = 0;
-        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
-        if (likely(PyLong_CheckExact(x))) {
-            v = __Pyx_NewRef(x);
-        } else {
-            v = PyNumber_Long(x);
-            if (unlikely(!v)) return (long) -1;
-            assert(PyLong_CheckExact(v));
-        }
-        {
-            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
-            if (unlikely(result < 0)) {
-                Py_DECREF(v);
-                return (long) -1;
-            }
-            is_negative = result == 1;
-        }
-        if (is_unsigned && unlikely(is_negative)) {
-            Py_DECREF(v);
-            goto raise_neg_overflow;
-        } else if (is_negative) {
-            stepval = PyNumber_Invert(v);
-            Py_DECREF(v);
-            if (unlikely(!stepval))
-                return (long) -1;
-        } else {
-            stepval = v;
-        }
-        v = NULL;
-        val = (long) 0;
-        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
-        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
-        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
-            PyObject *tmp, *digit;
-            long idigit;
-            digit = PyNumber_And(stepval, mask);
-            if (unlikely(!digit)) goto done;
-            idigit = PyLong_AsLong(digit);
-            Py_DECREF(digit);
-            if (unlikely(idigit < 0)) goto done;
-            val |= ((long) idigit) << bits;
-            tmp = PyNumber_Rshift(stepval, shift);
-            if (unlikely(!tmp)) goto done;
-            Py_DECREF(stepval); stepval = tmp;
-        }
-        Py_DECREF(shift); shift = NULL;
-        Py_DECREF(mask); mask = NULL;
+        } else
+        #endif
         {
-            long idigit = PyLong_AsLong(stepval);
-            if (unlikely(idigit < 0)) goto done;
-            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
-            if (unlikely(idigit >= (1L << remaining_bits)))
-                goto raise_overflow;
-            val |= ((long) idigit) << bits;
-        }
-        if (!is_unsigned) {
-            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
-                goto raise_overflow;
-            if (is_negative)
-                val = ~val;
+            return __Pyx_PySLong___Pyx_PyLong_As_long(x);
         }
-        ret = 0;
-    done:
-        Py_XDECREF(shift);
-        Py_XDECREF(mask);
-        Py_XDECREF(stepval);
-#endif
-        if (unlikely(ret))
-            return (long) -1;
-        return val;
     }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
+#if CYTHON_USE_PYLONG_INTERNALS
 raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
-}
-
-/* FastTypeChecks */
-#if CYTHON_COMPILING_IN_CPYTHON
-static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
-    while (a) {
-        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
-        if (a == b)
-            return 1;
-    }
-    return b == &PyBaseObject_Type;
-}
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (a == b) return 1;
-    mro = a->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
-                return 1;
-        }
-        return 0;
-    }
-    return __Pyx_InBases(a, b);
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+#endif
 }
-static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (cls == a || cls == b) return 1;
-    mro = cls->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            PyObject *base = PyTuple_GET_ITEM(mro, i);
-            if (base == (PyObject *)a || base == (PyObject *)b)
-                return 1;
-        }
-        return 0;
-    }
-    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+static long __Pyx_NonPyLong___Pyx_PyLong_As_long(PyObject *x) {
+    long val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (long) -1;
+    val = __Pyx_PyLong_As_long(tmp);
+    Py_DECREF(tmp);
+    return val;
 }
-static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
-    if (exc_type1) {
-        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_long(x);
     } else {
-        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
-    }
-}
-static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    assert(PyExceptionClass_Check(exc_type));
-    n = PyTuple_GET_SIZE(tuple);
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
-    for (i=0; i<n; i++) {
-        PyObject *t = PyTuple_GET_ITEM(tuple, i);
-        if (likely(PyExceptionClass_Check(t))) {
-            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
-        } else {
-        }
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
-    if (likely(err == exc_type)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        if (likely(PyExceptionClass_Check(exc_type))) {
-            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
-        } else if (likely(PyTuple_Check(exc_type))) {
-            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
-        } else {
-        }
-    }
-    return PyErr_GivenExceptionMatches(err, exc_type);
-}
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
-    assert(PyExceptionClass_Check(exc_type1));
-    assert(PyExceptionClass_Check(exc_type2));
-    if (likely(err == exc_type1 || err == exc_type2)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+        return __Pyx_NonPyLong___Pyx_PyLong_As_long(x);
     }
-    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
 }
-#endif
 
 /* GetRuntimeVersion */
 #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
@@ -14624,8 +17789,6 @@ static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt
         PyObject *py_minor_version = NULL;
         #endif
         long minor_version = 0;
-        PyObject *type, *value, *traceback;
-        PyErr_Fetch(&type, &value, &traceback);
         #if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
         minor_version = 11;
         #else
@@ -14637,11 +17800,7 @@ static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt
         #endif
         if (!(types_module = PyImport_ImportModule("types"))) goto end;
         if (!(code_type = PyObject_GetAttrString(types_module, "CodeType"))) goto end;
-        if (minor_version <= 7) {
-            (void)p;
-            result = PyObject_CallFunction(code_type, "iiiiiOOOOOOiOOO", a, k, l, s, f, code,
-                          c, n, v, fn, name, fline, lnos, fv, cell);
-        } else if (minor_version <= 10) {
+        if (minor_version <= 10) {
             result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOiOOO", a,p, k, l, s, f, code,
                           c, n, v, fn, name, fline, lnos, fv, cell);
         } else {
@@ -14653,8 +17812,19 @@ static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt
         Py_XDECREF(code_type);
         Py_XDECREF(exception_table);
         Py_XDECREF(types_module);
-        if (type) {
-            PyErr_Restore(type, value, traceback);
+        if (!result) {
+            PyObject *exc_type, *exc_value, *exc_tb;
+            PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+            if (PyErr_WarnFormat(
+                    PyExc_RuntimeWarning, 1,
+                    "Code object creation failed in Cython module: %S\nTry recompiling with a more recent version of Cython.",
+                    exc_value ? exc_value : exc_type) == 0) {
+                result = Py_None;
+                Py_INCREF(result);
+            }
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
         }
         return result;
     }
@@ -14753,7 +17923,14 @@ done:
 }
 
 /* DecompressString */
-static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo) {
+CYTHON_UNUSED
+static CYTHON_SMALL_CODE PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo) {
+#ifdef __Pyx_DecompressString_UNUSED
+    CYTHON_UNUSED_VAR(s);
+    CYTHON_UNUSED_VAR(length);
+    CYTHON_UNUSED_VAR(algo);
+    return NULL;
+#else
     PyObject *module = NULL, *decompress, *compressed_bytes, *decompressed;
     const char* module_name = algo == 3 ? "compression.zstd" : algo == 2 ? "bz2" : "zlib";
     PyObject *methodname = PyUnicode_FromString("decompress");
@@ -14814,6 +17991,66 @@ bad:
     Py_XDECREF(module);
     Py_DECREF(methodname);
     return NULL;
+#endif
+}
+
+/* DecompressString_LZSS */
+#ifndef __Pyx_DecompressString_LZSS_UNUSED
+CYTHON_UNUSED
+static CYTHON_SMALL_CODE size_t __pyx_lzss_decompress(const uint8_t* src, uint8_t* dst, size_t dst_len) {
+    size_t pos = 0, out_pos = 0;
+    while (1) {
+        uint32_t flags = src[pos++] | 0xFF00;
+        while (flags & 0x100) {
+            if (flags & 1) {
+                dst[out_pos++] = src[pos++];
+            } else {
+                uint32_t lo = src[pos++], hi = src[pos++];
+                uint32_t end_offset_of_last_occurrence, match_length;
+                if (!(lo & 0x80)) {
+                    end_offset_of_last_occurrence = lo;
+                    match_length = hi;
+                } else if (!(hi & 0x80)) {
+                    end_offset_of_last_occurrence = 0x80 + (((hi << 2) & 0x180) | (lo & 0x7F));
+                    match_length = hi & 0x1F;
+                } else {
+                    end_offset_of_last_occurrence = 0x80 + ((hi & 0x7F) << 7 | (lo & 0x7F));
+                    match_length = src[pos++];
+                }
+                match_length += 3;
+                size_t ref_pos = out_pos - end_offset_of_last_occurrence - match_length;
+                memcpy(dst + out_pos, dst + ref_pos, match_length);
+                out_pos += match_length;
+            }
+            if (out_pos >= dst_len) return pos;
+            flags >>= 1;
+        }
+    }
+}
+#endif
+static CYTHON_SMALL_CODE PyObject *__Pyx_DecompressString_LZSS(const char *s, size_t compressed_length, size_t uncompressed_length) {
+#ifdef __Pyx_DecompressString_LZSS_UNUSED
+    CYTHON_UNUSED_VAR(s);
+    CYTHON_UNUSED_VAR(compressed_length);
+    CYTHON_UNUSED_VAR(uncompressed_length);
+    return NULL;
+#else
+    PyObject *result;
+    unsigned char *result_data;
+    size_t src_length;
+    result = PyBytes_FromStringAndSize(NULL, (Py_ssize_t) uncompressed_length);
+    if (unlikely(!result)) return NULL;
+    result_data = __Pyx_PyBytes_AsWritableUString(result);
+    if (unlikely(!result_data)) goto bad;
+    src_length = __pyx_lzss_decompress((const uint8_t*) s, result_data, uncompressed_length);
+    if (unlikely(src_length != compressed_length)) goto decompression_failed;
+    return result;
+decompression_failed:
+    PyErr_SetString(PyExc_RuntimeError, "LZSS string data decompression failed");
+bad:
+    Py_DECREF(result);
+    return NULL;
+#endif
 }
 
 #include <string.h>
@@ -14917,6 +18154,9 @@ static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
 }
 static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
     __Pyx_TypeName result_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(result));
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!result_type_name)) goto bad;
+    #endif
     if (PyLong_Check(result)) {
         if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
@@ -14924,8 +18164,7 @@ static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
                 "and may be removed in a future version of Python.",
                 result_type_name)) {
             __Pyx_DECREF_TypeName(result_type_name);
-            Py_DECREF(result);
-            return NULL;
+            goto bad;
         }
         __Pyx_DECREF_TypeName(result_type_name);
         return result;
@@ -14934,6 +18173,7 @@ static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
                  "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ")",
                  result_type_name);
     __Pyx_DECREF_TypeName(result_type_name);
+bad:
     Py_DECREF(result);
     return NULL;
 }
@@ -14965,57 +18205,50 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x) {
   }
   return res;
 }
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject *x;
-  if (likely(PyLong_CheckExact(b))) {
+static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_AsSsize_t(PyObject* b) {
     #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(__Pyx_PyLong_IsCompact(b))) {
-        return __Pyx_PyLong_CompactValue(b);
-    } else {
-      const digit* digits = __Pyx_PyLong_Digits(b);
-      const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(b);
-      switch (size) {
-         case 2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-      }
-    }
+    Py_ssize_t ival;
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(b);
+    const int is_neg = __Pyx_PyLong_IsNeg(b);
+    const digit* digits = __Pyx_PyLong_Digits(b);
+    if (size == 0) return 0;
+    #if SIZEOF_SIZE_T * 8 > 1 * PyLong_SHIFT
+    if (size == 1) {
+        ival = (Py_ssize_t) (((size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 2 * PyLong_SHIFT
+    if (size == 2) {
+        ival = (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 3 * PyLong_SHIFT
+    if (size == 3) {
+        ival = (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 4 * PyLong_SHIFT
+    if (size == 4) {
+        ival = (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
     #endif
+        return PyLong_AsSsize_t(b);
+    return is_neg ? -ival : ival;
+    #else
     return PyLong_AsSsize_t(b);
-  }
-  x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyLong_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
+    #endif
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+    if (likely(PyLong_Check(b))) {
+        return __Pyx_PyLong_AsSsize_t(b);
+    } else {
+        Py_ssize_t ival;
+        PyObject *x = PyNumber_Index(b);
+        if (unlikely(!x)) return -1;
+        ival = __Pyx_PyLong_AsSsize_t(x);
+        Py_DECREF(x);
+        return ival;
+    }
 }
 static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
   if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
@@ -15138,7 +18371,7 @@ static __Pyx_InterpreterIdAndModule* __Pyx_State_FindModuleStateLookupTableLower
     return begin;
 }
 static PyObject *__Pyx_State_FindModule(CYTHON_UNUSED void* dummy) {
-    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
     if (interpreter_id == -1) return NULL;
 #if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
     __Pyx_ModuleStateLookupData* data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
@@ -15236,7 +18469,7 @@ static void __Pyx_State_ConvertFromInterpIdAsIndex(__Pyx_ModuleStateLookupData *
     data->interpreter_id_as_index = 0;
 }
 static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
-    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
     if (interpreter_id == -1) return -1;
     int result = 0;
     __Pyx_ModuleStateLookup_Lock();
@@ -15314,7 +18547,7 @@ static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
     return result;
 }
 static int __Pyx_State_RemoveModule(CYTHON_UNUSED void* dummy) {
-    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
     if (interpreter_id == -1) return -1;
     __Pyx_ModuleStateLookup_Lock();
 #if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
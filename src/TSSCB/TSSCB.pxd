@@ -0,0 +1,45 @@
+from ..CUniaxialMaterial cimport CUniaxialMaterial, MYOPENSEES_STATS
+
+
+# 计数器编号，名称见TSSCB.pyx中的COUNTERS
+cdef enum:  # TSSCB计数器编号
+    TSSCB_STAGE_11
+    TSSCB_STAGE_12
+    TSSCB_STAGE_22
+    TSSCB_STAGE_21
+    TSSCB_FRACTURED
+    TSSCB_FRACTURING
+    TSSCB_SC_K2_REVERSE
+    TSSCB_SC_K1
+    TSSCB_SC_K2
+    TSSCB_SC_ELASTIC
+    TSSCB_N_COUNTERS
+
+
+cdef class TSSCB(CUniaxialMaterial):
+    # 材料参数（均用 double）
+    cdef double F1, k0, ugap, F2, k1, k2, beta
+    cdef bint hasHardening
+    cdef double uh, r1, r2, r3, uf
+    cdef int configType
+    cdef double up
+    # 计算变量
+    cdef double ua
+    # 历史状态变量
+    cdef int Cstage, Tstage
+    cdef double Cstrain, Tstrain, Ctangent, Ttangent
+    cdef bint Chardening, Thardening
+    cdef double Cstress1, Tstress1, Cstress2, Tstress2, Cstress3, Tstress3, Cstress4, Tstress4
+    cdef double CCDD, TCDD
+    cdef bint Cfracture, Tfracture, Cfracturing, Tfracturing
+    cdef double Cplate1, Tplate1, Cplate2, Tplate2, CfractureFore, TfractureFore
+    cdef double Crp, Trp
+    cdef int i
+    # 计数器(仅在编译时定义MYOPENSEES_STATS=1时累加)
+    cdef long long counts[TSSCB_N_COUNTERS]
+
+    cdef void _check_paras(self)
+    cdef void _init_paras(self)
+    cdef void _determineTrialState(self, double dStrain)
+    cdef double _frictionModel(self, double F0, double du, double half=*)
+    cdef double _SCModel(self, double u0, double F0, double du)
@@ -1,6 +1,6 @@
 import sys
 from typing import Literal
-from ..UniaxialMaterial import UniaxialMaterial
+from ..UniaxialMaterial import UniaxialMaterial, STATS
 
 
 class TSSCB(UniaxialMaterial):
@@ -237,6 +237,8 @@ class TSSCB(UniaxialMaterial):
             self.Tstage = 2  # If ugap is zero, always in stage-2
         if self.Tfracture:
             # SMA cable fracture completed
+            if STATS:
+                self._count('fractured')
             if self.configType == 1:
                 uy = self.F1 / self.k0
                 if self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy:
@@ -252,6 +254,8 @@ class TSSCB(UniaxialMaterial):
             return
         if self.Tfracturing:
             # SMA cable fracture starts
+            if STATS:
+                self._count('fracturing')
             if self.Cstress4 >= 0:
                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp
             else:
@@ -259,11 +263,15 @@ class TSSCB(UniaxialMaterial):
             return
         if self.Cstage == 1 and self.Tstage == 1:
             # NOTE: stage-1 -> stage-1
+            if STATS:
+                self._count('stage_1_1')
             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
             self.Tstress2 = self.Tstress1
             self.Tstress3 = self.Tstress1
         elif self.Cstage == 1 and self.Tstage == 2:
             # NOTE: stage-1 -> stage-2
+            if STATS:
+                self._count('stage_1_2')
             if dStrain > 0:
                 du1 = self.ugap - self.Cstrain  # Strain increment in stage-1
                 du2 = dStrain - du1  # Strain increment in stage-2
@@ -292,6 +300,8 @@ class TSSCB(UniaxialMaterial):
                 self.Tstress3 = -self.F1
         elif self.Cstage == 2 and self.Tstage == 2:
             # NOTE: stage-2 -> stage-2
+            if STATS:
+                self._count('stage_2_2')
             if self.Thardening:
                 self.TCDD = self.CCDD + abs(dStrain) / (self.uh - self.ugap)
             if self.Tstrain >= 0:
@@ -330,6 +340,8 @@ class TSSCB(UniaxialMaterial):
                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
         elif self.Cstage == 2 and self.Tstage == 1:
             # NOTE: stage-2 -> stage-1
+            if STATS:
+                self._count('stage_2_1')
             if dStrain < 0:
                 du1 = -(self.Cstrain - self.ugap)
                 du2 = -(self.ugap - self.Tstrain)
@@ -426,21 +438,37 @@ class TSSCB(UniaxialMaterial):
         if du > 0:
             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+                if STATS:
+                    self._count('sc_k2_reverse')
             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
                 F = self.k1 * u
+                if STATS:
+                    self._count('sc_k1')
             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
                 F = self.k2 * u + self.F2 - self.k2 * uy
+                if STATS:
+                    self._count('sc_k2')
             else:
                 F = F_
+                if STATS:
+                    self._count('sc_elastic')
         else:
             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+                if STATS:
+                    self._count('sc_k2_reverse')
             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
                 F = self.k1 * u
+                if STATS:
+                    self._count('sc_k1')
             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+                if STATS:
+                    self._count('sc_k2')
             else:
                 F = F_
+                if STATS:
+                    self._count('sc_elastic')
         if self.Tfracturing:
             return F * self.Trp
         else:
@@ -1,28 +1,17 @@
-# cython: language_level=3, boundscheck=False, wraparound=False
+# cython: language_level=3, boundscheck=False, wraparound=False, freethreading_compatible=True
 from libc.math cimport fabs
 from libc.float cimport DBL_EPSILON
+from libc.string cimport memset
 
 
-cdef class TSSCB:
-    cdef public int tag
-    # 材料参数（均用 double）
-    cdef double F1, k0, ugap, F2, k1, k2, beta
-    cdef bint hasHardening
-    cdef double uh, r1, r2, r3, uf
-    cdef int configType
-    cdef double up
-    # 计算变量
-    cdef double ua
-    # 历史状态变量
-    cdef int Cstage, Tstage
-    cdef double Cstrain, Tstrain, Ctangent, Ttangent
-    cdef bint Chardening, Thardening
-    cdef double Cstress1, Tstress1, Cstress2, Tstress2, Cstress3, Tstress3, Cstress4, Tstress4
-    cdef double CCDD, TCDD
-    cdef bint Cfracture, Tfracture, Cfracturing, Tfracturing
-    cdef double Cplate1, Tplate1, Cplate2, Tplate2, CfractureFore, TfractureFore
-    cdef double Crp, Trp
-    cdef int i
+# 计数器名称，与TSSCB.pxd中的计数器编号(TSSCB_STAGE_11 ~ TSSCB_SC_ELASTIC)一一对应
+COUNTERS = (
+    'stage_1_1', 'stage_1_2', 'stage_2_2', 'stage_2_1', 'fractured', 'fracturing',
+    'sc_k2_reverse', 'sc_k1', 'sc_k2', 'sc_elastic',
+)
+
+
+cdef class TSSCB(CUniaxialMaterial):
 
     def __cinit__(self,
                   int tag,
@@ -92,7 +81,7 @@ cdef class TSSCB:
         self.Crp = 0.0; self.Trp = 0.0
         self.i = 0
 
-    cpdef setTrialStrain(self, double strain, double strainRate=0):
+    cpdef void setTrialStrain(self, double strain, double strainRate=0):
         cdef double dStrain
         # 将试验态变量设为上一步的收敛态
         self.Tstrain = self.Cstrain
@@ -158,6 +147,8 @@ cdef class TSSCB:
             self.Tstage = 2
         # 如果已经完全断裂，直接使用摩擦模型
         if self.Tfracture:
+            if MYOPENSEES_STATS:
+                self.counts[TSSCB_FRACTURED] += 1
             if self.configType == 1:
                 uy = self.F1 / self.k0
                 if (self.Tplate2 + uy <= self.Tstrain <= self.Tplate1 - uy):
@@ -173,6 +164,8 @@ cdef class TSSCB:
             return
         # 如果正在断裂过程中
         if self.Tfracturing:
+            if MYOPENSEES_STATS:
+                self.counts[TSSCB_FRACTURING] += 1
             if self.Cstress4 >= 0.0:
                 self.Tstress4 = self.TfractureFore - (self.TfractureFore - self.F1) * self.Trp
             else:
@@ -181,11 +174,15 @@ cdef class TSSCB:
         # 各种状态转移逻辑
         if self.Cstage == 1 and self.Tstage == 1:
             # 1->1 级：摩擦模型
+            if MYOPENSEES_STATS:
+                self.counts[TSSCB_STAGE_11] += 1
             self.Tstress1 = self._frictionModel(self.Cstress3, dStrain)
             self.Tstress2 = self.Tstress1
             self.Tstress3 = self.Tstress1
         elif self.Cstage == 1 and self.Tstage == 2:
             # 1->2 级：进入第二阶段
+            if MYOPENSEES_STATS:
+                self.counts[TSSCB_STAGE_12] += 1
             if dStrain > 0:
                 du1 = self.ugap - self.Cstrain
                 du2 = dStrain - du1
@@ -212,6 +209,8 @@ cdef class TSSCB:
                 self.Tstress3 = -self.F1
         elif self.Cstage == 2 and self.Tstage == 2:
             # 2->2 级：双阶自复位
+            if MYOPENSEES_STATS:
+                self.counts[TSSCB_STAGE_22] += 1
             if self.Thardening:
                 self.TCDD = self.CCDD + fabs(dStrain) / (self.uh - self.ugap)
             if self.Tstrain >= 0:
@@ -248,6 +247,8 @@ cdef class TSSCB:
                 self.Tstress3 = self._frictionModel(self.Cstress3, dStrain)
         elif self.Cstage == 2 and self.Tstage == 1:
             # 2->1 级：从第二阶段返回第一阶段
+            if MYOPENSEES_STATS:
+                self.counts[TSSCB_STAGE_21] += 1
             if dStrain < 0:
                 du1 = -(self.Cstrain - self.ugap)
                 du2 = -(self.ugap - self.Tstrain)
@@ -321,27 +322,43 @@ cdef class TSSCB:
         if du > 0:
             if u < -self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
                 F = self.k2 * u - self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_K2_REVERSE] += 1
             elif -self.F2 * (1 - self.beta) / self.k1 <= u <= uy and F_ > self.k1 * u:
                 F = self.k1 * u
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_K1] += 1
             elif u > self.F2 * (1 - self.beta) / self.k1 and F_ > self.k2 * u + self.F2 - self.k2 * uy:
                 F = self.k2 * u + self.F2 - self.k2 * uy
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_K2] += 1
             else:
                 F = F_
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_ELASTIC] += 1
         else:
             if u > self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1):
                 F = self.k2 * u + self.F2 * (1 - self.beta) * (1 - self.k2 / self.k1)
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_K2_REVERSE] += 1
             elif -uy <= u <= self.F2 * (1 - self.beta) / self.k1 and F_ < self.k1 * u:
                 F = self.k1 * u
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_K1] += 1
             elif u < -self.F2 * (1 - self.beta) / self.k1 and F_ < self.k2 * u - (self.F2 - self.k2 * uy):
                 F = self.k2 * u - (self.F2 - self.k2 * uy)
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_K2] += 1
             else:
                 F = F_
+                if MYOPENSEES_STATS:
+                    self.counts[TSSCB_SC_ELASTIC] += 1
         if self.Tfracturing:
             return F * self.Trp
         else:
             return F
 
-    cpdef commitState(self):
+    cpdef void commitState(self):
         # 提交当前状态为收敛状态
         self.Cstrain = self.Tstrain
         self.Cstress3 = self.Tstress3
@@ -360,12 +377,44 @@ cdef class TSSCB:
         self.Crp = self.Trp
         self.i += 1
 
+    cpdef double getStrain(self):
+        return self.Tstrain
+
     cpdef double getStress(self):
         return self.Tstress4
 
     cpdef double getTangent(self):
         return self.Ttangent
 
-    cpdef setStrain(self, double strain):
-        self.setTrialStrain(strain)
-        self.commitState()
\ No newline at end of file
+    def getCounters(self) -> dict:
+        if not MYOPENSEES_STATS:
+            return {}
+        return {name: self.counts[i] for i, name in enumerate(COUNTERS)}
+
+    def resetCounters(self):
+        memset(self.counts, 0, sizeof(self.counts))
+
+    def getState(self) -> tuple:
+        return (
+            self.Cstage, self.Cstrain, self.Ctangent, self.Chardening,
+            self.Cstress1, self.Cstress2, self.Cstress3, self.Cstress4,
+            self.CCDD, self.Cfracture, self.Cfracturing,
+            self.Cplate1, self.Cplate2, self.CfractureFore, self.Crp,
+        )
+
+    def setState(self, tuple state):
+        self.Cstage = self.Tstage = state[0]
+        self.Cstrain = self.Tstrain = state[1]
+        self.Ctangent = self.Ttangent = state[2]
+        self.Chardening = self.Thardening = state[3]
+        self.Cstress1 = self.Tstress1 = state[4]
+        self.Cstress2 = self.Tstress2 = state[5]
+        self.Cstress3 = self.Tstress3 = state[6]
+        self.Cstress4 = self.Tstress4 = state[7]
+        self.CCDD = self.TCDD = state[8]
+        self.Cfracture = self.Tfracture = state[9]
+        self.Cfracturing = self.Tfracturing = state[10]
+        self.Cplate1 = self.Tplate1 = state[11]
+        self.Cplate2 = self.Tplate2 = state[12]
+        self.CfractureFore = self.TfractureFore = state[13]
+        self.Crp = self.Trp = state[14]
@@ -0,0 +1,436 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, freethreading_compatible=True
+# distutils: extra_compile_args = -fopenmp
+# distutils: extra_link_args = -fopenmp
+"""
+TSSCB种群: 以C结构体数组保存大量独立的TSSCB实例，
+逐步计算在nogil下进行，并通过prange在多个线程间并行推进各实例。
+"""
+import os
+import numpy as np
+from cython.parallel cimport prange
+from libc.math cimport fabs, NAN
+from libc.float cimport DBL_EPSILON
+from libc.stdlib cimport malloc, free
+
+
+cdef struct TSSCBState:
+    # 材料参数
+    double F1, k0, ugap, F2, k1, k2, beta
+    double uh, r1, r2, r3, uf, up
+    int configType
+    # 计算变量
+    double ua
+    # 历史状态变量
+    int Cstage, Tstage
+    double Cstrain, Tstrain, Ctangent, Ttangent
+    bint Chardening, Thardening
+    double Cstress1, Tstress1, Cstress2, Tstress2, Cstress3, Tstress3, Cstress4, Tstress4
+    double CCDD, TCDD
+    bint Cfracture, Tfracture, Cfracturing, Tfracturing
+    double Cplate1, Tplate1, Cplate2, Tplate2, CfractureFore, TfractureFore
+    double Crp, Trp
+
+
+# 参数列顺序及缺省值(与TSSCB的构造参数一致)
+PARAS = ('F1', 'k0', 'ugap', 'F2', 'k1', 'k2', 'beta',
+         'uh', 'r1', 'r2', 'r3', 'uf', 'configType', 'up')
+DEFAULTS = (1e16, 1.0, 1.0, 0.0, 1e16, 1.0, 0.0)
+
+
+cdef void _init_state(TSSCBState* s) noexcept nogil:
+    s.ua = s.ugap - s.F1 / s.k1
+    if s.ua < 0:
+        s.ua = 0.0
+    s.Cstage = 1; s.Tstage = 1
+    s.Cstrain = 0.0; s.Tstrain = 0.0
+    s.Cstress3 = 0.0; s.Tstress3 = 0.0
+    if s.ugap == 0.0:
+        s.Ctangent = s.k1; s.Ttangent = s.k1
+        s.Cstage = 2; s.Tstage = 2
+    else:
+        s.Ctangent = s.k0; s.Ttangent = s.k0
+    s.Chardening = False; s.Thardening = False
+    s.Cstress1 = 0.0; s.Tstress1 = 0.0
+    s.Cstress2 = 0.0; s.Tstress2 = 0.0
+    s.Cstress4 = 0.0; s.Tstress4 = 0.0
+    s.CCDD = 0.0; s.TCDD = 0.0
+    s.Cfracture = False; s.Tfracture = False
+    s.Cplate1 = s.ugap; s.Tplate1 = s.ugap
+    s.Cplate2 = -s.ugap; s.Tplate2 = -s.ugap
+    s.Cfracturing = False; s.Tfracturing = False
+    s.CfractureFore = 0.0; s.TfractureFore = 0.0
+    s.Crp = 0.0; s.Trp = 0.0
+
+
+cdef double _frictionModel(TSSCBState* s, double F0, double du, double half) noexcept nogil:
+    # 滑动摩擦力模型
+    cdef double F_
+    if du == 0.0:
+        return F0
+    F_ = F0 + du * s.k0
+    if F_ > s.F1 * half:
+        return s.F1 * half
+    elif F_ < -s.F1 * half:
+        return -s.F1 * half
+    return F_
+
+
+cdef double _SCModel(TSSCBState* s, double u0, double F0, double du) noexcept nogil:
+    # 双阶自复位模型
+    cdef double u, uy, F_, F
+    if du == 0.0:
+        return F0
+    if s.Tfracture:
+        return 0.0
+    u = u0 + du
+    uy = s.F2 / s.k1
+    F_ = F0 + du * s.k1
+    if du > 0:
+        if u < -s.F2 * (1 - s.beta) / s.k1 and F_ > s.k2 * u - s.F2 * (1 - s.beta) * (1 - s.k2 / s.k1):
+            F = s.k2 * u - s.F2 * (1 - s.beta) * (1 - s.k2 / s.k1)
+        elif -s.F2 * (1 - s.beta) / s.k1 <= u <= uy and F_ > s.k1 * u:
+            F = s.k1 * u
+        elif u > s.F2 * (1 - s.beta) / s.k1 and F_ > s.k2 * u + s.F2 - s.k2 * uy:
+            F = s.k2 * u + s.F2 - s.k2 * uy
+        else:
+            F = F_
+    else:
+        if u > s.F2 * (1 - s.beta) / s.k1 and F_ < s.k2 * u + s.F2 * (1 - s.beta) * (1 - s.k2 / s.k1):
+            F = s.k2 * u + s.F2 * (1 - s.beta) * (1 - s.k2 / s.k1)
+        elif -uy <= u <= s.F2 * (1 - s.beta) / s.k1 and F_ < s.k1 * u:
+            F = s.k1 * u
+        elif u < -s.F2 * (1 - s.beta) / s.k1 and F_ < s.k2 * u - (s.F2 - s.k2 * uy):
+            F = s.k2 * u - (s.F2 - s.k2 * uy)
+        else:
+            F = F_
+    if s.Tfracturing:
+        return F * s.Trp
+    return F
+
+
+cdef inline double _degradation(TSSCBState* s) noexcept nogil:
+    # 硬化后第二阶段的承载力退化量
+    return (s.F2 - s.F1 / 2.0) * s.TCDD * (s.r1 - s.r2 * (fabs(s.Tstrain) - s.ugap) / (s.uh - s.ugap))
+
+
+cdef void _determineTrialState(TSSCBState* s, double dStrain) noexcept nogil:
+    # 根据当前试验应变确定阶段和应力
+    cdef double uy, du1, du2, usc0, F1_, F2_, Fd, F_bound, F1_ideal1
+    cdef double F_hardening = 0.0
+    if -s.ugap <= s.Tstrain <= s.ugap:
+        s.Tstage = 1
+    else:
+        s.Tstage = 2
+    if s.ugap == 0.0:
+        s.Tstage = 2
+    # 如果已经完全断裂，直接使用摩擦模型
+    if s.Tfracture:
+        if s.configType == 1:
+            uy = s.F1 / s.k0
+            if s.Tplate2 + uy <= s.Tstrain <= s.Tplate1 - uy:
+                s.Tstress4 = 0.0
+            else:
+                s.Tstress4 = _frictionModel(s, s.Cstress4, dStrain, 0.5)
+                if dStrain < 0 and s.Tstrain > 0 and s.Tstress4 <= 0:
+                    s.Tstress4 = 0.0
+                elif dStrain > 0 and s.Tstrain < 0 and s.Tstress4 >= 0:
+                    s.Tstress4 = 0.0
+        else:
+            s.Tstress4 = _frictionModel(s, s.Cstress4, dStrain, 1.0)
+        return
+    # 如果正在断裂过程中
+    if s.Tfracturing:
+        if s.Cstress4 >= 0.0:
+            s.Tstress4 = s.TfractureFore - (s.TfractureFore - s.F1) * s.Trp
+        else:
+            s.Tstress4 = s.TfractureFore + (-s.F1 - s.TfractureFore) * s.Trp
+        return
+    # 各种状态转移逻辑
+    if s.Cstage == 1 and s.Tstage == 1:
+        # 1->1 级：摩擦模型
+        s.Tstress1 = _frictionModel(s, s.Cstress3, dStrain, 1.0)
+        s.Tstress2 = s.Tstress1
+        s.Tstress3 = s.Tstress1
+    elif s.Cstage == 1 and s.Tstage == 2:
+        # 1->2 级：进入第二阶段
+        if dStrain > 0:
+            du1 = s.ugap - s.Cstrain
+            du2 = dStrain - du1
+            usc0 = s.ugap - s.ua
+        else:
+            du1 = -s.ugap - s.Cstrain
+            du2 = dStrain - du1
+            usc0 = s.ua - s.ugap
+        if s.Thardening:
+            s.TCDD = s.CCDD + fabs(du2) / (s.uh - s.ugap)
+        F1_ = _frictionModel(s, s.Cstress1, du1, 1.0)
+        F2_ = _SCModel(s, usc0, F1_, du2)
+        s.Tstress1 = F2_
+        s.Tstress2 = s.Tstress1
+        Fd = _degradation(s)
+        if s.Thardening and s.Tstrain > 0:
+            s.Tstress2 = s.Tstress1 - Fd
+        elif s.Thardening and s.Tstrain < 0:
+            s.Tstress2 = s.Tstress1 + Fd
+        s.Tstress3 = s.Tstress2
+        if dStrain > 0 and s.Tstress2 < s.F1:
+            s.Tstress3 = s.F1
+        elif dStrain < 0 and s.Tstress2 > -s.F1:
+            s.Tstress3 = -s.F1
+    elif s.Cstage == 2 and s.Tstage == 2:
+        # 2->2 级：双阶自复位
+        if s.Thardening:
+            s.TCDD = s.CCDD + fabs(dStrain) / (s.uh - s.ugap)
+        if s.Tstrain >= 0:
+            usc0 = s.Cstrain - s.ua
+        else:
+            usc0 = s.Cstrain + s.ua
+        s.Tstress1 = _SCModel(s, usc0, s.Cstress1, dStrain)
+        s.Tstress2 = s.Tstress1
+        Fd = _degradation(s)
+        if s.Thardening and s.Tstrain > 0:
+            s.Tstress2 = s.Tstress1 - Fd
+        elif s.Thardening and s.Tstrain < 0:
+            s.Tstress2 = s.Tstress1 + Fd
+        if s.configType == 1:
+            F_bound = 0.0
+        else:
+            F_bound = s.F1
+        s.Tstress3 = s.Tstress2
+        if dStrain > 0 and s.Tstrain > 0 and s.Tstress2 < s.F1 and s.ugap > 0 and s.Cstress3 == s.F1:
+            s.Tstress3 = s.F1
+        elif dStrain < 0 and s.Tstrain < 0 and s.Tstress2 > -s.F1 and s.ugap > 0 and s.Cstress3 == -s.F1:
+            s.Tstress3 = -s.F1
+        elif s.Tstrain > 0 and s.Tstress2 < -F_bound:
+            s.Tstress3 = -F_bound
+        elif s.Tstrain < 0 and s.Tstress2 > F_bound:
+            s.Tstress3 = F_bound
+        if dStrain > 0 and s.Tstress3 <= s.Cstress3:
+            s.Tstress3 = s.Cstress4
+        elif dStrain < 0 and s.Tstress3 >= s.Cstress3:
+            s.Tstress3 = s.Cstress4
+        if s.configType == 1 and s.Tstrain >= 0 and dStrain > 0 and s.Thardening and s.Tstress2 < s.F1:
+            s.Tstress3 = _frictionModel(s, s.Cstress3, dStrain, 1.0)
+        elif s.configType == 1 and s.Tstrain <= 0 and dStrain < 0 and s.Thardening and s.Tstress2 > s.F1:
+            s.Tstress3 = _frictionModel(s, s.Cstress3, dStrain, 1.0)
+    elif s.Cstage == 2 and s.Tstage == 1:
+        # 2->1 级：从第二阶段返回第一阶段
+        if dStrain < 0:
+            du1 = -(s.Cstrain - s.ugap)
+            du2 = -(s.ugap - s.Tstrain)
+            usc0 = s.Cstrain - s.ua
+        else:
+            du1 = -s.ugap - s.Cstrain
+            du2 = s.Tstrain + s.ugap
+            usc0 = s.Cstrain + s.ua
+        if s.Thardening:
+            s.TCDD = s.CCDD + fabs(du1) / (s.uh - s.ugap)
+        F1_ = _SCModel(s, usc0, s.Cstress1, du1)
+        F1_ideal1 = F1_
+        if s.Thardening and s.Tstrain > 0:
+            F1_ideal1 = F1_ - _degradation(s)
+        elif s.Thardening and s.Tstrain < 0:
+            F1_ideal1 = F1_ + _degradation(s)
+        if s.configType == 1:
+            F_bound = 0.0
+        else:
+            F_bound = s.F1
+        F1_ = F1_ideal1
+        if dStrain > 0 and s.Tstrain > 0 and F1_ideal1 < s.F1 and s.ugap > 0 and s.Cstress3 == s.F1:
+            F1_ = s.F1
+        elif dStrain < 0 and s.Tstrain < 0 and F1_ideal1 > -s.F1 and s.ugap > 0 and s.Cstress3 == -s.F1:
+            F1_ = -s.F1
+        elif s.Tstrain > 0 and F1_ideal1 < -F_bound:
+            F1_ = -F_bound
+        elif s.Tstrain < 0 and F1_ideal1 > F_bound:
+            F1_ = F_bound
+        F2_ = _frictionModel(s, F1_, du2, 1.0)
+        s.Tstress1 = F2_
+        s.Tstress2 = s.Tstress1
+        s.Tstress3 = s.Tstress1
+    else:
+        # 非法的状态转移(nogil下无法抛出异常，以NaN标记)
+        s.Tstress4 = NAN
+        return
+    # 硬化部分力学修正
+    if s.Tstrain > s.uh:
+        F_hardening = (s.Tstrain - s.uh) * s.k2 * s.r3
+    elif -s.Tstrain > s.uh:
+        F_hardening = (-s.Tstrain - s.uh) * s.k2 * s.r3
+    if s.Tstrain >= 0:
+        s.Tstress4 = s.Tstress3 + F_hardening
+    else:
+        s.Tstress4 = s.Tstress3 - F_hardening
+
+
+cdef void _setTrialStrain(TSSCBState* s, double strain) noexcept nogil:
+    cdef double dStrain
+    # 将试验态变量设为上一步的收敛态
+    s.Tstrain = s.Cstrain
+    s.Tstress3 = s.Cstress3
+    s.Ttangent = s.Ctangent
+    s.Tstage = s.Cstage
+    s.Thardening = s.Chardening
+    s.Tstress1 = s.Cstress1
+    s.Tstress2 = s.Cstress2
+    s.Tstress4 = s.Cstress4
+    s.TCDD = s.CCDD
+    s.Tfracture = s.Cfracture
+    s.Tplate1 = s.Cplate1
+    s.Tplate2 = s.Cplate2
+    # 计算应变增量
+    dStrain = strain - s.Cstrain
+    if fabs(dStrain) <= DBL_EPSILON:
+        return  # 无变化则保持状态
+    s.Tstrain = strain
+    # 判断是否开始硬化或断裂
+    if fabs(s.Tstrain) > s.uh or s.Chardening:
+        s.Thardening = True
+    if fabs(s.Tstrain) > s.uf:
+        if s.up == 0.0:
+            s.Tfracture = True
+        else:
+            s.Tfracturing = True
+    if s.Tfracturing:
+        s.Trp = s.Crp + fabs(dStrain) / s.up
+        if s.Trp >= 1.0:
+            s.Tfracture = True
+            s.Trp = 1.0
+        if s.Crp == 0.0:
+            s.TfractureFore = s.Cstress4
+    # 确定当前试验状态（阶段、应力等）
+    _determineTrialState(s, dStrain)
+    # 更新端板位置
+    if dStrain > 0:
+        if s.Tplate1 < s.Tstrain:
+            s.Tplate1 = s.Tstrain
+        if not s.Tfracture:
+            s.Tplate2 += dStrain
+    else:
+        if s.Tplate2 > s.Tstrain:
+            s.Tplate2 = s.Tstrain
+        if not s.Tfracture:
+            s.Tplate1 += dStrain
+    if s.Tplate1 < s.ugap:
+        s.Tplate1 = s.ugap
+    if s.Tplate2 > -s.ugap:
+        s.Tplate2 = -s.ugap
+    # 更新切线刚度
+    s.Ttangent = (s.Tstress4 - s.Cstress4) / dStrain
+
+
+cdef void _commitState(TSSCBState* s) noexcept nogil:
+    # 提交当前状态为收敛状态
+    s.Cstrain = s.Tstrain
+    s.Cstress3 = s.Tstress3
+    s.Ctangent = s.Ttangent
+    s.Cstage = s.Tstage
+    s.Chardening = s.Thardening
+    s.Cstress1 = s.Tstress1
+    s.Cstress2 = s.Tstress2
+    s.Cstress4 = s.Tstress4
+    s.CCDD = s.TCDD
+    s.Cfracture = s.Tfracture
+    s.Cplate1 = s.Tplate1
+    s.Cplate2 = s.Tplate2
+    s.Cfracturing = s.Tfracturing
+    s.CfractureFore = s.TfractureFore
+    s.Crp = s.Trp
+
+
+cdef class TSSCBPopulation:
+    """
+    大量独立TSSCB实例组成的种群
+
+    paras为(n, m)的二维数组，每行对应一个实例，列顺序见`PARAS`，
+    m >= 7，缺省的列(uh及之后)取TSSCB的默认值。
+    """
+    cdef TSSCBState* states
+    cdef Py_ssize_t n
+    cdef public int num_threads
+
+    def __cinit__(self, paras, int num_threads=0):
+        p = np.atleast_2d(np.asarray(paras, dtype=np.float64))
+        cdef Py_ssize_t i, ncol = p.shape[1]
+        cdef TSSCBState* s
+        if ncol < 7 or ncol > len(PARAS):
+            raise ValueError(f"paras should have 7 to {len(PARAS)} columns, but got {ncol}")
+        self.n = p.shape[0]
+        self.num_threads = num_threads if num_threads > 0 else (os.cpu_count() or 1)
+        self.states = <TSSCBState*> malloc(max(self.n, 1) * sizeof(TSSCBState))
+        if self.states == NULL:
+            raise MemoryError()
+        for i in range(self.n):
+            row = p[i].tolist() + list(DEFAULTS[ncol - 7:])
+            s = &self.states[i]
+            s.F1, s.k0, s.ugap, s.F2, s.k1, s.k2, s.beta = row[:7]
+            s.uh, s.r1, s.r2, s.r3, s.uf = row[7:12]
+            s.configType = <int> row[12]
+            s.up = row[13]
+            if not (s.F1 >= 0 and s.k0 > 0 and s.ugap >= 0 and
+                    s.F2 > 0 and s.k1 > 0 and s.k2 > 0 and
+                    0 <= s.beta <= 2 and s.uh > 0 and
+                    s.r1 >= 0 and s.r2 >= 0 and s.r3 >= 0 and
+                    s.uf > 0 and s.up >= 0):
+                raise ValueError(f"Invalid parameters for TSSCBMaterial (member {i})")
+            _init_state(s)
+
+    def __dealloc__(self):
+        free(self.states)
+
+    def __len__(self):
+        return self.n
+
+    def revertToStart(self):
+        cdef Py_ssize_t i
+        for i in range(self.n):
+            _init_state(&self.states[i])
+
+    def setTrialStrain(self, strain):
+        """传入各实例当前步的应变值(长度为n的数组)"""
+        cdef double[::1] eps = np.ascontiguousarray(strain, dtype=np.float64)
+        cdef Py_ssize_t i
+        if eps.shape[0] != self.n:
+            raise ValueError(f"strain should have length {self.n}, but got {eps.shape[0]}")
+        for i in prange(self.n, nogil=True, num_threads=self.num_threads, schedule='static'):
+            _setTrialStrain(&self.states[i], eps[i])
+
+    def commitState(self):
+        cdef Py_ssize_t i
+        for i in prange(self.n, nogil=True, num_threads=self.num_threads, schedule='static'):
+            _commitState(&self.states[i])
+
+    def getStrain(self):
+        return np.array([self.states[i].Tstrain for i in range(self.n)])
+
+    def getStress(self):
+        return np.array([self.states[i].Tstress4 for i in range(self.n)])
+
+    def getTangent(self):
+        return np.array([self.states[i].Ttangent for i in range(self.n)])
+
+    def run(self, path):
+        """所有实例沿同一应变路径加载，每个线程负责一部分实例并完整推进其加载历史
+
+        Args:
+            path (array_like): 应变序列
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 形状为(n, len(path))的应力、切线刚度
+        """
+        cdef double[::1] u = np.ascontiguousarray(path, dtype=np.float64)
+        cdef Py_ssize_t n_step = u.shape[0]
+        stress_arr = np.empty((self.n, n_step))
+        tangent_arr = np.empty((self.n, n_step))
+        cdef double[:, ::1] stress = stress_arr
+        cdef double[:, ::1] tangent = tangent_arr
+        cdef Py_ssize_t i, j
+        cdef TSSCBState* s
+        for i in prange(self.n, nogil=True, num_threads=self.num_threads, schedule='dynamic'):
+            s = &self.states[i]
+            for j in range(n_step):
+                _setTrialStrain(s, u[j])
+                _commitState(s)
+                stress[i, j] = s.Tstress4
+                tangent[i, j] = s.Ttangent
+        return stress_arr, tangent_arr
@@ -0,0 +1,24 @@
+from ..CUniaxialMaterial cimport CUniaxialMaterial
+
+
+cdef class TwoStage(CUniaxialMaterial):
+    # Material parameters
+    cdef double F1, k1, kp1
+    cdef double F2, k2, kp2
+    cdef double ua
+
+    # Response history
+    cdef double Cstrain, Tstrain
+    cdef double Cstrain2, Tstrain2
+    cdef double Cstress, Tstress
+    cdef double Cstress1, Tstress1
+    cdef double Cstress2, Tstress2
+    cdef double Ctangent, Ttangent
+    cdef double Chookgap, Thookgap
+
+    cdef void _check_paras(self) except *
+    cdef void _init_paras(self)
+
+    @staticmethod
+    cdef double bilinear(double F_prev, double u_prev, double du,
+                         double Fy, double k, double kp) noexcept
@@ -63,6 +63,13 @@ class TwoStage(UniaxialMaterial):
     def setTrialStrain(self, strain, strainRate=0):
         """传入当前步的应变值strain"""
         dstrain2: float
+        # Reset history variables to last converged state
+        self.Tstrain2 = self.Cstrain2
+        self.Tstress = self.Cstress
+        self.Tstress1 = self.Cstress1
+        self.Tstress2 = self.Cstress2
+        self.Ttangent = self.Ctangent
+        self.Thookgap = self.Chookgap
         dStrain = strain - self.Cstrain
         self.Tstrain = strain
         if abs(dStrain) <= sys.float_info.epsilon:
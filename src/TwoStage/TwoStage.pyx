@@ -1,4 +1,4 @@
-# cython: language_level=3
+# cython: language_level=3, freethreading_compatible=True
 # cython: boundscheck=False, wraparound=False, cdivision=True, nonecheck=False
 
 from libc.math cimport fabs
@@ -10,22 +10,7 @@ cdef inline double dmax(double a, double b) noexcept:
 cdef inline double dmin(double a, double b) noexcept:
     return a if a < b else b
 
-cdef class TwoStage:
-    cdef public int tag
-
-    # Material parameters
-    cdef double F1, k1, kp1
-    cdef double F2, k2, kp2
-    cdef double ua
-
-    # Response history
-    cdef double Cstrain, Tstrain
-    cdef double Cstrain2, Tstrain2
-    cdef double Cstress, Tstress
-    cdef double Cstress1, Tstress1
-    cdef double Cstress2, Tstress2
-    cdef double Ctangent, Ttangent
-    cdef double Chookgap, Thookgap
+cdef class TwoStage(CUniaxialMaterial):
 
     def __init__(self,
                  int tag,
@@ -63,8 +48,8 @@ cdef class TwoStage:
         self.Thookgap = 0.0
 
     @staticmethod
-    cdef inline double bilinear(double F_prev, double u_prev, double du,
-                                double Fy, double k, double kp) noexcept:
+    cdef double bilinear(double F_prev, double u_prev, double du,
+                         double Fy, double k, double kp) noexcept:
         cdef double F_next
         if Fy == 0.0:
             return 0.0
@@ -82,6 +67,13 @@ cdef class TwoStage:
         cdef double dStrain, dstrain2
         cdef double tmp, denom
 
+        # Reset history variables to last converged state
+        self.Tstrain2 = self.Cstrain2
+        self.Tstress = self.Cstress
+        self.Tstress1 = self.Cstress1
+        self.Tstress2 = self.Cstress2
+        self.Ttangent = self.Ctangent
+        self.Thookgap = self.Chookgap
         dStrain = strain - self.Cstrain
         self.Tstrain = strain
         if fabs(dStrain) <= DBL_EPSILON:
@@ -151,6 +143,14 @@ cdef class TwoStage:
     cpdef double getTangent(self):
         return self.Ttangent
 
-    cpdef double setStrain(self, double strain, double strainRate=0.0):
-        self.setTrialStrain(strain, strainRate)
-        self.commitState()
+    def getState(self) -> tuple:
+        return (self.Cstrain, self.Cstrain2, self.Cstress, self.Cstress1, self.Cstress2, self.Ctangent, self.Chookgap)
+
+    def setState(self, tuple state):
+        self.Cstrain = self.Tstrain = state[0]
+        self.Cstrain2 = self.Tstrain2 = state[1]
+        self.Cstress = self.Tstress = state[2]
+        self.Cstress1 = self.Tstress1 = state[3]
+        self.Cstress2 = self.Tstress2 = state[4]
+        self.Ctangent = self.Ttangent = state[5]
+        self.Chookgap = self.Thookgap = state[6]
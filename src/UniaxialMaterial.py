@@ -1,14 +1,34 @@
+import copy
+import os
+import threading
 from abc import ABC, abstractmethod
 
 
+# 是否启用热点分支计数(环境变量MYOPENSEES_STATS=1)，在导入时确定，
+# 关闭时插桩处只有一次全局变量判断
+STATS = os.environ.get('MYOPENSEES_STATS', '0') not in ('', '0')
+
+
+# 材料编号 -> 材料对象，每个线程拥有独立的编号空间(类似每个OpenSees进程拥有独立的模型)，
+# 因此不同线程中的材料计算互不干扰，可在自由线程(无GIL)的Python中并行运行
+_registry = threading.local()
+
+
+def _objs() -> dict:
+    objs = getattr(_registry, 'objs', None)
+    if objs is None:
+        objs = _registry.objs = {}
+    return objs
+
+
 class UniaxialMaterial(ABC):
-    objs = {}
     
     def __new__(cls, tag: int, *args, **kwargs):
-        if tag in cls.objs.keys():
+        objs = _objs()
+        if tag in objs.keys():
             raise ValueError(f'tag {tag} already exists')
         obj = super().__new__(cls)
-        cls.objs[tag] = obj
+        objs[tag] = obj
         return obj
 
     @abstractmethod
@@ -23,9 +43,20 @@ class UniaxialMaterial(ABC):
 
     @classmethod
     def getUniaxialMaterial(cls, tag: int) -> 'UniaxialMaterial':
-        if tag not in cls.objs.keys():
+        objs = _objs()
+        if tag not in objs.keys():
             raise ValueError(f'Material with tag {tag} does not exist')
-        return cls.objs[tag]
+        return objs[tag]
+
+    @classmethod
+    def removeUniaxialMaterial(cls, tag: int):
+        """从当前线程的编号空间中移除材料"""
+        _objs().pop(tag, None)
+
+    @classmethod
+    def wipe(cls):
+        """清空当前线程中定义的所有材料"""
+        _objs().clear()
     
     @abstractmethod
     def getStrain(self) -> float: ...
@@ -35,4 +66,43 @@ class UniaxialMaterial(ABC):
 
     @abstractmethod
     def getTangent(self) -> float: ...
-    
+
+    def getState(self) -> dict:
+        """已提交的历史状态变量(以C开头且存在对应T变量的属性)，包括被引用材料的状态
+
+        返回的字典可序列化(pickle)，配合`setState`用于保存和恢复材料状态。
+        """
+        attrs = vars(self)
+        state = {}
+        for name, val in attrs.items():
+            if name[:1] == 'C' and 'T' + name[1:] in attrs:
+                state[name] = copy.deepcopy(val)
+            elif isinstance(val, UniaxialMaterial):
+                state[name] = val.getState()
+            elif isinstance(val, list) and val and all(isinstance(m, UniaxialMaterial) for m in val):
+                state[name] = [m.getState() for m in val]
+        return state
+
+    def setState(self, state: dict):
+        """恢复由`getState`得到的状态，试探状态同时设为已提交状态"""
+        for name, val in state.items():
+            attr = getattr(self, name)
+            if isinstance(attr, UniaxialMaterial):
+                attr.setState(val)
+            elif isinstance(attr, list) and attr and isinstance(attr[0], UniaxialMaterial):
+                for m, s in zip(attr, val):
+                    m.setState(s)
+            else:
+                setattr(self, name, copy.deepcopy(val))
+                setattr(self, 'T' + name[1:], copy.deepcopy(val))
+
+    def _count(self, name: str, n: int=1):
+        counters = self.__dict__.setdefault('_counters', {})
+        counters[name] = counters.get(name, 0) + n
+
+    def getCounters(self) -> dict:
+        """热点分支的进入次数(未启用MYOPENSEES_STATS或材料未插桩时为空字典)"""
+        return dict(self.__dict__.get('_counters', {}))
+
+    def resetCounters(self):
+        self.__dict__.pop('_counters', None)
@@ -0,0 +1,182 @@
+"""
+材料工厂: 按名称创建材料，自动选择当前解释器/平台下可用的最快实现
+
+查找顺序:
+1. ext: `src/<name>/`目录下就地编译的扩展模块(由同名.pyx编译得到)
+2. ext: `ext/`目录下预编译的扩展模块(如ext/Steel01.*.so/.pyd)
+3. py: `src/<name>/<name>.py`中的Python实现
+
+`src/`下的扩展材料继承`CUniaxialMaterial`(提供setStrain、getState/setState等接口)。
+`ext/`中早于该基类编译的扩展(只有cpdef的setTrialStrain/commitState/getStress/getTangent)
+包装为补充了setStrain的子类后使用，但不支持getState/setState(检查点、前缀缓存)，
+缺少上述方法的扩展类将被跳过。
+
+解析结果按(名称, 后端)缓存，模块只在第一次使用时导入。
+"""
+import importlib
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import threading
+from functools import lru_cache
+
+
+# 材料名称 -> 类名(未列出的材料类名与材料名称相同)
+_CLASS_NAMES = {
+    'Steel01': 'Steel01Material',
+}
+# 早于CUniaxialMaterial编译的扩展类须提供的方法
+_LEGACY_METHODS = ('setTrialStrain', 'commitState', 'getStress', 'getTangent')
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+_lock = threading.Lock()
+
+
+def make_material(name: str, tag: int, *args, backend: str=None, **kwargs):
+    """创建材料对象
+
+    Args:
+        name (str): 材料名称(如'Steel01'、'TSSCB')
+        tag (int): 材料编号
+        *args: 材料参数
+        backend (str, optional): 指定后端'ext'或'py'，默认自动选择
+        **kwargs: 材料参数
+
+    Returns:
+        UniaxialMaterial | CUniaxialMaterial: 材料对象
+    """
+    return get_material_class(name, backend)(tag, *args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def get_material_class(name: str, backend: str=None) -> type:
+    """解析材料类
+
+    Args:
+        name (str): 材料名称
+        backend (str, optional): 'ext'、'py'或None(先ext后py)
+
+    Raises:
+        ImportError: 指定的后端不可用
+    """
+    if backend not in (None, 'ext', 'py'):
+        raise ValueError(f'Unknown backend {backend}')
+    # 多个线程同时首次解析时，保证模块只加载一次
+    with _lock:
+        if backend in (None, 'ext'):
+            cls = _load_ext(name)
+            if cls is not None:
+                return cls
+            if backend == 'ext':
+                raise ImportError(f'No compiled extension of {name} is available for this interpreter')
+        return _load_py(name)
+
+
+@lru_cache(maxsize=None)
+def get_population_class(name: str):
+    """材料的种群类(`src/<name>/<name>Population`编译得到的扩展)，不可用时返回None
+
+    种群类以`(paras, num_threads)`构造，paras的列顺序为所在模块的`PARAS`，
+    `run(path)`返回所有实例沿同一加载路径的应力、切线刚度。
+    """
+    with _lock:
+        try:
+            module = importlib.import_module(f'src.{name}.{name}Population')
+        except ImportError:
+            return None
+        if not _is_extension(module):
+            return None
+        return getattr(module, f'{name}Population', None)
+
+
+def get_backend(name: str) -> str:
+    """自动选择时使用的后端名称"""
+    cls = get_material_class(name)
+    return 'ext' if _is_extension(sys.modules[cls.__module__]) else 'py'
+
+
+def material_name(cls: type) -> str:
+    """材料类对应的材料名称(`_CLASS_NAMES`的逆映射)"""
+    for name, class_name in _CLASS_NAMES.items():
+        if cls.__name__ == class_name:
+            return name
+    return cls.__name__
+
+
+def _class_name(name: str) -> str:
+    return _CLASS_NAMES.get(name, name)
+
+
+def _is_extension(module) -> bool:
+    return getattr(module, '__file__', '').endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
+
+
+def supports_state(cls: type) -> bool:
+    """材料类是否支持getState/setState(早于CUniaxialMaterial编译的扩展不支持)"""
+    return hasattr(cls, 'getState') and hasattr(cls, 'setState')
+
+
+def _load_ext(name: str):
+    try:
+        from src.CUniaxialMaterial import CUniaxialMaterial
+    except ImportError:
+        # 基类未编译时src下不存在可用的扩展材料，但ext/中的早期扩展仍可使用
+        CUniaxialMaterial = None
+    for mod_name in (f'src.{name}.{name}', f'ext.{name}'):
+        if CUniaxialMaterial is None and mod_name.startswith('src.'):
+            continue
+        try:
+            module = importlib.import_module(mod_name)
+        except ImportError:
+            # 不存在，或为其他Python版本/平台编译的扩展
+            continue
+        if not _is_extension(module):
+            continue
+        cls = getattr(module, _class_name(name), None) or getattr(module, name, None)
+        if not isinstance(cls, type):
+            continue
+        if CUniaxialMaterial is not None and issubclass(cls, CUniaxialMaterial):
+            return cls
+        if all(callable(getattr(cls, m, None)) for m in _LEGACY_METHODS):
+            return _legacy_class(cls, module.__name__)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _legacy_class(cls: type, module: str) -> type:
+    """为早期扩展类补充setStrain和(空的)计数器接口，module为扩展模块的导入名称"""
+    def setStrain(self, strain, strainRate=0):
+        self.setTrialStrain(strain, strainRate)
+        self.commitState()
+
+    def getCounters(self) -> dict:
+        return {}
+
+    def resetCounters(self):
+        pass
+
+    return type(cls.__name__, (cls,), {
+        '__module__': module,
+        '__doc__': cls.__doc__,
+        'setStrain': setStrain,
+        'getCounters': getCounters,
+        'resetCounters': resetCounters,
+    })
+
+
+def _load_py(name: str):
+    """加载Python实现(即使同目录下存在同名的已编译扩展)"""
+    path = os.path.join(_SRC_DIR, name, f'{name}.py')
+    if not os.path.isfile(path):
+        raise ImportError(f'Material {name} not found')
+    module = importlib.import_module(f'src.{name}.{name}')
+    if not _is_extension(module):
+        return getattr(module, _class_name(name))
+    mod_name = f'src.{name}.{name}_py'
+    module = sys.modules.get(mod_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(mod_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[mod_name] = module
+        spec.loader.exec_module(module)
+    return getattr(module, _class_name(name))
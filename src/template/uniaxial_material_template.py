@@ -1,7 +1,3 @@
-import math
-import sys
-import numpy as np
-import matplotlib.pyplot as plt
 from ..UniaxialMaterial import UniaxialMaterial
 
 
@@ -0,0 +1,346 @@
+import json
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.factory import make_material, get_backend, get_material_class, supports_state
+from utils.parallel import _release
+from utils.result_store import param_key, path_key
+
+
+# ----------------------------------------------------------------------
+# 材料状态的二进制序列化
+# ----------------------------------------------------------------------
+# 格式: MAGIC | 版本(1字节) | 结构描述长度(uint32) | 结构描述(JSON) | 浮点数(float64) | 整数(int64)
+# 结构描述只记录容器类型和键名，数值按出现顺序存放在两个定长数组中。
+# 不使用pickle，读取检查点时不会执行任意代码。
+_MAGIC = b'MOST'
+_VERSION = 1
+
+
+def pack_state(state) -> bytes:
+    """将`getState`返回的状态(Python材料为dict，扩展材料为tuple)序列化为紧凑的二进制数据"""
+    floats = []
+    ints = []
+    template = _flatten(state, floats, ints)
+    head = json.dumps(template, separators=(',', ':')).encode()
+    return b''.join((
+        _MAGIC, bytes([_VERSION]), struct.pack('<I', len(head)), head,
+        np.asarray(floats, dtype='<f8').tobytes(), np.asarray(ints, dtype='<i8').tobytes(),
+    ))
+
+
+def unpack_state(data: bytes):
+    """`pack_state`的逆操作"""
+    if data[:4] != _MAGIC or data[4] != _VERSION:
+        raise ValueError('Not a packed material state')
+    n = struct.unpack('<I', data[5:9])[0]
+    template = json.loads(data[9:9 + n])
+    n_floats, n_ints = _count_leaves(template)
+    off = 9 + n
+    floats = np.frombuffer(data, dtype='<f8', count=n_floats, offset=off)
+    ints = np.frombuffer(data, dtype='<i8', count=n_ints, offset=off + 8 * n_floats)
+    return _unflatten(template, iter(floats.tolist()), iter(ints.tolist()))
+
+
+def _flatten(obj, floats: list, ints: list):
+    if isinstance(obj, bool):
+        ints.append(int(obj))
+        return 'b'
+    if isinstance(obj, (int, np.integer)):
+        ints.append(int(obj))
+        return 'i'
+    if isinstance(obj, (float, np.floating)):
+        floats.append(float(obj))
+        return 'f'
+    if obj is None:
+        return 'n'
+    if isinstance(obj, str):
+        return {'s': obj}
+    if isinstance(obj, bytes):
+        return {'y': obj.decode('latin-1')}
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in 'iub':
+            ints.extend(obj.ravel().astype(np.int64).tolist())
+        else:
+            floats.extend(obj.ravel().astype(float).tolist())
+        return {'a': [list(obj.shape), obj.dtype.str]}
+    if isinstance(obj, dict):
+        return {'d': [[k, _flatten(v, floats, ints)] for k, v in obj.items()]}
+    if isinstance(obj, tuple):
+        return {'t': [_flatten(v, floats, ints) for v in obj]}
+    if isinstance(obj, list):
+        return {'l': [_flatten(v, floats, ints) for v in obj]}
+    raise TypeError(f'Cannot pack state value of type {type(obj).__name__}')
+
+
+def _count_leaves(t) -> tuple[int, int]:
+    if t == 'f':
+        return 1, 0
+    if t in ('i', 'b'):
+        return 0, 1
+    if t == 'n':
+        return 0, 0
+    (kind, val), = t.items()
+    if kind in ('s', 'y'):
+        return 0, 0
+    if kind == 'a':
+        size = int(np.prod(val[0]))
+        return (0, size) if np.dtype(val[1]).kind in 'iub' else (size, 0)
+    items = [v for _, v in val] if kind == 'd' else val
+    nf = ni = 0
+    for v in items:
+        a, b = _count_leaves(v)
+        nf += a
+        ni += b
+    return nf, ni
+
+
+def _unflatten(t, floats, ints):
+    if t == 'f':
+        return next(floats)
+    if t == 'i':
+        return next(ints)
+    if t == 'b':
+        return bool(next(ints))
+    if t == 'n':
+        return None
+    (kind, val), = t.items()
+    if kind == 's':
+        return val
+    if kind == 'y':
+        return val.encode('latin-1')
+    if kind == 'a':
+        shape, dtype = val
+        size = int(np.prod(shape))
+        src = ints if np.dtype(dtype).kind in 'iub' else floats
+        return np.array([next(src) for _ in range(size)], dtype=dtype).reshape(shape)
+    if kind == 'd':
+        return {k: _unflatten(v, floats, ints) for k, v in val}
+    if kind == 't':
+        return tuple(_unflatten(v, floats, ints) for v in val)
+    return [_unflatten(v, floats, ints) for v in val]
+
+
+# ----------------------------------------------------------------------
+# 计算日志
+# ----------------------------------------------------------------------
+class CampaignJournal:
+    """可中断恢复的批量计算日志
+
+    目录结构:
+    * journal.jsonl: 只追加的完成记录，每行一个已完成任务(写入后fsync)，末行不完整时忽略
+    * ckpt/<key>.ckpt: 进行中任务的最近检查点(步数、材料状态)，原子替换
+    * out/<key>.f64: 任务的输出(每步应力、切线刚度)，只追加，恢复时截断到检查点处
+
+    进程被终止后重新运行同一批任务，已完成的任务直接读取结果，未完成的任务从最近的检查点继续。
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(os.path.join(directory, 'ckpt'), exist_ok=True)
+        os.makedirs(os.path.join(directory, 'out'), exist_ok=True)
+        self.path = os.path.join(directory, 'journal.jsonl')
+        self._done: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        valid = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                break
+            self._done[rec['key']] = rec
+            valid += len(line)
+        if valid != len(data):
+            # 写入过程中被终止，截去不完整的末行
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid)
+
+    def is_done(self, key: str) -> bool:
+        return key in self._done
+
+    def completed(self) -> dict[str, dict]:
+        """已完成任务的记录"""
+        return dict(self._done)
+
+    def mark_done(self, key: str, **info):
+        """追加完成记录并删除检查点"""
+        rec = {'key': key, 'time': time.time(), **info}
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(rec, default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._done[key] = rec
+        ckpt = self._ckpt_path(key)
+        if os.path.exists(ckpt):
+            os.remove(ckpt)
+
+    def checkpoint(self, key: str, step: int, state: bytes):
+        """保存进行中任务的检查点(先写临时文件再原子替换)"""
+        path = self._ckpt_path(key)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(struct.pack('<Q', step) + state)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def load_checkpoint(self, key: str) -> tuple[int, bytes] | None:
+        """最近的检查点(步数, 材料状态)，不存在时返回None"""
+        path = self._ckpt_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            data = f.read()
+        return struct.unpack('<Q', data[:8])[0], data[8:]
+
+    def output_path(self, key: str) -> str:
+        return os.path.join(self.directory, 'out', f'{key}.f64')
+
+    def read_output(self, key: str) -> tuple[np.ndarray, np.ndarray]:
+        """已完成任务的应力、切线刚度"""
+        out = np.fromfile(self.output_path(key), dtype='<f8').reshape(-1, 2)
+        return out[:, 0].copy(), out[:, 1].copy()
+
+    def _ckpt_path(self, key: str) -> str:
+        return os.path.join(self.directory, 'ckpt', f'{key}.ckpt')
+
+
+def job_key(mat_type: str, paras_args: tuple, paras_kwargs: dict, strain,
+            strainRate=None, backend: str=None) -> str:
+    """任务键: 材料名称 + 参数哈希 + 加载路径哈希(及应变率哈希) + 后端
+
+    后端未指定时取自动选择的后端，不同后端的检查点状态不通用。
+    """
+    key = f'{mat_type}-{param_key(paras_args, paras_kwargs)}-{path_key(strain)}'
+    if strainRate is not None:
+        key += f'-r{path_key(strainRate)}'
+    return f'{key}-{backend or get_backend(mat_type)}'
+
+
+def run_resumable(
+    journal: CampaignJournal,
+    strain,
+    mat_type: str,
+    paras_args: tuple,
+    paras_kwargs: dict={},
+    strainRate=None,
+    checkpoint_every: int=10000,
+    checkpoint_seconds: float=60.0,
+    backend: str=None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """可中断恢复的材料计算
+
+    每隔checkpoint_every步或checkpoint_seconds秒(先到者为准)将输出追加写入磁盘，
+    再保存材料状态和步数作为检查点。任务已完成时直接读取结果。
+
+    Args:
+        journal (CampaignJournal): 计算日志
+        strain (array_like | Protocol): 应变序列
+        mat_type (str): 材料名称
+        paras_args (tuple): 参数
+        paras_kwargs (dict, optional): 参数
+        strainRate (array_like, optional): 应变率序列
+        checkpoint_every (int, optional): 检查点间隔步数，默认10000
+        checkpoint_seconds (float, optional): 检查点间隔时间(s)，默认60
+        backend (str, optional): 材料后端，默认自动选择(不支持检查点的早期扩展改用py)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: 应力、切线刚度
+
+    Raises:
+        TypeError: 指定的后端不支持getState/setState
+    """
+    if not supports_state(get_material_class(mat_type, backend)):
+        if backend is not None:
+            raise TypeError(f'{mat_type} ({backend}) does not support getState/setState required by checkpoints')
+        # 早于CUniaxialMaterial编译的扩展不能保存检查点，改用Python实现
+        backend = 'py'
+    x = np.asarray(strain, dtype=float)
+    key = job_key(mat_type, paras_args, paras_kwargs, x, strainRate, backend)
+    if journal.is_done(key):
+        return journal.read_output(key)
+    xs = x.tolist()
+    rates = None if strainRate is None else np.asarray(strainRate, dtype=float).tolist()
+    mat = make_material(mat_type, 1, *paras_args, backend=backend, **paras_kwargs)
+    out_path = journal.output_path(key)
+    try:
+        start = 0
+        ckpt = journal.load_checkpoint(key)
+        if ckpt is not None:
+            start, state = ckpt
+            mat.setState(unpack_state(state))
+        # 丢弃检查点之后写入的输出
+        with open(out_path, 'ab') as f:
+            f.truncate(16 * start)
+        with open(out_path, 'ab') as f:
+            buf = []
+            t_last = time.monotonic()
+            for i in range(start, len(xs)):
+                if rates is None:
+                    mat.setTrialStrain(xs[i])
+                else:
+                    mat.setTrialStrain(xs[i], rates[i])
+                mat.commitState()
+                buf.append(mat.getStress())
+                buf.append(mat.getTangent())
+                if len(buf) >= 2 * checkpoint_every or time.monotonic() - t_last >= checkpoint_seconds:
+                    _flush(f, buf)
+                    journal.checkpoint(key, i + 1, pack_state(mat.getState()))
+                    t_last = time.monotonic()
+            _flush(f, buf)
+    finally:
+        _release(mat)
+    journal.mark_done(key, mat_type=mat_type, paras_args=list(paras_args),
+                      paras_kwargs=paras_kwargs, n_steps=len(xs))
+    return journal.read_output(key)
+
+
+def _flush(f, buf: list):
+    f.write(np.asarray(buf, dtype='<f8').tobytes())
+    f.flush()
+    os.fsync(f.fileno())
+    buf.clear()
+
+
+def run_campaign(
+    journal: CampaignJournal,
+    strain,
+    jobs: list[tuple],
+    n_threads: int=1,
+    **kwargs,
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """批量运行可恢复的任务，已完成的任务跳过计算
+
+    Args:
+        journal (CampaignJournal): 计算日志
+        strain (array_like | Protocol): 所有任务共用的应变序列
+        jobs (list[tuple]): 每个任务为(mat_type, paras_args)或(mat_type, paras_args, paras_kwargs)
+        n_threads (int, optional): 线程数，默认1
+        **kwargs: 传递给`run_resumable`的其他参数
+
+    Returns:
+        dict[str, tuple[np.ndarray, np.ndarray]]: 任务键 -> (应力, 切线刚度)
+    """
+    x = np.asarray(strain, dtype=float)
+
+    def run(job):
+        mat_type, paras_args = job[:2]
+        paras_kwargs = job[2] if len(job) > 2 else {}
+        key = job_key(mat_type, paras_args, paras_kwargs, x, kwargs.get('strainRate'), kwargs.get('backend'))
+        return key, run_resumable(journal, x, mat_type, paras_args, paras_kwargs, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        return dict(pool.map(run, jobs))
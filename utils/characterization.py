@@ -0,0 +1,129 @@
+import math
+import numpy as np
+from src.GeneralizedMaxwell.GeneralizedMaxwell import GeneralizedMaxwell
+
+
+def frequency_sweep(
+    mat: GeneralizedMaxwell,
+    freqs: list[float],
+    amps: list[float],
+    n_per_cycle: int = 200,
+    min_cycles: int = 2,
+    max_cycles: int = 50,
+    rtol: float = 1e-4,
+) -> dict[str, np.ndarray]:
+    """黏滞材料的稳态频率扫描表征
+
+    所有(频率, 幅值)组合作为一个种群同时进行简谐加载，每一步对全部成员向量化执行与
+    `GeneralizedMaxwell.setTrialStrainDt`相同的RK4子步积分。每个循环结束时计算储能刚度、
+    损耗刚度和单圈耗能，当相邻两圈的耗能和储能刚度的相对变化均小于`rtol`时认为该成员
+    达到稳态，并将其移出种群，全部成员收敛后提前结束。
+
+    Args:
+        mat (GeneralizedMaxwell): 提供材料参数的模板材料(其状态不会被修改)
+        freqs (list[float]): 加载频率序列
+        amps (list[float]): 位移幅值序列
+        n_per_cycle (int, optional): 每个循环的加载步数，默认200
+        min_cycles (int, optional): 最少加载循环数，默认2
+        max_cycles (int, optional): 最多加载循环数，默认50
+        rtol (float, optional): 判断稳态的相对容差，默认1e-4
+
+    Returns:
+        dict[str, np.ndarray]: 各表格的形状均为(len(freqs), len(amps))，包括
+        * storage: 储能刚度K'
+        * loss: 损耗刚度K''
+        * loss_factor: 损耗因子K''/K'
+        * energy: 单圈耗能
+        * xi_eq: 等效阻尼比W/(4πWs)，Ws = K'A²/2
+        * n_cycles: 达到稳态所用的循环数
+        * converged: 是否在max_cycles内达到稳态
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    amps = np.asarray(amps, dtype=float)
+    if np.any(freqs <= 0) or np.any(amps <= 0):
+        raise ValueError('freqs and amps should be positive')
+    if n_per_cycle < 4:
+        raise ValueError(f'n_per_cycle should be at least 4, but got {n_per_cycle}')
+    nf, na = len(freqs), len(amps)
+    f_all = np.repeat(freqs, na)
+    A_all = np.tile(amps, nf)
+    n_all = nf * na
+    k = np.asarray(mat.k_ls, dtype=float)
+    c = np.asarray(mat.c_ls, dtype=float)
+    inv_alpha = 1.0 / np.asarray(mat.alpha_ls, dtype=float)
+    h = 1.0 / mat.n_iter
+    # 每个循环内所有成员的相位相同，仅dt和应变幅值不同
+    theta = 2 * math.pi * np.arange(n_per_cycle + 1) / n_per_cycle
+    sin_t = np.sin(theta)
+    cos_t = np.cos(theta)
+    d_sin = np.diff(sin_t)
+
+    def compute_dS(S, d_eps, dt):
+        dashpot_vel = np.sign(S) * np.power(np.abs(S) / c, inv_alpha)
+        return k * d_eps[:, None] - dt[:, None] * k * dashpot_vel
+
+    # 结果表格
+    storage = np.full(n_all, np.nan)
+    loss = np.full(n_all, np.nan)
+    energy = np.full(n_all, np.nan)
+    n_cycles = np.zeros(n_all, dtype=int)
+    converged = np.zeros(n_all, dtype=bool)
+    # 当前种群(仅包含尚未收敛的成员)
+    idx = np.arange(n_all)
+    A = A_all.copy()
+    dt = 1.0 / (f_all * n_per_cycle)
+    S = np.zeros((n_all, len(k)))
+    W_prev = np.full(n_all, np.nan)
+    Ks_prev = np.full(n_all, np.nan)
+    for cycle in range(1, max_cycles + 1):
+        F_prev = mat.k0 * A * sin_t[0] + S.sum(axis=1)
+        W = np.zeros(len(idx))
+        Ks = np.zeros(len(idx))
+        Kl = np.zeros(len(idx))
+        for j in range(n_per_cycle):
+            d_eps = A * d_sin[j]
+            for _ in range(mat.n_iter):
+                k1 = compute_dS(S, d_eps, dt)
+                k2 = compute_dS(S + 0.5 * h * k1, d_eps, dt)
+                k3 = compute_dS(S + 0.5 * h * k2, d_eps, dt)
+                k4 = compute_dS(S + h * k3, d_eps, dt)
+                S = S + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+            F = mat.k0 * A * sin_t[j + 1] + S.sum(axis=1)
+            W += 0.5 * (F + F_prev) * d_eps
+            Ks += F * sin_t[j + 1]
+            Kl += F * cos_t[j + 1]
+            F_prev = F
+        Ks *= 2.0 / (n_per_cycle * A)
+        Kl *= 2.0 / (n_per_cycle * A)
+        done = (
+            (np.abs(W - W_prev) <= rtol * np.abs(W))
+            & (np.abs(Ks - Ks_prev) <= rtol * np.abs(Ks))
+        )
+        if cycle < min_cycles:
+            done[:] = False
+        if cycle == max_cycles:
+            finished = np.ones(len(idx), dtype=bool)
+        else:
+            finished = done
+        storage[idx[finished]] = Ks[finished]
+        loss[idx[finished]] = Kl[finished]
+        energy[idx[finished]] = W[finished]
+        n_cycles[idx[finished]] = cycle
+        converged[idx[finished]] = done[finished]
+        # 已收敛的成员移出种群
+        keep = ~finished
+        if not keep.any():
+            break
+        idx, A, dt, S = idx[keep], A[keep], dt[keep], S[keep]
+        W_prev, Ks_prev = W[keep], Ks[keep]
+    Ws = 0.5 * storage * A_all ** 2
+    shape = (nf, na)
+    return {
+        'storage': storage.reshape(shape),
+        'loss': loss.reshape(shape),
+        'loss_factor': (loss / storage).reshape(shape),
+        'energy': energy.reshape(shape),
+        'xi_eq': (energy / (4 * math.pi * Ws)).reshape(shape),
+        'n_cycles': n_cycles.reshape(shape),
+        'converged': converged.reshape(shape),
+    }
@@ -0,0 +1,190 @@
+import numpy as np
+from utils.protocol import Protocol, find_reversals
+
+
+def split_branches(strain, tol: float=0.0) -> np.ndarray:
+    """在反向点处将加载路径划分为单调分支
+
+    Args:
+        strain (array_like): 应变序列
+        tol (float, optional): 忽略幅值小于tol的反向(用于含噪声的试验数据)，默认0
+
+    Returns:
+        np.ndarray: 各分支的分界点索引b，第k个分支为`strain[b[k]:b[k+1]+1]`
+    """
+    x = np.asarray(strain, dtype=float)
+    b = find_reversals(x)
+    if tol <= 0 or len(b) <= 2:
+        return b
+    xs = x.tolist()
+    keep = [int(b[0])]
+    for j in b[1:].tolist():
+        d = xs[j] - xs[keep[-1]]
+        if len(keep) >= 2 and d * (xs[keep[-1]] - xs[keep[-2]]) > 0:
+            # 沿原方向继续加载，延伸当前分支
+            keep[-1] = j
+        elif abs(d) >= tol:
+            keep.append(j)
+    if keep[-1] != len(x) - 1:
+        if len(keep) >= 2 and (xs[-1] - xs[keep[-1]]) * (xs[keep[-1]] - xs[keep[-2]]) >= 0:
+            keep[-1] = len(x) - 1
+        else:
+            keep.append(len(x) - 1)
+    return np.array(keep, dtype=int)
+
+
+def coarse_protocol(strain, n: int=50, tol: float=0.0) -> Protocol:
+    """以试验加载路径的反向点为转折点、每个分支n步的粗糙加载制度
+
+    `CurveComparator`只在模型的采样点上比较，步数n不引入插值误差；但模型本身的响应可能与步长有关
+    (如ModBoucWen的子步积分)，n过小时粗糙结果与完整加载路径的结果不同。
+    """
+    x = np.asarray(strain, dtype=float)
+    b = split_branches(x, tol)
+    return Protocol(x[b], [n] * (len(b) - 1))
+
+
+class _Branches:
+    """曲线按分支展开后的插值坐标
+
+    第k个分支内的点映射到s = k + t，t ∈ [0, 1]为分支内的相对位置，
+    所有分支拼接后s单调不减，因此可以用一次`np.interp`同时对所有分支插值。
+    """
+
+    def __init__(self, x: np.ndarray, b: np.ndarray):
+        L = np.diff(b) + 1
+        K = len(L)
+        offsets = np.concatenate(([0], np.cumsum(L)[:-1]))
+        self.idx = np.repeat(b[:-1], L) + (np.arange(L.sum()) - np.repeat(offsets, L))
+        self.seg = np.repeat(np.arange(K), L)
+        self.start = x[b[:-1]]
+        self.end = x[b[1:]]
+        span = self.end - self.start
+        self.span = np.where(span == 0, 1.0, span)
+        # 含噪声数据的分支内可能存在小的反向，取累积最大值保证单调
+        self.s = np.maximum.accumulate(self.query(x[self.idx], self.seg))
+        self.n_branches = K
+
+    def query(self, g: np.ndarray, seg: np.ndarray) -> np.ndarray:
+        """分支seg[i]内位移g[i]对应的插值坐标"""
+        return seg + np.clip((g - self.start[seg]) / self.span[seg], 0.0, 1.0)
+
+
+class CurveComparator:
+    """试验曲线与模型曲线的比较(在模型的采样点上比较)
+
+    两条曲线各自在反向点处划分为单调分支，试验力按分支以`np.interp`插值到模型的各个采样点，
+    力误差按模型采样点的梯形积分权重(限于两者位移范围的重叠部分)加权，耗能误差也在模型的采样点上计算。
+    模型曲线本身不插值，因此粗糙的模型路径(如`coarse_protocol`)在分支中间跨过屈服点时不会产生插值误差，
+    试验曲线的采样应比模型路径密。试验力的插值和权重只计算一次，每次比较只需若干向量化归约。
+
+    Examples:
+        >>> cmp = CurveComparator(u_test, F_test, n_model=50)
+        >>> F_model, _ = test_py(cmp.strain, Steel01Material, paras, {})
+        >>> cmp.compare(F_model)['force_nrmse']
+    """
+
+    def __init__(self, x_test, F_test, strain=None, tol: float=0.0,
+                 weights: tuple=(1.0, 1.0, 1.0), n_model: int=None):
+        """
+        Args:
+            x_test (array_like): 试验位移
+            F_test (array_like): 试验力
+            strain (array_like | Protocol, optional): 模型的加载路径，默认为试验位移(或n_model对应的粗糙加载制度)
+            tol (float, optional): 划分分支时忽略的小幅反向，默认0
+            weights (tuple, optional): `objective`中力误差、耗能误差、峰值误差的权重
+            n_model (int, optional): 未给出strain时，模型使用每个分支n_model步的`coarse_protocol`
+        """
+        x_t = np.asarray(x_test, dtype=float)
+        self.F_test = np.asarray(F_test, dtype=float)
+        if x_t.shape != self.F_test.shape or x_t.ndim != 1:
+            raise ValueError('x_test and F_test should be 1D arrays of the same length')
+        self.x_test = x_t
+        if strain is None:
+            strain = x_t if n_model is None else coarse_protocol(x_t, n_model, tol)
+        self.strain = strain
+        x_m = np.asarray(self.strain, dtype=float)
+        self.x_model = x_m
+        self.weights = weights
+        b_t = split_branches(x_t, tol)
+        b_m = split_branches(x_m, tol)
+        if len(b_t) != len(b_m):
+            raise ValueError(f'Test curve has {len(b_t) - 1} branches, but model path has {len(b_m) - 1}')
+        self.b_test, self.b_model = b_t, b_m
+        self._test = _Branches(x_t, b_t)
+        self._model = _Branches(x_m, b_m)
+        # 各分支的重叠位移范围(沿加载方向)
+        direction = np.sign(self._test.end - self._test.start)
+        lo = np.where(direction >= 0, np.maximum(self._test.start, self._model.start),
+                      np.minimum(self._test.start, self._model.start))
+        hi = np.where(direction >= 0, np.minimum(self._test.end, self._model.end),
+                      np.maximum(self._test.end, self._model.end))
+        valid = (hi - lo) * direction > 0
+        # 试验力插值到模型各分支的采样点(分支端点在相邻两个分支中各出现一次)
+        seg = self._model.seg
+        x_pts = x_m[self._model.idx]
+        self.F_test_model = np.interp(self._test.query(x_pts, seg), self._test.s, self.F_test[self._test.idx])
+        # 梯形积分权重(各点代表的重叠范围内的位移长度)，无重叠的分支权重为0
+        x_c = np.clip(x_pts, np.minimum(lo, hi)[seg], np.maximum(lo, hi)[seg])
+        d = np.abs(np.diff(x_c)) * (seg[1:] == seg[:-1]) * valid[seg[1:]]
+        self._w = 0.5 * (np.concatenate((d, [0.0])) + np.concatenate(([0.0], d)))
+        self.F_scale = float(np.max(np.abs(self.F_test))) or 1.0
+        # 试验曲线的耗能在模型的采样点上计算(与模型耗能使用相同的梯形积分)
+        F_t = np.empty(len(x_m))
+        F_t[self._model.idx] = self.F_test_model
+        self.E_test = _branch_energy(x_m, F_t, b_m)
+
+    def compare(self, F_model) -> dict:
+        """比较模型力序列(对应于`strain`)与试验曲线
+
+        Returns:
+            dict:
+            * force_rmse: 模型采样点上力误差的均方根(按位移长度加权)
+            * force_nrmse: force_rmse / max|F_test|
+            * energy_error: 总耗能的相对误差(两者均在模型采样点上积分)
+            * branch_energy_error: 各分支耗能误差(模型 - 试验)
+            * peak_error: 各分支末端(反向点)的力误差(模型 - 试验)
+            * peak_nrmse: 峰值力误差的均方根 / max|F_test|
+            * objective: 按weights加权的综合误差
+        """
+        F_m = np.asarray(F_model, dtype=float)
+        if F_m.shape != self.x_model.shape:
+            raise ValueError(f'F_model should have {len(self.x_model)} points, but got {len(F_m)}')
+        e = F_m[self._model.idx] - self.F_test_model
+        W = self._w.sum()
+        rmse = float(np.sqrt(np.sum(self._w * e ** 2) / W)) if W > 0 else np.nan
+        E_model = _branch_energy(self.x_model, F_m, self.b_model)
+        E_t = self.E_test.sum()
+        energy_error = float((E_model.sum() - E_t) / abs(E_t)) if E_t != 0 else np.nan
+        peak_error = F_m[self.b_model[1:]] - self.F_test[self.b_test[1:]]
+        peak_nrmse = float(np.sqrt(np.mean(peak_error ** 2)) / self.F_scale)
+        out = {
+            'force_rmse': rmse,
+            'force_nrmse': rmse / self.F_scale,
+            'energy_error': energy_error,
+            'branch_energy_error': E_model - self.E_test,
+            'peak_error': peak_error,
+            'peak_nrmse': peak_nrmse,
+        }
+        wf, we, wp = self.weights
+        out['objective'] = wf * out['force_nrmse'] + we * abs(energy_error) + wp * peak_nrmse
+        return out
+
+    def objective(self, F_model) -> float:
+        """标定用的标量目标函数"""
+        return self.compare(F_model)['objective']
+
+
+def compare_curves(x_test, F_test, x_model, F_model, tol: float=0.0,
+                   weights: tuple=(1.0, 1.0, 1.0)) -> dict:
+    """比较两条滞回曲线(见`CurveComparator.compare`)
+
+    两条曲线的位移采样可以不同，但须具有相同的分支数。
+    """
+    return CurveComparator(x_test, F_test, x_model, tol, weights).compare(F_model)
+
+
+def _branch_energy(x: np.ndarray, F: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """各分支的耗能(梯形积分)"""
+    E = np.concatenate(([0.0], np.cumsum(0.5 * (F[1:] + F[:-1]) * np.diff(x))))
+    return E[b[1:]] - E[b[:-1]]
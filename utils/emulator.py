@@ -0,0 +1,246 @@
+import math
+import numpy as np
+from utils.parallel import run_threaded
+
+
+class ResponseEmulator:
+    """固定加载制度下材料滞回曲线的代理模型
+
+    在参数空间的网格或Sobol序列设计点上预先计算材料响应(应力序列)，对响应矩阵做POD(即PCA，
+    对中心化的响应矩阵做奇异值分解)得到少量基向量，再以径向基函数(三次多项式核加线性项)
+    插值各设计点上的POD系数。新参数的响应由插值得到的系数与基向量重构，
+    计算量与设计点数和基向量数有关，与材料的计算过程无关。
+
+    误差估计: 由Rippa公式一次性得到各设计点的留一法(LOO)插值误差，
+    新参数处的误差取邻近设计点LOO误差的距离加权平均，再加上POD截断误差。
+    `predict`中误差估计超过容差时退回到材料的逐步计算。
+
+    Examples:
+        >>> u = generate_path([0, 10, -10, 20, -20, 30, -30, 0], 100)
+        >>> base = dict(Fy=10, uy=1, alpha=0.02, n=2, Q=0.2, b=1.5, A=1, beta=0.5, gamma=0.5)
+        >>> emu = ResponseEmulator(u, 'ModBoucWen', base, {'Fy': (5, 20), 'alpha': (0.01, 0.1)}, n_samples=128)
+        >>> F, err, emulated = emu.predict({'Fy': 12.3, 'alpha': 0.05}, tol=1e-3)
+    """
+
+    def __init__(
+        self,
+        strain,
+        mat_type: str,
+        paras: dict,
+        bounds: dict,
+        design: str='sobol',
+        n_samples: int=256,
+        log: tuple=(),
+        energy: float=1 - 1e-10,
+        max_modes: int=64,
+        seed: int=0,
+        backend: str=None,
+        n_threads: int=None,
+    ):
+        """
+        Args:
+            strain (array_like | Protocol): 加载制度(应变序列)
+            mat_type (str): 材料名称
+            paras (dict): 材料的全部参数(关键字形式)，未在bounds中给出的参数保持不变
+            bounds (dict): 变化的参数及其范围，{参数名: (下限, 上限)}
+            design (str, optional): 'sobol'(需要scipy)或'grid'，默认'sobol'
+            n_samples (int, optional): 设计点数，'grid'时为近似值(每维取round(n_samples ** (1/d))个点)
+            log (tuple, optional): 在对数尺度上取样和插值的参数名
+            energy (float, optional): POD保留的能量比例，默认1-1e-10
+            max_modes (int, optional): 最多保留的基向量数，默认64
+            seed (int, optional): Sobol序列的随机种子
+            backend (str, optional): 计算设计点时的材料后端，默认自动选择
+            n_threads (int, optional): 计算设计点时的线程数
+        """
+        if not bounds:
+            raise ValueError('bounds should not be empty')
+        for name, (lo, hi) in bounds.items():
+            if not hi > lo:
+                raise ValueError(f'Invalid bounds of {name}: ({lo}, {hi})')
+            if name in log and lo <= 0:
+                raise ValueError(f'Lower bound of {name} should be positive for log scale')
+        self.strain = np.asarray(strain, dtype=float)
+        self.mat_type = mat_type
+        self.paras = dict(paras)
+        self.names = list(bounds)
+        self.log = tuple(log)
+        self.backend = backend
+        self._lo = np.array([self._scale(n, bounds[n][0]) for n in self.names])
+        self._hi = np.array([self._scale(n, bounds[n][1]) for n in self.names])
+        self.n_emulated = 0
+        self.n_fallback = 0
+        U = _design(design, n_samples, len(self.names), seed)
+        jobs = [(mat_type, (), self._paras_at(u)) for u in U]
+        Y, _ = run_threaded(self.strain, jobs, n_threads=n_threads, backend=backend)
+        ok = np.all(np.isfinite(Y), axis=1)
+        self.n_failed = int(np.count_nonzero(~ok))
+        if np.count_nonzero(ok) < len(self.names) + 2:
+            raise RuntimeError('Too few valid design points')
+        self._fit(U[ok], Y[ok], energy, max_modes)
+
+    # ------------------------------------------------------------------
+    # 参数变换
+    # ------------------------------------------------------------------
+    def _scale(self, name: str, value: float) -> float:
+        return math.log(value) if name in self.log else float(value)
+
+    def _unit(self, params: dict) -> np.ndarray:
+        """参数 -> 单位超立方体内的坐标"""
+        x = np.array([self._scale(n, params[n]) for n in self.names])
+        return (x - self._lo) / (self._hi - self._lo)
+
+    def _paras_at(self, u: np.ndarray) -> dict:
+        """单位超立方体内的坐标 -> 完整的材料参数"""
+        x = self._lo + u * (self._hi - self._lo)
+        paras = dict(self.paras)
+        for name, v in zip(self.names, x.tolist()):
+            paras[name] = math.exp(v) if name in self.log else v
+        return paras
+
+    # ------------------------------------------------------------------
+    # 建立模型
+    # ------------------------------------------------------------------
+    def _fit(self, U: np.ndarray, Y: np.ndarray, energy: float, max_modes: int):
+        self.U = U
+        self.mean = Y.mean(axis=0)
+        _, s, Vt = np.linalg.svd(Y - self.mean, full_matrices=False)
+        cum = np.cumsum(s ** 2)
+        total = cum[-1] if cum[-1] > 0 else 1.0
+        r = int(np.searchsorted(cum / total, energy) + 1)
+        r = max(1, min(r, max_modes, len(s)))
+        self.basis = Vt[:r]  # (r, n_steps)
+        coef = (Y - self.mean) @ self.basis.T  # (n, r)
+        # POD截断误差(相对于响应的均方根)
+        y_norm = np.linalg.norm(Y, axis=1)
+        y_norm[y_norm == 0] = 1.0
+        self.truncation_error = float(np.sqrt(max(total - cum[r - 1], 0.0) / len(Y)) / np.mean(y_norm))
+        # 径向基插值 [[Φ, P], [Pᵀ, 0]] [w; c] = [coef; 0]
+        n, d = U.shape
+        A = np.zeros((n + d + 1, n + d + 1))
+        A[:n, :n] = _kernel(np.linalg.norm(U[:, None] - U[None], axis=2))
+        P = np.hstack((np.ones((n, 1)), U))
+        A[:n, n:] = P
+        A[n:, :n] = P.T
+        rhs = np.zeros((n + d + 1, r))
+        rhs[:n] = coef
+        A_inv = np.linalg.pinv(A)
+        self.weights = A_inv @ rhs
+        # Rippa公式: 第i个设计点的留一误差 = (A⁻¹ rhs)_i / (A⁻¹)_ii
+        diag = np.diag(A_inv)[:n]
+        loo = self.weights[:n] / diag[:, None]
+        # 基向量正交，系数误差的范数即响应误差的范数
+        self.loo_error = np.linalg.norm(loo, axis=1) / y_norm
+        self.n_modes = r
+
+    # ------------------------------------------------------------------
+    # 查询
+    # ------------------------------------------------------------------
+    def __call__(self, params: dict) -> np.ndarray:
+        """代理模型预测的应力序列(不做误差检查)"""
+        return self._reconstruct(self._coef(self._unit({**self.paras, **params})))
+
+    def _coef(self, u: np.ndarray) -> np.ndarray:
+        phi = _kernel(np.linalg.norm(self.U - u, axis=1))
+        n = len(self.U)
+        return phi @ self.weights[:n] + self.weights[n] + u @ self.weights[n + 1:]
+
+    def _reconstruct(self, coef: np.ndarray) -> np.ndarray:
+        return self.mean + coef @ self.basis
+
+    def error_estimate(self, params: dict, k: int=None) -> float:
+        """参数处的相对误差估计(邻近设计点LOO误差的距离加权平均与POD截断误差之和)
+
+        超出设计范围(外推)时无法估计误差，返回inf。
+
+        Args:
+            params (dict): 变化参数的取值
+            k (int, optional): 参与平均的邻近设计点数，默认为参数维数+1
+        """
+        return self._error(self._unit({**self.paras, **params}), k)
+
+    def _error(self, u: np.ndarray, k: int=None) -> float:
+        # 外推时LOO误差不能反映实际误差，视为不可信
+        if np.any((u < -1e-9) | (u > 1.0 + 1e-9)):
+            return np.inf
+        k = min(k or len(self.names) + 1, len(self.U))
+        dist = np.linalg.norm(self.U - u, axis=1)
+        idx = np.argpartition(dist, k - 1)[:k]
+        w = 1.0 / (dist[idx] + 1e-12)
+        return float(np.sum(w * self.loo_error[idx]) / np.sum(w) + self.truncation_error)
+
+    def predict(self, params: dict, tol: float=1e-3) -> tuple[np.ndarray, float, bool]:
+        """预测应力序列，误差估计超过容差或参数超出设计范围时退回到材料的逐步计算
+
+        Args:
+            params (dict): 变化参数的取值(未给出的参数取建立模型时的值)
+            tol (float, optional): 相对误差容差，默认1e-3
+
+        Returns:
+            tuple[np.ndarray, float, bool]: 应力序列、误差估计、是否由代理模型给出
+        """
+        u = self._unit({**self.paras, **params})
+        err = self._error(u)
+        if err <= tol:
+            self.n_emulated += 1
+            return self._reconstruct(self._coef(u)), err, True
+        self.n_fallback += 1
+        paras = dict(self.paras)
+        paras.update(params)
+        stress, _ = run_threaded(self.strain, [(self.mat_type, (), paras)], n_threads=1, backend=self.backend)
+        return stress[0], err, False
+
+    # ------------------------------------------------------------------
+    # 保存与加载
+    # ------------------------------------------------------------------
+    def save(self, path: str):
+        """保存为npz文件(离线建立模型，交互时直接加载)"""
+        np.savez_compressed(
+            path, strain=self.strain, U=self.U, mean=self.mean, basis=self.basis,
+            weights=self.weights, loo_error=self.loo_error, lo=self._lo, hi=self._hi,
+            truncation_error=self.truncation_error, mat_type=self.mat_type,
+            names=np.array(self.names), log=np.array(self.log, dtype=str),
+            paras_keys=np.array(list(self.paras)), paras_values=np.array(list(self.paras.values()), dtype=object),
+            backend=np.array(self.backend, dtype=object), n_failed=self.n_failed,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'ResponseEmulator':
+        with np.load(path, allow_pickle=True) as data:
+            emu = cls.__new__(cls)
+            emu.strain = data['strain']
+            emu.U = data['U']
+            emu.mean = data['mean']
+            emu.basis = data['basis']
+            emu.weights = data['weights']
+            emu.loo_error = data['loo_error']
+            emu._lo = data['lo']
+            emu._hi = data['hi']
+            emu.truncation_error = float(data['truncation_error'])
+            emu.mat_type = str(data['mat_type'])
+            emu.names = data['names'].tolist()
+            emu.log = tuple(data['log'].tolist())
+            emu.paras = dict(zip(data['paras_keys'].tolist(), data['paras_values'].tolist()))
+            emu.backend = data['backend'].item()
+            emu.n_failed = int(data['n_failed'])
+        emu.n_modes = len(emu.basis)
+        emu.n_emulated = 0
+        emu.n_fallback = 0
+        return emu
+
+
+def _kernel(r: np.ndarray) -> np.ndarray:
+    """三次多项式径向基函数φ(r) = r³"""
+    return r ** 3
+
+
+def _design(design: str, n_samples: int, d: int, seed: int) -> np.ndarray:
+    """单位超立方体内的设计点"""
+    if design == 'sobol':
+        from scipy.stats import qmc
+        m = max(1, math.ceil(math.log2(n_samples)))
+        return qmc.Sobol(d, scramble=True, seed=seed).random_base2(m)[:n_samples]
+    elif design == 'grid':
+        n = max(2, round(n_samples ** (1 / d)))
+        axes = [np.linspace(0.0, 1.0, n)] * d
+        return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, d)
+    raise ValueError(f'Unknown design {design}')
@@ -0,0 +1,135 @@
+import math
+from typing import Callable
+
+
+class RainflowCounter:
+    """流式四点法雨流计数
+
+    逐点传入应变(`push`)，在线识别反向点并用四点法提取闭合循环，
+    每提取一个循环即调用`on_cycle(range, mean, count)`。
+    只保存尚未闭合的反向点(残余序列)，不保存加载历史。
+    """
+
+    def __init__(self, on_cycle: Callable[[float, float, float], None]=None, keep_cycles: bool=False):
+        """
+        Args:
+            on_cycle (Callable, optional): 提取循环时的回调，参数为循环幅度、均值、计数(1或0.5)
+            keep_cycles (bool, optional): 是否在`cycles`中保存已提取的全循环，默认False
+        """
+        self.on_cycle = on_cycle
+        self.keep_cycles = keep_cycles
+        self.reset()
+
+    def reset(self):
+        self.stack: list[float] = []  # 尚未闭合的反向点
+        self.cycles: list[tuple[float, float, float]] = []
+        self.n_cycles = 0
+        self._last: float = None
+        self._dir = 0
+
+    def push(self, x: float):
+        """传入下一个点"""
+        if self._last is None:
+            self._last = x
+            return
+        d = x - self._last
+        if d == 0:
+            return
+        direction = 1 if d > 0 else -1
+        if direction != self._dir:
+            # 加载方向改变(或第一个增量)，上一个点为反向点
+            self._add_reversal(self._last)
+            self._dir = direction
+        self._last = x
+
+    def _add_reversal(self, r: float):
+        stack = self.stack
+        stack.append(r)
+        while len(stack) >= 4:
+            A, B, C, D = stack[-4:]
+            X = abs(C - B)
+            if X <= abs(B - A) and X <= abs(D - C):
+                # B-C构成一个闭合的全循环
+                del stack[-3:-1]
+                self._count(X, 0.5 * (B + C), 1.0)
+            else:
+                break
+
+    def _count(self, rng: float, mean: float, count: float):
+        self.n_cycles += count
+        if self.keep_cycles:
+            self.cycles.append((rng, mean, count))
+        if self.on_cycle is not None:
+            self.on_cycle(rng, mean, count)
+
+    def residue(self) -> list[tuple[float, float, float]]:
+        """残余序列(含当前尚未确认的最后一个点)对应的半循环，不改变计数器状态"""
+        pts = list(self.stack)
+        if self._last is not None and (not pts or pts[-1] != self._last):
+            pts.append(self._last)
+        return [(abs(b - a), 0.5 * (a + b), 0.5) for a, b in zip(pts[:-1], pts[1:])]
+
+
+class FatigueDamage:
+    """基于雨流计数和Coffin-Manson/Miner准则的低周疲劳损伤累积
+
+    作为`test_py`等驱动函数的hooks使用。每个循环的塑性应变幅度为
+    Δεp = max(Δε - 2ey, 0)，疲劳寿命由Coffin-Manson公式Δεp/2 = εf(2Nf)^c求得，
+    按Miner线性准则累积损伤D += n/Nf。D达到1时`failed`为True，
+    若stop=True则`update`返回True以终止加载(与Failure材料类似)。
+    """
+
+    def __init__(self, eps_f: float, c: float, ey: float=0.0, stop: bool=True, include_residue: bool=False):
+        """
+        Args:
+            eps_f (float): 疲劳延性系数εf
+            c (float): 疲劳延性指数(负数)
+            ey (float, optional): 弹性应变限值，循环幅度中扣除2ey作为塑性应变幅度，默认0
+            stop (bool, optional): 损伤达到1时是否终止加载，默认True
+            include_residue (bool, optional): 判断破坏时是否计入残余半循环的损伤，默认False
+        """
+        if eps_f <= 0:
+            raise ValueError('eps_f must be positive')
+        if c >= 0:
+            raise ValueError('c must be negative')
+        if ey < 0:
+            raise ValueError('ey must be non-negative')
+        self.eps_f = eps_f
+        self.c = c
+        self.ey = ey
+        self.stop = stop
+        self.include_residue = include_residue
+        self.counter = RainflowCounter(on_cycle=self._on_cycle)
+        self.damage = 0.0
+        self.failed = False
+
+    def cycle_damage(self, rng: float, count: float=1.0) -> float:
+        """幅度为rng的count个循环造成的损伤"""
+        dep = rng - 2 * self.ey
+        if dep <= 0:
+            return 0.0
+        Nf = 0.5 * math.pow(dep / (2 * self.eps_f), 1 / self.c)
+        return count / Nf
+
+    def _on_cycle(self, rng: float, mean: float, count: float):
+        self.damage += self.cycle_damage(rng, count)
+
+    def total_damage(self) -> float:
+        """已闭合循环的损伤与残余半循环的损伤之和"""
+        return self.damage + sum(self.cycle_damage(rng, n) for rng, _, n in self.counter.residue())
+
+    def update(self, strain: float, stress: float=None) -> bool:
+        """传入已提交的当前步应变，返回是否终止加载"""
+        self.counter.push(strain)
+        D = self.total_damage() if self.include_residue else self.damage
+        if D >= 1:
+            self.failed = True
+        return self.failed and self.stop
+
+    def result(self) -> dict:
+        return {
+            'damage': self.damage,
+            'total_damage': self.total_damage(),
+            'n_cycles': self.counter.n_cycles,
+            'failed': self.failed,
+        }
@@ -1,15 +1,20 @@
 from typing import Type, TypeVar
 from src.UniaxialMaterial import UniaxialMaterial
+from utils.metrics import run_hooks
+from utils.telemetry import instrument
 
 
 T = TypeVar('T', bound=UniaxialMaterial)
 
+@instrument('opensees', 'mat_type')
 def test_opspy(
     strain: list[float],
     mat_type: str,
     paras_args: tuple,
     paras_kwargs: dict = {},
     strainRate: list[float] = None,
+    hooks: list = None,
+    record: bool = True,
 ) -> tuple[list, list]:
     """基于项目中openseespy.pyd的材料测试
 
@@ -19,6 +24,10 @@ def test_opspy(
         paras_args (tuple): 参数
         paras_kwargs (dict): 参数
         strainRate (list[float], optional): 应变率序列
+        hooks (list, optional): 每步提交后调用`hook.update(strain, stress)`的对象(如ResponseMetrics)，
+            任意一个返回True时终止加载
+        record (bool, optional): 是否保存应力、切线刚度历史，为False时返回空列表，默认True
+        telemetry (Telemetry, optional): 传入时记录本次计算的步数、用时、NaN输出和失败(见`utils.telemetry`)
 
     Returns:
         tuple[list, list]: 应力、切线刚度
@@ -40,17 +49,23 @@ def test_opspy(
         else:
             ops.setTrialStrain(val, strainRate[i])
         ops.commitState()
-        stess.append(ops.getStress())
-        tangent.append(ops.getTangent())
+        if record:
+            stess.append(ops.getStress())
+            tangent.append(ops.getTangent())
+        if hooks and run_hooks(hooks, val, ops.getStress()):
+            break
     return stess, tangent
 
 
+@instrument('py', 'mat_cls')
 def test_py(
     strain: list[float],
     mat_cls: Type[T],
     paras_args: tuple,
     paras_kwargs: dict,
     strainRate: list[float] = None,
+    hooks: list = None,
+    record: bool = True,
 ) -> tuple[list[float], list[float]]:
     """基于Python材料类的材料测试
 
@@ -60,29 +75,110 @@ def test_py(
         paras_args (list): 参数
         paras_kwargs (dict): 参数
         strainRate (list[float], optional): 应变率序列
+        hooks (list, optional): 每步提交后调用`hook.update(strain, stress)`的对象(如ResponseMetrics)，
+            任意一个返回True时终止加载
+        record (bool, optional): 是否保存应力、切线刚度历史，为False时返回空列表，默认True
+        telemetry (Telemetry, optional): 传入时记录本次计算的步数、用时、NaN输出和失败(见`utils.telemetry`)
 
     Returns:
         tuple[list[float], list[float]]: 应力、切线刚度
     """
-    mat = mat_cls(1, *paras_args, **paras_kwargs)
     stress = []
     tangent = []
-    for i, val in enumerate(strain):
-        if strainRate is None:
-            mat.setStrain(val)
+    try:
+        mat = mat_cls(1, *paras_args, **paras_kwargs)
+        for i, val in enumerate(strain):
+            if strainRate is None:
+                mat.setStrain(val)
+            else:
+                mat.setStrain(val, strainRate[i])
+            if record:
+                stress.append(mat.getStress())
+                tangent.append(mat.getTangent())
+            if hooks and run_hooks(hooks, val, mat.getStress()):
+                break
+    finally:
+        # 释放材料编号(包括构造或计算出错时)，以便再次调用
+        UniaxialMaterial.removeUniaxialMaterial(1)
+    return stress, tangent
+
+@instrument('py', 'mat_cls')
+def test_py_time(
+    time: list[float],
+    strain: list[float],
+    mat_cls: Type[T],
+    paras_args: tuple,
+    paras_kwargs: dict,
+    hooks: list = None,
+    record: bool = True,
+) -> tuple[list[float], list[float]]:
+    """基于时间序列的率相关材料测试(如GeneralizedMaxwell)
+
+    时间增量dt和应变率在循环开始前一次性向量化计算，支持非均匀时间步长。
+    若材料实现了`setTrialStrainDt`，则直接传入dt，应变增量为0的步(保持阶段)也能正确松弛；
+    否则退回到`setTrialStrain(strain, strainRate)`。
+
+    Args:
+        time (list[float]): 时间序列(单调不减)，第一步的时间增量视为0
+        strain (list[float]): 应变序列
+        mat_cls (Type[T]): 材料类(UniaxialMaterial的子类)
+        paras_args (tuple): 参数
+        paras_kwargs (dict): 参数
+        hooks (list, optional): 每步提交后调用`hook.update(strain, stress)`的对象(如ResponseMetrics)，
+            任意一个返回True时终止加载
+        record (bool, optional): 是否保存应力、切线刚度历史，为False时返回空列表，默认True
+        telemetry (Telemetry, optional): 传入时记录本次计算的步数、用时、NaN输出和失败(见`utils.telemetry`)
+
+    Returns:
+        tuple[list[float], list[float]]: 应力、切线刚度
+    """
+    import numpy as np
+    time = np.asarray(time, dtype=float)
+    strain = np.asarray(strain, dtype=float)
+    if time.shape != strain.shape or time.ndim != 1:
+        raise ValueError('time and strain should be 1D arrays of the same length')
+    dt = np.diff(time, prepend=time[:1])
+    if np.any(dt < 0):
+        raise ValueError('time should be non-decreasing')
+    d_eps = np.diff(strain, prepend=0.0)
+    strainRate = np.divide(d_eps, dt, out=np.zeros_like(d_eps), where=dt > 0)
+    stress = []
+    tangent = []
+    try:
+        mat = mat_cls(1, *paras_args, **paras_kwargs)
+        if hasattr(mat, 'setTrialStrainDt'):
+            for val, dt_i in zip(strain.tolist(), dt.tolist()):
+                mat.setTrialStrainDt(val, dt_i)
+                mat.commitState()
+                if record:
+                    stress.append(mat.getStress())
+                    tangent.append(mat.getTangent())
+                if hooks and run_hooks(hooks, val, mat.getStress()):
+                    break
         else:
-            mat.setStrain(val, strainRate[i])
-        stress.append(mat.getStress())
-        tangent.append(mat.getTangent())
+            for val, rate_i in zip(strain.tolist(), strainRate.tolist()):
+                mat.setStrain(val, rate_i)
+                if record:
+                    stress.append(mat.getStress())
+                    tangent.append(mat.getTangent())
+                if hooks and run_hooks(hooks, val, mat.getStress()):
+                    break
+    finally:
+        # 释放材料编号(包括构造或计算出错时)，以便再次调用
+        UniaxialMaterial.removeUniaxialMaterial(1)
     return stress, tangent
 
+@instrument('ext', 'mat_type')
 def test_ext(
     strain: list[float],
     mat_type: str,
     paras_args: tuple,
     paras_kwargs: dict,
-    strainRate: list[float] = None,) -> tuple[list[float], list[float]]:
-    """导入python的c扩展进行材料测试
+    strainRate: list[float] = None,
+    hooks: list = None,
+    record: bool = True,
+) -> tuple[list[float], list[float]]:
+    """导入python的c扩展进行材料测试(ext目录或src下就地编译的扩展)
 
     Args:
         strain (list[float]): 应变序列
@@ -90,13 +186,16 @@ def test_ext(
         paras_args (list): 参数
         paras_kwargs (dict): 参数
         strainRate (list[float], optional): 应变率序列
+        hooks (list, optional): 每步提交后调用`hook.update(strain, stress)`的对象(如ResponseMetrics)，
+            任意一个返回True时终止加载
+        record (bool, optional): 是否保存应力、切线刚度历史，为False时返回空列表，默认True
+        telemetry (Telemetry, optional): 传入时记录本次计算的步数、用时、NaN输出和失败(见`utils.telemetry`)
 
     Returns:
         tuple[list[float], list[float]]: 应力、切线刚度
     """
-    import importlib
-    module = importlib.import_module(f'ext.{mat_type}')
-    mat_cls = getattr(module, mat_type)
+    from src.factory import get_material_class
+    mat_cls = get_material_class(mat_type, backend='ext')
     mat = mat_cls(1, *paras_args, **paras_kwargs)
     stress = []
     tangent = []
@@ -105,8 +204,11 @@ def test_ext(
             mat.setStrain(val)
         else:
             mat.setStrain(val, strainRate[i])
-        stress.append(mat.getStress())
-        tangent.append(mat.getTangent())
+        if record:
+            stress.append(mat.getStress())
+            tangent.append(mat.getTangent())
+        if hooks and run_hooks(hooks, val, mat.getStress()):
+            break
     return stress, tangent
 
 def generate_path(disp_level: list, n: int=200, sf: float=1):
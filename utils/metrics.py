@@ -0,0 +1,149 @@
+import math
+
+
+class ResponseMetrics:
+    """加载过程中逐步累积的响应指标(内存占用与加载步数无关)
+
+    作为`test_py`等驱动函数的hooks使用，每步提交后调用`update(strain, stress)`。
+    累积的指标包括:
+    * 滞回耗能(梯形积分)
+    * 累积塑性变形CPD(与`Failure`相同的屈服面追踪方法，需提供uy)
+    * 每圈的正、负向峰值(位移及对应的力)、耗能和等效阻尼比
+    * 残余变形(最近一次力过零时的变形)
+
+    以位移由负向正穿过0作为一圈的结束，每圈的等效阻尼比为
+    ξ = E / (π(F⁺u⁺ + F⁻u⁻))，其中u⁺、u⁻为本圈的峰值位移，F⁺、F⁻为对应的力。
+    """
+
+    def __init__(self, uy: float=None, keep_cycles: bool=True):
+        """
+        Args:
+            uy (float, optional): 屈服变形，提供时计算累积塑性变形
+            keep_cycles (bool, optional): 是否保存每圈的指标，默认True
+        """
+        if uy is not None and uy <= 0:
+            raise ValueError('uy must be positive')
+        self.uy = uy
+        self.keep_cycles = keep_cycles
+        self.reset()
+
+    def reset(self):
+        self.n_steps = 0
+        self.strain = 0.0
+        self.stress = 0.0
+        self.energy = 0.0
+        self.cpd = 0.0
+        self.yieldface = self.uy
+        self.max_strain = 0.0
+        self.min_strain = 0.0
+        self.max_stress = 0.0
+        self.min_stress = 0.0
+        self.residual = 0.0
+        self.max_residual = 0.0
+        self.cycles: list[dict] = []
+        self._new_cycle()
+
+    def _new_cycle(self):
+        self._cyc_energy = 0.0
+        self._cyc_umax = 0.0
+        self._cyc_Fumax = 0.0
+        self._cyc_umin = 0.0
+        self._cyc_Fumin = 0.0
+        self._cyc_Fmax = 0.0
+        self._cyc_Fmin = 0.0
+
+    def update(self, strain: float, stress: float) -> bool:
+        """传入已提交的当前步应变和应力，返回False(不终止加载)"""
+        u0, F0 = self.strain, self.stress
+        du = strain - u0
+        dE = 0.5 * (stress + F0) * du
+        self.n_steps += 1
+        self.energy += dE
+        self._cyc_energy += dE
+        # 累积塑性变形
+        if self.uy is not None:
+            if strain > self.yieldface:
+                self.cpd += strain - self.yieldface
+                self.yieldface = strain
+            elif strain < self.yieldface - 2 * self.uy:
+                self.cpd += self.yieldface - 2 * self.uy - strain
+                self.yieldface = strain + 2 * self.uy
+        # 峰值
+        self.max_strain = max(self.max_strain, strain)
+        self.min_strain = min(self.min_strain, strain)
+        self.max_stress = max(self.max_stress, stress)
+        self.min_stress = min(self.min_stress, stress)
+        if strain > self._cyc_umax:
+            self._cyc_umax, self._cyc_Fumax = strain, stress
+        if strain < self._cyc_umin:
+            self._cyc_umin, self._cyc_Fumin = strain, stress
+        self._cyc_Fmax = max(self._cyc_Fmax, stress)
+        self._cyc_Fmin = min(self._cyc_Fmin, stress)
+        # 残余变形(力过零点处线性插值)
+        if (F0 > 0 >= stress or F0 < 0 <= stress) and stress != F0:
+            self.residual = u0 + du * F0 / (F0 - stress)
+            self.max_residual = max(self.max_residual, abs(self.residual))
+        # 位移由负向正穿过0，一圈结束
+        if u0 < 0 <= strain:
+            self._close_cycle()
+        self.strain, self.stress = strain, stress
+        return False
+
+    def _close_cycle(self):
+        if self.keep_cycles:
+            Es = self._cyc_Fumax * self._cyc_umax + self._cyc_Fumin * self._cyc_umin
+            self.cycles.append({
+                'energy': self._cyc_energy,
+                'umax': self._cyc_umax,
+                'umin': self._cyc_umin,
+                'Fmax': self._cyc_Fmax,
+                'Fmin': self._cyc_Fmin,
+                'xi_eq': self._cyc_energy / (math.pi * Es) if Es > 0 else math.nan,
+            })
+        self._new_cycle()
+
+    def result(self) -> dict:
+        """当前累积的指标"""
+        return {
+            'n_steps': self.n_steps,
+            'energy': self.energy,
+            'cpd': self.cpd if self.uy is not None else math.nan,
+            'max_strain': self.max_strain,
+            'min_strain': self.min_strain,
+            'max_stress': self.max_stress,
+            'min_stress': self.min_stress,
+            'residual': self.residual,
+            'max_residual': self.max_residual,
+            'cycles': list(self.cycles),
+        }
+
+
+def run_hooks(hooks: list, strain: float, stress: float) -> bool:
+    """依次调用所有hooks，任意一个返回True时返回True(终止加载)"""
+    stop = False
+    for hook in hooks:
+        if hook.update(strain, stress):
+            stop = True
+    return stop
+
+
+def format_counters(counters: dict, width: int=40) -> str:
+    """将材料的`getCounters()`结果格式化为文本直方图
+
+    Args:
+        counters (dict): 分支名称 -> 进入次数
+        width (int, optional): 最长条形的字符数，默认40
+
+    Returns:
+        str: 每行为名称、次数、占比和条形
+    """
+    if not counters:
+        return '(counters disabled)'
+    total = sum(counters.values())
+    peak = max(counters.values()) or 1
+    name_width = max(len(name) for name in counters)
+    lines = []
+    for name, n in counters.items():
+        bar = '#' * round(width * n / peak)
+        lines.append(f'{name:<{name_width}}  {n:>10d}  {n / total if total else 0:6.1%}  {bar}')
+    return '\n'.join(lines)
@@ -0,0 +1,320 @@
+import math
+import zlib
+from statistics import NormalDist
+import numpy as np
+from utils.parallel import run_threaded
+
+
+# ----------------------------------------------------------------------
+# 参数分布
+# ----------------------------------------------------------------------
+# 分布以逆累积分布函数(u ∈ (0, 1) -> 参数值)表示，也可以直接使用scipy的冻结分布(调用其ppf)。
+# 所有参数都由[0, 1)均匀随机数变换得到，同一随机种子下各设计方案的同名参数使用相同的均匀随机数(公共随机数)。
+
+def uniform(lo: float, hi: float):
+    """[lo, hi)上的均匀分布"""
+    return lambda u: lo + (hi - lo) * u
+
+
+def normal(mean: float, std: float):
+    """正态分布"""
+    dist = NormalDist(mean, std)
+    return lambda u: np.array([dist.inv_cdf(v) for v in _open(u).tolist()])
+
+
+def lognormal(mean: float, cov: float):
+    """对数正态分布
+
+    Args:
+        mean (float): 均值
+        cov (float): 变异系数
+    """
+    s2 = math.log(1 + cov ** 2)
+    dist = NormalDist(math.log(mean) - s2 / 2, math.sqrt(s2))
+    return lambda u: np.exp([dist.inv_cdf(v) for v in _open(u).tolist()])
+
+
+def _open(u: np.ndarray) -> np.ndarray:
+    """避免逆累积分布函数在0处无定义"""
+    return np.clip(u, 1e-16, 1 - 1e-16)
+
+
+class ParameterSampler:
+    """按参数名独立的随机数流分块抽样
+
+    每个参数的均匀随机数流由(seed, 参数名)确定，分块抽样的结果与一次性抽样相同，
+    且与其他参数及其分布无关，因此比较不同设计方案时可以使用公共随机数。
+    """
+
+    def __init__(self, distributions: dict, seed: int=0):
+        """
+        Args:
+            distributions (dict): {参数名: 逆累积分布函数或scipy冻结分布}
+            seed (int, optional): 随机种子
+        """
+        self.distributions = dict(distributions)
+        self.seed = seed
+        self._rngs = {name: np.random.default_rng([seed, zlib.crc32(name.encode())])
+                      for name in self.distributions}
+
+    def draw(self, size: int) -> dict[str, np.ndarray]:
+        """依次抽取下一块样本"""
+        out = {}
+        for name, dist in self.distributions.items():
+            u = self._rngs[name].random(size)
+            ppf = getattr(dist, 'ppf', dist)
+            out[name] = np.asarray(ppf(u), dtype=float)
+        return out
+
+
+# ----------------------------------------------------------------------
+# 流式统计量
+# ----------------------------------------------------------------------
+class Welford:
+    """逐步(对各加载步向量化)的流式均值和方差，按块合并(Chan等的并行算法)"""
+
+    def __init__(self, n_steps: int):
+        self.n = 0
+        self.mean = np.zeros(n_steps)
+        self.M2 = np.zeros(n_steps)
+
+    def update(self, Y: np.ndarray):
+        """传入一块样本，形状为(块大小, 步数)"""
+        nb = len(Y)
+        if nb == 0:
+            return
+        mb = Y.mean(axis=0)
+        M2b = ((Y - mb) ** 2).sum(axis=0)
+        N = self.n + nb
+        delta = mb - self.mean
+        self.mean += delta * (nb / N)
+        self.M2 += M2b + delta ** 2 * (self.n * nb / N)
+        self.n = N
+
+    @property
+    def var(self) -> np.ndarray:
+        return self.M2 / (self.n - 1) if self.n > 1 else np.full_like(self.mean, np.nan)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.var)
+
+
+class P2Quantile:
+    """P²算法的流式分位数估计(Jain & Chlamtac, 1985)，对各加载步和各分位数向量化
+
+    每个分位数、每一步只保存5个标记点，内存与样本数无关。
+    """
+
+    def __init__(self, n_steps: int, probs: tuple=(0.05, 0.5, 0.95)):
+        self.probs = np.asarray(probs, dtype=float)
+        if np.any((self.probs <= 0) | (self.probs >= 1)):
+            raise ValueError('probs should be in (0, 1)')
+        m = len(self.probs)
+        p = self.probs[:, None]
+        self.n = 0
+        self._buffer = []
+        self._q = np.empty((m, 5, n_steps))  # 标记点高度
+        self._pos = np.empty((m, 5, n_steps))  # 标记点位置
+        self._desired = np.hstack((np.ones((m, 1)), 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, np.full((m, 1), 5.0)))
+        self._dn = np.hstack((np.zeros((m, 1)), p / 2, p, (1 + p) / 2, np.ones((m, 1))))
+
+    def update(self, Y: np.ndarray):
+        """传入一块样本，形状为(块大小, 步数)"""
+        for y in np.asarray(Y, dtype=float):
+            self._update_one(y)
+
+    def _update_one(self, x: np.ndarray):
+        self.n += 1
+        if self.n <= 5:
+            self._buffer.append(x)
+            if self.n == 5:
+                self._q[:] = np.sort(np.array(self._buffer), axis=0)[None]
+                self._pos[:] = np.arange(1.0, 6.0)[None, :, None]
+                self._desired = self._desired[:, :, None] * np.ones_like(self._pos)
+                self._buffer = []
+            return
+        q, pos = self._q, self._pos
+        # 样本所在的区间k(0~3)，并更新两端的标记点
+        k = (x >= q[:, 1:4]).sum(axis=1)
+        np.minimum(q[:, 0], x, out=q[:, 0])
+        np.maximum(q[:, 4], x, out=q[:, 4])
+        pos += np.arange(5)[None, :, None] > k[:, None, :]
+        self._desired += self._dn[:, :, None]
+        # 调整中间的3个标记点
+        for i in (1, 2, 3):
+            d = self._desired[:, i] - pos[:, i]
+            up = (d >= 1) & (pos[:, i + 1] - pos[:, i] > 1)
+            down = (d <= -1) & (pos[:, i - 1] - pos[:, i] < -1)
+            move = up | down
+            if not move.any():
+                continue
+            s = np.where(up, 1.0, -1.0)
+            n0, n1, n2 = pos[:, i - 1], pos[:, i], pos[:, i + 1]
+            q0, q1, q2 = q[:, i - 1], q[:, i], q[:, i + 1]
+            # 抛物线插值
+            qp = q1 + s / (n2 - n0) * ((n1 - n0 + s) * (q2 - q1) / (n2 - n1)
+                                       + (n2 - n1 - s) * (q1 - q0) / (n1 - n0))
+            # 不单调时改用线性插值
+            qs = np.where(up, q2, q0)
+            ns = np.where(up, n2, n0)
+            ql = q1 + s * (qs - q1) / (ns - n1)
+            q_new = np.where((q0 < qp) & (qp < q2), qp, ql)
+            q[:, i] = np.where(move, q_new, q1)
+            pos[:, i] += np.where(move, s, 0.0)
+
+    def result(self) -> dict[float, np.ndarray]:
+        """{分位数: 各步的估计值}"""
+        if self.n == 0:
+            return {}
+        if self.n < 5:
+            Y = np.array(self._buffer)
+            return {p: np.quantile(Y, p, axis=0) for p in self.probs.tolist()}
+        return {p: self._q[j, 2].copy() for j, p in enumerate(self.probs.tolist())}
+
+
+class StreamingStats:
+    """各加载步响应的均值、标准差、最值和分位数"""
+
+    def __init__(self, n_steps: int, probs: tuple=(0.05, 0.5, 0.95)):
+        self.moments = Welford(n_steps)
+        self.quantiles = P2Quantile(n_steps, probs) if probs else None
+        self.min = np.full(n_steps, np.inf)
+        self.max = np.full(n_steps, -np.inf)
+
+    def update(self, Y: np.ndarray):
+        if len(Y) == 0:
+            return
+        self.moments.update(Y)
+        if self.quantiles is not None:
+            self.quantiles.update(Y)
+        np.minimum(self.min, Y.min(axis=0), out=self.min)
+        np.maximum(self.max, Y.max(axis=0), out=self.max)
+
+    def result(self) -> dict:
+        return {
+            'n': self.moments.n,
+            'mean': self.moments.mean.copy(),
+            'std': self.moments.std,
+            'min': self.min.copy(),
+            'max': self.max.copy(),
+            'quantiles': self.quantiles.result() if self.quantiles is not None else {},
+        }
+
+
+# ----------------------------------------------------------------------
+# 蒙特卡洛分析
+# ----------------------------------------------------------------------
+def run_monte_carlo(
+    strain,
+    mat_type: str,
+    paras: dict,
+    distributions: dict,
+    n_samples: int,
+    probs: tuple=(0.05, 0.5, 0.95),
+    block: int=64,
+    seed: int=0,
+    backend: str=None,
+    n_threads: int=None,
+    return_samples: bool=False,
+) -> dict:
+    """材料参数不确定性的蒙特卡洛分析
+
+    参数按块抽样，每块由`run_threaded`计算(默认使用最快的可用后端)，
+    计算结果用于更新流式统计量后即被丢弃，内存占用与样本数无关。
+    输出含NaN的样本计为失败，不参与统计。
+
+    Args:
+        strain (array_like | Protocol): 加载制度
+        mat_type (str): 材料名称
+        paras (dict): 材料的全部参数(关键字形式)，distributions中的参数将被样本值替换
+        distributions (dict): {参数名: 逆累积分布函数或scipy冻结分布}，见`uniform`、`normal`、`lognormal`
+        n_samples (int): 样本数
+        probs (tuple, optional): 需要估计的分位数，默认(0.05, 0.5, 0.95)
+        block (int, optional): 每块的样本数，默认64
+        seed (int, optional): 随机种子，不同设计方案使用相同的种子即为公共随机数
+        backend (str, optional): 材料后端，默认自动选择
+        n_threads (int, optional): 线程数
+        return_samples (bool, optional): 是否返回参数样本，默认False
+
+    Returns:
+        dict: n(有效样本数)、n_failed、mean、std、min、max、quantiles({分位数: 应力序列})，
+        以及return_samples为True时的samples({参数名: 样本数组})
+    """
+    x = np.asarray(strain, dtype=float)
+    sampler = ParameterSampler(distributions, seed)
+    stats = StreamingStats(len(x), probs)
+    n_failed = 0
+    samples = {name: [] for name in distributions} if return_samples else None
+    for start in range(0, n_samples, block):
+        theta = sampler.draw(min(block, n_samples - start))
+        Y = _run_block(x, mat_type, paras, theta, backend, n_threads)
+        ok = np.all(np.isfinite(Y), axis=1)
+        n_failed += int(np.count_nonzero(~ok))
+        stats.update(Y[ok])
+        if return_samples:
+            for name, v in theta.items():
+                samples[name].append(v)
+    out = stats.result()
+    out['n_failed'] = n_failed
+    if return_samples:
+        out['samples'] = {name: np.concatenate(v) for name, v in samples.items()}
+    return out
+
+
+def compare_designs(
+    strain,
+    mat_type: str,
+    paras_a: dict,
+    paras_b: dict,
+    distributions_a: dict,
+    distributions_b: dict=None,
+    n_samples: int=1000,
+    probs: tuple=(0.05, 0.5, 0.95),
+    block: int=64,
+    seed: int=0,
+    backend: str=None,
+    n_threads: int=None,
+) -> dict:
+    """以公共随机数比较两个设计方案，统计逐样本的响应差(方案B - 方案A)
+
+    两个方案的同名参数由相同的均匀随机数变换得到，差值的方差远小于独立抽样时的方差。
+
+    Args:
+        paras_a (dict): 方案A的材料参数
+        paras_b (dict): 方案B的材料参数
+        distributions_a (dict): 方案A的参数分布
+        distributions_b (dict, optional): 方案B的参数分布，默认与方案A相同
+        其余参数同`run_monte_carlo`
+
+    Returns:
+        dict: 响应差的统计量(同`run_monte_carlo`)，n_failed为任一方案失败的样本数
+    """
+    x = np.asarray(strain, dtype=float)
+    sampler_a = ParameterSampler(distributions_a, seed)
+    sampler_b = ParameterSampler(distributions_b or distributions_a, seed)
+    stats = StreamingStats(len(x), probs)
+    n_failed = 0
+    for start in range(0, n_samples, block):
+        size = min(block, n_samples - start)
+        Ya = _run_block(x, mat_type, paras_a, sampler_a.draw(size), backend, n_threads)
+        Yb = _run_block(x, mat_type, paras_b, sampler_b.draw(size), backend, n_threads)
+        ok = np.all(np.isfinite(Ya), axis=1) & np.all(np.isfinite(Yb), axis=1)
+        n_failed += int(np.count_nonzero(~ok))
+        stats.update(Yb[ok] - Ya[ok])
+    out = stats.result()
+    out['n_failed'] = n_failed
+    return out
+
+
+def _run_block(x, mat_type, paras, theta, backend, n_threads) -> np.ndarray:
+    size = len(next(iter(theta.values()))) if theta else 0
+    jobs = []
+    for j in range(size):
+        p = dict(paras)
+        for name, v in theta.items():
+            p[name] = float(v[j])
+        jobs.append((mat_type, (), p))
+    # 参数无效(构造函数抛出异常)或计算出错的样本结果为NaN，计入n_failed
+    stress, _ = run_threaded(x, jobs, n_threads=n_threads, backend=backend, on_error='nan')
+    return stress
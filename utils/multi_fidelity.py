@@ -0,0 +1,165 @@
+import numpy as np
+from utils.curve_compare import CurveComparator
+from utils.parallel import run_threaded
+
+
+class MultiFidelityEvaluator:
+    """两级精度的标定目标函数评估
+
+    候选参数先在粗糙加载制度(试验路径的反向点 + 每个分支n_coarse步，见`coarse_protocol`)上计算目标函数，
+    只有较优的候选再在完整加载路径上计算。率无关的分段线性材料(如TSSCB)在粗糙制度下的反向点响应是精确的，
+    ModBoucWen等光滑模型的粗糙结果存在离散误差，两级目标函数的一致性由秩相关系数检验:
+    除晋级的候选外，另随机抽取一部分未晋级的候选进行完整计算(审计)，以免相关系数只反映较优候选的局部排序。
+
+    Examples:
+        >>> ev = MultiFidelityEvaluator(u_test, F_test, 'TSSCB', paras, n_coarse=10, keep=0.1)
+        >>> for gen in range(n_gen):
+        ...     f, full = ev.evaluate(population)  # population为参数字典的列表
+        >>> ev.report()
+    """
+
+    def __init__(
+        self,
+        x_test,
+        F_test,
+        mat_type: str,
+        paras: dict,
+        n_coarse: int=10,
+        strain_full=None,
+        keep: float=0.1,
+        min_keep: int=1,
+        audit: float=0.05,
+        tol: float=0.0,
+        weights: tuple=(1.0, 1.0, 1.0),
+        seed: int=0,
+        backend: str=None,
+        n_threads: int=None,
+    ):
+        """
+        Args:
+            x_test (array_like): 试验位移
+            F_test (array_like): 试验力
+            mat_type (str): 材料名称
+            paras (dict): 材料的全部参数(关键字形式)，候选参数将覆盖其中的同名项
+            n_coarse (int, optional): 粗糙制度每个分支的步数，默认10
+            strain_full (array_like | Protocol, optional): 完整精度的加载路径，默认为试验位移
+            keep (float, optional): 每批中晋级完整计算的比例，默认0.1
+            min_keep (int, optional): 每批中最少晋级的候选数，默认1
+            audit (float, optional): 未晋级候选中随机进行完整计算的比例，默认0.05
+            tol (float, optional): 划分分支时忽略的小幅反向
+            weights (tuple, optional): 目标函数中力误差、耗能误差、峰值误差的权重
+            seed (int, optional): 审计抽样的随机种子
+            backend (str, optional): 材料后端，默认自动选择
+            n_threads (int, optional): 线程数
+        """
+        if not 0 < keep <= 1:
+            raise ValueError('keep should be in (0, 1]')
+        self.mat_type = mat_type
+        self.paras = dict(paras)
+        self.keep = keep
+        self.min_keep = min_keep
+        self.audit = audit
+        self.backend = backend
+        self.n_threads = n_threads
+        self.coarse = CurveComparator(x_test, F_test, tol=tol, weights=weights, n_model=n_coarse)
+        self.full = CurveComparator(x_test, F_test, strain_full, tol=tol, weights=weights)
+        self._rng = np.random.default_rng(seed)
+        self.n_candidates = 0
+        self.n_full = 0
+        self.steps = 0
+        self.pairs: list[tuple[float, float]] = []
+        self.best = None
+        self.best_objective = np.inf
+
+    def _objectives(self, comparator: CurveComparator, candidates: list[dict]) -> np.ndarray:
+        jobs = [(self.mat_type, (), {**self.paras, **c}) for c in candidates]
+        stress, _ = run_threaded(comparator.strain, jobs, n_threads=self.n_threads, backend=self.backend)
+        self.steps += stress.size
+        f = np.array([comparator.objective(F) for F in stress])
+        # 计算失败(NaN)的候选视为最差
+        return np.where(np.isfinite(f), f, np.inf)
+
+    def evaluate(self, candidates: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+        """评估一批候选参数
+
+        Args:
+            candidates (list[dict]): 候选参数
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 目标函数(晋级的候选为完整精度的值，其余为粗糙精度的值)、
+            是否进行了完整计算
+        """
+        n = len(candidates)
+        if n == 0:
+            return np.empty(0), np.empty(0, dtype=bool)
+        f = self._objectives(self.coarse, candidates)
+        n_keep = min(n, max(self.min_keep, int(np.ceil(self.keep * n))))
+        full = np.zeros(n, dtype=bool)
+        full[np.argsort(f, kind='stable')[:n_keep]] = True
+        rest = np.flatnonzero(~full)
+        n_audit = min(len(rest), int(self._rng.binomial(len(rest), self.audit))) if self.audit > 0 else 0
+        if n_audit:
+            full[self._rng.choice(rest, n_audit, replace=False)] = True
+        idx = np.flatnonzero(full)
+        f_full = self._objectives(self.full, [candidates[i] for i in idx])
+        self.pairs.extend(zip(f[idx].tolist(), f_full.tolist()))
+        f[idx] = f_full
+        self.n_candidates += n
+        self.n_full += len(idx)
+        i_best = idx[np.argmin(f_full)]
+        if f[i_best] < self.best_objective:
+            self.best_objective = float(f[i_best])
+            self.best = dict(candidates[i_best])
+        return f, full
+
+    def __call__(self, candidate: dict) -> float:
+        """逐个评估(用于串行优化器)，粗糙目标函数不劣于当前最优值时进行完整计算"""
+        f = float(self._objectives(self.coarse, [candidate])[0])
+        self.n_candidates += 1
+        if f <= self.best_objective or (self.audit > 0 and self._rng.random() < self.audit):
+            f_full = float(self._objectives(self.full, [candidate])[0])
+            self.pairs.append((f, f_full))
+            self.n_full += 1
+            if f_full < self.best_objective:
+                self.best_objective = f_full
+                self.best = dict(candidate)
+            return f_full
+        return f
+
+    def correlation(self) -> float:
+        """已完整计算的候选中，两级目标函数的Spearman秩相关系数"""
+        finite = [(a, b) for a, b in self.pairs if np.isfinite(a) and np.isfinite(b)]
+        if len(finite) < 3:
+            return np.nan
+        a, b = np.array(finite).T
+        ra, rb = _rank(a), _rank(b)
+        if ra.std() == 0 or rb.std() == 0:
+            return np.nan
+        return float(np.corrcoef(ra, rb)[0, 1])
+
+    def report(self) -> dict:
+        """评估统计
+
+        Returns:
+            dict: 候选数、完整计算数、计算步数相对于全部完整计算的比例(cost_ratio)、
+            Spearman秩相关系数及样本数、当前最优参数及其目标函数
+        """
+        full_steps = self.n_candidates * len(self.full.x_model)
+        return {
+            'n_candidates': self.n_candidates,
+            'n_full': self.n_full,
+            'cost_ratio': self.steps / full_steps if full_steps else np.nan,
+            'spearman': self.correlation(),
+            'n_pairs': len(self.pairs),
+            'best': self.best,
+            'best_objective': self.best_objective,
+        }
+
+
+def _rank(a: np.ndarray) -> np.ndarray:
+    """秩(相同值取平均秩)"""
+    order = np.argsort(a, kind='stable')
+    ranks = np.empty(len(a))
+    ranks[order] = np.arange(len(a))
+    _, inv, counts = np.unique(a, return_inverse=True, return_counts=True)
+    return (np.bincount(inv, ranks) / counts)[inv]
@@ -0,0 +1,213 @@
+import os
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+import numpy as np
+
+
+class OpenSeesPool:
+    """常驻的OpenSees工作进程池，用于批量计算参考结果
+
+    每个工作进程只导入一次OpenSees模块，之后依次处理(材料, 参数, 应变序列)任务，
+    每个任务开始前调用`wipe`重新定义材料，因此各任务相互独立。
+    一批任务的应变输入和应力、切线刚度输出放在同一块共享内存中，进程间只传递任务描述。
+
+    Examples:
+        >>> with OpenSeesPool(4) as pool:
+        ...     results = pool.map([('Steel01', (10, 2, 0.02), {}, u), ('ModBoucWen', paras, {}, u)])
+        >>> stress, tangent = results[0]
+    """
+
+    def __init__(self, n_workers: int=None, module: str='bin.opensees', telemetry=None):
+        """
+        Args:
+            n_workers (int, optional): 工作进程数，默认为CPU核数
+            module (str, optional): OpenSees模块名，默认为项目中的'bin.opensees'
+            telemetry (Telemetry, optional): 传入时记录各任务的步数、用时、NaN输出、失败和进程池利用率
+        """
+        self.n_workers = n_workers or mp.cpu_count()
+        self.module = module
+        self.telemetry = telemetry
+        self.tasks = mp.Queue()
+        # 结果通过管道同步发送(mp.Queue由后台线程发送，进程崩溃时已完成任务的结果可能丢失)
+        self._results, self._results_w = mp.Pipe(duplex=False)
+        self._results_lock = mp.Lock()
+        if os.name == 'posix':
+            # 工作进程与主进程共用同一个resource_tracker，共享内存仅由主进程释放
+            from multiprocessing import resource_tracker
+            resource_tracker.ensure_running()
+        # 各工作进程正在计算的任务序号(-1为空闲)，进程崩溃时据此确定丢失的任务
+        self.current = mp.Array('q', [-1] * self.n_workers, lock=False)
+        self._batch = 0
+        self.workers = [self._spawn(k) for k in range(self.n_workers)]
+
+    def _spawn(self, k: int) -> mp.Process:
+        self.current[k] = -1
+        p = mp.Process(target=_worker, daemon=True, args=(
+            self.module, self.tasks, self._results_w, self._results_lock, self.current, k))
+        p.start()
+        return p
+
+    def _check_workers(self, pending: set, errors: dict):
+        """将崩溃的工作进程正在计算的任务记为失败，并启动新的工作进程代替
+
+        Raises:
+            RuntimeError: 工作进程在空闲时退出(如无法导入OpenSees模块)
+        """
+        idle_exit = None
+        for k, p in enumerate(self.workers):
+            if p.is_alive():
+                continue
+            i = self.current[k]
+            if i in pending:
+                pending.discard(i)
+                errors[i] = f'OpenSees worker died (exit code {p.exitcode})'
+            elif i < 0:
+                idle_exit = p.exitcode
+            self.workers[k] = self._spawn(k)
+        if idle_exit is not None:
+            raise RuntimeError(f'OpenSees worker exited unexpectedly (exit code {idle_exit})')
+
+    def map(self, jobs: list[tuple]) -> list[tuple[np.ndarray, np.ndarray]]:
+        """批量计算
+
+        Args:
+            jobs (list[tuple]): 每个任务为(mat_type, paras_args, paras_kwargs, strain)
+                或(mat_type, paras_args, paras_kwargs, strain, strainRate)
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: 各任务的应力、切线刚度，顺序与jobs一致
+
+        Raises:
+            RuntimeError: 任务出错或工作进程崩溃(如OpenSees内部段错误)，其余任务仍会计算完成
+        """
+        if not jobs:
+            return []
+        strains = [np.asarray(job[3], dtype=float).ravel() for job in jobs]
+        lengths = [len(u) for u in strains]
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        N = int(offsets[-1])
+        # 共享内存布局: 4行N列，依次为应变、应变率、应力、切线刚度
+        t0 = time.perf_counter()
+        # 批次编号，用于丢弃此前中断的批次遗留的结果
+        self._batch += 1
+        shm = shared_memory.SharedMemory(create=True, size=max(4 * N, 1) * 8)
+        try:
+            buf = np.ndarray((4, N), dtype=float, buffer=shm.buf)
+            for i, job in enumerate(jobs):
+                sl = slice(offsets[i], offsets[i + 1])
+                buf[0, sl] = strains[i]
+                has_rate = len(job) > 4 and job[4] is not None
+                if has_rate:
+                    buf[1, sl] = np.asarray(job[4], dtype=float).ravel()
+                mat_type, paras_args, paras_kwargs = job[:3]
+                self.tasks.put((self._batch, i, shm.name, N, int(offsets[i]), lengths[i],
+                                mat_type, tuple(paras_args) + tuple(paras_kwargs.values()), has_rate))
+            errors = {}
+            elapsed = [0.0] * len(jobs)
+            pending = set(range(len(jobs)))
+            while pending:
+                # 等待结果或任一工作进程退出
+                ready = wait([self._results] + [p.sentinel for p in self.workers])
+                if self._results not in ready:
+                    self._check_workers(pending, errors)
+                    continue
+                batch, i, err, dt = self._results.recv()
+                if batch != self._batch or i not in pending:
+                    continue
+                pending.discard(i)
+                elapsed[i] = dt
+                if err is not None:
+                    errors[i] = err
+            if self.telemetry is not None:
+                self._record(jobs, lengths, offsets, buf, errors, elapsed, time.perf_counter() - t0)
+            if errors:
+                i = min(errors)
+                raise RuntimeError(f'Job {i} ({jobs[i][0]}) failed in OpenSees worker: {errors[i]}')
+            out = []
+            for i in range(len(jobs)):
+                sl = slice(offsets[i], offsets[i + 1])
+                out.append((buf[2, sl].copy(), buf[3, sl].copy()))
+            del buf
+        finally:
+            shm.close()
+            shm.unlink()
+        return out
+
+    def run(self, mat_type: str, paras_args: tuple, paras_kwargs: dict, strain,
+            strainRate=None) -> tuple[np.ndarray, np.ndarray]:
+        """计算单个任务"""
+        return self.map([(mat_type, paras_args, paras_kwargs, strain, strainRate)])[0]
+
+    def _record(self, jobs, lengths, offsets, buf, errors, elapsed, wall):
+        for i, job in enumerate(jobs):
+            if i in errors:
+                self.telemetry.record_run(job[0], 'opensees', 0, elapsed[i], failed=True)
+            else:
+                F = buf[2, offsets[i]:offsets[i + 1]]
+                self.telemetry.record_run(job[0], 'opensees', lengths[i], elapsed[i],
+                                          n_nan=int(np.count_nonzero(np.isnan(F))))
+        self.telemetry.record_batch('opensees', min(self.n_workers, len(jobs)), len(jobs), wall, sum(elapsed))
+
+    def close(self):
+        for _ in self.workers:
+            self.tasks.put(None)
+        for p in self.workers:
+            p.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _worker(module: str, tasks, results, lock, current, k: int):
+    import importlib
+    ops = importlib.import_module(module)
+    # 只有项目中编译的openseespy有setTrialStrain和commitState函数，否则使用setStrain
+    stepwise = hasattr(ops, 'setTrialStrain') and hasattr(ops, 'commitState')
+    shm = None
+    buf = None
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        batch, i, name, N, offset, n, mat_type, paras, has_rate = task
+        current[k] = i
+        t0 = time.perf_counter()
+        try:
+            if shm is None or shm.name != name:
+                if shm is not None:
+                    shm.close()
+                shm = shared_memory.SharedMemory(name=name)
+            buf = np.ndarray((4, N), dtype=float, buffer=shm.buf)
+            sl = slice(offset, offset + n)
+            strain = buf[0, sl].tolist()
+            rate = buf[1, sl].tolist() if has_rate else [0.0] * n
+            ops.wipe()
+            ops.uniaxialMaterial(mat_type, 1, *paras)
+            ops.testUniaxialMaterial(1)
+            stress = []
+            tangent = []
+            for val, rate_i in zip(strain, rate):
+                if stepwise:
+                    ops.setTrialStrain(val, rate_i)
+                    ops.commitState()
+                else:
+                    ops.setStrain(val, rate_i)
+                stress.append(ops.getStress())
+                tangent.append(ops.getTangent())
+            buf[2, sl] = stress
+            buf[3, sl] = tangent
+            msg = (batch, i, None, time.perf_counter() - t0)
+        except Exception as e:
+            msg = (batch, i, repr(e), time.perf_counter() - t0)
+        with lock:
+            results.send(msg)
+        current[k] = -1
+        # 释放对共享内存的引用，以便切换到下一批任务的共享内存
+        buf = None
+    if shm is not None:
+        shm.close()
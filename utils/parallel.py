@@ -0,0 +1,149 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.factory import make_material
+
+
+def gil_enabled() -> bool:
+    """当前解释器是否启用了GIL(自由线程构建的Python 3.13t/3.14t返回False)"""
+    is_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_enabled is None else is_enabled()
+
+
+def run_threaded(
+    strain,
+    jobs: list[tuple],
+    n_threads: int=None,
+    backend: str=None,
+    telemetry=None,
+    on_error: str='raise',
+) -> tuple[np.ndarray, np.ndarray]:
+    """在线程池中对多个相互独立的材料实例进行计算
+
+    所有任务共用同一个应变序列，结果直接写入预先分配的二维数组的对应行，
+    不需要进程间的序列化和内存复制。材料编号空间是线程局部的，各线程中的材料互不干扰。
+    在自由线程的Python中各线程可并行运行；启用GIL时结果相同，但没有加速效果。
+
+    Args:
+        strain (array_like | Protocol): 应变序列
+        jobs (list[tuple]): 每个任务为(mat_type, paras_args)或(mat_type, paras_args, paras_kwargs)
+        n_threads (int, optional): 线程数，默认为CPU核数
+        backend (str, optional): 材料后端'ext'或'py'，默认自动选择(见`src.factory`)
+        telemetry (Telemetry, optional): 传入时记录各任务的步数、用时、NaN输出和线程池利用率
+        on_error (str, optional): 任务(构造或计算)出错时的处理方式，'raise'抛出异常(默认)，
+            'nan'将该任务的结果行置为NaN并继续计算其他任务
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: 形状为(len(jobs), len(strain))的应力、切线刚度
+    """
+    x = np.asarray(strain, dtype=float).tolist()
+    stress = np.empty((len(jobs), len(x)))
+    tangent = np.empty((len(jobs), len(x)))
+
+    n_threads = n_threads or os.cpu_count()
+    if on_error not in ('raise', 'nan'):
+        raise ValueError(f"on_error should be 'raise' or 'nan', but got {on_error!r}")
+
+    def run(i: int) -> float:
+        t0 = time.perf_counter()
+        mat_type, paras_args = jobs[i][:2]
+        paras_kwargs = jobs[i][2] if len(jobs[i]) > 2 else {}
+        try:
+            mat = make_material(mat_type, 1, *paras_args, backend=backend, **paras_kwargs)
+        except Exception:
+            # Python材料的构造函数抛出异常时编号已登记，需释放以免影响该线程的后续任务
+            from src.UniaxialMaterial import UniaxialMaterial
+            UniaxialMaterial.removeUniaxialMaterial(1)
+            if on_error == 'raise':
+                raise
+            stress[i] = np.nan
+            tangent[i] = np.nan
+            return time.perf_counter() - t0
+        try:
+            F = []
+            k = []
+            for val in x:
+                mat.setTrialStrain(val)
+                mat.commitState()
+                F.append(mat.getStress())
+                k.append(mat.getTangent())
+            stress[i] = F
+            tangent[i] = k
+        except Exception:
+            if telemetry is not None:
+                telemetry.record_run(mat_type, _backend_of(mat), 0, time.perf_counter() - t0, failed=True)
+            if on_error == 'raise':
+                raise
+            stress[i] = np.nan
+            tangent[i] = np.nan
+            return time.perf_counter() - t0
+        finally:
+            _release(mat)
+        dt = time.perf_counter() - t0
+        if telemetry is not None:
+            telemetry.record_run(mat_type, _backend_of(mat), len(x), dt,
+                                 n_nan=int(np.count_nonzero(np.isnan(stress[i]))))
+        return dt
+
+    t0 = time.perf_counter()
+    busy = 0.0
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        # 逐个取回结果，使工作线程中的异常在此处抛出
+        for dt in pool.map(run, range(len(jobs))):
+            busy += dt
+    if telemetry is not None:
+        telemetry.record_batch('threads', min(n_threads, len(jobs)), len(jobs), time.perf_counter() - t0, busy)
+    return stress, tangent
+
+
+def _backend_of(mat) -> str:
+    from src.UniaxialMaterial import UniaxialMaterial
+    return 'py' if isinstance(mat, UniaxialMaterial) else 'ext'
+
+
+def _release(mat):
+    """释放当前线程中材料占用的编号(扩展材料为弱引用登记，无需处理)"""
+    from src.UniaxialMaterial import UniaxialMaterial
+    if isinstance(mat, UniaxialMaterial):
+        UniaxialMaterial.removeUniaxialMaterial(mat.tag)
+
+
+def benchmark(
+    mat_type: str='Steel01',
+    paras_args: tuple=(10, 2, 0.02),
+    n_jobs: int=64,
+    n_steps: int=20000,
+    threads: list[int]=None,
+    backend: str=None,
+) -> list[tuple[int, float, float]]:
+    """线程数与计算速度的关系
+
+    Returns:
+        list[tuple[int, float, float]]: (线程数, 用时, 相对单线程的加速比)
+    """
+    strain = 30 * np.sin(np.linspace(0, 20 * np.pi, n_steps))
+    jobs = [(mat_type, paras_args)] * n_jobs
+    if threads is None:
+        threads = [1]
+        while threads[-1] * 2 <= (os.cpu_count() or 1):
+            threads.append(threads[-1] * 2)
+    results = []
+    for n in threads:
+        t0 = time.perf_counter()
+        run_threaded(strain, jobs, n_threads=n, backend=backend)
+        dt = time.perf_counter() - t0
+        results.append((n, dt, results[0][1] / dt if results else 1.0))
+    return results
+
+
+if __name__ == "__main__":
+    # python -m utils.parallel [mat_type paras...]，如python -m utils.parallel Steel01 10 2 0.02
+    from src.factory import get_backend
+    mat_type = sys.argv[1] if len(sys.argv) > 1 else 'Steel01'
+    paras_args = tuple(float(v) for v in sys.argv[2:]) or (10, 2, 0.02)
+    print(f'Python {sys.version.split()[0]}, GIL enabled: {gil_enabled()}, '
+          f'CPU count: {os.cpu_count()}, backend of {mat_type}: {get_backend(mat_type)}')
+    for n, dt, speedup in benchmark(mat_type, paras_args):
+        print(f'threads = {n:3d}  time = {dt:8.3f} s  speedup = {speedup:5.2f}')
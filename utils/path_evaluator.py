@@ -0,0 +1,218 @@
+import inspect
+import sys
+import numpy as np
+from utils.protocol import Protocol, find_reversals
+
+
+# 各材料的初始切线刚度
+_INIT_TANGENT = {
+    'Steel01': lambda p: 0.0,
+    'TwoStage': lambda p: p['k1'],
+    'TSSCB': lambda p: p['k0'],
+}
+
+
+def evaluate_path(
+    strain: list[float],
+    mat_type: str,
+    paras_args: tuple,
+    paras_kwargs: dict = {},
+) -> tuple[np.ndarray, np.ndarray]:
+    """率无关分段线性材料的解析路径计算
+
+    在反向点处将加载路径划分为单调段，每一段内的应力由闭合解对所有点一次性向量化计算，
+    Python层面的计算量正比于反向点(及屈服、钩距闭合等转折点)的数量，而与路径点数无关。
+    结果与逐点调用`setTrialStrain`/`commitState`一致(至舍入误差)。
+
+    支持的材料:
+    * Steel01
+    * TwoStage
+    * TSSCB(仅当整个路径处于第一阶段，即|strain| <= min(ugap, uh, uf)时使用解析解，
+      否则退回到逐点计算)
+
+    Args:
+        strain (list[float] | Protocol): 应变序列，为Protocol时直接以其转折点划分单调段
+        mat_type (str): 材料名称
+        paras_args (tuple): 参数
+        paras_kwargs (dict, optional): 参数
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: 应力、切线刚度
+    """
+    if isinstance(strain, Protocol):
+        b = strain.breakpoints()
+    else:
+        b = None
+    x = np.asarray(strain, dtype=float)
+    if mat_type not in _KERNELS:
+        raise ValueError(f'Analytic path evaluation is not available for {mat_type}')
+    paras = _bind_paras(mat_type, paras_args, paras_kwargs)
+    if mat_type == 'TSSCB':
+        limit = min(paras['ugap'], paras['uh'], paras['uf'])
+        if paras['ugap'] == 0 or np.max(np.abs(x)) > limit:
+            return _evaluate_stepwise(x, mat_type, paras_args, paras_kwargs)
+    kernel, state = _KERNELS[mat_type](paras)
+    stress = np.empty_like(x)
+    if b is None:
+        b = find_reversals(x)
+    # 第一个点由初始状态(应变为0)加载得到
+    stress[:1], state = kernel(state, x[:1])
+    for i0, i1 in zip(b[:-1], b[1:]):
+        stress[i0 + 1:i1 + 1], state = kernel(state, x[i0 + 1:i1 + 1])
+    tangent = _secant_tangent(x, stress, _INIT_TANGENT[mat_type](paras))
+    return stress, tangent
+
+
+def _bind_paras(mat_type: str, paras_args: tuple, paras_kwargs: dict) -> dict:
+    """按材料类的构造函数签名解析参数(不创建材料对象)"""
+    mat_cls = _material_class(mat_type)
+    bound = inspect.signature(mat_cls).bind(0, *paras_args, **paras_kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def _material_class(mat_type: str):
+    if mat_type == 'Steel01':
+        from src.Steel01.Steel01 import Steel01Material
+        return Steel01Material
+    elif mat_type == 'TwoStage':
+        from src.TwoStage.TwoStage import TwoStage
+        return TwoStage
+    elif mat_type == 'TSSCB':
+        from src.TSSCB.TSSCB import TSSCB
+        return TSSCB
+    raise ValueError(f'Unknown material type {mat_type}')
+
+
+def _evaluate_stepwise(x, mat_type, paras_args, paras_kwargs):
+    from utils.material_test import test_py
+    stress, tangent = test_py(x.tolist(), _material_class(mat_type), paras_args, paras_kwargs)
+    return np.array(stress), np.array(tangent)
+
+
+def _secant_tangent(x: np.ndarray, stress: np.ndarray, tangent0: float) -> np.ndarray:
+    """逐点割线刚度，应变增量为0的点沿用上一点的切线刚度"""
+    dx = np.diff(x, prepend=0.0)
+    dF = np.diff(stress, prepend=0.0)
+    valid = np.abs(dx) > sys.float_info.epsilon
+    tangent = np.full_like(x, tangent0)
+    tangent[valid] = dF[valid] / dx[valid]
+    # 前向填充无效点
+    idx = np.where(valid, np.arange(len(x)), -1)
+    idx = np.maximum.accumulate(idx)
+    return np.where(idx >= 0, tangent[np.maximum(idx, 0)], tangent0)
+
+
+def _bilinear(F0: float, u0: float, u: np.ndarray, direction: float,
+              Fy: float, k: float, kp: float) -> np.ndarray:
+    """双线性模型在单调段内的闭合解(与TwoStage.bilinear逐点计算结果一致)"""
+    if Fy == 0:
+        return np.zeros_like(u)
+    F = F0 + k * (u - u0)
+    if direction > 0:
+        return np.minimum(F, kp * u + (1 - kp / k) * Fy)
+    else:
+        return np.maximum(F, kp * u - (1 - kp / k) * Fy)
+
+
+def _direction(state_strain: float, e: np.ndarray) -> float:
+    return float(np.sign(e[-1] - state_strain)) if len(e) else 0.0
+
+
+def _steel01(paras: dict):
+    Fy, k, b = paras['Fy'], paras['k'], paras['b']
+    if not (Fy > 0 and k > 0):
+        raise ValueError('Fy and k must be positive')
+    uy = Fy / k
+
+    def kernel(state, e):
+        eps0, sig0 = state
+        F = sig0 + k * (e - eps0)
+        F = np.where(F > b * k * (e - uy) + Fy, b * k * (e - uy) + Fy, F)
+        F = np.where(F < b * k * (e + uy) - Fy, b * k * (e + uy) - Fy, F)
+        return F, (e[-1], F[-1])
+
+    return kernel, (0.0, 0.0)
+
+
+def _twostage(paras: dict):
+    F1, k1, kp1 = paras['F1'], paras['k1'], paras['kp1']
+    F2, k2, kp2 = paras['F2'], paras['k2'], paras['kp2']
+    ua = paras['ua']
+    if ua < 0:
+        raise ValueError('ua must be non-negative')
+
+    def element2(state, e_prev, e, d):
+        """二阶单元(钩距触发)在单调段内的应力，必要时在钩距状态转变处继续划分"""
+        s2, u2, gap = state
+        F = np.empty_like(e)
+        start = 0
+        while start < len(e):
+            ee = e[start:]
+            p = d * (ee - e_prev)  # 本段内的累积变形(非负)
+            if -ua < gap < ua:
+                # 钩距内滑动，闭合后以双线性模型加载
+                g = ua - gap if d > 0 else gap + ua
+                du2 = d * np.maximum(p - g, 0.0)
+                F[start:] = _bilinear(s2, u2, u2 + du2, d, F2, k2, kp2)
+                s2, u2 = F[-1], u2 + du2[-1]
+                gap = d * ua if p[-1] >= g else gap + d * p[-1]
+                break
+            elif (gap == ua and d > 0) or (gap == -ua and d < 0 and gap != ua):
+                # 钩距沿加载方向闭合
+                F[start:] = _bilinear(s2, u2, u2 + d * p, d, F2, k2, kp2)
+                s2, u2 = F[-1], u2 + d * p[-1]
+                break
+            else:
+                # 钩距沿反方向闭合: 先弹性卸载至0，再张开钩距
+                Fe = _bilinear(s2, u2, u2 + d * p, d, F2, k2, kp2)
+                cross = np.flatnonzero(d * Fe > 0)
+                if len(cross) == 0:
+                    F[start:] = Fe
+                    s2, u2 = Fe[-1], u2 + d * p[-1]
+                    break
+                j = cross[0]
+                F[start:start + j] = Fe[:j]
+                Fc = Fe[j - 1] if j > 0 else s2
+                ec = ee[j - 1] if j > 0 else e_prev
+                du = ee[j] - ec
+                dstrain2 = du * abs(Fc) / (abs(Fe[j]) + abs(Fc))
+                gap = -d * ua + (du - dstrain2)
+                gap = max(gap, -ua) if d < 0 else min(gap, ua)
+                # 与逐点计算一致，穿越步的二阶单元应变按整个增量推进
+                u2 = u2 + (ee[j] - e_prev)
+                s2 = 0.0
+                F[start + j] = 0.0
+                e_prev = ee[j]
+                start += j + 1
+        return F, (s2, u2, gap)
+
+    def kernel(state, e):
+        eps0, s1, s2, u2, gap = state
+        d = _direction(eps0, e)
+        if d == 0:
+            return np.full_like(e, s1 + s2), state
+        F_1 = _bilinear(s1, eps0, e, d, F1, k1, kp1)
+        F_2, (s2, u2, gap) = element2((s2, u2, gap), eps0, e, d)
+        return F_1 + F_2, (e[-1], F_1[-1], s2, u2, gap)
+
+    return kernel, (0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def _tsscb(paras: dict):
+    F1, k0 = paras['F1'], paras['k0']
+
+    def kernel(state, e):
+        # 第一阶段: 理想弹塑性摩擦模型
+        eps0, sig0 = state
+        F = np.clip(sig0 + k0 * (e - eps0), -F1, F1)
+        return F, (e[-1], F[-1])
+
+    return kernel, (0.0, 0.0)
+
+
+_KERNELS = {
+    'Steel01': _steel01,
+    'TwoStage': _twostage,
+    'TSSCB': _tsscb,
+}
@@ -0,0 +1,227 @@
+import numpy as np
+from utils.curve_compare import split_branches
+
+
+def decimate(x, y, n_buckets: int, method: str='minmax', idx: np.ndarray=None) -> np.ndarray:
+    """按单调分支对滞回曲线降采样
+
+    每个分支按其点数比例分配桶数(至少1个)，分支的首尾点(反向点)总是保留。
+    * minmax: 每个桶保留首点、末点及y的最小、最大值点，保证曲线的包络不变
+    * lttb: Largest-Triangle-Three-Buckets，每个桶保留1个使三角形面积最大的点
+
+    Args:
+        x (array_like): 位移
+        y (array_like): 力
+        n_buckets (int): 总桶数(约为绘图区域的像素宽度)
+        method (str, optional): 'minmax'或'lttb'，默认'minmax'
+        idx (np.ndarray, optional): 只在这些(递增的)索引上降采样，默认为全部点
+
+    Returns:
+        np.ndarray: 保留点的索引(递增)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if idx is None:
+        idx = np.arange(len(x))
+    n = len(idx)
+    if n <= max(4 * n_buckets, 2):
+        return idx
+    b = split_branches(x[idx])
+    L = np.diff(b)
+    L[-1] += 1  # 最后一个分支包含终点
+    # 各分支的桶数
+    B = np.maximum(1, np.floor(L * (n_buckets / n))).astype(int)
+    B = np.minimum(B, L)
+    offsets = np.concatenate(([0], np.cumsum(B)[:-1]))
+    local = np.arange(n) - np.repeat(b[:-1], L)
+    bucket = np.repeat(offsets, L) + local * np.repeat(B, L) // np.repeat(L, L)
+    if method == 'minmax':
+        keep = _minmax(y[idx], bucket)
+    elif method == 'lttb':
+        keep = _lttb(x[idx], y[idx], bucket)
+    else:
+        raise ValueError(f'Unknown method {method}')
+    keep = np.union1d(keep, b)
+    return idx[keep]
+
+
+def _minmax(y: np.ndarray, bucket: np.ndarray) -> np.ndarray:
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:] - 1, len(y) - 1]
+    yy = np.where(np.isnan(y), np.inf, y)
+    lo = np.minimum.reduceat(yy, starts)
+    yy = np.where(np.isnan(y), -np.inf, y)
+    hi = np.maximum.reduceat(yy, starts)
+    i_lo = _first(y == lo[bucket], bucket)
+    i_hi = _first(y == hi[bucket], bucket)
+    return np.unique(np.concatenate((starts, ends, i_lo, i_hi)))
+
+
+def _first(mask: np.ndarray, bucket: np.ndarray) -> np.ndarray:
+    """每个桶中第一个满足mask的索引"""
+    i = np.flatnonzero(mask)
+    bk = bucket[i]
+    return i[np.r_[True, bk[1:] != bk[:-1]]] if len(i) else i
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, bucket: np.ndarray) -> np.ndarray:
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(x)]
+    counts = ends - starts
+    xm = np.add.reduceat(x, starts) / counts
+    ym = np.add.reduceat(y, starts) / counts
+    keep = [0]
+    a = 0
+    for j in range(1, len(starts)):
+        s, e = starts[j], ends[j]
+        if j + 1 < len(starts):
+            xn, yn = xm[j + 1], ym[j + 1]
+        else:
+            xn, yn = x[-1], y[-1]
+        area = np.abs((x[a] - xn) * (y[s:e] - y[a]) - (x[a] - x[s:e]) * (yn - y[a]))
+        a = s + int(np.argmax(area)) if len(area) > 1 else s
+        keep.append(a)
+    keep.append(len(x) - 1)
+    return np.array(keep)
+
+
+class HysteresisPlot:
+    """按像素数降采样绘制的滞回曲线，缩放、平移后重新从完整数据中选取可见部分降采样
+
+    Examples:
+        >>> p = plot_hysteresis({'py': (u, F_py), 'ext': (u, F_ext)})
+        >>> plt.show()
+    """
+
+    def __init__(self, ax, curves: dict, method: str='minmax', oversample: float=1.0, **kwargs):
+        """
+        Args:
+            ax (matplotlib.axes.Axes): 坐标轴
+            curves (dict): {标签: (位移, 力)}
+            method (str, optional): 降采样方法'minmax'或'lttb'，默认'minmax'
+            oversample (float, optional): 每像素的桶数，默认1
+            **kwargs: 传递给`ax.plot`的其他参数
+        """
+        self.ax = ax
+        self.method = method
+        self.oversample = oversample
+        self.data = {}
+        self.lines = {}
+        for label, (x, y) in curves.items():
+            x = np.asarray(x, dtype=float)
+            y = np.asarray(y, dtype=float)
+            if x.shape != y.shape:
+                raise ValueError(f'{label}: x and y should have the same length')
+            self.data[label] = (x, y)
+            self.lines[label], = ax.plot([], [], label=label, **kwargs)
+        # 以完整数据确定初始坐标范围
+        xs = np.concatenate([d[0] for d in self.data.values()])
+        ys = np.concatenate([d[1] for d in self.data.values()])
+        ax.update_datalim(np.column_stack((
+            [np.nanmin(xs), np.nanmax(xs)], [np.nanmin(ys), np.nanmax(ys)])))
+        ax.autoscale_view()
+        self.update()
+        self._cids = [
+            ax.callbacks.connect('xlim_changed', self._on_lims),
+            ax.callbacks.connect('ylim_changed', self._on_lims),
+        ]
+
+    def _on_lims(self, ax):
+        self.update()
+        ax.figure.canvas.draw_idle()
+
+    def update(self):
+        """按当前坐标范围和绘图区域宽度重新降采样"""
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        n_buckets = max(16, int(self.ax.bbox.width * self.oversample))
+        for label, (x, y) in self.data.items():
+            visible = (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+            # 保留可见点的相邻点，使穿出边界的线段完整
+            visible[1:] |= visible[:-1].copy()
+            visible[:-1] |= visible[1:].copy()
+            idx = np.flatnonzero(visible)
+            if len(idx) == 0:
+                self.lines[label].set_data([], [])
+                continue
+            keep = decimate(x, y, n_buckets, self.method, idx)
+            xd, yd = x[keep], y[keep]
+            # 相邻保留点之间存在不可见点时断开
+            hidden = np.cumsum(~visible)
+            gap = np.flatnonzero(hidden[keep[1:] - 1] - hidden[keep[:-1]] > 0)
+            if len(gap):
+                xd = np.insert(xd, gap + 1, np.nan)
+                yd = np.insert(yd, gap + 1, np.nan)
+            self.lines[label].set_data(xd, yd)
+
+    def disconnect(self):
+        for cid in self._cids:
+            self.ax.callbacks.disconnect(cid)
+        self._cids = []
+
+
+def plot_hysteresis(curves, ax=None, method: str='minmax', legend: bool=True, **kwargs) -> HysteresisPlot:
+    """绘制(多条)滞回曲线，按绘图区域的像素数降采样
+
+    Args:
+        curves (dict | tuple): {标签: (位移, 力)}，或单条曲线(位移, 力)
+        ax (matplotlib.axes.Axes, optional): 坐标轴，默认为当前坐标轴
+        method (str, optional): 降采样方法'minmax'或'lttb'，默认'minmax'
+        legend (bool, optional): 是否显示图例，默认True
+        **kwargs: 传递给`ax.plot`的其他参数
+
+    Returns:
+        HysteresisPlot: 绘图对象(需保持引用，缩放时才会重新降采样)
+    """
+    import matplotlib.pyplot as plt
+    if ax is None:
+        ax = plt.gca()
+    if not isinstance(curves, dict):
+        curves = {None: curves}
+        legend = False
+    plot = HysteresisPlot(ax, curves, method, **kwargs)
+    if legend:
+        ax.legend()
+    return plot
+
+
+def plot_backends(
+    strain,
+    mat_type: str,
+    paras_args: tuple,
+    paras_kwargs: dict={},
+    backends: tuple=('py', 'ext', 'opspy'),
+    ax=None,
+    method: str='minmax',
+) -> HysteresisPlot:
+    """分别以Python材料、扩展材料和openseespy计算并叠加绘制滞回曲线，不可用的后端跳过
+
+    Args:
+        strain (array_like | Protocol): 应变序列
+        mat_type (str): 材料名称
+        paras_args (tuple): 参数
+        paras_kwargs (dict, optional): 参数
+        backends (tuple, optional): 后端，默认('py', 'ext', 'opspy')
+        ax (matplotlib.axes.Axes, optional): 坐标轴
+        method (str, optional): 降采样方法
+    """
+    from src.factory import get_material_class
+    from utils.material_test import test_py, test_ext, test_opspy
+    x = np.asarray(strain, dtype=float)
+    curves = {}
+    for backend in backends:
+        try:
+            if backend == 'py':
+                F, _ = test_py(x.tolist(), get_material_class(mat_type, 'py'), paras_args, paras_kwargs)
+            elif backend == 'ext':
+                F, _ = test_ext(x.tolist(), mat_type, paras_args, paras_kwargs)
+            elif backend == 'opspy':
+                F, _ = test_opspy(x.tolist(), mat_type, paras_args, paras_kwargs)
+            else:
+                raise ValueError(f'Unknown backend {backend}')
+        except ImportError:
+            continue
+        curves[f'F_{backend}'] = (x, F)
+    if not curves:
+        raise RuntimeError(f'No backend of {mat_type} is available')
+    return plot_hysteresis(curves, ax, method)
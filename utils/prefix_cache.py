@@ -0,0 +1,121 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from src.factory import supports_state
+from utils.protocol import Protocol, find_reversals
+from utils.result_store import param_key
+
+
+class PrefixStateCache:
+    """共享加载历史前缀的状态缓存
+
+    在加载路径的每个分段点(反向点)处保存材料的已提交状态(`getState`)及此前的应力、切线刚度，
+    键为(材料类, 参数, 路径前缀哈希)。新的计算从已缓存的最长前缀处恢复(`setState`)，
+    仅计算剩余部分。适用于同一组参数依次在某加载制度及其延长制度下的计算(如逐级增加幅值的循环加载)。
+
+    Examples:
+        >>> cache = PrefixStateCache()
+        >>> mat = Steel01Material(1, 10, 2, 0.02)
+        >>> init = mat.getState()
+        >>> F1, k1 = cache.run(path1, mat, (10, 2, 0.02))
+        >>> mat.setState(init)  # 回到初始状态(或重新创建材料)
+        >>> F2, k2 = cache.run(path1 + path2, mat, (10, 2, 0.02))  # 仅计算path2部分
+    """
+
+    def __init__(self, max_entries: int=4096):
+        """
+        Args:
+            max_entries (int, optional): 最多缓存的状态数，超出时淘汰最久未使用的，默认4096
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.steps_skipped = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def run(
+        self,
+        strain,
+        mat,
+        paras_args: tuple,
+        paras_kwargs: dict={},
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """沿加载路径计算材料响应，尽可能从缓存的前缀状态恢复
+
+        Args:
+            strain (array_like | Protocol): 应变序列
+            mat (UniaxialMaterial | CUniaxialMaterial): 处于初始状态的材料对象，参数须与paras一致
+            paras_args (tuple): 材料参数(用于构造缓存键)
+            paras_kwargs (dict, optional): 材料参数
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 应力、切线刚度
+
+        Raises:
+            TypeError: 材料不支持getState/setState(早于CUniaxialMaterial编译的扩展)
+        """
+        if not supports_state(type(mat)):
+            raise TypeError(f'{type(mat).__name__} does not support getState/setState required by the prefix cache')
+        if isinstance(strain, Protocol):
+            bounds = strain.breakpoints()
+        else:
+            bounds = None
+        x = np.ascontiguousarray(strain, dtype=float)
+        n = len(x)
+        if bounds is None:
+            bounds = find_reversals(x)
+        base = (f'{type(mat).__module__}.{type(mat).__qualname__}', param_key(paras_args, paras_kwargs))
+        keys = self._prefix_keys(base, x, bounds)
+        # 查找已缓存的最长前缀
+        start = -1
+        stress = np.empty(n)
+        tangent = np.empty(n)
+        for b, key in zip(bounds[::-1], keys[::-1]):
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                state, F, k = entry
+                mat.setState(state)
+                stress[:b + 1] = F
+                tangent[:b + 1] = k
+                start = b
+                self.hits += 1
+                self.steps_skipped += b + 1
+                break
+        else:
+            self.misses += 1
+        bound_keys = dict(zip(bounds.tolist(), keys))
+        xs = x.tolist()
+        for i in range(start + 1, n):
+            mat.setTrialStrain(xs[i])
+            mat.commitState()
+            stress[i] = mat.getStress()
+            tangent[i] = mat.getTangent()
+            if i in bound_keys:
+                # 缓存的前缀为本次结果数组的视图，不额外复制
+                self._put(bound_keys[i], (mat.getState(), stress[:i + 1], tangent[:i + 1]))
+        return stress.copy(), tangent.copy()
+
+    @staticmethod
+    def _prefix_keys(base: tuple, x: np.ndarray, bounds: np.ndarray) -> list[tuple]:
+        """各分段点处路径前缀x[:b+1]的哈希(增量计算)"""
+        h = hashlib.sha1()
+        keys = []
+        prev = 0
+        for b in bounds.tolist():
+            h.update(x[prev:b + 1].tobytes())
+            prev = b + 1
+            keys.append(base + (b, h.hexdigest()))
+        return keys
+
+    def _put(self, key: tuple, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,225 @@
+import numpy as np
+
+
+def find_reversals(strain) -> np.ndarray:
+    """查找加载路径的反向点，将路径划分为若干单调段
+
+    第k段为`strain[b[k]:b[k+1]+1]`，段内应变单调(允许相邻点相等)，
+    应变保持不变的点归入前一段。
+
+    Args:
+        strain (array_like): 应变序列
+
+    Returns:
+        np.ndarray: 各单调段的分界点索引b，首尾分别为0和len(strain)-1
+    """
+    x = np.asarray(strain, dtype=float)
+    if x.ndim != 1 or len(x) == 0:
+        raise ValueError('strain should be a non-empty 1D array')
+    sgn = np.sign(np.diff(x))
+    nz = np.flatnonzero(sgn)
+    # 相邻两个非零增量方向相反的位置即为反向点
+    turn = nz[1:][sgn[nz[1:]] != sgn[nz[:-1]]]
+    return np.concatenate(([0], turn, [len(x) - 1])).astype(int)
+
+
+class Protocol:
+    """紧凑的加载路径表示: 转折点 + 各段采样数
+
+    第k段从`points[k]`线性变化到`points[k+1]`，共`n[k]`步(不含起点)，各点再乘以比例系数sf，
+    与`utils.material_test.generate_path`相同的采样方式(给出decimals时再按该小数位数取整，
+    decimals=6对应`utils.utils.generate_path`)。可直接迭代或转换为数组，驱动函数无需预先展开。
+    """
+
+    def __init__(self, points: list[float], n: list[int], decimals: int=None, sf: float=1):
+        self.points = np.asarray(points, dtype=float)
+        self.n = np.asarray(n, dtype=int)
+        self.decimals = decimals
+        self.sf = sf
+        if self.points.ndim != 1 or len(self.points) < 1:
+            raise ValueError('points should be a non-empty 1D array')
+        if self.n.shape != (len(self.points) - 1,):
+            raise ValueError(f'n should have {len(self.points) - 1} elements, but got {self.n.size}')
+        if np.any(self.n <= 0):
+            raise ValueError('Each segment should have at least one step')
+
+    @classmethod
+    def from_levels(cls, disp_level: list, n: int=200, sf: float=1, decimals: int=None) -> 'Protocol':
+        """与`utils.material_test.generate_path(disp_level, n, sf)`等价的紧凑表示(展开结果逐位一致)
+
+        decimals=6(sf=1)时与`utils.utils.generate_path(disp_level, n)`逐位一致。
+        """
+        return cls(disp_level, [n] * (len(disp_level) - 1), decimals, sf)
+
+    @classmethod
+    def from_path(cls, strain, decimals: int=None) -> 'Protocol':
+        """将稠密的分段线性路径压缩为转折点 + 各段采样数
+
+        Args:
+            strain (array_like): 应变序列(各段内等间距采样)
+            decimals (int, optional): 路径已按该小数位数取整(如`utils.utils.generate_path`为6)，默认None。
+                未取整的路径给出decimals时展开结果与原路径不一致，将引发ValueError
+
+        Raises:
+            ValueError: 展开后与原路径不一致(路径不是等间距采样的分段线性路径)
+        """
+        x = np.asarray(strain, dtype=float)
+        if len(x) < 2:
+            return cls(x, [], decimals)
+        d = np.diff(x)
+        # 步长发生变化的位置即为转折点(取整时步长存在1个单位以内的波动)
+        atol = 2.5 * 10.0 ** -decimals if decimals is not None else 1e-12
+        knots = np.flatnonzero(np.abs(np.diff(d)) > atol) + 1
+        b = np.concatenate(([0], knots, [len(x) - 1]))
+        protocol = cls(x[b], np.diff(b), decimals)
+        tol = 0.0 if decimals is not None else 1e-12 * max(np.max(np.abs(x)), 1.0)
+        if np.max(np.abs(protocol.expand() - x)) > tol:
+            raise ValueError('strain is not a uniformly sampled piecewise linear path')
+        return protocol
+
+    def breakpoints(self) -> np.ndarray:
+        """各转折点在展开后路径中的索引"""
+        return np.concatenate(([0], np.cumsum(self.n)))
+
+    def expand(self) -> np.ndarray:
+        """展开为稠密的应变序列"""
+        seg = np.repeat(np.arange(len(self.n)), self.n)
+        j = np.arange(int(self.n.sum())) - np.repeat(self.breakpoints()[:-1], self.n)
+        a = self.points[:-1][seg]
+        b = self.points[1:][seg]
+        u = np.append(a + (b - a) * j / self.n[seg], self.points[-1]) * self.sf
+        if self.decimals is not None:
+            # 使用内置round以与generate_path的取整结果一致
+            u = np.array([round(v, self.decimals) for v in u.tolist()])
+        return u
+
+    def __len__(self):
+        return int(self.n.sum()) + 1
+
+    def __iter__(self):
+        for a, b, n in zip(self.points[:-1].tolist(), self.points[1:].tolist(), self.n.tolist()):
+            for j in range(n):
+                yield self._round((a + (b - a) * j / n) * self.sf)
+        yield self._round(self.points[-1].item() * self.sf)
+
+    def _round(self, v: float) -> float:
+        return v if self.decimals is None else round(v, self.decimals)
+
+    def __array__(self, dtype=None, copy=None):
+        u = self.expand()
+        return u if dtype is None else u.astype(dtype)
+
+
+class CompressedSeries:
+    """只保存斜率变化点的序列，可按需展开
+
+    对于分段线性材料在分段线性路径下的响应(应力、切线刚度)，相邻斜率变化点之间的响应
+    关于应变(或步数)是线性的，因此只需保存这些点的索引和数值，展开时线性插值。
+    """
+
+    def __init__(self, length: int, index: np.ndarray, values: np.ndarray):
+        self.length = length
+        self.index = np.asarray(index, dtype=np.int64)
+        self.values = np.asarray(values, dtype=float)
+
+    @classmethod
+    def compress(cls, y, x=None, rtol: float=1e-12, atol: float=0.0) -> 'CompressedSeries':
+        """压缩序列y
+
+        从反向点出发，逐次在误差最大的点处插入节点(Douglas-Peucker)，
+        直至展开结果与原序列的差值不超过`atol + rtol * max|y|`。rtol=atol=0时逐位一致。
+
+        Args:
+            y (array_like): 待压缩的序列
+            x (array_like | Protocol, optional): 插值自变量(应变)，默认为步数
+            rtol (float, optional): 相对容差，默认1e-12
+            atol (float, optional): 绝对容差，默认0
+        """
+        y = np.asarray(y, dtype=float)
+        n = len(y)
+        if n <= 2:
+            return cls(n, np.arange(n), y)
+        t = _abscissa(x, n)
+        tol = atol + rtol * np.max(np.abs(y))
+        idx = np.unique(np.concatenate((find_reversals(t), [0, n - 1])))
+        while True:
+            seg = np.minimum(np.searchsorted(idx, np.arange(n), side='right') - 1, len(idx) - 2)
+            err = np.abs(_interp_knots(t, idx, y[idx]) - y)
+            err_max = np.maximum.reduceat(err, idx[:-1])
+            cand = np.flatnonzero((err > tol) & (err == err_max[seg]))
+            if len(cand) == 0:
+                return cls(n, idx, y[idx])
+            # 每段只插入一个误差最大的点
+            _, first = np.unique(seg[cand], return_index=True)
+            idx = np.union1d(idx, cand[first])
+
+    def expand(self, x=None) -> np.ndarray:
+        """展开为稠密序列，x须与压缩时使用的自变量相同"""
+        return _interp_knots(_abscissa(x, self.length), self.index, self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return self.index.nbytes + self.values.nbytes
+
+    def __len__(self):
+        return self.length
+
+
+def _abscissa(x, n: int) -> np.ndarray:
+    if x is None:
+        return np.arange(n, dtype=float)
+    t = np.asarray(x, dtype=float)
+    if len(t) != n:
+        raise ValueError(f'x should have length {n}, but got {len(t)}')
+    return t
+
+
+def _interp_knots(t: np.ndarray, idx: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """以idx处的节点对t做分段线性插值(t在相邻节点之间可以不严格单调)"""
+    n = len(t)
+    k = np.minimum(np.searchsorted(idx, np.arange(n), side='right') - 1, len(idx) - 2)
+    if len(idx) == 1:
+        return np.full(n, values[0])
+    t0, t1 = t[idx[k]], t[idx[k + 1]]
+    v0, v1 = values[k], values[k + 1]
+    dt = t1 - t0
+    w = np.divide(t - t0, dt, out=np.zeros(n), where=dt != 0)
+    return v0 + (v1 - v0) * w
+
+
+def compress_response(
+    strain,
+    stress,
+    tangent=None,
+    rtol: float=1e-12,
+    atol: float=0.0,
+) -> dict:
+    """压缩材料响应，应力和切线刚度以应变为自变量压缩
+
+    Args:
+        strain (array_like | Protocol): 应变序列
+        stress (array_like): 应力序列
+        tangent (array_like, optional): 切线刚度序列
+        rtol (float, optional): 相对容差，默认1e-12
+        atol (float, optional): 绝对容差，默认0
+
+    Returns:
+        dict: 键为strain(Protocol)、stress、tangent(CompressedSeries)
+    """
+    if not isinstance(strain, Protocol):
+        strain = Protocol.from_path(strain)
+    x = strain.expand()
+    out = {'strain': strain, 'stress': CompressedSeries.compress(stress, x, rtol, atol)}
+    if tangent is not None:
+        out['tangent'] = CompressedSeries.compress(tangent, x, rtol, atol)
+    return out
+
+
+def expand_response(compressed: dict) -> dict[str, np.ndarray]:
+    """将`compress_response`的结果展开为稠密数组"""
+    x = compressed['strain'].expand()
+    out = {'strain': x}
+    for key, val in compressed.items():
+        if key != 'strain':
+            out[key] = val.expand(x)
+    return out
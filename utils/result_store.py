@@ -0,0 +1,249 @@
+import hashlib
+import json
+import multiprocessing as mp
+import queue as queue_
+import numpy as np
+
+
+def param_key(paras_args: tuple=(), paras_kwargs: dict={}) -> str:
+    """参数组的哈希键(整数与浮点数视为相同，如5与5.0)"""
+    text = json.dumps({'args': [_num(v) for v in paras_args],
+                       'kwargs': {k: _num(v) for k, v in paras_kwargs.items()}},
+                      sort_keys=True, default=float)
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def path_key(strain) -> str:
+    """加载路径(应变序列)的哈希键"""
+    x = np.ascontiguousarray(strain, dtype='<f8')
+    return hashlib.sha1(x.tobytes()).hexdigest()[:12]
+
+
+def result_key(material: str, paras_args: tuple, paras_kwargs: dict, strain) -> str:
+    """结果组路径`<material>/<param_key>-<path_key>`，strain可以是已计算的path_key"""
+    pk = strain if isinstance(strain, str) else path_key(strain)
+    return f'{material}/{param_key(paras_args, paras_kwargs)}-{pk}'
+
+
+def _num(val):
+    if isinstance(val, (int, float, np.number)) and not isinstance(val, bool):
+        return float(val)
+    return val
+
+
+class ResultStore:
+    """基于HDF5的分块压缩结果库
+
+    布局为`/<material>/<param_key>-<path_key>/<name>`(与`campaign.job_key`相同，
+    同一参数在不同加载路径下的结果互不覆盖)，每个数组保存为可扩展的一维分块压缩数据集，
+    参数和标量指标保存在组的属性中。读取时按需切片，无需加载整个结果库。
+
+    Examples:
+        >>> with ResultStore('sweep.h5') as store:
+        ...     store.write('Steel01', (10, 2, 0.02), {}, u, {'stress': F, 'tangent': k})
+        ...     F_peak = store.read('Steel01', (10, 2, 0.02), {}, u, 'stress', slice(0, 100))
+    """
+
+    def __init__(self, path: str, mode: str='a', chunk: int=4096, compression: str='gzip', level: int=4):
+        """
+        Args:
+            path (str): HDF5文件路径
+            mode (str, optional): 打开方式，'r'只读，'a'读写，默认'a'
+            chunk (int, optional): 数据集分块长度，默认4096
+            compression (str, optional): 压缩方法，默认'gzip'
+            level (int, optional): 压缩等级，默认4
+        """
+        import h5py
+        self.file = h5py.File(path, mode)
+        self.chunk = chunk
+        self.compression = compression
+        self.level = level if compression == 'gzip' else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.file.close()
+
+    def flush(self):
+        self.file.flush()
+
+    def write(
+        self,
+        material: str,
+        paras_args: tuple,
+        paras_kwargs: dict,
+        strain,
+        arrays: dict[str, np.ndarray],
+        metrics: dict=None,
+        append: bool=False,
+        overwrite: bool=False,
+    ) -> str:
+        """写入一次计算的结果
+
+        Args:
+            material (str): 材料名称
+            paras_args (tuple): 参数
+            paras_kwargs (dict): 参数
+            strain (array_like | Protocol | str): 加载路径(或已计算的`path_key`)，参与结果组的键
+            arrays (dict[str, np.ndarray]): 一维数组，如stress、tangent
+            metrics (dict, optional): 标量指标，保存在组的属性中
+            append (bool, optional): 在已存在的同名数组末尾追加(如分段写入同一加载路径的结果)，默认False
+            overwrite (bool, optional): 替换已存在的同名数组，默认False
+
+        Returns:
+            str: 数据所在组的路径
+
+        Raises:
+            ValueError: 同名数组已存在且未指定append或overwrite，或同时指定了两者
+        """
+        if append and overwrite:
+            raise ValueError('append and overwrite are mutually exclusive')
+        key = result_key(material, paras_args, paras_kwargs, strain)
+        if not (append or overwrite) and key in self.file:
+            existing = [name for name in arrays if name in self.file[key]]
+            if existing:
+                raise ValueError(f'{key}/{existing[0]} already exists, pass append=True or overwrite=True')
+        group = self.file.require_group(key)
+        if 'paras' not in group.attrs:
+            group.attrs['paras'] = json.dumps(
+                {'args': list(paras_args), 'kwargs': paras_kwargs}, default=float)
+        for name, data in arrays.items():
+            data = np.asarray(data, dtype=float).ravel()
+            if name in group and overwrite:
+                del group[name]
+            if name in group:
+                dset = group[name]
+                n0 = dset.shape[0]
+                dset.resize((n0 + len(data),))
+                dset[n0:] = data
+            else:
+                group.create_dataset(
+                    name, data=data, maxshape=(None,), chunks=(self.chunk,),
+                    compression=self.compression, compression_opts=self.level, shuffle=True)
+        for name, val in (metrics or {}).items():
+            group.attrs[name] = val
+        return key
+
+    def read(
+        self,
+        material: str,
+        paras_args: tuple,
+        paras_kwargs: dict,
+        strain,
+        name: str,
+        sel: slice=slice(None),
+    ) -> np.ndarray:
+        """读取某一数组(或其切片)，仅解压涉及的数据块"""
+        return self.dataset(material, paras_args, paras_kwargs, strain, name)[sel]
+
+    def dataset(self, material: str, paras_args: tuple, paras_kwargs: dict, strain, name: str):
+        """返回h5py数据集对象，可进一步惰性切片"""
+        return self.file[f'{result_key(material, paras_args, paras_kwargs, strain)}/{name}']
+
+    def metrics(self, material: str, paras_args: tuple, paras_kwargs: dict, strain) -> dict:
+        group = self.file[result_key(material, paras_args, paras_kwargs, strain)]
+        return {k: v for k, v in group.attrs.items() if k != 'paras'}
+
+    def contains(self, material: str, paras_args: tuple, paras_kwargs: dict, strain) -> bool:
+        return result_key(material, paras_args, paras_kwargs, strain) in self.file
+
+    def keys(self, material: str=None) -> list[str]:
+        """所有结果组的路径"""
+        materials = [material] if material is not None else list(self.file.keys())
+        return [f'{m}/{k}' for m in materials if m in self.file for k in self.file[m].keys()]
+
+    def paras(self, key: str) -> tuple[tuple, dict]:
+        """由结果组路径取回参数"""
+        d = json.loads(self.file[key].attrs['paras'])
+        return tuple(d['args']), d['kwargs']
+
+
+class ResultWriter:
+    """单写入进程: 多个工作进程通过队列提交结果，由独立进程顺序写入同一个HDF5文件
+
+    Examples:
+        >>> writer = ResultWriter('sweep.h5')
+        >>> # 在工作进程中(需将writer.queue传入)
+        >>> submit(writer.queue, 'Steel01', paras, {}, u, {'stress': F})
+        >>> writer.close()
+    """
+
+    def __init__(self, path: str, flush_every: int=100, **store_kwargs):
+        """
+        Args:
+            path (str): HDF5文件路径
+            flush_every (int, optional): 每写入多少条结果刷新一次文件，默认100
+            **store_kwargs: 传给ResultStore的其他参数
+        """
+        self.queue = mp.Queue()
+        self._error_queue = mp.Queue()
+        self.errors: list[tuple[str, str]] = []
+        self.process = mp.Process(
+            target=_writer_loop, args=(self.queue, self._error_queue, path, flush_every, store_kwargs), daemon=True)
+        self.process.start()
+
+    def submit(self, *args, **kwargs):
+        submit(self.queue, *args, **kwargs)
+
+    def close(self):
+        """写入队列中剩余的结果并结束写入进程
+
+        Raises:
+            RuntimeError: 有结果写入失败(失败的结果及原因见`errors`)或写入进程异常退出
+        """
+        self.queue.put(None)
+        # 先取回错误记录再join，避免写入进程阻塞在队列上
+        while True:
+            try:
+                self.errors = self._error_queue.get(timeout=0.1)
+                break
+            except queue_.Empty:
+                if not self.process.is_alive():
+                    break
+        self.process.join()
+        if self.process.exitcode != 0:
+            raise RuntimeError(f'Result writer exited with code {self.process.exitcode}')
+        if self.errors:
+            key, err = self.errors[0]
+            raise RuntimeError(f'{len(self.errors)} result(s) failed to be written, first: {key}: {err}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def submit(queue, material: str, paras_args: tuple, paras_kwargs: dict, strain,
+           arrays: dict[str, np.ndarray], metrics: dict=None, append: bool=False, overwrite: bool=False):
+    """向写入进程提交一条结果(可在任意持有queue的进程中调用)，参数含义见`ResultStore.write`"""
+    arrays = {k: np.asarray(v, dtype=float) for k, v in arrays.items()}
+    # 只传递加载路径的哈希，避免在队列中重复传输整个路径
+    pk = strain if isinstance(strain, str) else path_key(strain)
+    queue.put((material, tuple(paras_args), dict(paras_kwargs), pk, arrays, metrics, append, overwrite))
+
+
+def _writer_loop(queue, error_queue, path: str, flush_every: int, store_kwargs: dict):
+    errors = []
+    try:
+        with ResultStore(path, 'a', **store_kwargs) as store:
+            n = 0
+            while True:
+                item = queue.get()
+                if item is None:
+                    break
+                try:
+                    store.write(*item)
+                except Exception as e:
+                    # 单条结果写入失败时记录原因，继续写入其他结果
+                    errors.append((result_key(*item[:4]), repr(e)))
+                    continue
+                n += 1
+                if n % flush_every == 0:
+                    store.flush()
+    finally:
+        error_queue.put(errors)
@@ -0,0 +1,447 @@
+"""
+本地材料计算服务
+
+服务进程持有常驻的工作进程池(已导入材料模块)，通过Unix socket或本机TCP端口接收
+(材料, 参数, 加载制度)请求，多个工具共用同一服务，无需各自启动解释器和导入材料。
+* 合并: 相同的请求(材料、参数、加载路径、后端均相同)在计算完成前只计算一次
+* 批处理: 短时间内到达的、加载路径相同的请求合并为一批，均分给各工作进程并行计算
+* 帧格式: 4字节(大端)头部长度 + JSON头部 + 数组原始字节，头部的arrays字段给出各数组的dtype和形状
+
+启动: python -m utils.service --socket /tmp/myopensees.sock 或 python -m utils.service --port 8765
+
+Examples:
+    >>> with MaterialClient('/tmp/myopensees.sock') as client:
+    ...     F, k = client.run('Steel01', (10, 2, 0.02), {}, u)
+    ...     results = client.map([('Steel01', (10, 2, 0.02)), ('Steel01', (12, 2, 0.02))], u)
+"""
+import asyncio
+import inspect
+import json
+import os
+import socket
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from utils.protocol import Protocol
+from utils.result_store import param_key, path_key
+
+
+# ----------------------------------------------------------------------
+# 帧格式
+# ----------------------------------------------------------------------
+def _pack(header: dict, arrays: list=()) -> bytes:
+    arrays = [np.ascontiguousarray(a) for a in arrays]
+    header = dict(header, arrays=[[a.dtype.str, list(a.shape)] for a in arrays])
+    head = json.dumps(header, separators=(',', ':')).encode()
+    return b''.join([struct.pack('>I', len(head)), head] + [a.tobytes() for a in arrays])
+
+
+def _unpack_arrays(header: dict, payload: bytes) -> list[np.ndarray]:
+    arrays = []
+    off = 0
+    for dtype, shape in header.get('arrays', []):
+        dt = np.dtype(dtype)
+        n = int(np.prod(shape)) * dt.itemsize
+        arrays.append(np.frombuffer(payload, dtype=dt, count=int(np.prod(shape)), offset=off).reshape(shape))
+        off += n
+    return arrays
+
+
+def _payload_size(header: dict) -> int:
+    return sum(int(np.prod(shape)) * np.dtype(dtype).itemsize for dtype, shape in header.get('arrays', []))
+
+
+async def _read_msg(reader: asyncio.StreamReader) -> tuple[dict, list[np.ndarray]]:
+    n = struct.unpack('>I', await reader.readexactly(4))[0]
+    header = json.loads(await reader.readexactly(n))
+    payload = await reader.readexactly(_payload_size(header))
+    return header, _unpack_arrays(header, payload)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(min(n - len(buf), 1 << 20))
+        if not chunk:
+            raise ConnectionError('Connection closed by the service')
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv_msg(sock: socket.socket) -> tuple[dict, list[np.ndarray]]:
+    n = struct.unpack('>I', _recv_exact(sock, 4))[0]
+    header = json.loads(_recv_exact(sock, n))
+    return header, _unpack_arrays(header, _recv_exact(sock, _payload_size(header)))
+
+
+# ----------------------------------------------------------------------
+# 工作进程
+# ----------------------------------------------------------------------
+def _warm(preload: tuple, backend: str):
+    """工作进程初始化: 预先解析(导入)材料类"""
+    from src.factory import get_material_class
+    for name in preload:
+        try:
+            get_material_class(name, backend)
+        except ImportError:
+            pass
+
+
+def _run_batch(strain: np.ndarray, jobs: list[tuple], backend: str) -> list:
+    """在工作进程中计算一批任务，单个任务失败不影响其他任务
+
+    同一材料的多个任务在存在编译的种群类(如TSSCBPopulation、ModTakedaPopulation)时
+    一次`run(path)`完成，其余任务(及种群无法计算的任务)逐个计算。
+    """
+    from src.factory import make_material
+    from src.UniaxialMaterial import UniaxialMaterial
+    from utils.parallel import _release
+    out = [None] * len(jobs)
+    if backend != 'py':
+        groups = {}
+        for i, job in enumerate(jobs):
+            groups.setdefault(job[0], []).append(i)
+        for mat_type, idx in groups.items():
+            if len(idx) > 1:
+                _run_population(strain, mat_type, [jobs[i] for i in idx], idx, out)
+    xs = strain.tolist()
+    for i, (mat_type, paras_args, paras_kwargs) in enumerate(jobs):
+        if out[i] is not None:
+            continue
+        try:
+            # 与OpenSeesPool相同，每个任务开始前清空编号空间(构造函数抛出异常时编号不会被释放)
+            UniaxialMaterial.wipe()
+            mat = make_material(mat_type, 1, *paras_args, backend=backend, **paras_kwargs)
+            try:
+                F = []
+                k = []
+                for val in xs:
+                    mat.setTrialStrain(val)
+                    mat.commitState()
+                    F.append(mat.getStress())
+                    k.append(mat.getTangent())
+            finally:
+                _release(mat)
+            out[i] = (np.array(F), np.array(k))
+        except Exception as e:
+            out[i] = repr(e)
+    return out
+
+
+def _run_population(strain: np.ndarray, mat_type: str, jobs: list[tuple], idx: list[int], out: list):
+    """以种群类计算同一材料的多个任务，结果写入out[idx]
+
+    参数按标量材料的构造函数签名对应到种群的`PARAS`列，无法对应的任务(参数错误、
+    非缺省的标志参数等)及种群拒绝的参数组留给逐个计算，以得到各任务自己的错误信息。
+    """
+    from src.factory import get_material_class, get_population_class
+    pop_cls = get_population_class(mat_type)
+    if pop_cls is None:
+        return
+    paras = sys.modules[pop_cls.__module__].PARAS
+    sig = inspect.signature(get_material_class(mat_type, 'py'))
+    rows = []
+    members = []
+    for i, (_, paras_args, paras_kwargs) in zip(idx, jobs):
+        try:
+            bound = sig.bind(1, *paras_args, **paras_kwargs)
+        except TypeError:
+            continue
+        bound.apply_defaults()
+        values = bound.arguments
+        # 种群只包含数值参数，OpenSees风格的标志参数(如'-hardening')须为缺省值或对应的标志
+        if any(name not in paras and name != 'tag' and not _is_flag(name, val) for name, val in values.items()):
+            continue
+        rows.append([values[name] for name in paras])
+        members.append(i)
+    if len(members) < 2:
+        return
+    try:
+        pop = pop_cls(np.array(rows, dtype=float), num_threads=1)
+    except (TypeError, ValueError):
+        # 剔除种群无法构造的参数组后重试
+        valid = [j for j, row in enumerate(rows) if _population_accepts(pop_cls, row)]
+        rows = [rows[j] for j in valid]
+        members = [members[j] for j in valid]
+        if len(members) < 2:
+            return
+        pop = pop_cls(np.array(rows, dtype=float), num_threads=1)
+    F, k = pop.run(strain)
+    for j, i in enumerate(members):
+        out[i] = (F[j], k[j])
+
+
+def _population_accepts(pop_cls: type, row: list) -> bool:
+    try:
+        pop_cls(np.array([row], dtype=float), num_threads=1)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _is_flag(name: str, val) -> bool:
+    flag = '-' + name.lstrip('_')
+    return val is None or val == flag or val == flag.encode()
+
+
+# ----------------------------------------------------------------------
+# 服务
+# ----------------------------------------------------------------------
+class MaterialService:
+    """asyncio材料计算服务"""
+
+    def __init__(
+        self,
+        n_workers: int=None,
+        backend: str=None,
+        batch_window: float=0.005,
+        max_batch: int=64,
+        preload: tuple=('Steel01', 'TwoStage', 'TSSCB', 'ModBoucWen', 'ModTakeda'),
+    ):
+        """
+        Args:
+            n_workers (int, optional): 工作进程数，默认为CPU核数
+            backend (str, optional): 材料后端，默认自动选择
+            batch_window (float, optional): 批处理的等待时间(s)，默认0.005
+            max_batch (int, optional): 每批最多的任务数，默认64
+            preload (tuple, optional): 工作进程启动时预先导入的材料
+        """
+        self.n_workers = n_workers or os.cpu_count()
+        self.backend = backend
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.preload = preload
+        self.pool = None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._batches: dict[str, tuple] = {}
+        self.stats = {'requests': 0, 'coalesced': 0, 'batches': 0, 'jobs': 0, 'errors': 0}
+
+    async def serve(self, path: str=None, host: str='127.0.0.1', port: int=0):
+        """启动服务(path给出时使用Unix socket，否则监听本机TCP端口)，直到被取消"""
+        self.pool = ProcessPoolExecutor(self.n_workers, initializer=_warm, initargs=(self.preload, self.backend))
+        # 预先启动全部工作进程
+        await asyncio.gather(*[asyncio.get_running_loop().run_in_executor(self.pool, os.getpid)
+                               for _ in range(self.n_workers)])
+        if path is not None:
+            if os.path.exists(path):
+                os.remove(path)
+            server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            server = await asyncio.start_server(self._handle, host, port)
+        self.server = server
+        if os.name == 'posix':
+            # SIGTERM时与Ctrl+C相同，停止服务并清理socket文件
+            import signal
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    header, arrays = await _read_msg(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                task = asyncio.create_task(self._respond(header, arrays, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _respond(self, header: dict, arrays: list, writer: asyncio.StreamWriter, lock: asyncio.Lock):
+        rid = header.get('id')
+        try:
+            if header.get('op') == 'stats':
+                msg = _pack({'id': rid, 'ok': True, 'stats': self.stats})
+            else:
+                stress, tangent = await self.submit(header, arrays)
+                msg = _pack({'id': rid, 'ok': True}, [stress, tangent])
+        except Exception as e:
+            self.stats['errors'] += 1
+            msg = _pack({'id': rid, 'ok': False, 'error': str(e)})
+        async with lock:
+            writer.write(msg)
+            await writer.drain()
+
+    async def submit(self, header: dict, arrays: list) -> tuple[np.ndarray, np.ndarray]:
+        """提交一个计算请求(合并相同的进行中请求，并与相同加载路径的请求合批)"""
+        if 'protocol' in header:
+            p = header['protocol']
+            strain = Protocol(p['points'], p['n'], p.get('decimals'), p.get('sf', 1)).expand()
+        else:
+            strain = np.asarray(arrays[0], dtype=float)
+        mat_type = header['mat_type']
+        paras_args = tuple(header.get('paras_args', ()))
+        paras_kwargs = header.get('paras_kwargs', {})
+        backend = header.get('backend', self.backend)
+        self.stats['requests'] += 1
+        path_hash = path_key(strain)
+        key = f'{mat_type}-{param_key(paras_args, paras_kwargs)}-{path_hash}-{backend}'
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(fut)
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._inflight[key] = fut
+        batch_key = f'{path_hash}-{backend}'
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            handle = loop.call_later(self.batch_window, self._flush, batch_key)
+            batch = self._batches[batch_key] = (strain, backend, [], handle)
+        batch[2].append(((mat_type, paras_args, paras_kwargs), key, fut))
+        if len(batch[2]) >= self.max_batch:
+            batch[3].cancel()
+            self._flush(batch_key)
+        return await asyncio.shield(fut)
+
+    def _flush(self, batch_key: str):
+        batch = self._batches.pop(batch_key, None)
+        if batch is not None:
+            asyncio.ensure_future(self._dispatch(*batch[:3]))
+
+    async def _dispatch(self, strain: np.ndarray, backend: str, items: list):
+        self.stats['batches'] += 1
+        self.stats['jobs'] += len(items)
+        loop = asyncio.get_running_loop()
+        # 将一批任务均分给各工作进程并行计算
+        n_chunks = min(self.n_workers, len(items))
+        bounds = np.linspace(0, len(items), n_chunks + 1).astype(int).tolist()
+        chunks = [[job for job, _, _ in items[i:j]] for i, j in zip(bounds[:-1], bounds[1:])]
+        outs = await asyncio.gather(*[loop.run_in_executor(self.pool, _run_batch, strain, chunk, backend)
+                                      for chunk in chunks], return_exceptions=True)
+        results = []
+        for chunk, out in zip(chunks, outs):
+            results.extend([repr(out)] * len(chunk) if isinstance(out, BaseException) else out)
+        for (_, key, fut), res in zip(items, results):
+            self._inflight.pop(key, None)
+            if fut.done():
+                continue
+            if isinstance(res, str):
+                fut.set_exception(RuntimeError(res))
+            else:
+                fut.set_result(res)
+
+
+def run_service(path: str=None, host: str='127.0.0.1', port: int=8765, **kwargs):
+    """阻塞运行服务(Ctrl+C退出)"""
+    service = MaterialService(**kwargs)
+    try:
+        asyncio.run(service.serve(path, host, port))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+# ----------------------------------------------------------------------
+# 客户端
+# ----------------------------------------------------------------------
+class MaterialClient:
+    """材料计算服务的同步客户端"""
+
+    def __init__(self, path: str=None, host: str='127.0.0.1', port: int=8765, timeout: float=None):
+        """
+        Args:
+            path (str, optional): Unix socket路径，给出时优先使用
+            host (str, optional): 服务地址，默认'127.0.0.1'
+            port (int, optional): 服务端口，默认8765
+            timeout (float, optional): 超时时间(s)
+        """
+        if path is not None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(path)
+        else:
+            self.sock = socket.create_connection((host, port), timeout)
+        self._next_id = 0
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _request(self, mat_type: str, paras_args: tuple, paras_kwargs: dict, strain, backend: str) -> tuple[int, bytes]:
+        rid = self._next_id
+        self._next_id += 1
+        header = {'id': rid, 'op': 'run', 'mat_type': mat_type, 'paras_args': list(paras_args),
+                  'paras_kwargs': paras_kwargs}
+        if backend is not None:
+            header['backend'] = backend
+        if isinstance(strain, Protocol):
+            # 只传递转折点和步数
+            header['protocol'] = {'points': strain.points.tolist(), 'n': strain.n.tolist(),
+                                  'decimals': strain.decimals, 'sf': strain.sf}
+            return rid, _pack(header)
+        return rid, _pack(header, [np.asarray(strain, dtype=float)])
+
+    def run(self, mat_type: str, paras_args: tuple, paras_kwargs: dict, strain,
+            backend: str=None) -> tuple[np.ndarray, np.ndarray]:
+        """计算单个任务，返回应力、切线刚度"""
+        return self.map([(mat_type, paras_args, paras_kwargs)], strain, backend)[0]
+
+    def map(self, jobs: list[tuple], strain, backend: str=None) -> list[tuple[np.ndarray, np.ndarray]]:
+        """批量计算(一次发送全部请求，服务端合批计算)
+
+        Args:
+            jobs (list[tuple]): 每个任务为(mat_type, paras_args)或(mat_type, paras_args, paras_kwargs)
+            strain (array_like | Protocol): 所有任务共用的应变序列
+            backend (str, optional): 材料后端，默认由服务决定
+
+        Raises:
+            RuntimeError: 任一任务计算失败
+        """
+        order = {}
+        msgs = []
+        for i, job in enumerate(jobs):
+            paras_kwargs = job[2] if len(job) > 2 else {}
+            rid, msg = self._request(job[0], job[1], paras_kwargs, strain, backend)
+            order[rid] = i
+            msgs.append(msg)
+        self.sock.sendall(b''.join(msgs))
+        results = [None] * len(jobs)
+        errors = {}
+        for _ in range(len(jobs)):
+            header, arrays = _recv_msg(self.sock)
+            i = order[header['id']]
+            if header['ok']:
+                results[i] = (arrays[0], arrays[1])
+            else:
+                errors[i] = header['error']
+        if errors:
+            i = min(errors)
+            raise RuntimeError(f'Job {i} ({jobs[i][0]}) failed in material service: {errors[i]}')
+        return results
+
+    def stats(self) -> dict:
+        """服务的请求、合并、批次统计"""
+        rid = self._next_id
+        self._next_id += 1
+        self.sock.sendall(_pack({'id': rid, 'op': 'stats'}))
+        header, _ = _recv_msg(self.sock)
+        return header['stats']
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Local material evaluation service')
+    parser.add_argument('--socket', default=None, help='Unix socket path')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--backend', default=None, choices=['ext', 'py'])
+    args = parser.parse_args()
+    run_service(args.socket, args.host, args.port, n_workers=args.workers, backend=args.backend)
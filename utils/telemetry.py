@@ -0,0 +1,309 @@
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+from src.factory import material_name
+
+
+class Telemetry:
+    """批量计算的运行指标汇总与导出
+
+    按(材料, 后端)汇总每次计算的步数、用时、失败次数和NaN输出，按名称汇总进程池/线程池的利用率，
+    并读取已登记缓存(如`PrefixStateCache`)的命中次数。每次计算只记录一次，不增加逐步计算的开销。
+    汇总结果可定期以JSON lines(每次导出追加一行)或Prometheus文本文件(每次导出整体替换)的形式写出，
+    便于监控长时间运行的计算和估计所需的计算资源。
+
+    Examples:
+        >>> tel = Telemetry('runs.prom', fmt='prometheus', interval=30)
+        >>> tel.watch_cache('prefix', cache)
+        >>> with tel:
+        ...     test_py(u, Steel01Material, (10, 2, 0.02), {}, telemetry=tel)
+        ...     run_threaded(u, jobs, telemetry=tel)
+    """
+
+    def __init__(self, path: str=None, fmt: str='jsonl', interval: float=None, prefix: str='myopensees'):
+        """
+        Args:
+            path (str, optional): 导出文件路径，为None时只在内存中汇总
+            fmt (str, optional): 'jsonl'或'prometheus'，默认'jsonl'
+            interval (float, optional): 定期导出的间隔(s)，为None时仅在调用`export`或`stop`时导出
+            prefix (str, optional): Prometheus指标名前缀
+        """
+        if fmt not in ('jsonl', 'prometheus'):
+            raise ValueError(f'Unknown format {fmt}')
+        self.path = path
+        self.fmt = fmt
+        self.interval = interval
+        self.prefix = prefix
+        self.t_start = time.time()
+        self._lock = threading.Lock()
+        self._runs: dict[tuple, dict] = {}
+        self._pools: dict[str, dict] = {}
+        self._caches: dict = {}
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    # ------------------------------------------------------------------
+    # 记录
+    # ------------------------------------------------------------------
+    def record_run(self, material: str, backend: str, n_steps: int, seconds: float,
+                   n_nan: int=0, failed: bool=False):
+        """记录一次材料计算
+
+        Args:
+            material (str): 材料名称
+            backend (str): 后端('py'、'ext'、'opensees'等)
+            n_steps (int): 计算步数
+            seconds (float): 用时(s)
+            n_nan (int, optional): 输出中NaN的个数
+            failed (bool, optional): 计算是否抛出异常
+        """
+        with self._lock:
+            s = self._runs.get((material, backend))
+            if s is None:
+                s = self._runs[(material, backend)] = {
+                    'runs': 0, 'steps': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                    'failures': 0, 'nan_runs': 0, 'nan_values': 0,
+                }
+            s['runs'] += 1
+            s['steps'] += n_steps
+            s['seconds'] += seconds
+            s['max_seconds'] = max(s['max_seconds'], seconds)
+            s['failures'] += bool(failed)
+            s['nan_runs'] += n_nan > 0
+            s['nan_values'] += n_nan
+
+    def record_batch(self, pool: str, n_workers: int, n_jobs: int, wall: float, busy: float):
+        """记录并行池的一批任务
+
+        Args:
+            pool (str): 池名称(如'threads'、'opensees')
+            n_workers (int): 工作线程/进程数
+            n_jobs (int): 任务数
+            wall (float): 整批任务的墙钟时间(s)
+            busy (float): 各任务用时之和(s)
+        """
+        with self._lock:
+            s = self._pools.get(pool)
+            if s is None:
+                s = self._pools[pool] = {'batches': 0, 'jobs': 0, 'capacity': 0.0, 'busy': 0.0}
+            s['batches'] += 1
+            s['jobs'] += n_jobs
+            s['capacity'] += n_workers * wall
+            s['busy'] += busy
+            s['workers'] = n_workers
+
+    def watch_cache(self, name: str, cache):
+        """登记缓存对象，导出时读取其hits、misses(及steps_skipped)属性"""
+        with self._lock:
+            self._caches[name] = cache
+
+    # ------------------------------------------------------------------
+    # 汇总与导出
+    # ------------------------------------------------------------------
+    def snapshot(self) -> dict:
+        """当前的汇总指标"""
+        with self._lock:
+            runs = []
+            for (material, backend), s in self._runs.items():
+                runs.append({
+                    'material': material,
+                    'backend': backend,
+                    **s,
+                    'steps_per_second': s['steps'] / s['seconds'] if s['seconds'] > 0 else math.nan,
+                    'mean_seconds': s['seconds'] / s['runs'],
+                })
+            pools = []
+            for name, s in self._pools.items():
+                pools.append({
+                    'pool': name,
+                    **s,
+                    'utilization': s['busy'] / s['capacity'] if s['capacity'] > 0 else math.nan,
+                })
+            caches = []
+            for name, cache in self._caches.items():
+                hits, misses = int(cache.hits), int(cache.misses)
+                caches.append({
+                    'cache': name,
+                    'hits': hits,
+                    'misses': misses,
+                    'hit_rate': hits / (hits + misses) if hits + misses else math.nan,
+                    'steps_skipped': int(getattr(cache, 'steps_skipped', 0)),
+                })
+        return {
+            'time': time.time(),
+            'uptime': time.time() - self.t_start,
+            'runs': runs,
+            'pools': pools,
+            'caches': caches,
+        }
+
+    def export(self, path: str=None):
+        """写出当前的汇总指标(jsonl追加一行，prometheus原子替换整个文件)"""
+        path = path or self.path
+        if path is None:
+            return
+        snap = self.snapshot()
+        if self.fmt == 'jsonl':
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(_finite(snap), ensure_ascii=False) + '\n')
+        else:
+            # 先写入临时文件再替换，避免采集端读到写了一半的文件
+            tmp = f'{path}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus(snap))
+            os.replace(tmp, path)
+
+    def to_prometheus(self, snap: dict=None) -> str:
+        """Prometheus文本格式"""
+        snap = snap or self.snapshot()
+        p = self.prefix
+        lines = [
+            f'# TYPE {p}_uptime_seconds gauge',
+            f'{p}_uptime_seconds {snap["uptime"]:.3f}',
+        ]
+        run_metrics = [
+            ('runs_total', 'runs', 'counter'),
+            ('steps_total', 'steps', 'counter'),
+            ('run_seconds_total', 'seconds', 'counter'),
+            ('run_seconds_max', 'max_seconds', 'gauge'),
+            ('failures_total', 'failures', 'counter'),
+            ('nan_runs_total', 'nan_runs', 'counter'),
+            ('nan_values_total', 'nan_values', 'counter'),
+            ('steps_per_second', 'steps_per_second', 'gauge'),
+        ]
+        for metric, key, kind in run_metrics:
+            lines.append(f'# TYPE {p}_{metric} {kind}')
+            for r in snap['runs']:
+                lines.append(f'{p}_{metric}{{material="{r["material"]}",backend="{r["backend"]}"}} {_fmt(r[key])}')
+        pool_metrics = [
+            ('pool_jobs_total', 'jobs', 'counter'),
+            ('pool_busy_seconds_total', 'busy', 'counter'),
+            ('pool_capacity_seconds_total', 'capacity', 'counter'),
+            ('pool_workers', 'workers', 'gauge'),
+            ('pool_utilization', 'utilization', 'gauge'),
+        ]
+        for metric, key, kind in pool_metrics:
+            lines.append(f'# TYPE {p}_{metric} {kind}')
+            for r in snap['pools']:
+                lines.append(f'{p}_{metric}{{pool="{r["pool"]}"}} {_fmt(r[key])}')
+        cache_metrics = [
+            ('cache_hits_total', 'hits', 'counter'),
+            ('cache_misses_total', 'misses', 'counter'),
+            ('cache_steps_skipped_total', 'steps_skipped', 'counter'),
+        ]
+        for metric, key, kind in cache_metrics:
+            lines.append(f'# TYPE {p}_{metric} {kind}')
+            for r in snap['caches']:
+                lines.append(f'{p}_{metric}{{cache="{r["cache"]}"}} {_fmt(r[key])}')
+        return '\n'.join(lines) + '\n'
+
+    # ------------------------------------------------------------------
+    # 定期导出
+    # ------------------------------------------------------------------
+    def start(self):
+        """启动定期导出的后台线程(需设置interval和path)"""
+        if self.interval is None or self.path is None or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止后台线程并导出最终结果"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self.export()
+
+    def _loop(self):
+        while not self._stop_event.wait(self.interval):
+            self.export()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def instrument(backend: str, mat_param: str):
+    """为材料测试驱动函数添加`telemetry`关键字参数
+
+    传入Telemetry对象时记录本次计算的材料名称、步数、用时、输出中的NaN个数及是否抛出异常。
+
+    Args:
+        backend (str): 后端名称
+        mat_param (str): 驱动函数中材料名称(或材料类)的参数名
+    """
+    def decorator(func):
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, telemetry: Telemetry=None, **kwargs):
+            if telemetry is None:
+                return func(*args, **kwargs)
+            bound = sig.bind(*args, **kwargs)
+            mat = bound.arguments[mat_param]
+            material = mat if isinstance(mat, str) else material_name(mat)
+            counter = None
+            if not bound.arguments.get('record', True) and bound.arguments.get('hooks'):
+                # 不保存历史且hooks可能提前终止加载时，由计步hook统计实际完成的步数
+                counter = _StepCounter()
+                bound.arguments['hooks'] = [counter, *bound.arguments['hooks']]
+            t0 = time.perf_counter()
+            try:
+                stress, tangent = func(*bound.args, **bound.kwargs)
+            except Exception:
+                telemetry.record_run(material, backend, 0, time.perf_counter() - t0, failed=True)
+                raise
+            dt = time.perf_counter() - t0
+            if counter is not None:
+                n_steps = counter.n
+            elif len(stress):
+                n_steps = len(stress)
+            else:
+                # 不保存历史且没有hooks时必定完成整个应变序列
+                n_steps = len(bound.arguments['strain'])
+            telemetry.record_run(material, backend, n_steps, dt, n_nan=count_nan(stress))
+            return stress, tangent
+        return wrapper
+    return decorator
+
+
+class _StepCounter:
+    """统计驱动函数实际完成步数的hook(每步提交后调用一次，不终止加载)"""
+
+    def __init__(self):
+        self.n = 0
+
+    def update(self, strain: float, stress: float) -> bool:
+        self.n += 1
+        return False
+
+
+def count_nan(values) -> int:
+    """序列中NaN的个数"""
+    return sum(1 for v in values if v != v)
+
+
+def _fmt(v) -> str:
+    if isinstance(v, float):
+        return 'NaN' if math.isnan(v) else repr(v)
+    return str(v)
+
+
+def _finite(obj):
+    """JSON中以null表示NaN"""
+    if isinstance(obj, float) and math.isnan(obj):
+        return None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_finite(v) for v in obj]
+    return obj